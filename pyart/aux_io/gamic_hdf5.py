@@ -41,7 +41,8 @@ LIGHT_SPEED = 2.99792458e8  # speed of light in meters per second
 def read_gamic(filename, field_names=None, additional_metadata=None,
                file_field_names=False, exclude_fields=None,
                valid_range_from_file=True, units_from_file=True,
-               pulse_width=None, **kwargs):
+               pulse_width=None, include_fields=None, scans=None,
+               nthreads=1, **kwargs):
     """
     Read a GAMIC hdf5 file.
 
@@ -74,6 +75,19 @@ def read_gamic(filename, field_names=None, additional_metadata=None,
     pulse_width : list or None,
         Mandatory for gamic radar processors which have pulsewidth enums.
         pulse_width should contain the pulsewidth' in us.
+    include_fields : list or None, optional
+        List of fields to include in the radar object, None (the default)
+        includes all fields not excluded.  This is applied after the
+        `file_field_names` and `field_names` parameters.  The HDF5 datasets
+        of fields which are not included are not read.
+    scans : list or None, optional
+        Indices, 0-based, of the scans to read from the file.  None (the
+        default) will read all scans.  The groups of other scans are not
+        read.
+    nthreads : int, optional
+        Number of threads used to decode the sweeps of each field.  The
+        data is read from the file by a single thread as h5py serializes
+        access to the HDF5 library.
 
     Returns
     -------
@@ -91,10 +105,11 @@ def read_gamic(filename, field_names=None, additional_metadata=None,
 
     # create metadata retrieval object
     filemetadata = FileMetadata('gamic', field_names, additional_metadata,
-                                file_field_names, exclude_fields)
+                                file_field_names, exclude_fields,
+                                include_fields)
 
     # Open HDF5 file and get handle
-    gfile = GAMICFile(filename)
+    gfile = GAMICFile(filename, scans)
 
     # verify that all scans are present in file
     assert gfile.is_file_complete()
@@ -135,7 +150,10 @@ def read_gamic(filename, field_names=None, additional_metadata=None,
     try:
         sweep_number['data'] = gfile.what_attrs('set_idx', 'int32')
     except KeyError:
-        sweep_number['data'] = np.arange(gfile.nsweeps, dtype='int32')
+        if scans is None:
+            sweep_number['data'] = np.arange(gfile.nsweeps, dtype='int32')
+        else:
+            sweep_number['data'] = np.array(scans, dtype='int32')
 
     # sweep_type
     scan_type = gfile.raw_scan0_group_attr('what', 'scan_type').lower()
@@ -168,7 +186,7 @@ def read_gamic(filename, field_names=None, additional_metadata=None,
 
     # range
     _range = filemetadata('range')
-    ngates = int(gfile.raw_scan0_group_attr('how', 'bin_count'))
+    ngates = gfile.ngates
     range_start = float(gfile.raw_scan0_group_attr('how', 'range_start'))
     #n_samples insertion
     range_samples = int(gfile.raw_scan0_group_attr('how', 'range_samples')) 
@@ -205,7 +223,7 @@ def read_gamic(filename, field_names=None, additional_metadata=None,
             continue
 
         field_dic = filemetadata(field_name)
-        field_dic['data'] = gfile.moment_data(group, 'float32')
+        field_dic['data'] = gfile.moment_data(group, 'float32', nthreads)
         field_dic['_FillValue'] = get_fillvalue()
 
         if valid_range_from_file:
@@ -299,7 +317,7 @@ def _get_instrument_params(gfile, filemetadata, pulse_width):
     pw_names = ['pulse_width_us', 'pulse_width_mks', 'pulse_width']
     pw_name = 'pulse_width_us'
     for pw_name in pw_names:
-        if gfile.is_attr_in_group('/scan0/how', pw_name):
+        if gfile.is_attr_in_scan0_group('how', pw_name):
             break
     if pw_name == 'pulse_width':
         if not pulse_width:
@@ -331,7 +349,7 @@ def _get_instrument_params(gfile, filemetadata, pulse_width):
     dic['data'] = gfile.sweep_expand(gfile.how_attrs('range', 'float32'))
     instrument_params['unambiguous_range'] = dic
 
-    if gfile.is_attr_in_group('/scan0/how/extended', 'nyquist_velocity'):
+    if gfile.is_attr_in_scan0_group('how/extended', 'nyquist_velocity'):
         dic = filemetadata('nyquist_velocity')
         dic['data'] = gfile.sweep_expand(
             gfile.how_ext_attrs('nyquist_velocity'))
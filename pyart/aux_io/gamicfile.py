@@ -13,7 +13,9 @@ GAMICFile class and utility functions.
 .. autosummary::
     :toctree: generated/
 
-    _get_gamic_sweep_data
+    _decode_gamic_sweeps
+    _decode_gamic_sweep
+    _gamic_scale_offset
 
 
 """
@@ -21,6 +23,8 @@ GAMICFile class and utility functions.
 import numpy as np
 import h5py
 
+from ..io.common import _run_in_threads
+
 
 class GAMICFile(object):
     """
@@ -30,15 +34,22 @@ class GAMICFile(object):
     ----------
     filename : str
         Filename of GAMIC HDF5 file.
+    scans : list or None, optional
+        Indices, 0-based, of the scans to access.  None (the default)
+        accesses all scans in the file.  The sweep based methods only read
+        from these scans and the scan0 methods read from the first of these
+        scans.
 
     Attributes
     ----------
     nsweeps : int
-        Number of sweeps (or scans) in the file.
+        Number of sweeps (or scans) accessed in the file.
     rays_per_sweep : array of int32
         Number of rays in each sweep.
     total_rays : int
         Total number of rays in all sweeps.
+    ngates : int
+        Largest number of gates (bins) in a sweep.
     start_ray, end_ray : array of int32
         Index of the first (start) and last (end) ray in each sweep, 0-based.
     _hfile : HDF5 file
@@ -48,13 +59,16 @@ class GAMICFile(object):
 
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, scans=None):
         """ initialize object. """
         self._hfile = h5py.File(filename, 'r')
-        self.nsweeps = self._hfile['what'].attrs['sets']
-        self._scans = ['scan%i' % (i) for i in range(self.nsweeps)]
+        if scans is None:
+            scans = range(self._hfile['what'].attrs['sets'])
+        self._scans = ['scan%i' % (i) for i in scans]
+        self.nsweeps = len(self._scans)
         self.rays_per_sweep = self.how_attrs('ray_count', 'int32')
         self.total_rays = sum(self.rays_per_sweep)
+        self.ngates = int(self.how_attrs('bin_count', 'int32').max())
         # starting and ending ray for each sweep
         self.start_ray = np.cumsum(np.append([0], self.rays_per_sweep[:-1]))
         self.end_ray = np.cumsum(self.rays_per_sweep) - 1
@@ -75,7 +89,7 @@ class GAMICFile(object):
 
     def is_file_single_scan_type(self):
         """ True is all scans are the same scan type, False otherwise. """
-        scan_type = self._hfile['scan0/what'].attrs['scan_type']
+        scan_type = self._hfile[self._scans[0]]['what'].attrs['scan_type']
         for scan in self._scans:
             if self._hfile[scan]['what'].attrs['scan_type'] != scan_type:
                 return False
@@ -99,8 +113,18 @@ class GAMICFile(object):
         return self._hfile[group].attrs[attr]
 
     def raw_scan0_group_attr(self, group, attr):
-        """ Return an attribute from the scan0 group with no reformatting. """
-        return self._hfile['/scan0'][group].attrs[attr]
+        """
+        Return an attribute from a group of the first scan accessed with no
+        reformatting.
+        """
+        return self._hfile[self._scans[0]][group].attrs[attr]
+
+    def is_attr_in_scan0_group(self, group, attr):
+        """
+        True if the attribute is present in a group of the first scan
+        accessed, False otherwise.
+        """
+        return attr in self._hfile[self._scans[0]][group].attrs
 
     # scan/sweep based attribute lookup
     def how_attrs(self, attr, dtype):
@@ -122,12 +146,17 @@ class GAMICFile(object):
 
     # misc looping
     def moment_groups(self):
-        """ Return a list of groups under scan0 where moments are stored. """
-        return [k for k in self._hfile['/scan0'] if k.startswith('moment_')]
+        """
+        Return a list of groups under the first scan accessed where moments
+        are stored.
+        """
+        return [k for k in self._hfile[self._scans[0]]
+                if k.startswith('moment_')]
 
     def moment_names(self, scan0_groups):
         """ Return a list of moment names for a list of scan0 groups. """
-        return [self._hfile['/scan0'][k].attrs['moment'].decode('utf-8') for
+        scan0 = self._hfile[self._scans[0]]
+        return [scan0[k].attrs['moment'].decode('utf-8') for
                 k in scan0_groups]
 
     def is_field_in_ray_header(self, field):
@@ -141,43 +170,69 @@ class GAMICFile(object):
             data[start:end+1] = self._hfile[scan]['ray_header'][field]
         return data
 
-    def moment_data(self, group, dtype):
-        """ Read in moment data from all sweeps. """
-        ngates = int(self._hfile['/scan0/how'].attrs['bin_count'])
-        data = np.ma.zeros((self.total_rays, ngates), dtype=dtype)
-        data[:] = np.ma.masked      # volume data initially all masked
-        for scan, start, end in zip(self._scans, self.start_ray, self.end_ray):
-            # read in sweep data if field exists in scan.
-            if group in self._hfile[scan]:
-                sweep_data = _get_gamic_sweep_data(self._hfile[scan][group])
-                data[start:end+1, :sweep_data.shape[1]] = sweep_data[:]
-        return data
+    def moment_data(self, group, dtype, nthreads=1):
+        """
+        Read in moment data from all sweeps.
+
+        The raw data of each sweep is read directly into a single volume
+        array which is decoded using nthreads threads.
+        """
+        shape = (self.total_rays, self.ngates)
+        data = np.zeros(shape, dtype=dtype)
+        mask = np.ones(shape, dtype=bool)   # volume data initially all masked
+
+        # read in sweep data if field exists in scan.
+        dsets = [(self._hfile[scan][group], start, end) for scan, start, end
+                 in zip(self._scans, self.start_ray, self.end_ray)
+                 if group in self._hfile[scan]]
+        if len(dsets) == 0:
+            return np.ma.masked_array(data, mask)
+        raw = np.zeros(shape, np.result_type(*[d.dtype for d, _, _ in dsets]))
+        sweeps = []
+        for dset, start, end in dsets:
+            sweep = np.s_[start:end+1, :dset.shape[1]]
+            dset.read_direct(raw, dest_sel=sweep)
+            scale, offset = _gamic_scale_offset(dset)
+            sweeps.append(
+                (raw[sweep], scale, offset, data[sweep], mask[sweep]))
+        _decode_gamic_sweeps(sweeps, nthreads)
+        return np.ma.masked_array(data, mask)
 
     def sweep_expand(self, arr, dtype='float32'):
         """ Expand an sweep indexed array to be ray indexed """
         return np.repeat(arr, self.rays_per_sweep).astype(dtype)
 
 
-def _get_gamic_sweep_data(group):
-    """ Get GAMIC HDF5 sweep data from an HDF5 group. """
-    dyn_range_min = group.attrs['dyn_range_min']
-    dyn_range_max = group.attrs['dyn_range_max']
-    raw_data = group[:]
-    fmt = group.attrs['format']
+def _decode_gamic_sweeps(sweeps, nthreads):
+    """
+    Decode sweeps dividing the sweeps between threads.
+
+    Each sweep is a tuple of the arguments to :py:func:`_decode_gamic_sweep`.
+    The raw data of the sweeps is read before decoding as h5py serializes
+    all access to the HDF5 library.
+    """
+    _run_in_threads(_decode_gamic_sweep, sweeps, nthreads)
+
+
+def _decode_gamic_sweep(raw, scale, offset, data, mask):
+    """ Decode raw GAMIC sweep data, 0 indicates a masked value. """
+    data[:] = raw * scale + offset
+    mask[:] = raw == 0
+
+
+def _gamic_scale_offset(dset):
+    """ Return the scale and offset of a GAMIC HDF5 moment dataset. """
+    dyn_range_min = dset.attrs['dyn_range_min']
+    dyn_range_max = dset.attrs['dyn_range_max']
+    fmt = dset.attrs['format']
     if fmt == b'UV16':
-        # unsigned 16-bit integer data, 0 indicates a masked value
-        assert raw_data.dtype == np.uint16
+        # unsigned 16-bit integer data
+        assert dset.dtype == np.uint16
         scale = (dyn_range_max - dyn_range_min) / 65535.
-        offset = dyn_range_min
-        sweep_data = np.ma.masked_array(
-            raw_data * scale + offset, mask=(raw_data == 0), dtype='float32')
     elif fmt == b'UV8':
-        # unsigned 8-bit integer data, 0 indicates a masked value
-        assert raw_data.dtype == np.uint8
+        # unsigned 8-bit integer data
+        assert dset.dtype == np.uint8
         scale = (dyn_range_max - dyn_range_min) / 255.
-        offset = dyn_range_min
-        sweep_data = np.ma.masked_array(
-            raw_data * scale + offset, mask=(raw_data == 0), dtype='float32')
     else:
         raise NotImplementedError('GAMIC data format: %s', fmt)
-    return sweep_data
+    return scale, dyn_range_min
@@ -9,7 +9,9 @@ Routines for reading ODIM_H5 files.
 
     read_odim_h5
     _to_str
-    _get_odim_h5_sweep_data
+    _read_odim_h5_field
+    _decode_odim_h5_sweeps
+    _decode_odim_h5_sweep
 
 """
 
@@ -24,6 +26,7 @@ except ImportError:
 
 from ..config import FileMetadata, get_fillvalue
 from ..io.common import make_time_unit_str, _test_arguments
+from ..io.common import _run_in_threads
 from ..core.radar import Radar
 from ..exceptions import MissingOptionalDependency
 
@@ -49,7 +52,8 @@ ODIM_H5_FIELD_NAMES = {
 
 
 def read_odim_h5(filename, field_names=None, additional_metadata=None,
-                 file_field_names=False, exclude_fields=None, **kwargs):
+                 file_field_names=False, exclude_fields=None,
+                 include_fields=None, scans=None, nthreads=1, **kwargs):
     """
     Read a ODIM_H5 file.
 
@@ -77,7 +81,19 @@ def read_odim_h5(filename, field_names=None, additional_metadata=None,
     exclude_fields : list or None, optional
         List of fields to exclude from the radar object. This is applied
         after the `file_field_names` and `field_names` parameters.
-
+    include_fields : list or None, optional
+        List of fields to include in the radar object, None (the default)
+        includes all fields not excluded.  This is applied after the
+        `file_field_names` and `field_names` parameters.  The HDF5 datasets
+        of fields which are not included are not read.
+    scans : list or None, optional
+        Indices, 0-based, of the sweeps (datasetN groups) to read from the
+        file.  None (the default) will read all sweeps.  The groups of other
+        sweeps are not read.
+    nthreads : int, optional
+        Number of threads used to decode the sweeps of each field.  The
+        data is read from the file by a single thread as h5py serializes
+        access to the HDF5 library.
 
     Returns
     -------
@@ -105,7 +121,8 @@ def read_odim_h5(filename, field_names=None, additional_metadata=None,
     if field_names is None:
         field_names = ODIM_H5_FIELD_NAMES
     filemetadata = FileMetadata('odim_h5', field_names, additional_metadata,
-                                file_field_names, exclude_fields)
+                                file_field_names, exclude_fields,
+                                include_fields)
 
     # open the file
     try:
@@ -122,6 +139,8 @@ def read_odim_h5(filename, field_names=None, additional_metadata=None,
     # begin with dataset
     datasets = [k for k in hfile if k.startswith('dataset')]
     datasets.sort(key=lambda x: int(x[7:]))
+    if scans is not None:
+        datasets = [datasets[i] for i in scans]
     nsweeps = len(datasets)
 
     # latitude, longitude and altitude
@@ -174,7 +193,10 @@ def read_odim_h5(filename, field_names=None, additional_metadata=None,
 
     # sweep_number
     sweep_number = filemetadata('sweep_number')
-    sweep_number['data'] = np.arange(nsweeps, dtype='int32')
+    if scans is None:
+        sweep_number['data'] = np.arange(nsweeps, dtype='int32')
+    else:
+        sweep_number['data'] = np.array(scans, dtype='int32')
 
     # sweep_mode
     sweep_mode = filemetadata('sweep_mode')
@@ -211,7 +233,7 @@ def read_odim_h5(filename, field_names=None, additional_metadata=None,
 
     # range
     _range = filemetadata('range')
-    if 'rstart' in hfile['dataset1/where'].attrs:
+    if 'rstart' in hfile[datasets[0]]['where'].attrs:
         # derive range from rstart and rscale attributes if available
 
         # check that the gate spacing is constant between sweeps
@@ -221,7 +243,8 @@ def read_odim_h5(filename, field_names=None, additional_metadata=None,
         rscale = [hfile[d]['where'].attrs['rscale'] for d in datasets]
         if any(rscale != rscale[0]):
             raise ValueError('range scale changes between sweeps')
-        nbins = int(hfile['dataset1']['where'].attrs['nbins'])
+        # sweeps may contain different number of bins, use the largest
+        nbins = max(int(hfile[d]['where'].attrs['nbins']) for d in datasets)
         _range['data'] = (np.arange(nbins, dtype='float32') * rscale[0] +
                           rstart[0] * 1000.)
         _range['meters_to_center_of_first_gate'] = rstart[0] * 1000.
@@ -237,7 +260,7 @@ def read_odim_h5(filename, field_names=None, additional_metadata=None,
         if any(max_range != max_range[0]):
             raise ValueError('maximum range changes between sweeps')
         # nbins is required
-        nbins = hfile['dataset1/data1/data'].shape[1]
+        nbins = hfile[datasets[0]]['data1']['data'].shape[1]
         _range['data'] = np.linspace(
             0, max_range[0] * 1000., nbins).astype('float32')
         _range['meters_to_center_of_first_gate'] = 0
@@ -311,30 +334,26 @@ def read_odim_h5(filename, field_names=None, additional_metadata=None,
 
     # fields
     fields = {}
-    h_field_keys = [k for k in hfile['dataset1'] if k.startswith('data')]
-    odim_fields = [hfile['dataset1'][d]['what'].attrs['quantity'] for d in
+    h_field_keys = [k for k in hfile[datasets[0]] if k.startswith('data')]
+    odim_fields = [hfile[datasets[0]][d]['what'].attrs['quantity'] for d in
                    h_field_keys]
     for odim_field, h_field_key in zip(odim_fields, h_field_keys):
         field_name = filemetadata.get_field_name(_to_str(odim_field))
         if field_name is None:
             continue
-        fdata = np.ma.zeros((total_rays, nbins), dtype='float32')
-        start = 0
-        # loop over the sweeps, copy data into correct location in data array
-        for dset, rays_in_sweep in zip(datasets, rays_per_sweep):
-            sweep_data = _get_odim_h5_sweep_data(hfile[dset][h_field_key])
-            sweep_nbins = sweep_data.shape[1]
-            fdata[start:start + rays_in_sweep, :sweep_nbins] = sweep_data[:]
-            start += rays_in_sweep
+        groups = [hfile[dset][h_field_key] for dset in datasets]
         # create field dictionary
         field_dic = filemetadata(field_name)
-        field_dic['data'] = fdata
+        field_dic['data'] = _read_odim_h5_field(
+            groups, rays_per_sweep, nbins, nthreads)
         field_dic['_FillValue'] = get_fillvalue()
         fields[field_name] = field_dic
 
     # instrument_parameters
     instrument_parameters = None
 
+    hfile.close()
+
     return Radar(
         _time, _range, fields, metadata, scan_type,
         latitude, longitude, altitude,
@@ -352,26 +371,58 @@ def _to_str(text):
         return text
 
 
-def _get_odim_h5_sweep_data(group):
-    """ Get ODIM_H5 sweet data from an HDF5 group. """
+def _read_odim_h5_field(groups, rays_per_sweep, nbins, nthreads=1):
+    """
+    Read the data of a field from the ODIM_H5 data groups of each sweep.
+
+    The raw data of each sweep is read directly into a single volume array
+    which is decoded sweep by sweep into a preallocated masked array.
+    """
+    total_rays = sum(rays_per_sweep)
+    dtype = np.result_type(*[group['data'].dtype for group in groups])
+    raw = np.zeros((total_rays, nbins), dtype=dtype)
+    data = np.zeros((total_rays, nbins), dtype='float32')
+    mask = np.zeros((total_rays, nbins), dtype=bool)
+
+    sweeps = []
+    start = 0
+    for group, rays_in_sweep in zip(groups, rays_per_sweep):
+        sweep_nbins = group['data'].shape[1]
+        if sweep_nbins > nbins:
+            raise ValueError(
+                'sweep contains %d bins, more than the %d range bins' %
+                (sweep_nbins, nbins))
+        sweep = np.s_[start:start + rays_in_sweep, :sweep_nbins]
+        group['data'].read_direct(raw, dest_sel=sweep)
+        attrs = dict(group['what'].attrs)
+        sweeps.append((raw[sweep], attrs, data[sweep], mask[sweep]))
+        start += rays_in_sweep
+    _decode_odim_h5_sweeps(sweeps, nthreads)
+    return np.ma.masked_array(data, mask)
+
+
+def _decode_odim_h5_sweeps(sweeps, nthreads):
+    """
+    Decode sweeps dividing the sweeps between threads.
+
+    Each sweep is a tuple of the arguments to
+    :py:func:`_decode_odim_h5_sweep`.  The raw data of the sweeps is read
+    before decoding as h5py serializes all access to the HDF5 library,
+    the decoding releases the GIL allowing the sweeps to be decoded
+    concurrently.
+    """
+    _run_in_threads(_decode_odim_h5_sweep, sweeps, nthreads)
+
 
-    # mask raw data
-    what = group['what']
-    raw_data = group['data'][:]
+def _decode_odim_h5_sweep(raw, attrs, data, mask):
+    """
+    Decode the raw data of an ODIM_H5 sweep into data and mask.
 
-    if 'nodata' in what.attrs:
-        nodata = what.attrs.get('nodata')
-        data = np.ma.masked_equal(raw_data, nodata)
-    else:
-        data = np.ma.masked_array(raw_data)
-    if 'undetect' in what.attrs:
-        undetect = what.attrs.get('undetect')
-        data[data == undetect] = np.ma.masked
-
-    offset = 0.0
-    gain = 1.0
-    if 'offset' in what.attrs:
-        offset = what.attrs.get('offset')
-    if 'gain' in what.attrs:
-        gain = what.attrs.get('gain')
-    return data * gain + offset
+    Gates with the nodata or undetect value are masked and the gain and
+    offset from the attributes of the what group, attrs, are applied.
+    """
+    if 'nodata' in attrs:
+        mask |= raw == attrs['nodata']
+    if 'undetect' in attrs:
+        mask |= raw == attrs['undetect']
+    data[:] = raw * attrs.get('gain', 1.0) + attrs.get('offset', 0.0)
@@ -0,0 +1,156 @@
+""" Unit Tests for Py-ART's aux_io/gamic_hdf5.py module. """
+
+import numpy as np
+from numpy.testing import assert_almost_equal, assert_array_equal
+import pytest
+
+import pyart
+from pyart.testing import InTemporaryDirectory
+
+pytestmark = pytest.mark.skipif(
+    not pyart.aux_io.gamic_hdf5._H5PY_AVAILABLE,
+    reason="h5py is not installed.")
+
+# rays and bins of each scan, the second scan has more bins than the first
+SCANS = [(36, 20), (36, 25), (18, 15)]
+MOMENTS = [(b'Zh', b'UV8', 'uint8', 255.),
+           (b'Vh', b'UV16', 'uint16', 65535.)]
+DYN_RANGE_MIN = -32.
+DYN_RANGE_MAX = 95.5
+
+
+def _make_gamic_file(filename):
+    """ Create a small GAMIC HDF5 file, return the raw moment data. """
+    import h5py
+    rng = np.random.RandomState(0)
+    raw = {}
+    with h5py.File(filename, 'w') as hfile:
+        what = hfile.create_group('what')
+        what.attrs['sets'] = len(SCANS)
+        what.attrs['object'] = np.bytes_('PVOL')
+        where = hfile.create_group('where')
+        where.attrs['lat'] = 45.
+        where.attrs['lon'] = 7.
+        where.attrs['height'] = 100.
+        how = hfile.create_group('how')
+        how.attrs['azimuth_beam'] = 1.
+        how.attrs['elevation_beam'] = 1.
+        for i, (nrays, nbins) in enumerate(SCANS):
+            scan = hfile.create_group('scan%d' % (i))
+            scan.create_group('what').attrs['scan_type'] = np.bytes_('PPI')
+            how = scan.create_group('how')
+            attrs = {
+                'ray_count': nrays, 'bin_count': nbins, 'range_start': 0.,
+                'range_samples': 1, 'range_step': 500.,
+                'radar_wave_length': 0.053, 'elevation': 0.5 + i,
+                'azimuth': 0., 'angle_step': 1., 'angle_sync': 1,
+                'scan_speed': 10., 'pulse_width_us': 0.8, 'PRF': 1000.,
+                'unfolding': 0, 'range': 150000., 'time_samples': 20}
+            for key, value in attrs.items():
+                how.attrs[key] = value
+            how.create_group('extended').attrs['nyquist_velocity'] = 8.
+            ray_header = np.zeros(nrays, dtype=[
+                ('timestamp', 'i8'), ('elevation_start', 'f4'),
+                ('elevation_stop', 'f4'), ('azimuth_start', 'f4'),
+                ('azimuth_stop', 'f4'), ('az_speed', 'f4')])
+            ray_header['timestamp'] = (
+                1577836800000000 + np.arange(nrays) * 100000)
+            ray_header['azimuth_start'] = np.arange(nrays) * 360. / nrays
+            ray_header['azimuth_stop'] = ray_header['azimuth_start'] + 1.
+            ray_header['elevation_start'] = 0.5 + i
+            ray_header['elevation_stop'] = 0.5 + i
+            scan.create_dataset('ray_header', data=ray_header)
+            for j, (name, fmt, dtype, _) in enumerate(MOMENTS):
+                if i == 2 and j == 1:
+                    continue    # moment not present in the last scan
+                data = rng.randint(0, 256, (nrays, nbins)).astype(dtype)
+                data[0, :2] = [0, 1]
+                moment = scan.create_dataset(
+                    'moment_%d' % (j), data=data, compression='gzip')
+                moment.attrs['moment'] = np.bytes_(name)
+                moment.attrs['format'] = np.bytes_(fmt)
+                moment.attrs['dyn_range_min'] = DYN_RANGE_MIN
+                moment.attrs['dyn_range_max'] = DYN_RANGE_MAX
+                moment.attrs['unit'] = np.bytes_('dBZ')
+                raw.setdefault(name.decode('ascii'), {})[i] = data
+    return raw
+
+
+def _expected(raw, scans, moment, nbins):
+    """ Return the expected field data of a moment for the scans. """
+    _, _, _, max_code = [m for m in MOMENTS if m[0] == moment.encode()][0]
+    scale = (DYN_RANGE_MAX - DYN_RANGE_MIN) / max_code
+    nrays = [SCANS[i][0] for i in scans]
+    expected = np.ma.masked_all((sum(nrays), nbins))
+    start = 0
+    for i, rays in zip(scans, nrays):
+        if i in raw[moment]:
+            data = raw[moment][i]
+            expected[start:start + rays, :data.shape[1]] = np.ma.masked_array(
+                data * scale + DYN_RANGE_MIN, mask=(data == 0))
+        start += rays
+    return expected
+
+
+def _assert_field_equal(data, expected):
+    """ Assert field data and masks are equal. """
+    assert data.dtype == np.float32
+    assert_array_equal(np.ma.getmaskarray(data),
+                       np.ma.getmaskarray(expected))
+    assert_almost_equal(data.filled(0), expected.filled(0), 4)
+
+
+def test_read_gamic():
+    with InTemporaryDirectory():
+        raw = _make_gamic_file('test.h5')
+        radar = pyart.aux_io.read_gamic('test.h5', file_field_names=True)
+    assert radar.nsweeps == 3
+    assert radar.nrays == 90
+    assert radar.ngates == 25   # largest scan
+    assert_array_equal(radar.sweep_number['data'], [0, 1, 2])
+    for moment in ['Zh', 'Vh']:
+        data = radar.fields[moment]['data']
+        _assert_field_equal(data, _expected(raw, [0, 1, 2], moment, 25))
+        # raw values of 0 are masked
+        assert np.all(data.mask[[0, 36], 0])
+        assert not np.any(data.mask[[0, 36], 1])
+    # moment missing from the last scan is masked
+    assert np.all(radar.fields['Vh']['data'].mask[72:])
+
+
+def test_read_gamic_include_fields():
+    with InTemporaryDirectory():
+        _make_gamic_file('test.h5')
+        radar = pyart.aux_io.read_gamic(
+            'test.h5', file_field_names=True, include_fields=['Vh'])
+    assert list(radar.fields) == ['Vh']
+
+
+def test_read_gamic_scans():
+    # the first selected scan has more bins than scan0
+    with InTemporaryDirectory():
+        raw = _make_gamic_file('test.h5')
+        radar = pyart.aux_io.read_gamic(
+            'test.h5', file_field_names=True, scans=[1, 2])
+    assert radar.nsweeps == 2
+    assert radar.nrays == 54
+    assert radar.ngates == 25
+    assert_array_equal(radar.sweep_number['data'], [1, 2])
+    assert_array_equal(radar.sweep_start_ray_index['data'], [0, 36])
+    assert_almost_equal(radar.fixed_angle['data'], [1.5, 2.5])
+    assert_almost_equal(radar.range['data'][[0, -1]], [0., 12000.])
+    for moment in ['Zh', 'Vh']:
+        _assert_field_equal(radar.fields[moment]['data'],
+                            _expected(raw, [1, 2], moment, 25))
+    assert np.all(radar.fields['Vh']['data'].mask[36:])
+
+
+def test_read_gamic_nthreads():
+    with InTemporaryDirectory():
+        _make_gamic_file('test.h5')
+        radar = pyart.aux_io.read_gamic('test.h5', file_field_names=True)
+        threaded = pyart.aux_io.read_gamic(
+            'test.h5', file_field_names=True, nthreads=3)
+    for moment in ['Zh', 'Vh']:
+        _assert_field_equal(
+            threaded.fields[moment]['data'], radar.fields[moment]['data'])
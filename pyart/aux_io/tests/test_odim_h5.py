@@ -0,0 +1,137 @@
+""" Unit Tests for Py-ART's aux_io/odim_h5.py module. """
+
+import numpy as np
+from numpy.testing import assert_almost_equal, assert_array_equal
+import pytest
+
+import pyart
+from pyart.testing import InTemporaryDirectory
+
+pytestmark = pytest.mark.skipif(
+    not pyart.aux_io.odim_h5._H5PY_AVAILABLE, reason="h5py is not installed.")
+
+# rays and bins of each sweep, quantity and dtype of each field
+SWEEPS = [(36, 20), (36, 15), (18, 25)]
+QUANTITIES = [(b'DBZH', 'uint8'), (b'VRADH', 'uint16')]
+GAIN = 0.5
+OFFSET = -32.
+NODATA = 255
+UNDETECT = 0
+
+
+def _make_odim_file(filename):
+    """ Create a small ODIM_H5 PVOL file, return the raw data. """
+    import h5py
+    rng = np.random.RandomState(0)
+    raw = {}
+    with h5py.File(filename, 'w') as hfile:
+        hfile.attrs['Conventions'] = np.bytes_('ODIM_H5/V2_2')
+        what = hfile.create_group('what')
+        what.attrs['object'] = np.bytes_('PVOL')
+        what.attrs['version'] = np.bytes_('H5rad 2.2')
+        what.attrs['source'] = np.bytes_('NOD:test')
+        where = hfile.create_group('where')
+        where.attrs['lat'] = 45.
+        where.attrs['lon'] = 7.
+        where.attrs['height'] = 100.
+        for i, (nrays, nbins) in enumerate(SWEEPS):
+            dset = hfile.create_group('dataset%d' % (i + 1))
+            where = dset.create_group('where')
+            where.attrs['nrays'] = nrays
+            where.attrs['nbins'] = nbins
+            where.attrs['rstart'] = 0.
+            where.attrs['rscale'] = 500.
+            where.attrs['elangle'] = 0.5 + i
+            what = dset.create_group('what')
+            what.attrs['startdate'] = np.bytes_('20200101')
+            what.attrs['starttime'] = np.bytes_('0000%02d' % (i * 10))
+            what.attrs['enddate'] = np.bytes_('20200101')
+            what.attrs['endtime'] = np.bytes_('0000%02d' % (i * 10 + 9))
+            for j, (quantity, dtype) in enumerate(QUANTITIES):
+                data = rng.randint(0, 256, (nrays, nbins)).astype(dtype)
+                data[0, :3] = [NODATA, UNDETECT, 1]
+                group = dset.create_group('data%d' % (j + 1))
+                group.create_dataset('data', data=data, compression='gzip')
+                what = group.create_group('what')
+                what.attrs['quantity'] = quantity
+                what.attrs['gain'] = GAIN
+                what.attrs['offset'] = OFFSET
+                what.attrs['nodata'] = float(NODATA)
+                what.attrs['undetect'] = float(UNDETECT)
+                raw.setdefault(quantity.decode('ascii'), []).append(data)
+    return raw
+
+
+def _expected(sweeps, nbins):
+    """ Return the expected field data from the raw data of sweeps. """
+    expected = np.ma.masked_all((sum(len(s) for s in sweeps), nbins))
+    start = 0
+    for sweep in sweeps:
+        sweep_data = np.ma.masked_array(
+            sweep * GAIN + OFFSET,
+            mask=(sweep == NODATA) | (sweep == UNDETECT))
+        expected[start:start + len(sweep), :sweep.shape[1]] = sweep_data
+        expected[start:start + len(sweep), sweep.shape[1]:] = 0
+        start += len(sweep)
+    return expected
+
+
+def _assert_field_equal(data, expected):
+    """ Assert field data and masks are equal. """
+    assert data.dtype == np.float32
+    assert_array_equal(np.ma.getmaskarray(data),
+                       np.ma.getmaskarray(expected))
+    assert_almost_equal(data.filled(0), expected.filled(0), 4)
+
+
+def test_read_odim_h5():
+    with InTemporaryDirectory():
+        raw = _make_odim_file('test.h5')
+        radar = pyart.aux_io.read_odim_h5('test.h5', file_field_names=True)
+    assert radar.nsweeps == 3
+    assert radar.nrays == 90
+    assert radar.ngates == 25   # largest sweep
+    assert_array_equal(radar.sweep_number['data'], [0, 1, 2])
+    assert_array_equal(radar.sweep_start_ray_index['data'], [0, 36, 72])
+    for field in ['DBZH', 'VRADH']:
+        data = radar.fields[field]['data']
+        _assert_field_equal(data, _expected(raw[field], 25))
+        # nodata and undetect values are masked
+        assert np.all(data.mask[[0, 36, 72], 0])
+        assert np.all(data.mask[[0, 36, 72], 1])
+        assert not np.any(data.mask[[0, 36, 72], 2])
+
+
+def test_read_odim_h5_include_fields():
+    with InTemporaryDirectory():
+        _make_odim_file('test.h5')
+        radar = pyart.aux_io.read_odim_h5(
+            'test.h5', file_field_names=True, include_fields=['VRADH'])
+    assert list(radar.fields) == ['VRADH']
+
+
+def test_read_odim_h5_scans():
+    with InTemporaryDirectory():
+        raw = _make_odim_file('test.h5')
+        radar = pyart.aux_io.read_odim_h5(
+            'test.h5', file_field_names=True, scans=[2, 1])
+    assert radar.nsweeps == 2
+    assert radar.nrays == 54
+    assert radar.ngates == 25
+    assert_array_equal(radar.sweep_number['data'], [2, 1])
+    assert_array_equal(radar.sweep_start_ray_index['data'], [0, 18])
+    assert_almost_equal(radar.fixed_angle['data'], [2.5, 1.5])
+    for field in ['DBZH', 'VRADH']:
+        expected = _expected([raw[field][2], raw[field][1]], 25)
+        _assert_field_equal(radar.fields[field]['data'], expected)
+
+
+def test_read_odim_h5_nthreads():
+    with InTemporaryDirectory():
+        _make_odim_file('test.h5')
+        radar = pyart.aux_io.read_odim_h5('test.h5', file_field_names=True)
+        threaded = pyart.aux_io.read_odim_h5(
+            'test.h5', file_field_names=True, nthreads=3)
+    for field in ['DBZH', 'VRADH']:
+        _assert_field_equal(
+            threaded.fields[field]['data'], radar.fields[field]['data'])
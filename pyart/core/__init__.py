@@ -16,6 +16,7 @@ Core classes
     Radar
     Grid
     HorizontalWindProfile
+    GateGeometryCache
 
 Coordinate transformations
 ==========================
@@ -31,11 +32,22 @@ Coordinate transformations
     geographic_to_cartesian
     geographic_to_cartesian_aeqd
 
+Serialization
+=============
+
+.. autosummary::
+    :toctree: generated/
+
+    dumps
+    loads
+
 """
 
 from .radar import Radar
 from .grid import Grid
 from .wind_profile import HorizontalWindProfile
+from .geometry_cache import GateGeometryCache
+from .serialization import dumps, loads
 
 from .transforms import antenna_to_cartesian
 from .transforms import antenna_vectors_to_cartesian
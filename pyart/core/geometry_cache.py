@@ -0,0 +1,233 @@
+"""
+pyart.core.geometry_cache
+=========================
+
+Caching of gate locations shared by radars with the same geometry.
+
+.. autosummary::
+    :toctree: generated/
+
+    _geometry_digest
+
+.. autosummary::
+    :toctree: generated/
+    :template: dev_template.rst
+
+    GateGeometryCache
+
+"""
+
+import collections
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from .transforms import antenna_vectors_to_cartesian, cartesian_to_geographic
+
+
+class GateGeometryCache(object):
+    """
+    A cache of gate locations for radars which share the same geometry.
+
+    Calculating the Cartesian and geographic locations of the gates in a
+    radar volume is expensive and consecutive volumes from a site often
+    share the same geometry.  The cache stores the locations calculated
+    for a geometry, identified by the range, azimuth and elevation data and,
+    for geographic locations and altitudes, the projection and radar
+    location, so that they are only calculated once.  Radar objects use the
+    cache when their gate_geometry_cache attribute, by default the class
+    attribute shared by all Radar objects, is set to a GateGeometryCache.
+
+    The cached arrays are shared between all users and are read-only.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of entries held in memory, each entry holds the
+        locations of one geometry and kind of coordinate.  The least
+        recently used entries are discarded.
+    dtype : dtype or None, optional
+        Data type of the cached locations.  Using float32 halves the memory
+        used by float64 locations at the cost of precision, approximately
+        1 m at 100 km.  None uses the data type of the calculated
+        locations.
+    cache_dir : str or None, optional
+        Directory in which the locations are stored as NumPy .npy files
+        which are memory mapped when used.  The files can be shared between
+        processes and sessions.  None keeps the locations in memory only.
+
+    """
+
+    def __init__(self, max_entries=16, dtype=None, cache_dir=None):
+        """ initalize. """
+        self.max_entries = max_entries
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.cache_dir = cache_dir
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """ Return the number of entries in memory. """
+        return len(self._entries)
+
+    def clear(self):
+        """ Remove all entries from memory, files on disk are kept. """
+        with self._lock:
+            self._entries.clear()
+
+    def gate_x_y_z(self, ranges, azimuths, elevations):
+        """
+        Return the Cartesian locations of gates.
+
+        Parameters
+        ----------
+        ranges, azimuths, elevations : array
+            Gate ranges in meters, ray azimuths and elevations in degrees.
+
+        Returns
+        -------
+        x, y, z : 2D array
+            Cartesian locations of the gates in meters, see
+            :py:func:`antenna_vectors_to_cartesian`.
+
+        """
+        key = 'xyz_' + _geometry_digest(ranges, azimuths, elevations)
+
+        def compute():
+            return antenna_vectors_to_cartesian(
+                ranges, azimuths, elevations, edges=False)
+
+        return self._lookup(key, compute, 3)
+
+    def gate_longitude_latitude(self, ranges, azimuths, elevations,
+                                projparams):
+        """
+        Return the geographic locations of gates.
+
+        Parameters
+        ----------
+        ranges, azimuths, elevations : array
+            Gate ranges in meters, ray azimuths and elevations in degrees.
+        projparams : dict
+            Projection parameters passed to
+            :py:func:`cartesian_to_geographic`, including the lon_0 and
+            lat_0 parameters when required.
+
+        Returns
+        -------
+        lon, lat : 2D array
+            Longitude and latitude of the gates in degrees.
+
+        """
+        key = 'lonlat_' + _geometry_digest(
+            ranges, azimuths, elevations,
+            extra=repr(sorted((k, str(v)) for k, v in projparams.items())))
+
+        def compute():
+            x, y, z = self.gate_x_y_z(ranges, azimuths, elevations)
+            return cartesian_to_geographic(x, y, projparams)
+
+        return self._lookup(key, compute, 2)
+
+    def gate_altitude(self, ranges, azimuths, elevations, altitude):
+        """
+        Return the altitude of gates.
+
+        Parameters
+        ----------
+        ranges, azimuths, elevations : array
+            Gate ranges in meters, ray azimuths and elevations in degrees.
+        altitude : array
+            Altitude of the radar in meters.
+
+        Returns
+        -------
+        gate_altitude : 2D array
+            Altitude of the gates in meters.
+
+        """
+        altitude = np.asarray(altitude)
+        key = 'alt_' + _geometry_digest(
+            ranges, azimuths, elevations, altitude)
+
+        def compute():
+            x, y, z = self.gate_x_y_z(ranges, azimuths, elevations)
+            return (altitude + z, )
+
+        return self._lookup(key, compute, 1)[0]
+
+    def _lookup(self, key, compute, ncoords):
+        """
+        Return the arrays of an entry, calculating them using compute if
+        they are not in memory or on disk.
+        """
+        if self.dtype is not None:
+            key = '%s_%s' % (key, self.dtype.str[1:])
+        with self._lock:
+            arrays = self._entries.pop(key, None)
+            if arrays is not None:
+                self._entries[key] = arrays
+                return arrays
+
+        arrays = None
+        if self.cache_dir is not None:
+            arrays = self._load(key, ncoords)
+        if arrays is None:
+            arrays = tuple(np.asarray(a, dtype=self.dtype)
+                           for a in compute())
+            for array in arrays:
+                array.flags.writeable = False
+            if self.cache_dir is not None:
+                arrays = self._save(key, arrays)
+
+        with self._lock:
+            self._entries[key] = arrays
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return arrays
+
+    def _filenames(self, key, ncoords):
+        """ Return the filenames of the arrays of an entry on disk. """
+        return [os.path.join(self.cache_dir, '%s_%d.npy' % (key, i))
+                for i in range(ncoords)]
+
+    def _load(self, key, ncoords):
+        """ Memory map the arrays of an entry, None if not on disk. """
+        filenames = self._filenames(key, ncoords)
+        if not all(os.path.exists(f) for f in filenames):
+            return None
+        return tuple(np.load(f, mmap_mode='r') for f in filenames)
+
+    def _save(self, key, arrays):
+        """ Save the arrays of an entry and return them memory mapped. """
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        filenames = self._filenames(key, len(arrays))
+        for filename, array in zip(filenames, arrays):
+            # write to a temporary file and rename so that other processes
+            # never read a partially written file
+            tmp_filename = '%s.%d.tmp' % (filename, os.getpid())
+            with open(tmp_filename, 'wb') as f:
+                np.save(f, array)
+            os.rename(tmp_filename, filename)
+        return tuple(np.load(f, mmap_mode='r') for f in filenames)
+
+
+def _geometry_digest(ranges, azimuths, elevations, altitude=None,
+                     extra=''):
+    """ Return a hex digest identifying a radar geometry. """
+    digest = hashlib.sha1()
+    arrays = [ranges, azimuths, elevations]
+    if altitude is not None:
+        arrays.append(altitude)
+    for array in arrays:
+        # the data type determines that of the calculated locations
+        array = np.ma.getdata(array)
+        digest.update(array.dtype.str.encode('ascii'))
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        digest.update(str(array.shape).encode('ascii'))
+        digest.update(array.tobytes())
+    digest.update(extra.encode('utf-8'))
+    return digest.hexdigest()
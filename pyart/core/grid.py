@@ -31,6 +31,7 @@ except ImportError:
 
 from ..config import get_metadata
 from ..lazydict import LazyLoadDict
+from .serialization import _compact_state
 from .transforms import cartesian_to_geographic
 from .transforms import cartesian_vectors_to_geographic
 
@@ -152,7 +153,8 @@ class Grid(object):
         del state['point_latitude']
         del state['point_longitude']
         del state['point_altitude']
-        return state
+        # masked arrays are pickled as their data and mask arrays
+        return _compact_state(state)
 
     def __setstate__(self, state):
         """ Restore unpicklable entries from pickled object. """
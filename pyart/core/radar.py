@@ -30,6 +30,7 @@ from netCDF4 import num2date, date2num
 
 from ..config import get_metadata
 from ..lazydict import LazyLoadDict
+from .serialization import _compact_state
 from .transforms import antenna_vectors_to_cartesian, cartesian_to_geographic
 
 
@@ -173,9 +174,17 @@ class Radar(object):
         Number of rays in the volume.
     nsweeps : int
         Number of sweep in the volume.
+    gate_geometry_cache : GateGeometryCache or None
+        Cache used to calculate the gate_x, gate_y, gate_z, gate_longitude,
+        gate_latitude and gate_altitude data, None calculates the data for
+        each Radar object.  This is a class attribute shared by all Radar
+        objects unless set on an instance.
 
     """
 
+    # GateGeometryCache shared by all radars, None for no caching
+    gate_geometry_cache = None
+
     def __init__(self, time, _range, fields, metadata, scan_type,
                  latitude, longitude, altitude,
 
@@ -259,7 +268,8 @@ class Radar(object):
         del state['gate_longitude']
         del state['gate_latitude']
         del state['gate_altitude']
-        return state
+        # masked arrays are pickled as their data and mask arrays
+        return _compact_state(state)
 
     def __setstate__(self, state):
         """ Restore unpicklable entries from pickled object. """
@@ -406,12 +416,20 @@ class Radar(object):
         Returns
         -------
         data : array
-            Array containing data for the requested sweep and field.
+            Array containing data for the requested sweep and field.  Only
+            the data for the requested sweep is loaded from fields whose
+            loading is delayed if the reader supports partial loading, in
+            this case the field data is not loaded and the returned array is
+            not a view.
 
         """
         self.check_field_exists(field_name)
         s = self.get_slice(sweep)
-        data = self.fields[field_name]['data'][s]
+        field_dic = self.fields[field_name]
+        if isinstance(field_dic, LazyLoadDict):
+            data = field_dic.get_partial('data', s)
+        else:
+            data = field_dic['data'][s]
         if copy:
             return data.copy()
         else:
@@ -900,8 +918,12 @@ def _gate_data_factory(radar, coordinate):
         ranges = radar.range['data']
         azimuths = radar.azimuth['data']
         elevations = radar.elevation['data']
-        cartesian_coords = antenna_vectors_to_cartesian(
-            ranges, azimuths, elevations, edges=False)
+        cache = radar.gate_geometry_cache
+        if cache is None:
+            cartesian_coords = antenna_vectors_to_cartesian(
+                ranges, azimuths, elevations, edges=False)
+        else:
+            cartesian_coords = cache.gate_x_y_z(ranges, azimuths, elevations)
         # load x, y, and z data except for the coordinate in question
         if coordinate != 0:
             radar.gate_x['data'] = cartesian_coords[0]
@@ -917,13 +939,19 @@ def _gate_lon_lat_data_factory(radar, coordinate):
     """ Return a function which returns the geographic locations of gates. """
     def _gate_lon_lat_data():
         """ The function which returns the geographic locations gates. """
-        x = radar.gate_x['data']
-        y = radar.gate_y['data']
         projparams = radar.projection.copy()
         if projparams.pop('_include_lon_0_lat_0', False):
             projparams['lon_0'] = radar.longitude['data'][0]
             projparams['lat_0'] = radar.latitude['data'][0]
-        geographic_coords = cartesian_to_geographic(x, y, projparams)
+        cache = radar.gate_geometry_cache
+        if cache is None:
+            x = radar.gate_x['data']
+            y = radar.gate_y['data']
+            geographic_coords = cartesian_to_geographic(x, y, projparams)
+        else:
+            geographic_coords = cache.gate_longitude_latitude(
+                radar.range['data'], radar.azimuth['data'],
+                radar.elevation['data'], projparams)
         # set the other geographic coordinate
         if coordinate == 0:
             radar.gate_latitude['data'] = geographic_coords[1]
@@ -937,5 +965,10 @@ def _gate_altitude_data_factory(radar):
     """ Return a function which returns the gate altitudes. """
     def _gate_altitude_data():
         """ The function which returns the gate altitudes. """
-        return radar.altitude['data'] + radar.gate_z['data']
+        cache = radar.gate_geometry_cache
+        if cache is None:
+            return radar.altitude['data'] + radar.gate_z['data']
+        return cache.gate_altitude(
+            radar.range['data'], radar.azimuth['data'],
+            radar.elevation['data'], radar.altitude['data'])
     return _gate_altitude_data
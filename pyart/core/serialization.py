@@ -0,0 +1,155 @@
+"""
+pyart.core.serialization
+========================
+
+Compact serialization of Radar and Grid objects.
+
+.. autosummary::
+    :toctree: generated/
+
+    dumps
+    loads
+    _compact_state
+    _compact_value
+    _rebuild_masked_array
+
+.. autosummary::
+    :toctree: generated/
+    :template: dev_template.rst
+
+    _MaskedArrayParts
+
+"""
+
+import pickle
+
+import numpy as np
+
+try:
+    # pickle protocol 5 is included in Python 3.8 and later, and available
+    # for earlier versions from the pickle5 backport
+    if pickle.HIGHEST_PROTOCOL >= 5:
+        _pickle5 = pickle
+    else:
+        import pickle5 as _pickle5
+    _PICKLE5_AVAILABLE = True
+except ImportError:
+    _PICKLE5_AVAILABLE = False
+
+from ..lazydict import LazyLoadDict
+
+
+def dumps(obj):
+    """
+    Serialize an object, a Radar or Grid for example, with the array data
+    held in out-of-band buffers.
+
+    The field data, masks and coordinate arrays of the object are not copied
+    into the returned bytes, rather a list of buffers which reference the
+    memory of the arrays is returned.  These buffers can be sent to another
+    process, for example by writing them to shared memory or a socket,
+    without copying.  Pickle protocol 5, Python 3.8 or the pickle5 package,
+    is required for out-of-band buffers, without it the arrays are included
+    in the returned bytes and the list of buffers is empty.
+
+    Parameters
+    ----------
+    obj : object
+        Object to serialize.
+
+    Returns
+    -------
+    data : bytes
+        Serialized object, less the out-of-band buffers.
+    buffers : list
+        Buffers of the array data, in the order expected by :py:func:`loads`.
+
+    """
+    if not _PICKLE5_AVAILABLE:
+        return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), []
+    buffers = []
+    data = _pickle5.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    return data, [buf.raw() for buf in buffers]
+
+
+def loads(data, buffers=()):
+    """
+    Deserialize an object serialized with :py:func:`dumps`.
+
+    Arrays are created from the buffers without copying, they reference
+    the memory of the buffers and are read-only if the buffers are.
+
+    Parameters
+    ----------
+    data : bytes
+        Serialized object.
+    buffers : list
+        Out-of-band buffers returned by :py:func:`dumps`.
+
+    Returns
+    -------
+    obj : object
+        Deserialized object.
+
+    """
+    if not _PICKLE5_AVAILABLE:
+        return pickle.loads(data)
+    return _pickle5.loads(data, buffers=buffers)
+
+
+def _compact_state(state):
+    """
+    Return a copy of a Radar or Grid state with the masked arrays replaced.
+
+    Masked arrays pickle their data and mask as bytes, copying them.  In
+    the returned state they are replaced by _MaskedArrayParts which pickle
+    the data and mask as ndarrays, which are not copied when pickled with
+    out-of-band buffers.  The original state is not modified.
+    """
+    return dict((k, _compact_value(v)) for k, v in state.items())
+
+
+def _compact_value(value):
+    """ Return a value with masked arrays replaced by _MaskedArrayParts. """
+    if isinstance(value, np.ma.MaskedArray):
+        return _MaskedArrayParts(value)
+    if isinstance(value, LazyLoadDict):
+        # lazy keys are left as is and are not evaluated
+        lazydic = value.copy()
+        for key, item in value._dic.items():
+            lazydic._dic[key] = _compact_value(item)
+        return lazydic
+    if type(value) is dict:
+        return dict((k, _compact_value(v)) for k, v in value.items())
+    return value
+
+
+class _MaskedArrayParts(object):
+    """
+    The data, mask and fill value of a masked array, which unpickle as a
+    masked array.
+
+    Parameters
+    ----------
+    array : MaskedArray
+        Masked array, the data and mask are referenced not copied.
+
+    """
+
+    def __init__(self, array):
+        """ initialize the object. """
+        self.data = np.ma.getdata(array)
+        self.mask = np.ma.getmask(array)
+        self.fill_value = array._fill_value
+
+    def __reduce__(self):
+        """ Return the arguments which rebuild the masked array. """
+        return (_rebuild_masked_array, (self.data, self.mask, self.fill_value))
+
+
+def _rebuild_masked_array(data, mask, fill_value):
+    """ Return a masked array from its parts without copying them. """
+    array = np.ma.MaskedArray(data, mask=mask, copy=False)
+    # set directly to restore the fill value exactly as it was
+    array._fill_value = fill_value
+    return array
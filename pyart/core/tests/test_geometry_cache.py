@@ -0,0 +1,91 @@
+""" Unit Tests for Py-ART's core/geometry_cache.py module. """
+
+import os
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+
+import pyart
+from pyart.core import GateGeometryCache
+
+
+def test_gate_x_y_z():
+    radar = pyart.testing.make_target_radar()
+    cache = GateGeometryCache()
+    args = (radar.range['data'], radar.azimuth['data'],
+            radar.elevation['data'])
+    x, y, z = cache.gate_x_y_z(*args)
+    assert_array_equal(x, radar.gate_x['data'])
+    assert_array_equal(y, radar.gate_y['data'])
+    assert_array_equal(z, radar.gate_z['data'])
+    assert not x.flags.writeable
+
+    # same geometry returns the same arrays
+    x2, y2, z2 = cache.gate_x_y_z(*args)
+    assert x2 is x
+    assert len(cache) == 1
+
+    # different geometry calculates new locations
+    x3, y3, z3 = cache.gate_x_y_z(args[0] * 2, args[1], args[2])
+    assert x3 is not x
+    assert_allclose(x3[:, :25], x[:, ::2])
+    assert len(cache) == 2
+
+
+def test_max_entries_and_dtype():
+    radar = pyart.testing.make_target_radar()
+    cache = GateGeometryCache(max_entries=1, dtype='float32')
+    args = (radar.range['data'], radar.azimuth['data'],
+            radar.elevation['data'])
+    x, y, z = cache.gate_x_y_z(*args)
+    assert x.dtype == np.float32
+    assert_allclose(x, radar.gate_x['data'], atol=1e-2)
+    cache.gate_x_y_z(args[0] + 1, args[1], args[2])
+    assert len(cache) == 1
+    assert cache.gate_x_y_z(*args)[0] is not x
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_radar_gate_geometry_cache():
+    radar = pyart.testing.make_target_radar()
+    radar2 = pyart.testing.make_target_radar()
+    cache = GateGeometryCache()
+    radar2.gate_geometry_cache = cache
+    for attr in ['gate_x', 'gate_y', 'gate_z', 'gate_longitude',
+                 'gate_latitude', 'gate_altitude']:
+        assert_allclose(getattr(radar2, attr)['data'],
+                        getattr(radar, attr)['data'])
+    assert len(cache) == 3
+
+    # radars with the same geometry share the cached locations
+    radar3 = pyart.testing.make_target_radar()
+    radar3.gate_geometry_cache = cache
+    assert radar3.gate_latitude['data'] is radar2.gate_latitude['data']
+    assert radar3.gate_altitude['data'] is radar2.gate_altitude['data']
+
+    # location is part of the geographic key
+    radar3.latitude['data'][0] += 1.
+    radar3.init_gate_longitude_latitude()
+    assert_allclose(radar3.gate_latitude['data'][0, 0],
+                    radar2.gate_latitude['data'][0, 0] + 1.)
+    assert len(cache) == 4
+
+
+def test_cache_dir():
+    radar = pyart.testing.make_target_radar()
+    args = (radar.range['data'], radar.azimuth['data'],
+            radar.elevation['data'])
+    with pyart.testing.InTemporaryDirectory():
+        cache = GateGeometryCache(cache_dir='geometry')
+        x, y, z = cache.gate_x_y_z(*args)
+        assert isinstance(x, np.memmap)
+        assert len(os.listdir('geometry')) == 3
+        assert_array_equal(x, radar.gate_x['data'])
+
+        # a new cache uses the files on disk
+        cache2 = GateGeometryCache(cache_dir='geometry')
+        x2, y2, z2 = cache2.gate_x_y_z(*args)
+        assert isinstance(x2, np.memmap)
+        assert_array_equal(z2, radar.gate_z['data'])
+        del x, y, z, x2, y2, z2
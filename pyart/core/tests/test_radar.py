@@ -11,6 +11,7 @@ import inspect
 
 import numpy as np
 from numpy.testing import assert_allclose, assert_almost_equal
+from numpy.testing import assert_array_equal
 import pytest
 
 import pyart
@@ -303,6 +304,42 @@ def test_get_methods():
     pytest.raises(Exception, radar.get_nyquist_vel, 0)
 
 
+def test_get_field_lazy():
+
+    class SliceableData(object):
+        """ Callable which records the parts of the data requested. """
+
+        def __init__(self, data):
+            self.data = data
+            self.requests = []
+
+        def __call__(self):
+            self.requests.append(slice(None))
+            return self.data
+
+        def __getitem__(self, key):
+            self.requests.append(key)
+            return self.data[key]
+
+    radar = pyart.testing.make_empty_ppi_radar(30, 20, 5)
+    data = np.arange(100 * 30, dtype=np.float32).reshape(100, 30)
+    lazy_data = SliceableData(data)
+    field_dic = pyart.lazydict.LazyLoadDict({})
+    field_dic.set_lazy('data', lazy_data)
+    radar.fields['reflectivity'] = field_dic
+
+    # only the rays of the sweep are requested, the field remains lazy
+    assert_array_equal(radar.get_field(1, 'reflectivity'), data[20:40])
+    assert lazy_data.requests == [slice(20, 40)]
+    assert 'data' in field_dic._lazyload
+    assert_array_equal(field_dic.get_partial('data', 5), data[5])
+
+    # once loaded the field is sliced
+    assert_array_equal(field_dic['data'], data)
+    assert_array_equal(radar.get_field(2, 'reflectivity'), data[40:60])
+    assert lazy_data.requests == [slice(20, 40), 5, slice(None)]
+
+
 def test_extract_sweeps():
     radar = pyart.testing.make_empty_ppi_radar(100, 360, 3)
     radar.fields['reflectivity'] = {'data': np.zeros((1080, 100))}
@@ -0,0 +1,67 @@
+""" Unit Tests for Py-ART's core/serialization.py module. """
+
+import pickle
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+import pyart
+from pyart.core.serialization import _compact_state, _MaskedArrayParts
+from pyart.lazydict import LazyLoadDict
+
+
+def make_radar():
+    radar = pyart.testing.make_target_radar()
+    data = radar.fields['reflectivity']['data']
+    radar.fields['reflectivity']['data'] = np.ma.masked_greater(data, 30)
+    return radar
+
+
+def check_radar(radar, radar_new):
+    field = radar.fields['reflectivity']['data']
+    field_new = radar_new.fields['reflectivity']['data']
+    assert isinstance(field_new, np.ma.MaskedArray)
+    assert_array_equal(field_new, field)
+    assert_array_equal(field_new.mask, field.mask)
+    assert field_new.fill_value == field.fill_value
+    assert 'data' in radar_new.gate_x
+
+
+def test_radar_pickle_masked_fields():
+    radar = make_radar()
+    radar_new = pickle.loads(pickle.dumps(radar, pickle.HIGHEST_PROTOCOL))
+    check_radar(radar, radar_new)
+
+
+def test_dumps_loads():
+    radar = make_radar()
+    data, buffers = pyart.core.dumps(radar)
+    if pyart.core.serialization._PICKLE5_AVAILABLE:
+        assert len(buffers) > 0
+        # the field data is not included in the serialized bytes
+        assert len(data) < radar.fields['reflectivity']['data'].nbytes
+    radar_new = pyart.core.loads(data, buffers)
+    check_radar(radar, radar_new)
+
+
+def test_dumps_loads_grid():
+    grid = pyart.testing.make_target_grid()
+    data, buffers = pyart.core.dumps(grid)
+    grid_new = pyart.core.loads(data, buffers)
+    assert_array_equal(grid_new.fields['reflectivity']['data'],
+                       grid.fields['reflectivity']['data'])
+
+
+def test_compact_state():
+    array = np.ma.masked_less(np.arange(5.), 2)
+    lazydic = LazyLoadDict({'data': array})
+    lazydic.set_lazy('lazy', lambda: 1)
+    state = {'a': {'data': array}, 'b': lazydic, 'c': 1}
+    compact = _compact_state(state)
+    assert isinstance(compact['a']['data'], _MaskedArrayParts)
+    assert isinstance(compact['b']._dic['data'], _MaskedArrayParts)
+    assert 'lazy' in compact['b']._lazyload
+    assert compact['c'] == 1
+    # original state is not modified
+    assert state['a']['data'] is array
+    assert lazydic._dic['data'] is array
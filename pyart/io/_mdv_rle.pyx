@@ -0,0 +1,74 @@
+"""
+pyart.io._mdv_rle
+=================
+
+Cython routine for decoding run length encoded MDV data.
+
+.. autosummary::
+    :toctree: generated/
+
+    decode_rle8
+
+"""
+
+import numpy as np
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def decode_rle8(const unsigned char[::1] data, int key,
+                Py_ssize_t decompr_size):
+    """
+    decode_rle8(data, key, decompr_size)
+
+    Decode 8-bit MDV run length encoded data.
+
+    A key byte is followed by a count and value, the value is repeated count
+    times, all other bytes are literal values.  Decoding releases the GIL.
+    Data which is not encoded, as occurs in truncated files, is set to zero
+    and data beyond decompr_size is discarded.
+
+    Parameters
+    ----------
+    data : 1D uint8 array
+        Run length encoded data.
+    key : int
+        Key byte which starts a run.
+    decompr_size : int
+        Number of bytes in the decoded data.
+
+    Returns
+    -------
+    out : 1D uint8 array
+        Decoded data.
+
+    """
+    cdef Py_ssize_t data_ptr = 0
+    cdef Py_ssize_t out_ptr = 0
+    cdef Py_ssize_t ndata = data.shape[0]
+    cdef Py_ssize_t end
+    cdef unsigned char value
+
+    out = np.zeros((decompr_size, ), dtype='uint8')
+    cdef unsigned char[::1] out_view = out
+
+    with nogil:
+        while data_ptr < ndata and out_ptr < decompr_size:
+            if data[data_ptr] != key:
+                # not encoded
+                out_view[out_ptr] = data[data_ptr]
+                data_ptr += 1
+                out_ptr += 1
+                continue
+            # run length encoded, a truncated run ends the data
+            if data_ptr + 2 >= ndata:
+                break
+            end = min(out_ptr + data[data_ptr + 1], decompr_size)
+            value = data[data_ptr + 2]
+            while out_ptr < end:
+                out_view[out_ptr] = value
+                out_ptr += 1
+            data_ptr += 3
+    return out
@@ -25,6 +25,8 @@ A class and supporting functions for reading Sigmet (raw format) files.
 """
 from __future__ import print_function
 
+import io
+import mmap
 import struct
 import datetime
 import warnings
@@ -40,6 +42,10 @@ cdef class SigmetFile:
     """
     A class for accessing data from Sigmet (IRIS) product files.
 
+    Files on disk are memory mapped and the data records are decoded
+    directly from the mapping without being copied.  Other file-like
+    objects, for example compressed files, are read record by record.
+
     Parameters
     ----------
     filename : str
@@ -64,6 +70,8 @@ cdef class SigmetFile:
         Number of data types in the file.
     _fh : file
         Open file being read.
+    _mmap : mmap or None
+        Memory map of the file, None when the file could not be mapped.
     _raw_product_bhdrs : list
         List of raw_product_bhdr structure dictionaries seperated by sweep.
         None when data has not yet been read.
@@ -71,11 +79,12 @@ cdef class SigmetFile:
     """
     cdef public debug, product_hdr, ingest_header, ingest_data_headers, \
         data_types, data_type_names, ndata_types,
-    cdef public _fh, _raw_product_bhdrs
+    cdef public _fh, _mmap, _raw_product_bhdrs
 
     cdef np.ndarray _rbuf
     cdef np.int16_t * _rbuf_p   # hack for fast indexing of _rbuf
     cdef public int _rbuf_pos, _record_number
+    cdef public long _mmap_pos
 
     def __init__(self, filename, debug=False):
         """ initalize the object. """
@@ -97,6 +106,17 @@ cdef class SigmetFile:
         self.ndata_types = len(self.data_types)
         self.data_type_names = [SIGMET_DATA_TYPES[i] for i in self.data_types]
 
+        # memory map files on disk, compressed and other file-like objects
+        # cannot be mapped as the bytes of the file are not the records.
+        self._mmap = None
+        if isinstance(fh, io.BufferedReader):
+            try:
+                self._mmap = mmap.mmap(
+                    fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, EnvironmentError):
+                self._mmap = None
+        self._mmap_pos = fh.tell()
+
         # set attributes
         self.ingest_data_headers = None
         self._fh = fh
@@ -116,9 +136,18 @@ cdef class SigmetFile:
 
     def close(self):
         """ Close the file. """
+        self._rbuf = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # arrays still reference the mapping, it is released when
+                # they are garbage collected.
+                pass
+            self._mmap = None
         self._fh.close()
 
-    def read_data(self, full_xhdr=False):
+    def read_data(self, full_xhdr=False, raw_data=False):
         """
         Read all data from the file.
 
@@ -129,6 +158,12 @@ cdef class SigmetFile:
             ones.  False will return a length 1 extended header converted to
             int32.  This is useful when the file contains a customer specified
             extended header (for example aircraft radar).
+        raw_data : bool, optional
+            True to return the raw data of each data type as int16 arrays
+            which are views of a single volume array, the data can be
+            converted using the :py:func:`convert_data` method.  False, the
+            default, returns the converted data.  The full_xhdr parameter
+            is ignored when True.
 
         Returns
         -------
@@ -142,7 +177,103 @@ cdef class SigmetFile:
             -1 in the 'nbins' array.
 
         """
+        raw_volume = self._read_raw_volume()
+
+        data = {}
+        metadata = {}
+        for i, name in enumerate(self.data_type_names):
+            az0, el0, az1, el1, ray_nbins, ray_time, prf_flag = (
+                _parse_ray_headers(raw_volume[:, :, i, :6]))
+            metadata[name] = {
+                'azimuth_0': az0.astype('float32'),
+                'elevation_0': el0.astype('float32'),
+                'azimuth_1': az1.astype('float32'),
+                'elevation_1': el1.astype('float32'),
+                'nbins': ray_nbins.astype('int16'),
+                'time': ray_time.astype('uint16'),
+                'prf_flag': prf_flag.astype('int16')}
+
+            raw = raw_volume[:, :, i, 6:]
+            if raw_data:
+                data[name] = raw
+            else:
+                data[name] = self.convert_data(
+                    name, raw, metadata[name]['nbins'], full_xhdr)
+        return data, metadata
+
+    def convert_data(self, name, raw, nbins, full_xhdr=False):
+        """
+        Convert raw data of a data type to floating point values.
+
+        Parameters
+        ----------
+        name : str
+            Data type name.
+        raw : array
+            Raw int16 data of the data type as returned by
+            :py:func:`read_data` with raw_data set to True, the rays may
+            be reordered or selected.
+        nbins : array
+            Number of bins in each ray, the 'nbins' metadata for the rays
+            in raw.
+        full_xhdr : bool
+            True to return a copy of the raw extended headers, False to
+            return a length 1 extended header converted to int32.  Only
+            used for the XHDR data type.
+
+        Returns
+        -------
+        data : array
+            Converted data, a masked array for all data types except XHDR.
+
+        """
+        data_type = self.data_types[self.data_type_names.index(name)]
+        if data_type == 0 and full_xhdr:
+            return np.array(raw)
+        data = convert_sigmet_data(data_type, raw, nbins)
+        nyquist = self.nyquist_scale(name)
+        if nyquist is not None:
+            data *= nyquist
+        return data
+
+    def nyquist_scale(self, name):
+        """
+        Return the Nyquist velocity which scales the converted data of a
+        data type, None when the data type is not scaled.
+        """
+        # the scaling is determined here so that the product_hdr does not
+        # need to be accessed at lower abstraction layers.
+        if name not in ['VEL', 'WIDTH']:
+            return None
+        wavelength_cm = self.product_hdr['product_end']['wavelength']
+        prt_value = 1. / self.product_hdr['product_end']['prf']
+        if name == 'VEL':
+            # scale 1-byte velocity by the Nyquist (section 4.3.29)
+            task_config = self.ingest_header['task_configuration']
+            multi_prf_flag = task_config['task_dsp_info']['multi_prf_flag']
+            if multi_prf_flag > 3 or multi_prf_flag < 0:
+                multiplier = 1  # multiplier not defined in IRIS manual
+            else:
+                multiplier = [1, 2, 3, 4][multi_prf_flag]
+        else:
+            # The IRIS Programmer's Manual indicates 1-byte width format data
+            # should be scaled by the unambiguous velocity, twice the nyquist,
+            # (section 4.3.35) but both RSL and RadX scale this data by the
+            # nyquist.  Therefore to agree with these two packages the width
+            # is scaled by the nyquist.
+            multiplier = 1
+        return wavelength_cm / (10000.0 * 4.0 * prt_value) * multiplier
+
+    def _read_raw_volume(self):
+        """
+        Read the raw data of all sweeps into a single volume array.
 
+        The volume is sized from the ingest headers and each ray is decoded
+        directly into it.  The returned array has a shape of (nsweeps,
+        nrays, ndata_types, nbins + 6), the first 6 words of each ray are
+        the ray header.  When the file is truncated only the sweeps read
+        are returned.
+        """
         # determine size of data
         nsweeps = self.ingest_header['task_configuration'][
             'task_scan_info']['number_sweeps']
@@ -150,178 +281,110 @@ cdef class SigmetFile:
         nrays = self.ingest_header['ingest_configuration'][
             'number_rays_sweep']
 
-        # create empty outputs
-        shape = (nsweeps, nrays, nbins)
-        data = dict([(name, np.ma.empty(shape, dtype='float32'))
-                    for name in self.data_type_names])
-        if 'XHDR' in self.data_type_names:
-            if full_xhdr:
-                data['XHDR'] = np.ones(shape, dtype='int16')
-            else:
-                data['XHDR'] = np.ones((nsweeps, nrays, 1), dtype='int32')
-
-        metadata = {}
-        for name in self.data_type_names:
-            header_dic = {
-                'azimuth_0': np.empty((nsweeps, nrays), dtype='float32'),
-                'elevation_0': np.empty((nsweeps, nrays), dtype='float32'),
-                'azimuth_1': np.empty((nsweeps, nrays), dtype='float32'),
-                'elevation_1': np.empty((nsweeps, nrays), dtype='float32'),
-                'nbins': np.empty((nsweeps, nrays), dtype='int16'),
-                'time': np.empty((nsweeps, nrays), dtype='uint16'),
-                'prf_flag': np.empty((nsweeps, nrays), dtype='int16')}
-            metadata[name] = header_dic
+        # set data initially to ones so that missing data can be better
+        # seen when debugging
+        raw_volume = np.ones(
+            (nsweeps, nrays, self.ndata_types, nbins + 6), dtype='int16')
 
         self.ingest_data_headers = dict([(name, []) for name in
                                          self.data_type_names])
-
         self._raw_product_bhdrs = []
 
         # read in data sweep by sweep
         for i in xrange(nsweeps):
-            ingest_data_hdrs, sweep_data, sweep_metadata = self._get_sweep(
-                full_xhdr=full_xhdr)
+            ingest_data_hdrs = self._get_sweep(
+                raw_volume[i].reshape(-1, nbins + 6))
 
             # check for a truncated file, return sweep(s) read up until error
             if ingest_data_hdrs is None:
-
                 mess = ('File truncated or corrupt, %i of %i sweeps read' %
                         (i, nsweeps))
                 warnings.warn(mess)
+                return raw_volume[:i]
 
-                for name in self.data_type_names:
-                    data[name] = data[name][:i]
-                    for k in metadata[name]:
-                        metadata[name][k] = metadata[name][k][:i]
-                return data, metadata
-
-            for j, name in enumerate(self.data_type_names):
-                temp = sweep_metadata[j]
-                (az0, el0, az1, el1, ray_nbins, ray_time, prf_flag) = temp
-
-                data[name][i] = sweep_data[j]
-                metadata[name]['azimuth_0'][i] = az0
-                metadata[name]['azimuth_1'][i] = az1
-                metadata[name]['elevation_0'][i] = el0
-                metadata[name]['elevation_1'][i] = el1
-                metadata[name]['nbins'][i] = ray_nbins
-                metadata[name]['time'][i] = ray_time
-                metadata[name]['prf_flag'][i] = prf_flag
-                self.ingest_data_headers[name].append(ingest_data_hdrs[j])
-
-        # scale 1-byte velocity by the Nyquist (section 4.3.29)
-        # this conversion is kept in this method so that the
-        # product_hdr does not need to be accessed at lower abstraction
-        # layers.
-        if 'VEL' in self.data_type_names:
-            wavelength_cm = self.product_hdr['product_end']['wavelength']
-            prt_value = 1. / self.product_hdr['product_end']['prf']
-            task_config = self.ingest_header['task_configuration']
-            multi_prf_flag = task_config['task_dsp_info']['multi_prf_flag']
-            if multi_prf_flag > 3 or multi_prf_flag < 0:
-                multiplier = 1  # multiplier not defined in IRIS manual
-            else:
-                multiplier = [1, 2, 3, 4][multi_prf_flag]
-            nyquist = wavelength_cm / (10000.0 * 4.0 * prt_value) * multiplier
-            data['VEL'] *= nyquist
-        # scale 1-byte width by the Nyquist
-        if 'WIDTH' in self.data_type_names:
-            # The IRIS Programmer's Manual indicates 1-byte width format data
-            # should be scaled by the unambiguous velocity, twice the nyquist,
-            # (section 4.3.35) but both RSL and RadX scale this data by the
-            # nyquist.  Therefore to agree with these two packages the width
-            # is scaled by the nyquist.
-            wavelength_cm = self.product_hdr['product_end']['wavelength']
-            prt_value = 1. / self.product_hdr['product_end']['prf']
-            nyquist = wavelength_cm / (10000.0 * 4.0 * prt_value)
-            data['WIDTH'] *= nyquist
+            for name, ingest_data_hdr in zip(self.data_type_names,
+                                             ingest_data_hdrs):
+                self.ingest_data_headers[name].append(ingest_data_hdr)
+        return raw_volume
 
-        return data, metadata
-
-    def _get_sweep(self, full_xhdr=False, raw_data=False):
+    def _get_sweep(self, np.ndarray[np.int16_t, ndim=2] out):
         """
-        Get the data and metadata from the next sweep.
+        Decode the raw data from the next sweep.
 
-        If the file ends early None is returned for all values.
+        If the file ends early or the sweep does not fit in out None is
+        returned.
 
         Parameters
         ----------
-        full_xhdr : bool
-            True to return the full extended headers if they exist padded with
-            ones.  False will return a length 1 extended header converted to
-            int32.  This is useful when the file contains a customer specified
-            extended header (for example aircraft radar).
-        raw_data : bool, optional
-            True to return the raw_data for the given sweep, False to
-            convert the data to floating point representation.
+        out : array
+            Array to decode the rays of the sweep into, shape (nrays *
+            ndata_types, nbins + 6).  The rays of the data types are
+            interleaved in the order they appear in the file.
 
         Returns
         -------
         ingest_data_headers : list of dict
             List of ingest_data_header structures for each data type.
-        sweep_data : list of arrays
-            Sweep data for each data types in the order they appear in the
-            file.
-        sweep_metadata : list of tuples
-            Sweep metadata for each data type in the same order as sweep_data.
 
         """
 
         # get the next record
-        lead_record = self._fh.read(RECORD_SIZE)
-        self._record_number += 1
+        lead_record = self._read_record()
 
-        # check if the file ended early, if so return Nones
-        if len(lead_record) != RECORD_SIZE:
-            return None, None, None
+        # check if the file ended early, if so return None
+        if lead_record is None:
+            return None
 
         # unpack structures
-        raw_prod_bhdr = _unpack_raw_prod_bhdr(lead_record)
+        header = lead_record[:(12 + 76 * self.ndata_types) // 2].tobytes()
+        raw_prod_bhdr = _unpack_raw_prod_bhdr(header)
         self._raw_product_bhdrs.append([raw_prod_bhdr])
         ingest_data_headers = _unpack_ingest_data_headers(
-            lead_record, self.ndata_types)
+            header, self.ndata_types)
         if ingest_data_headers is None:
-            return None, None, None
+            return None
 
         # determine size of data
         nray_data_types = [d['number_rays_file_expected']
                            for d in ingest_data_headers]
         nrays = sum(nray_data_types)    # total rays
-        nbins = self.product_hdr['product_end']['number_bins']
+        nbins = out.shape[1] - 6
+        if nrays > out.shape[0]:
+            return None
 
         # prepare to read rays
-        self._rbuf = np.frombuffer(lead_record, dtype='int16')
+        self._rbuf = lead_record
         self._rbuf_p = <np.int16_t*>self._rbuf.data
         self._rbuf_pos = int((12 + 76 * self.ndata_types) / 2) - 1
-        # set data initially to ones so that missing data can be better
-        # seen when debugging
-        raw_sweep_data = np.ones((nrays, nbins + 6), dtype='int16')
 
-        # get the raw data ray-by-ray
+        # decode the raw data ray-by-ray
         for ray_i in xrange(nrays):
             if self.debug:
                 print("Reading ray: %i of %i" % (ray_i, nrays), end='')
                 print("self._rbuf_pos is", self._rbuf_pos)
-            if self._get_ray(nbins, raw_sweep_data[ray_i]):
-                return None, None, None
-
-        # return raw data if requested
-        if raw_data:
-            return ingest_data_headers, raw_sweep_data
-
-        # convert the data and parse the metadata
-        sweep_data = []
-        sweep_metadata = []
-        for i, data_type in enumerate(self.data_types):
-            if data_type == 0 and full_xhdr:
-                sweep_data.append(raw_sweep_data[i::self.ndata_types, 6:])
-            else:
-                sweep_data.append(convert_sigmet_data(
-                    data_type, raw_sweep_data[i::self.ndata_types, 6:],
-                    raw_sweep_data[i::self.ndata_types, 4]))
-            sweep_metadata.append(_parse_ray_headers(
-                raw_sweep_data[i::self.ndata_types, :6]))
-        return ingest_data_headers, sweep_data, sweep_metadata
+            if self._get_ray(nbins, out[ray_i]):
+                return None
+        return ingest_data_headers
+
+    def _read_record(self):
+        """
+        Return the next record as an int16 array, None at the end of the
+        file.  The array is a view of the memory mapped file when available.
+        """
+        if self._mmap is not None:
+            if self._mmap_pos + RECORD_SIZE > len(self._mmap):
+                return None
+            record = np.frombuffer(self._mmap, dtype='int16',
+                                   count=RECORD_SIZE // 2,
+                                   offset=self._mmap_pos)
+            self._mmap_pos += RECORD_SIZE
+        else:
+            string = self._fh.read(RECORD_SIZE)
+            if len(string) != RECORD_SIZE:
+                return None
+            record = np.frombuffer(string, dtype='int16')
+        self._record_number += 1
+        return record
 
     @cython.wraparound(False)
     cdef int _get_ray(self, int nbins, np.ndarray[np.int16_t, ndim=1] out):
@@ -406,18 +469,19 @@ cdef class SigmetFile:
 
     cdef int _load_record(self):
         """ Load the next record. returns -1 on fail, 0 if success. """
-        record = self._fh.read(RECORD_SIZE)
-        if len(record) != RECORD_SIZE:
+        record = self._read_record()
+        if record is None:
             return -1   # failed read
-        self._record_number += 1
         if self.debug:
             print("Finished loading record:", self._record_number)
-        self._raw_product_bhdrs[-1].append(_unpack_raw_prod_bhdr(record))
-        self._rbuf = np.frombuffer(record, dtype='int16')
+        self._raw_product_bhdrs[-1].append(
+            _unpack_raw_prod_bhdr(record[:6].tobytes()))
+        self._rbuf = record
         self._rbuf_pos = 6
         self._rbuf_p = <np.int16_t*>self._rbuf.data
         return 0
 
+
 # functions used by the SigmetFile class
 
 
@@ -617,9 +681,14 @@ SIGMET_DATA_TYPES = {
 # file. Rewriting the convertions/masking in Cython does not seem to improved
 # performance likely since most of the routines are already vectorized.
 def convert_sigmet_data(data_type, data, nbins):
-    """ Convert sigmet data. """
-    out = np.empty_like(data, dtype='float32')
-    mask = np.zeros_like(data, dtype=np.bool8)
+    """
+    Convert sigmet data.
+
+    Data can have any number of dimensions, the last being the bins of each
+    ray, nbins has the shape of the remaining dimensions.
+    """
+    out = np.empty_like(data, dtype='float32', order='C')
+    mask = np.zeros_like(data, dtype=np.bool8, order='C')
 
     data_type_name = SIGMET_DATA_TYPES[data_type]
 
@@ -706,8 +775,10 @@ def convert_sigmet_data(data_type, data, nbins):
     elif data_type_name[-1] != '2':
         # make a view of left half of the data as uint8,
         # this is the actual ray data collected, the right half is blank.
-        nrays, nbin = data.shape
-        ndata = data.view('(2,) uint8').reshape(nrays, -1)[:, :nbin]
+        # the view requires contiguous data, read_data passes a slice of the
+        # raw volume.
+        nbin = data.shape[-1]
+        ndata = np.ascontiguousarray(data).view('uint8')[..., :nbin]
 
         if data_type_name in like_dbt:
             # DB_DBT, 1, Total Power (1 byte)
@@ -789,7 +860,9 @@ def convert_sigmet_data(data_type, data, nbins):
         return np.ma.masked_array(out)
 
     # mask any gates which are beyond the number of gates in that ray.
-    _mask_gates_not_collected(mask.view(np.uint8), nbins)
+    _mask_gates_not_collected(
+        mask.view(np.uint8).reshape(-1, mask.shape[-1]),
+        np.ascontiguousarray(nbins, dtype='int16').reshape(-1))
 
     return np.ma.masked_array(out, mask=mask, fill_value=-9999.0,
                               shrink=False)
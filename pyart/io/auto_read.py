@@ -8,15 +8,25 @@ Automatic reading of radar files by detecting format.
     :toctree: generated/
 
     read
+    read_metadata
     determine_filetype
+    _scan_nexrad_archive
+    _scan_sigmet
+    _scan_cfradial
+    _scan_mdv
+    _scan_uf
 
 """
 
 import bz2
 import gzip
+import struct
 
+import numpy as np
 import netCDF4
 
+from ..util.datetime_utils import datetime_from_dataset
+from .common import prepare_for_read
 from .rsl import read_rsl, _RSL_AVAILABLE
 from .mdv_radar import read_mdv
 from .cfradial import read_cfradial
@@ -24,8 +34,15 @@ from .sigmet import read_sigmet
 from .nexrad_archive import read_nexrad_archive
 from .nexrad_cdm import read_nexrad_cdm
 from .nexradl3_read import read_nexrad_level3
-from .uf import read_uf
+from .uf import read_uf, _get_scan_type
 from .chl import read_chl
+from .cfradial import _scan_type_from_sweep_mode
+from .sigmet import ymds_time_to_datetime
+from ._sigmetfile import SigmetFile, bin2_to_angle, bin4_to_angle
+from .nexrad_level2 import NEXRADLevel2File
+from .mdv_common import MdvFile
+from .uffile import UFRay, _structure_size, _unpack_structure
+from .uffile import UF_MANDATORY_HEADER
 
 
 def read(filename, use_rsl=False, **kwargs):
@@ -146,6 +163,291 @@ def read(filename, use_rsl=False, **kwargs):
     raise TypeError('Unknown or unsupported file format: ' + filetype)
 
 
+def read_metadata(filename):
+    """
+    Read the metadata of a radar file without reading the field data.
+
+    Only the headers of the file are read, which allows catalogs of radar
+    files to be built much faster than reading each file with
+    :py:func:`read`.  NEXRAD Level II, Sigmet, CF/Radial, MDV and UF files
+    are supported.
+
+    Parameters
+    ----------
+    filename : str
+        Name of radar file to read.
+
+    Returns
+    -------
+    metadata : dict
+        Dictionary of metadata with keys:
+
+        * 'filetype' : file type as returned by :py:func:`determine_filetype`.
+        * 'instrument_name' : name of the radar or site, None if unknown.
+        * 'time_start' : datetime of the first ray in the volume.
+        * 'scan_type' : 'ppi', 'rhi', etc.
+        * 'scan_strategy' : VCP number for NEXRAD files, task or scan name
+          for Sigmet and CF/Radial files, None when not recorded.
+        * 'nsweeps' : number of sweeps, None if unknown.
+        * 'fixed_angles' : array of the fixed angle of each sweep in
+          degrees, None if unknown.
+        * 'fields' : list of the names of the fields in the file.
+        * 'latitude', 'longitude', 'altitude' : location of the radar.
+
+        Fields are named as they appear in the file.  For NEXRAD Level II
+        files these are the moments present in the first scan.  A
+        TypeError is raised if the format is not supported.
+
+    """
+    filetype = determine_filetype(filename)
+
+    # Bzip and Gzip, only supported for formats which can be read from a
+    # file-like object
+    if filetype == 'BZ2' or filetype == 'GZ':
+        fh = prepare_for_read(filename)
+        try:
+            filetype = determine_filetype(fh)
+            if filetype not in ['WSR88D', 'SIGMET', 'MDV', 'UF']:
+                raise ValueError(
+                    'Compressed file cannot be read, '
+                    'uncompress and try again')
+            metadata = _METADATA_SCANNERS[filetype](fh)
+        finally:
+            fh.close()
+        metadata['filetype'] = filetype
+        return metadata
+
+    scanner = filetype
+    if filetype == 'NETCDF3' or filetype == 'NETCDF4':
+        dset = netCDF4.Dataset(filename)
+        if 'cdm_data_type' not in dset.ncattrs():   # not NEXRAD CDM
+            scanner = 'CFRADIAL'
+        dset.close()
+    if scanner not in _METADATA_SCANNERS:
+        raise TypeError('Metadata reading not supported for format: ' +
+                        filetype)
+    metadata = _METADATA_SCANNERS[scanner](filename)
+    metadata['filetype'] = filetype
+    return metadata
+
+
+def _scan_nexrad_archive(filename):
+    """ Return the metadata of a NEXRAD Level II file. """
+    # only the records of the first scan are decompressed and indexed
+    nfile = NEXRADLevel2File(prepare_for_read(filename), lazy=True,
+                             scans=[0])
+    time_start, _ = nfile.get_times([0])
+    lat, lon, alt = nfile.location()
+    if nfile.vcp is not None:
+        nsweeps = nfile.vcp['msg5_header']['num_cuts']
+        fixed_angles = nfile.get_target_angles(range(nsweeps))
+    else:
+        nsweeps = None
+        fixed_angles = None
+    metadata = {
+        'instrument_name': nfile.volume_header['icao'].decode('ascii'),
+        'time_start': time_start,
+        'scan_type': 'ppi',
+        'scan_strategy': nfile.get_vcp_pattern(),
+        'nsweeps': nsweeps,
+        'fixed_angles': fixed_angles,
+        'fields': nfile.scan_info([0])[0]['moments'],
+        'latitude': lat,
+        'longitude': lon,
+        'altitude': alt,
+    }
+    nfile.close()
+    return metadata
+
+
+def _scan_sigmet(filename):
+    """ Return the metadata of a Sigmet file from the first two records. """
+    sigmetfile = SigmetFile(prepare_for_read(filename))
+    ingest_config = sigmetfile.ingest_header['ingest_configuration']
+    task_config = sigmetfile.ingest_header['task_configuration']
+    scan_info = task_config['task_scan_info']
+    sigmetfile.close()
+
+    # the PPI and RHI scan information lists the angle of each sweep in
+    # the task, of which only the completed sweeps are in the file
+    nsweeps = min(scan_info['number_sweeps'],
+                  ingest_config['number_sweeps_completed'])
+    scan_mode = scan_info['antenna_scan_mode']
+    if scan_mode in [1, 2, 4]:
+        angles = np.frombuffer(scan_info['task_scan_type_scan_info'],
+                               dtype='<u2', count=nsweeps, offset=4)
+        fixed_angles = bin2_to_angle(angles).astype('float32')
+    else:
+        fixed_angles = None
+    if scan_mode == 2:
+        scan_type = 'rhi'
+    else:
+        scan_type = 'ppi'
+
+    lat = bin4_to_angle(ingest_config['latitude_radar'])
+    if lat > 180.0:
+        lat -= 360.0
+    lon = bin4_to_angle(ingest_config['longitude_radar'])
+    if lon > 180.0:
+        lon -= 360.0
+    product_hdr = sigmetfile.product_hdr
+    fields = [f for f in sigmetfile.data_type_names if f != 'XHDR']
+    return {
+        'instrument_name': _decode(ingest_config['site_name']),
+        'time_start': ymds_time_to_datetime(
+            ingest_config['volume_scan_start_time']),
+        'scan_type': scan_type,
+        'scan_strategy': _decode(
+            product_hdr['product_configuration']['task_name']),
+        'nsweeps': nsweeps,
+        'fixed_angles': fixed_angles,
+        'fields': fields,
+        'latitude': lat,
+        'longitude': lon,
+        'altitude': product_hdr['product_end']['ground_height'],
+    }
+
+
+def _scan_cfradial(filename):
+    """
+    Return the metadata of a CF/Radial file from the global attributes and
+    the coordinate and sweep variables.
+    """
+    ncobj = netCDF4.Dataset(filename)
+    ncvars = ncobj.variables
+    attrs = ncobj.ncattrs()
+
+    time_start = datetime_from_dataset(ncobj)
+    modes = netCDF4.chartostring(ncvars['sweep_mode'][:])
+    mode = modes[0]
+    if isinstance(mode, bytes):
+        mode = mode.decode('utf-8')
+
+    if 'ray_n_gates' in ncvars:
+        dimensions = ('n_points', )
+    else:
+        dimensions = ('time', 'range')
+    fields = [k for k, v in ncvars.items() if v.dimensions == dimensions]
+
+    scan_strategy = None
+    for name in ['scan_name', 'scan_id']:
+        if name in attrs:
+            scan_strategy = getattr(ncobj, name)
+            break
+    fixed_angles = np.asarray(ncvars['fixed_angle'][:], dtype='float32')
+    metadata = {
+        'instrument_name': getattr(ncobj, 'instrument_name', None),
+        'time_start': time_start,
+        'scan_type': _scan_type_from_sweep_mode(mode),
+        'scan_strategy': scan_strategy,
+        'nsweeps': len(fixed_angles),
+        'fixed_angles': fixed_angles,
+        'fields': fields,
+        'latitude': float(ncvars['latitude'][0]),
+        'longitude': float(ncvars['longitude'][0]),
+        'altitude': float(ncvars['altitude'][0]),
+    }
+    ncobj.close()
+    return metadata
+
+
+def _scan_mdv(filename):
+    """ Return the metadata of a MDV file from the headers and chunks. """
+    mdvfile = MdvFile(prepare_for_read(filename))
+    az_deg, _, el_deg = mdvfile._calc_geometry()
+    if mdvfile.projection == 'rhi':
+        fixed_angles = np.array(az_deg, dtype='float32')
+    else:
+        fixed_angles = np.array(el_deg, dtype='float32')
+    radar_info = mdvfile.radar_info
+    metadata = {
+        'instrument_name': _decode(radar_info['radar_name']),
+        'time_start': mdvfile.times['time_begin'],
+        'scan_type': mdvfile.projection,
+        'scan_strategy': _decode(radar_info['scan_type_name']),
+        'nsweeps': len(fixed_angles),
+        'fixed_angles': fixed_angles,
+        'fields': mdvfile.fields,
+        'latitude': radar_info['latitude_deg'],
+        'longitude': radar_info['longitude_deg'],
+        'altitude': radar_info['altitude_km'] * 1000.0,
+    }
+    mdvfile.close()
+    return metadata
+
+
+def _scan_uf(filename):
+    """
+    Return the metadata of a UF file from the first record and the
+    mandatory header of the remaining records.  The records are located
+    using their lengths, only the mandatory header of each record after
+    the first is read.
+    """
+    fh = prepare_for_read(filename)
+    header_size = _structure_size(UF_MANDATORY_HEADER)
+
+    # determine padding around records, see uffile._read_records
+    buf = fh.read(8)
+    try:
+        padding = buf.index(b'UF')
+    except ValueError:
+        fh.close()
+        raise IOError('file in not a valid UF file')
+    record_size = struct.unpack('>h', buf[padding+2:padding+4])[0] * 2
+    bytes_read = len(buf) - padding
+    first_ray = UFRay(buf[padding:] + fh.read(record_size - bytes_read))
+    header = first_ray.mandatory_header
+    sweep_numbers = [header['sweep_number']]
+    fixed_angles = [header['fixed_angle'] / 64.]
+
+    # seek to the mandatory header of each remaining record
+    start = padding + record_size + 2 * padding
+    while True:
+        fh.seek(start)
+        buf = fh.read(header_size)
+        if len(buf) < header_size:  # EOF reached
+            break
+        header = _unpack_structure(buf, UF_MANDATORY_HEADER)
+        if header['record_length'] <= 0:
+            break
+        if header['sweep_number'] != sweep_numbers[-1]:
+            sweep_numbers.append(header['sweep_number'])
+            fixed_angles.append(header['fixed_angle'] / 64.)
+        start += header['record_length'] * 2 + 2 * padding
+    fh.close()
+
+    lat, lon, alt = first_ray.get_location()
+    fields = [_decode(p['data_type']) for p in first_ray.field_positions]
+    return {
+        'instrument_name': _decode(first_ray.mandatory_header['radar_name']),
+        'time_start': first_ray.get_datetime(),
+        'scan_type': _get_scan_type(first_ray),
+        'scan_strategy': None,
+        'nsweeps': len(fixed_angles),
+        'fixed_angles': np.array(fixed_angles, dtype='float32'),
+        'fields': fields,
+        'latitude': lat,
+        'longitude': lon,
+        'altitude': alt,
+    }
+
+
+def _decode(string):
+    """ Return a stripped str from a, possibly null padded, byte string. """
+    if isinstance(string, bytes):
+        string = string.decode('ascii', 'replace')
+    return string.rstrip('\x00').strip()
+
+
+_METADATA_SCANNERS = {
+    'WSR88D': _scan_nexrad_archive,
+    'SIGMET': _scan_sigmet,
+    'CFRADIAL': _scan_cfradial,
+    'MDV': _scan_mdv,
+    'UF': _scan_uf,
+}
+
+
 def determine_filetype(filename):
     """
     Return the filetype of a given file by examining the first few bytes.
@@ -0,0 +1,224 @@
+"""
+pyart.io.batch_read
+===================
+
+Reading of many radar files using a pool of workers.
+
+.. autosummary::
+    :toctree: generated/
+
+    read_many
+    iread_many
+    _read_file
+    _export_fields
+    _import_fields
+    _transfer_directory
+    _map_and_remove
+
+.. autosummary::
+    :toctree: generated/
+    :template: dev_template.rst
+
+    _SharedArray
+
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+try:
+    from concurrent import futures
+    _FUTURES_AVAILABLE = True
+except ImportError:
+    _FUTURES_AVAILABLE = False
+
+from ..exceptions import MissingOptionalDependency
+from ..util.datetime_utils import datetime_from_radar
+from .auto_read import read
+
+
+def read_many(filenames, workers=None, executor='process', fields=None,
+              **kwargs):
+    """
+    Read many radar files using a pool of workers.
+
+    Additional parameters are passed to :py:func:`read`.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Names of the radar files to read.
+    workers : int or None, optional
+        Number of worker processes or threads.  None uses the default of
+        the executor, the number of processors on the machine for processes.
+    executor : 'process' or 'thread', optional
+        Type of pool used.  Processes, the default, read files in parallel
+        independent of the Global Interpreter Lock, the field data read by
+        the processes is transferred through shared memory rather than
+        being pickled.  Threads avoid the transfer entirely but only read in
+        parallel where the readers release the GIL, for example during
+        decompression.
+    fields : list or None, optional
+        Names of the fields to keep in each radar, other fields are removed
+        by the worker before the radar is returned.  None keeps all fields.
+
+    Returns
+    -------
+    radars : list
+        Radar objects ordered by the time of the first ray in each volume.
+
+    """
+    radars = [radar for _, radar in iread_many(
+        filenames, workers, executor, fields, **kwargs)]
+    radars.sort(key=datetime_from_radar)
+    return radars
+
+
+def iread_many(filenames, workers=None, executor='process', fields=None,
+               **kwargs):
+    """
+    Read many radar files using a pool of workers, yielding each radar as
+    it is read.
+
+    Parameters are the same as :py:func:`read_many`.  Exceptions raised
+    while reading a file are raised when its radar would be yielded.
+
+    Yields
+    ------
+    filename : str
+        Name of the file read.
+    radar : Radar
+        Radar object read from the file.  Radars are yielded in the order
+        in which the files finish being read.
+
+    """
+    # check that concurrent.futures is available
+    if not _FUTURES_AVAILABLE:
+        raise MissingOptionalDependency(
+            "concurrent.futures (the futures package on Python 2) is "
+            "required to use iread_many but is not installed")
+
+    if executor == 'thread':
+        pool = futures.ThreadPoolExecutor(workers)
+        transfer_dir = None
+    elif executor == 'process':
+        pool = futures.ProcessPoolExecutor(workers)
+        transfer_dir = _transfer_directory()
+    else:
+        raise ValueError("executor must be 'process' or 'thread'")
+
+    tasks = {}
+    try:
+        tasks = dict(
+            (pool.submit(_read_file, filename, fields, transfer_dir, kwargs),
+             filename) for filename in filenames)
+        for task in futures.as_completed(tasks):
+            radar = task.result()
+            if transfer_dir is not None:
+                _import_fields(radar)
+            yield tasks[task], radar
+    finally:
+        # tasks not started when the iteration is stopped are not run
+        for task in tasks:
+            task.cancel()
+        pool.shutdown(wait=True)
+        if transfer_dir is not None:
+            shutil.rmtree(transfer_dir, ignore_errors=True)
+
+
+def _read_file(filename, fields, transfer_dir, kwargs):
+    """
+    Read a radar file in a worker, exporting the field data to transfer_dir
+    when it is not None.
+    """
+    radar = read(filename, **kwargs)
+    if fields is not None:
+        for field_name in list(radar.fields.keys()):
+            if field_name not in fields:
+                del radar.fields[field_name]
+    if transfer_dir is not None:
+        _export_fields(radar, transfer_dir)
+    return radar
+
+
+def _export_fields(radar, directory):
+    """
+    Replace the field data of a radar with SharedArray objects.
+
+    Lazy fields are evaluated and replaced by dictionaries.
+    """
+    for field_name in list(radar.fields.keys()):
+        field_dic = dict(radar.fields[field_name].items())
+        field_dic['data'] = _SharedArray(field_dic['data'], directory)
+        radar.fields[field_name] = field_dic
+
+
+def _import_fields(radar):
+    """ Replace the SharedArray objects in a radar with the field data. """
+    for field_dic in radar.fields.values():
+        if isinstance(field_dic['data'], _SharedArray):
+            field_dic['data'] = field_dic['data'].load()
+
+
+def _transfer_directory():
+    """
+    Create a directory used to transfer field data between processes,
+    in memory (/dev/shm) when available.
+    """
+    shm = '/dev/shm'
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return tempfile.mkdtemp(prefix='pyart_', dir=shm)
+    return tempfile.mkdtemp(prefix='pyart_')
+
+
+class _SharedArray(object):
+    """
+    A reference to an array, optionally masked, stored in a file which is
+    memory mapped by the receiving process.
+
+    Only the paths to the files are pickled.  The files are removed when
+    the array is loaded, the mapping remains valid until the array is
+    released.
+
+    Parameters
+    ----------
+    data : array or masked array
+        Array to store.
+    directory : str
+        Directory in which the array is stored.
+
+    """
+
+    def __init__(self, data, directory):
+        """ initialize the object. """
+        fd, self.path = tempfile.mkstemp(suffix='.npy', dir=directory)
+        with os.fdopen(fd, 'wb') as fh:
+            np.save(fh, np.ma.getdata(data))
+        self.mask_path = None
+        if np.ma.is_masked(data):
+            fd, self.mask_path = tempfile.mkstemp(suffix='.npy', dir=directory)
+            with os.fdopen(fd, 'wb') as fh:
+                np.save(fh, np.ma.getmaskarray(data))
+        self.masked = isinstance(data, np.ma.MaskedArray)
+
+    def load(self):
+        """ Return the array, memory mapped copy-on-write. """
+        data = _map_and_remove(self.path)
+        if not self.masked:
+            return data
+        mask = np.ma.nomask
+        if self.mask_path is not None:
+            mask = _map_and_remove(self.mask_path)
+        return np.ma.masked_array(data, mask)
+
+
+def _map_and_remove(path):
+    """ Memory map a .npy file copy-on-write and remove the file. """
+    data = np.load(path, mmap_mode='c')
+    try:
+        os.remove(path)
+    except OSError:     # the file is open on some platforms
+        pass
+    return data
@@ -9,6 +9,7 @@ Utilities for reading CF/Radial files.
     :template: dev_template.rst
 
     _NetCDFVariableDataExtractor
+    _VariableGateUnpacker
 
 .. autosummary::
     :toctree: generated/
@@ -17,8 +18,12 @@ Utilities for reading CF/Radial files.
     write_cfradial
     _find_all_meta_group_vars
     _ncvar_to_dict
+    _ncvar_to_packed_dict
     _unpack_variable_gate_field_dic
+    _scan_type_from_sweep_mode
     _create_ncvar
+    _pack_fields
+    _pack_field_dic
 
 """
 
@@ -32,10 +37,19 @@ import netCDF4
 
 from ..config import FileMetadata
 from .common import stringarray_to_chararray, _test_arguments
+from .common import _cast_field_data, _packed_field_dic, _run_in_threads
 from ..core.radar import Radar
 from ..lazydict import LazyLoadDict
 
 
+# createVariable arguments used for field variables by the compression
+# profiles of write_cfradial.
+_COMPRESSION_PROFILES = {
+    'default': {'zlib': True},
+    'fast': {'zlib': True, 'complevel': 1, 'shuffle': True},
+    None: {'zlib': False},
+}
+
 # Variables and dimensions in the instrument_parameter convention and
 # radar_parameters sub-convention that will be read from and written to
 # CfRadial files using Py-ART.
@@ -70,7 +84,8 @@ _INSTRUMENT_PARAMS_DIMS = {
 
 def read_cfradial(filename, field_names=None, additional_metadata=None,
                   file_field_names=False, exclude_fields=None,
-                  delay_field_loading=False, **kwargs):
+                  delay_field_loading=False, dtype=None, keep_packed=False,
+                  **kwargs):
     """
     Read a Cfradial netCDF file.
 
@@ -97,9 +112,21 @@ def read_cfradial(filename, field_names=None, additional_metadata=None,
         True to delay loading of field data from the file until the 'data'
         key in a particular field dictionary is accessed.  In this case
         the field attribute of the returned Radar object will contain
-        LazyLoadDict objects not dict objects.  Delayed field loading will not
-        provide any speedup in file where the number of gates vary between
-        rays (ngates_vary=True) and is not recommended.
+        LazyLoadDict objects not dict objects.  In files where the number of
+        gates vary between rays (ngates_vary=True) the field data is also
+        unpacked into a 2D array when loaded.
+    dtype : dtype or None, optional
+        Data type of the field data, for example 'float32'.  None, the
+        default, uses the data type of the variables in the file after
+        scaling.
+    keep_packed : bool, optional
+        True to store the data of field variables packed as integers with
+        scale_factor and/or add_offset attributes as the integer codes
+        from the file, the data is decoded into a masked array of type dtype
+        each time the 'data' key of the field dictionary, a LazyLoadDict,
+        is evaluated.  The codes are read when the file is read.  Fields in
+        files where the number of gates vary between rays are not kept
+        packed.  False, the default, decodes the field data when read.
 
     Returns
     -------
@@ -196,31 +223,7 @@ def read_cfradial(filename, field_names=None, additional_metadata=None,
         mode = netCDF4.chartostring(sweep_mode['data'][0])[()]
 
 
-    # options specified in the CF/Radial standard
-    if mode == 'rhi':
-        scan_type = 'rhi'
-    elif mode == 'vertical_pointing':
-        scan_type = 'vpt'
-    elif mode == 'azimuth_surveillance':
-        scan_type = 'ppi'
-    elif mode == 'elevation_surveillance':
-        scan_type = 'rhi'
-    elif mode == 'manual_ppi':
-        scan_type = 'ppi'
-    elif mode == 'manual_rhi':
-        scan_type = 'rhi'
-
-    # fallback types
-    elif 'sur' in mode:
-        scan_type = 'ppi'
-    elif 'sec' in mode:
-        scan_type = 'sector'
-    elif 'rhi' in mode:
-        scan_type = 'rhi'
-    elif 'ppi' in mode:
-        scan_type = 'ppi'
-    else:
-        scan_type = 'other'
+    scan_type = _scan_type_from_sweep_mode(mode)
 
     # 4.8 Sensor pointing variables -> create attribute dictionaries
     azimuth = _ncvar_to_dict(ncvars['azimuth'])
@@ -282,6 +285,14 @@ def read_cfradial(filename, field_names=None, additional_metadata=None,
         keys = [k for k, v in ncvars.items()
                 if v.dimensions == ('time', 'range')]
 
+    if 'ray_n_gates' in ncvars:
+        # field data is unpacked from the n_points dimension into 2D arrays
+        shape = (len(ncvars['time']), len(ncvars['range']))
+        unpacker = _VariableGateUnpacker(
+            shape, ncvars['ray_n_gates'][:], ncvars['ray_start_index'][:])
+    else:
+        unpacker = None
+
     fields = {}
     for key in keys:
         field_name = filemetadata.get_field_name(key)
@@ -289,15 +300,15 @@ def read_cfradial(filename, field_names=None, additional_metadata=None,
             if exclude_fields is not None and key in exclude_fields:
                 continue
             field_name = key
-        fields[field_name] = _ncvar_to_dict(ncvars[key], delay_field_loading)
-
-    if 'ray_n_gates' in ncvars:
-        shape = (len(ncvars['time']), len(ncvars['range']))
-        ray_n_gates = ncvars['ray_n_gates'][:]
-        ray_start_index = ncvars['ray_start_index'][:]
-        for dic in fields.values():
-            _unpack_variable_gate_field_dic(
-                dic, shape, ray_n_gates, ray_start_index)
+        ncvar = ncvars[key]
+        packed = ('scale_factor' in ncvar.ncattrs() or
+                  'add_offset' in ncvar.ncattrs())
+        if (keep_packed and packed and unpacker is None and
+                np.issubdtype(ncvar.dtype, np.integer)):
+            fields[field_name] = _ncvar_to_packed_dict(ncvar, dtype)
+        else:
+            fields[field_name] = _ncvar_to_dict(
+                ncvar, delay_field_loading, unpacker, dtype)
 
     # 4.5 instrument_parameters sub-convention -> instrument_parameters dict
     # 4.6 radar_parameters sub-convention -> instrument_parameters dict
@@ -342,12 +353,12 @@ def _find_all_meta_group_vars(ncvars, meta_group_name):
             v.meta_group == meta_group_name]
 
 
-def _ncvar_to_dict(ncvar, lazydict=False):
+def _ncvar_to_dict(ncvar, lazydict=False, unpacker=None, dtype=None):
     """ Convert a NetCDF Dataset variable to a dictionary. """
     # copy all attribute except for scaling parameters
     d = dict((k, getattr(ncvar, k)) for k in ncvar.ncattrs()
              if k not in ['scale_factor', 'add_offset'])
-    data_extractor = _NetCDFVariableDataExtractor(ncvar)
+    data_extractor = _NetCDFVariableDataExtractor(ncvar, unpacker, dtype)
     if lazydict:
         d = LazyLoadDict(d)
         d.set_lazy('data', data_extractor)
@@ -356,6 +367,35 @@ def _ncvar_to_dict(ncvar, lazydict=False):
     return d
 
 
+def _ncvar_to_packed_dict(ncvar, dtype=None):
+    """
+    Convert a NetCDF Dataset variable packed as integers to a dictionary
+    whose data is stored as the packed codes and decoded when accessed.
+    """
+    d = dict((k, getattr(ncvar, k)) for k in ncvar.ncattrs()
+             if k not in ['scale_factor', 'add_offset'])
+    scale_factor = getattr(ncvar, 'scale_factor', 1.)
+    add_offset = getattr(ncvar, 'add_offset', 0.)
+    if dtype is None:
+        # netCDF4 unpacks to the type of the scaling parameters
+        dtype = np.result_type(scale_factor, add_offset)
+
+    # mask the codes masked by netCDF4
+    masked_codes = []
+    if '_FillValue' in d:
+        masked_codes.append(d['_FillValue'])
+    elif ncvar.dtype.itemsize > 1:
+        masked_codes.append(netCDF4.default_fillvals[ncvar.dtype.str[1:]])
+    if 'missing_value' in d:
+        masked_codes.extend(np.atleast_1d(d['missing_value']))
+
+    ncvar.set_auto_maskandscale(False)
+    codes = ncvar[:]
+    ncvar.set_auto_maskandscale(True)
+    return _packed_field_dic(
+        d, codes, scale_factor, add_offset, masked_codes, dtype)
+
+
 class _NetCDFVariableDataExtractor(object):
     """
     Class facilitating on demand extraction of data from a NetCDF variable.
@@ -364,16 +404,36 @@ class _NetCDFVariableDataExtractor(object):
     ----------
     ncvar : netCDF4.Variable
         NetCDF Variable from which data will be extracted.
+    unpacker : _VariableGateUnpacker or None
+        Unpacker used to create a 2D array from the data of variables with
+        a n_points dimension.  None for other variables.
+    dtype : dtype or None
+        Data type of the returned data, None for that of the variable.
 
     """
 
-    def __init__(self, ncvar):
+    def __init__(self, ncvar, unpacker=None, dtype=None):
         """ initialize the object. """
         self.ncvar = ncvar
+        self.unpacker = unpacker
+        self.dtype = dtype
+
+    def __getitem__(self, key):
+        """
+        Return an array containing part of the data from the stored
+        variable, only the requested rays are read from the file.
+        """
+        if self.unpacker is not None:
+            data = self.unpacker.read(self.ncvar, key)
+        else:
+            data = self.ncvar[key]
+        return _cast_field_data(data, self.dtype)
 
     def __call__(self):
         """ Return an array containing data from the stored variable. """
         data = self.ncvar[:]
+        if self.unpacker is not None:
+            return _cast_field_data(self.unpacker(data), self.dtype)
         if data is np.ma.masked:
             # If the data is a masked scalar, MaskedConstant is returned by
             # NetCDF4 version 1.2.3+. This object does not preserve the dtype
@@ -386,22 +446,121 @@ class _NetCDFVariableDataExtractor(object):
         # Use atleast_1d to force the array to be at minimum one dimensional,
         # some version of netCDF return scalar or scalar arrays for scalar
         # NetCDF variables.
-        return np.atleast_1d(data)
+        return _cast_field_data(np.atleast_1d(data), self.dtype)
 
 
 def _unpack_variable_gate_field_dic(
         dic, shape, ray_n_gates, ray_start_index):
     """ Create a 2D array from a 1D field data, dic update in place """
-    fdata = dic['data']
-    data = np.ma.masked_all(shape, dtype=fdata.dtype)
-    for i, (gates, idx) in enumerate(zip(ray_n_gates, ray_start_index)):
-        data[i, :gates] = fdata[idx:idx+gates]
-    dic['data'] = data
+    unpacker = _VariableGateUnpacker(shape, ray_n_gates, ray_start_index)
+    dic['data'] = unpacker(dic['data'])
     return
 
 
+class _VariableGateUnpacker(object):
+    """
+    Class for unpacking 1D variable gate field data into 2D arrays.
+
+    The location of each gate in the 1D data is found once when the object
+    is created, the data from each field is then unpacked with a single
+    scatter.  Gates beyond the number of gates in a ray are masked.
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of the unpacked data, (nrays, ngates).
+    ray_n_gates : array
+        Number of gates in each ray.
+    ray_start_index : array
+        Index of the first gate of each ray in the 1D data.
+
+    """
+
+    def __init__(self, shape, ray_n_gates, ray_start_index):
+        """ initialize the object. """
+        ray_n_gates = np.asarray(ray_n_gates, dtype='int64')
+        ray_start_index = np.asarray(ray_start_index, dtype='int64')
+        gates = np.arange(shape[1])
+        self.shape = shape
+        self.gate_mask = gates < ray_n_gates[:, np.newaxis]
+        self.index = (ray_start_index[:, np.newaxis] + gates)[self.gate_mask]
+        # position of the first gate of each ray in index
+        self.ray_offsets = np.zeros((shape[0] + 1, ), dtype='int64')
+        np.cumsum(self.gate_mask.sum(axis=1), out=self.ray_offsets[1:])
+
+    def __call__(self, fdata, start=0, stop=None, first=0):
+        """
+        Return a 2D masked array unpacked from 1D field data.
+
+        Only rays start to stop are unpacked when specified, in this case
+        fdata should begin at the gate with index first.
+        """
+        if stop is None:
+            stop = self.shape[0]
+        gate_mask = self.gate_mask[start:stop]
+        index = self.index[self.ray_offsets[start]:self.ray_offsets[stop]]
+        index = index - first
+        shape = (stop - start, self.shape[1])
+        data = np.zeros(shape, dtype=fdata.dtype)
+        data[gate_mask] = np.ma.getdata(fdata)[index]
+        mask = np.ones(shape, dtype=np.bool_)
+        mask[gate_mask] = np.ma.getmaskarray(fdata)[index]
+        return np.ma.array(data, mask=mask)
+
+    def read(self, ncvar, key):
+        """
+        Return part of the 2D data of a NetCDF variable.
+
+        When the rays are selected using a slice only the gates in these
+        rays are read from the variable.
+        """
+        if not isinstance(key, tuple):
+            key = (key, )
+        rays = key[0]
+        if not isinstance(rays, slice) or rays.step not in (None, 1):
+            return self(ncvar[:])[key]
+        start, stop, _ = rays.indices(self.shape[0])
+        stop = max(start, stop)
+        index = self.index[self.ray_offsets[start]:self.ray_offsets[stop]]
+        if len(index):
+            first, last = index.min(), index.max() + 1
+        else:
+            first = last = 0
+        data = self(ncvar[first:last], start, stop, first)
+        return data[(slice(None), ) + key[1:]]
+
+
+def _scan_type_from_sweep_mode(mode):
+    """ Return the Py-ART scan type for a CF/Radial sweep mode. """
+    # options specified in the CF/Radial standard
+    if mode == 'rhi':
+        return 'rhi'
+    elif mode == 'vertical_pointing':
+        return 'vpt'
+    elif mode == 'azimuth_surveillance':
+        return 'ppi'
+    elif mode == 'elevation_surveillance':
+        return 'rhi'
+    elif mode == 'manual_ppi':
+        return 'ppi'
+    elif mode == 'manual_rhi':
+        return 'rhi'
+
+    # fallback types
+    elif 'sur' in mode:
+        return 'ppi'
+    elif 'sec' in mode:
+        return 'sector'
+    elif 'rhi' in mode:
+        return 'rhi'
+    elif 'ppi' in mode:
+        return 'ppi'
+    return 'other'
+
+
 def write_cfradial(filename, radar, format='NETCDF4', time_reference=None,
-                   arm_time_variables=False):
+                   arm_time_variables=False, chunks=None, pack_dtype=None,
+                   compression='default', nthreads=1):
     """
     Write a Radar object to a CF/Radial compliant netCDF file.
 
@@ -425,7 +584,10 @@ def write_cfradial(filename, radar, format='NETCDF4', time_reference=None,
         * _Least_significant_digit
         * _FillValue
 
-    See the netCDF4 documentation for details on these settings.
+    See the netCDF4 documentation for details on these settings.  For field
+    variables these keys take precedence over the chunks, pack_dtype and
+    compression arguments.  Fields with a _Write_as_dtype key of an integer
+    type are packed into that type.
 
     Parameters
     ----------
@@ -444,8 +606,41 @@ def write_cfradial(filename, radar, format='NETCDF4', time_reference=None,
     arm_time_variables : bool
         True to create the ARM standard time variables base_time and
         time_offset, False will not create these variables.
+    chunks : None, 'sweep' or tuple of int, optional
+        Chunk shape, (rays, gates), of the field variables.  'sweep' uses
+        chunks spanning the rays of the largest sweep and all gates so that
+        reading a sweep of a field touches as few chunks as possible.  None
+        uses the netCDF4 library default chunking.
+    pack_dtype : None or dtype, optional
+        Integer dtype, for example 'int16' or 'uint8', into which floating
+        point fields are packed using scale_factor and add_offset attributes
+        calculated from the range of the data.  None only packs fields with
+        a _Write_as_dtype key.
+    compression : 'default', 'fast' or None, optional
+        Compression profile of the field variables.  'default' uses zlib
+        compression at the netCDF4 default level, 'fast' uses the lowest
+        compression level and the shuffle filter which is considerably
+        faster and, for packed fields, produces files of a similar size.
+        None disables compression of the fields.
+    nthreads : int, optional
+        Number of threads used to pack the fields.  The packed fields are
+        written, and compressed, by netCDF4 in the calling thread.
 
     """
+    if compression not in _COMPRESSION_PROFILES:
+        raise ValueError('Unknown compression profile: %s' % (compression))
+    field_kwargs = dict(_COMPRESSION_PROFILES[compression])
+    if chunks == 'sweep':
+        rays_per_sweep = (radar.sweep_end_ray_index['data'] -
+                          radar.sweep_start_ray_index['data'] + 1)
+        max_rays = int(rays_per_sweep.max()) if radar.nsweeps else 1
+        chunks = (max(max_rays, 1), max(radar.ngates, 1))
+    if chunks is not None:
+        field_kwargs['chunksizes'] = tuple(chunks)
+
+    # pack the fields before the file is created
+    packed_fields = _pack_fields(radar.fields, pack_dtype, nthreads)
+
     dataset = netCDF4.Dataset(filename, 'w', format=format)
 
     # determine the maximum string length
@@ -532,7 +727,12 @@ def write_cfradial(filename, radar, format='NETCDF4', time_reference=None,
 
     # fields
     for field, dic in radar.fields.items():
-        _create_ncvar(dic, dataset, field, ('time', 'range'))
+        if field in packed_fields:
+            _create_ncvar(packed_fields[field], dataset, field,
+                          ('time', 'range'), field_kwargs, packed=True)
+        else:
+            _create_ncvar(dic, dataset, field, ('time', 'range'),
+                          field_kwargs)
 
     # sweep parameters
     _create_ncvar(radar.sweep_number, dataset, 'sweep_number', ('sweep', ))
@@ -689,7 +889,8 @@ def write_cfradial(filename, radar, format='NETCDF4', time_reference=None,
     dataset.close()
 
 
-def _create_ncvar(dic, dataset, name, dimensions):
+def _create_ncvar(dic, dataset, name, dimensions, defaults=None,
+                  packed=False):
     """
     Create and fill a Variable in a netCDF Dataset object.
 
@@ -703,6 +904,13 @@ def _create_ncvar(dic, dataset, name, dimensions):
         Name of variable to create.
     dimension : tuple of str
         Dimension of variable.
+    defaults : dict, optional
+        Default createVariable arguments, overridden by any special keys in
+        dic.  None uses zlib compression.
+    packed : bool, optional
+        True when the data in dic has been packed by
+        :py:func:`_pack_field_dic`, the data is written without automatic
+        masking and scaling.
 
     """
     # create array from list, etc.
@@ -732,7 +940,10 @@ def _create_ncvar(dic, dataset, name, dimensions):
         '_Least_significant_digit': 'least_significant_digit',
         '_FillValue': 'fill_value',
     }
-    kwargs = {'zlib': True}  # default is to use compression
+    if defaults is None:
+        kwargs = {'zlib': True}  # default is to use compression
+    else:
+        kwargs = dict(defaults)
     for dic_key, kwargs_key in special_keys.items():
         if dic_key in dic:
             kwargs[kwargs_key] = dic[dic_key]
@@ -788,6 +999,8 @@ def _create_ncvar(dic, dataset, name, dimensions):
         else:
             ncvar[..., :data.shape[-1]] = data[:]
     else:
+        if packed:
+            ncvar.set_auto_maskandscale(False)
         ncvar[:] = data[:]
 
 
@@ -839,3 +1052,73 @@ def _calculate_scale_and_offset(dic, dtype, minimum=None, maximum=None):
     offset = minimum - mini * scale
 
     return scale, offset, np.iinfo(dtype).min
+
+
+def _pack_fields(fields, pack_dtype=None, nthreads=1):
+    """
+    Pack the fields which are to be written as an integer dtype.
+
+    Fields with a _Write_as_dtype key of an integer type are packed into
+    that type, other floating point fields are packed into pack_dtype when
+    it is not None.  Packing is divided between nthreads threads.  A
+    dictionary of packed copies of the field dictionaries, see
+    :py:func:`_pack_field_dic`, is returned, the original fields are not
+    modified.
+    """
+    to_pack = []
+    for field, dic in fields.items():
+        if '_Write_as_dtype' in dic:
+            dtype = np.dtype(dic['_Write_as_dtype'])
+        elif (pack_dtype is not None and
+              np.issubdtype(np.asarray(dic['data']).dtype, np.floating)):
+            dtype = np.dtype(pack_dtype)
+        else:
+            continue
+        if np.issubdtype(dtype, np.integer):
+            # copying the dictionary in this thread loads any lazy data
+            to_pack.append((field, dict(dic), dtype))
+
+    _run_in_threads(
+        _pack_field_dic, [(dic, dtype) for _, dic, dtype in to_pack],
+        nthreads)
+    return dict((field, dic) for field, dic, dtype in to_pack)
+
+
+def _pack_field_dic(dic, dtype):
+    """
+    Pack the data in a field dictionary into an integer dtype.
+
+    The dictionary is modified in place, the data is replaced by the packed
+    integers and the scale_factor, add_offset and _FillValue keys are set.
+    When the dictionary does not contain scale_factor or add_offset keys
+    these are calculated using :py:func:`_calculate_scale_and_offset`.
+    Packing follows the netCDF4 conventions, masked and non-finite values
+    are set to the fill value and values outside of the range of dtype are
+    clipped.
+    """
+    dtype = np.dtype(dtype)
+    dic.pop('_Write_as_dtype', None)
+    data = dic['data']
+    mask = np.ma.getmaskarray(data)
+    values = np.ma.getdata(data)
+    if np.issubdtype(values.dtype, np.floating):
+        mask = np.logical_or(mask, ~np.isfinite(values))
+
+    if 'scale_factor' not in dic and 'add_offset' not in dic:
+        if '_FillValue' in dic:
+            mask = np.logical_or(mask, values == dic['_FillValue'])
+        scale, offset, fill = _calculate_scale_and_offset(dic, dtype)
+        dic['scale_factor'] = scale
+        dic['add_offset'] = offset
+        dic['_FillValue'] = fill
+    scale = dic.get('scale_factor', 1.0)
+    offset = dic.get('add_offset', 0.0)
+    fill = dic.get('_FillValue', netCDF4.default_fillvals[dtype.str[1:]])
+    dic['_FillValue'] = dtype.type(fill)
+
+    info = np.iinfo(dtype)
+    packed = np.around((values - offset) / scale)
+    np.clip(packed, info.min, info.max, out=packed)
+    packed[mask] = fill
+    dic['data'] = packed.astype(dtype)
+    return dic
@@ -11,15 +11,27 @@ Input/output routines common to many file formats.
     stringarray_to_chararray
     _test_arguments
     make_time_unit_str
+    _cast_field_data
+    _packed_field_dic
+    _run_in_threads
+
+.. autosummary::
+    :toctree: generated/
+    :template: dev_template.rst
+
+    _PackedFieldData
 
 """
 
 import bz2
 import gzip
+import threading
 
 import numpy as np
 import netCDF4
 
+from ..lazydict import LazyLoadDict
+
 
 def prepare_for_read(filename):
     """
@@ -101,3 +113,124 @@ def _test_arguments(dic):
 def make_time_unit_str(dtobj):
     """ Return a time unit string from a datetime object. """
     return "seconds since " + dtobj.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _cast_field_data(data, dtype):
+    """ Return field data cast to dtype, None returns the data unchanged. """
+    if dtype is None or np.dtype(dtype) == data.dtype:
+        return data
+    return data.astype(dtype)
+
+
+def _packed_field_dic(dic, codes, scale_factor, add_offset, masked_codes,
+                      dtype):
+    """
+    Return a field dictionary whose data is stored as packed integer codes.
+
+    The 'data' key of the returned LazyLoadDict is decoded from the codes
+    when accessed, see :py:class:`_PackedFieldData`.
+    """
+    dic = LazyLoadDict(dic)
+    dic.set_lazy('data', _PackedFieldData(
+        codes, scale_factor, add_offset, masked_codes, dtype))
+    return dic
+
+
+def _run_in_threads(func, args_list, nthreads):
+    """
+    Call func with each tuple of arguments in args_list using threads.
+
+    The calls are divided between at most nthreads threads, thread i makes
+    calls i, i + nthreads, ...  The calls are made in the calling thread
+    when nthreads is one or less.  The first exception raised by any call
+    is re-raised after all threads have finished.  A list of the return
+    values, in the order of args_list, is returned.
+    """
+    results = [None] * len(args_list)
+    nthreads = min(nthreads, len(args_list))
+    if nthreads <= 1:
+        for i, args in enumerate(args_list):
+            results[i] = func(*args)
+        return results
+    errors = []
+
+    def worker(indices):
+        """ Make calls recording any exception raised. """
+        try:
+            for i in indices:
+                results[i] = func(*args_list[i])
+        except Exception as error:
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=worker,
+                         args=(range(i, len(args_list), nthreads), ))
+        for i in range(nthreads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+class _PackedFieldData(object):
+    """
+    Field data stored as packed integer codes which are decoded on access.
+
+    The decoded data is codes * scale_factor + add_offset with codes in
+    masked_codes masked.  The scale factor and offset may be scalars or
+    arrays with an element for each ray.  Parts of the data can be decoded
+    by indexing the object, indexing the rays limits the codes decoded.
+
+    Parameters
+    ----------
+    codes : 2D array
+        Packed integer codes, (nrays, ngates).
+    scale_factor, add_offset : float or 1D array
+        Scale factor and offset, scalars or for each ray.
+    masked_codes : sequence of int
+        Codes which are masked in the decoded data.
+    dtype : dtype
+        Data type of the decoded data.
+
+    """
+
+    def __init__(self, codes, scale_factor, add_offset, masked_codes=(),
+                 dtype='float32'):
+        """ initialize the object. """
+        self.codes = codes
+        self.scale_factor = scale_factor
+        self.add_offset = add_offset
+        self.masked_codes = list(masked_codes)
+        self.dtype = np.dtype(dtype)
+
+    def __call__(self):
+        """ Return the decoded data. """
+        return self[:]
+
+    def __getitem__(self, key):
+        """ Return part of the decoded data. """
+        if not isinstance(key, tuple):
+            key = (key, )
+        ray_key, gate_key = key[0], key[1:]
+        codes = self.codes[ray_key]
+        data = codes.astype(self.dtype)
+        data *= self._ray_param(self.scale_factor, ray_key, codes.ndim)
+        data += self._ray_param(self.add_offset, ray_key, codes.ndim)
+        mask = np.in1d(codes, self.masked_codes).reshape(codes.shape)
+        data = np.ma.array(data, mask=mask)
+        if gate_key:
+            data = data[(slice(None), ) * (codes.ndim - 1) + gate_key]
+        return data
+
+    @staticmethod
+    def _ray_param(param, ray_key, ndim):
+        """ Return a scale or offset which broadcasts against codes. """
+        if np.ndim(param) == 0:
+            return param
+        param = param[ray_key]
+        if ndim == 2:
+            param = param[:, np.newaxis]
+        return param
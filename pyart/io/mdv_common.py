@@ -11,6 +11,14 @@ Functions and classes common between MDV grid and radar files.
     MdvFile
     _MdvVolumeDataExtractor
 
+.. autosummary::
+    :toctree: generated/
+
+    _decompress_level
+    _decode_level
+    _decode_levels_threaded
+    _decode_rle8
+
 """
 
 from __future__ import print_function
@@ -27,6 +35,8 @@ import datetime
 import numpy as np
 
 from ..core.transforms import antenna_to_cartesian
+from ._mdv_rle import decode_rle8
+from .common import _run_in_threads
 
 # mapping from MDV name space to CF-Radial name space
 MDV_METADATA_MAP = {'instrument_name': 'data_set_source',
@@ -501,7 +511,7 @@ class MdvFile(object):
             print("Writing chunk headers")
         self._write_chunk_headers(self.master_header["nchunks"])
 
-    def read_a_field(self, fnum, debug=False):
+    def read_a_field(self, fnum, debug=False, nthreads=1):
         """
         Read a field from the MDV file.
 
@@ -511,6 +521,9 @@ class MdvFile(object):
             Field number to read.
         debug : bool
             True to print debugging information, False to supress.
+        nthreads : int, optional
+            Number of threads used to decompress and decode the levels of the
+            field.
 
         Returns
         -------
@@ -520,11 +533,10 @@ class MdvFile(object):
 
         See Also
         --------
+        read_fields : Read a number of fields from the MDV file.
         read_all_fields : Read all fields in the MDV file.
 
         """
-
-        field_header = self.field_headers[fnum]
         # if the field has already been read, return it
         if self.fields_data[fnum] is not None:
             if debug:
@@ -534,13 +546,122 @@ class MdvFile(object):
         # field has not yet been read, populate the object and return
         if debug:
             print("No data found in object, populating")
+        return self.read_fields([fnum], debug, nthreads)[0]
+
+    def read_fields(self, fnums=None, debug=False, nthreads=1):
+        """
+        Read a number of fields from the MDV file.
+
+        The compressed data of every level of the fields is read from the
+        file and then decompressed and decoded directly into a preallocated
+        array of shape (nfields, nz, ny, nx), when the fields have the same
+        shape.  The levels can be decoded concurrently by a number of
+        threads, the zlib, bzip2 and gzip decompressors release the GIL.
+
+        Parameters
+        ----------
+        fnums : list of int or None
+            Field numbers to read, None reads all fields.
+        debug : bool
+            True to print debugging information, False to supress.
+        nthreads : int, optional
+            Number of threads used to decompress and decode the levels of the
+            fields.
+
+        Returns
+        -------
+        fields_data : list of arrays
+            Field data of each field.  This data is also stored as a object
+            attribute under the field name.
+
+        """
+        if fnums is None:
+            fnums = range(self.master_header['nfields'])
+        fnums = list(fnums)
+        to_read = sorted(set(
+            fnum for fnum in fnums if self.fields_data[fnum] is None))
+
+        # allocate a single array for the fields when possible
+        shapes = [(self.field_headers[fnum]['nz'],
+                   self.field_headers[fnum]['ny'],
+                   self.field_headers[fnum]['nx']) for fnum in to_read]
+        if len(set(shapes)) == 1:
+            out = np.empty((len(to_read), ) + shapes[0], dtype='float32')
+        else:
+            out = [np.empty(shape, dtype='float32') for shape in shapes]
+
+        # read the compressed levels of all fields then decode them
+        levels = []
+        for fnum, field_data in zip(to_read, out):
+            field_header = self.field_headers[fnum]
+            for sw, compr in enumerate(self._read_field_chunks(fnum, debug)):
+                levels.append(compr + (field_header, field_data[sw]))
+        _decode_levels_threaded(levels, nthreads)
+
+        # store data as object attribute and return
+        for fnum, field_data in zip(to_read, out):
+            self.fields_data[fnum] = field_data
+        return [self.fields_data[fnum] for fnum in fnums]
+
+    def read_a_field_raw(self, fnum):
+        """
+        Read the encoded data of a field from the MDV file.
+
+        Parameters
+        ----------
+        fnum : int
+            Field number to read.
+
+        Returns
+        -------
+        codes : array or None
+            Encoded 8 or 16-bit integer field data, shape (nz, ny, nx).  The
+            field data is codes * scale + bias with codes equal to
+            bad_data_value masked, these parameters are in the field header.
+            None when the field is not encoded as integers.
+
+        """
+        field_header = self.field_headers[fnum]
+        encoding_dtypes = {ENCODING_INT8: 'uint8', ENCODING_INT16: 'uint16'}
+        if field_header['encoding_type'] not in encoding_dtypes:
+            return None
+        dtype = encoding_dtypes[field_header['encoding_type']]
+        shape = (field_header['nz'], field_header['ny'], field_header['nx'])
+        codes = np.empty(shape, dtype=dtype)
+        for sw, sw_data in enumerate(self._read_field_levels(fnum)):
+            codes[sw] = sw_data
+        return codes
+
+    def read_all_fields(self, nthreads=1):
+        """ Read all fields, storing data to field name attributes. """
+        self.read_fields(nthreads=nthreads)
+
+    def close(self):
+        """ Close the MDV file. """
+        self.fileptr.close()
+
+    ###################
+    # private methods #
+    ###################
 
+    def _read_field_levels(self, fnum, debug=False):
+        """
+        Read and decompress the levels of a field, yielding the encoded data
+        of each level as an array of shape (ny, nx).
+        """
+        field_header = self.field_headers[fnum]
+        for compr_info, compr_data in self._read_field_chunks(fnum, debug):
+            yield _decompress_level(compr_info, compr_data, field_header)
+
+    def _read_field_chunks(self, fnum, debug=False):
+        """
+        Read the compressed levels of a field, yielding the compression
+        information and compressed data of each level.
+        """
+        field_header = self.field_headers[fnum]
         nz = field_header['nz']
-        ny = field_header['ny']
-        nx = field_header['nx']
 
         # read the header
-        field_data = np.zeros([nz, ny, nx], dtype='float32')
         self.fileptr.seek(field_header['field_data_offset'])
         self._get_levels_info(nz)  # dict not used, but need to seek.
 
@@ -550,7 +671,7 @@ class MdvFile(object):
 
             # get the compressed level data
             compr_info = self._get_compression_info()
-            if compr_info['magic_cookie'] == 0xfe0103fd:
+            if compr_info['magic_cookie'] == RL8_COMPRESSION:
                 # Run length encoding only has 20 bytes of compression
                 # information with slightly different order, back up
                 # 4 bytes to read all of the compressed data.
@@ -558,78 +679,7 @@ class MdvFile(object):
                 compr_data = self.fileptr.read(compr_info['spare'][0])
             else:
                 compr_data = self.fileptr.read(compr_info['nbytes_coded'])
-            encoding_type = field_header['encoding_type']
-            if encoding_type == ENCODING_INT8:
-                fmt = '>%iB' % (nx * ny)
-                np_form = '>B'
-            elif encoding_type == ENCODING_INT16:
-                fmt = '>%iH' % (nx * ny)
-                np_form = '>H'
-            elif encoding_type == ENCODING_FLOAT32:
-                fmt = '>%if' % (nx * ny)
-                np_form = '>f'
-            else:
-                raise NotImplementedError('encoding: ', encoding_type)
-
-            # decompress the level data
-            if compr_info['magic_cookie'] == GZIP_COMPRESSED:
-                cd_fobj = BytesIO(compr_data)
-                gzip_file_handle = gzip.GzipFile(fileobj=cd_fobj)
-                decompr_data = gzip_file_handle.read(struct.calcsize(fmt))
-                gzip_file_handle.close()
-            elif compr_info['magic_cookie'] == ZLIB_COMPRESSED:
-                decompr_data = zlib.decompress(compr_data)
-            elif compr_info['magic_cookie'] == BZIP_COMPRESSED:
-                decompr_data = bz2.decompress(compr_data)
-            elif compr_info['magic_cookie'] == TA_NOT_COMPRESSED:
-                decompr_data = compr_data
-            elif compr_info['magic_cookie'] == GZIP_NOT_COMPRESSED:
-                decompr_data = compr_data
-            elif compr_info['magic_cookie'] == ZLIB_NOT_COMPRESSED:
-                decompr_data = compr_data
-            elif compr_info['magic_cookie'] == BZIP_NOT_COMPRESSED:
-                decompr_data = compr_data
-            elif compr_info['magic_cookie'] == RL8_COMPRESSION:
-                # Run length encoding of 8-bit data
-                # Compression info is in a different order, namely
-                # int32 : RL8_FLAG (0xfe0103fd)
-                # int32 : key
-                # int32 : nbytes_array (bytes of encoded data with header)
-                # int32 : nbytes_full (bytes of unencoded data, no header)
-                # int32 : nbytes_coded (bytes of encoded data, no header)
-                key = compr_info['nbytes_uncompressed']
-                decompr_size = compr_info['nbytes_coded']
-                decompr_data = _decode_rle8(compr_data, key, decompr_size)
-            else:
-                raise NotImplementedError('unknown compression mode')
-
-            # read the decompressed data, reshape and mask
-            sw_data = np.frombuffer(decompr_data, np_form).astype('float32')
-            sw_data.shape = (ny, nx)
-            mask = sw_data == field_header['bad_data_value']
-            np.putmask(sw_data, mask, [np.NaN])
-
-            # scale and offset the data, store in field_data
-            scale = field_header['scale']
-            bias = field_header['bias']
-            field_data[sw, :, :] = sw_data * scale + bias
-
-        # store data as object attribute and return
-        self.fields_data[fnum] = field_data
-        return field_data
-
-    def read_all_fields(self):
-        """ Read all fields, storing data to field name attributes. """
-        for i in range(self.master_header['nfields']):
-            self.read_a_field(i)
-
-    def close(self):
-        """ Close the MDV file. """
-        self.fileptr.close()
-
-    ###################
-    # private methods #
-    ###################
+            yield compr_info, compr_data
 
     def _write_a_field(self, fnum, debug=False):
         """ write field number 'fnum' to mdv file """
@@ -1148,28 +1198,91 @@ class MdvFile(object):
         return [fh[i]['field_name'] for i in range(len(fh))]
 
 
+def _decompress_level(compr_info, compr_data, field_header):
+    """
+    Decompress the data of a level, returning the encoded data as an array
+    of shape (ny, nx).
+    """
+    ny = field_header['ny']
+    nx = field_header['nx']
+    encoding_type = field_header['encoding_type']
+    if encoding_type == ENCODING_INT8:
+        np_form = '>B'
+    elif encoding_type == ENCODING_INT16:
+        np_form = '>H'
+    elif encoding_type == ENCODING_FLOAT32:
+        np_form = '>f'
+    else:
+        raise NotImplementedError('encoding: ', encoding_type)
+
+    # decompress the level data
+    magic_cookie = compr_info['magic_cookie']
+    if magic_cookie == GZIP_COMPRESSED:
+        cd_fobj = BytesIO(compr_data)
+        gzip_file_handle = gzip.GzipFile(fileobj=cd_fobj)
+        decompr_data = gzip_file_handle.read(
+            nx * ny * np.dtype(np_form).itemsize)
+        gzip_file_handle.close()
+    elif magic_cookie == ZLIB_COMPRESSED:
+        decompr_data = zlib.decompress(compr_data)
+    elif magic_cookie == BZIP_COMPRESSED:
+        decompr_data = bz2.decompress(compr_data)
+    elif magic_cookie in [TA_NOT_COMPRESSED, GZIP_NOT_COMPRESSED,
+                          ZLIB_NOT_COMPRESSED, BZIP_NOT_COMPRESSED]:
+        decompr_data = compr_data
+    elif magic_cookie == RL8_COMPRESSION:
+        # Run length encoding of 8-bit data
+        # Compression info is in a different order, namely
+        # int32 : RL8_FLAG (0xfe0103fd)
+        # int32 : key
+        # int32 : nbytes_array (bytes of encoded data with header)
+        # int32 : nbytes_full (bytes of unencoded data, no header)
+        # int32 : nbytes_coded (bytes of encoded data, no header)
+        key = compr_info['nbytes_uncompressed']
+        decompr_size = compr_info['nbytes_coded']
+        decompr_data = _decode_rle8(compr_data, key, decompr_size)
+    else:
+        raise NotImplementedError('unknown compression mode')
+
+    # read the decompressed data and reshape
+    sw_data = np.frombuffer(decompr_data, np_form)
+    sw_data.shape = (ny, nx)
+    return sw_data
+
+
+def _decode_level(compr_info, compr_data, field_header, out):
+    """
+    Decompress and decode the data of a level into out, a float32 array of
+    shape (ny, nx).  Bad data is set to NaN.
+    """
+    sw_data = _decompress_level(compr_info, compr_data, field_header)
+    # mask, scale and offset the data
+    out[:] = sw_data
+    mask = out == field_header['bad_data_value']
+    out *= field_header['scale']
+    out += field_header['bias']
+    out[mask] = np.NaN
+
+
+def _decode_levels_threaded(levels, nthreads):
+    """
+    Decode levels dividing the levels between threads.
+
+    Each level is a tuple of the arguments to :py:func:`_decode_level`.
+    Decompression and most of the decoding releases the GIL allowing the
+    levels to be decoded concurrently.
+    """
+    _run_in_threads(_decode_level, levels, nthreads)
+
+
 def _decode_rle8(compr_data, key, decompr_size):
     """ Decode 8-bit MDV run length encoding. """
     # Encoding is described in section 7 of:
     # http://rap.ucar.edu/projects/IHL/RalHtml/protocols/mdv_file/
-    # This function would benefit greate by being rewritten in Cython
+    # The decoding, see _mdv_rle.decode_rle8, releases the GIL so levels can
+    # be decoded concurrently.
     data = np.frombuffer(compr_data, dtype='>B')
-    out = np.empty((decompr_size, ), dtype='uint8')
-    data_ptr = 0
-    out_ptr = 0
-    while data_ptr != len(data):
-        v = data[data_ptr]
-        if v != key:  # not encoded
-            out[out_ptr] = v
-            data_ptr += 1
-            out_ptr += 1
-        else:   # run length encoded
-            count = data[data_ptr+1]
-            value = data[data_ptr+2]
-            out[out_ptr:out_ptr+count] = value
-            data_ptr += 3
-            out_ptr += count
-    return out.tostring()
+    return decode_rle8(data, key, decompr_size)
 
 
 class _MdvVolumeDataExtractor(object):
@@ -1187,15 +1300,19 @@ class _MdvVolumeDataExtractor(object):
     two_dims : bool.
         True to combine the first and second dimension of the array when
         returning the data, False will return a three dimensional array.
+    dtype : dtype or None
+        Data type of the returned array, None for float32.
 
     """
 
-    def __init__(self, mdvfile, field_num, fillvalue, two_dims=True):
+    def __init__(self, mdvfile, field_num, fillvalue, two_dims=True,
+                 dtype=None):
         """ initialize the object. """
         self.mdvfile = mdvfile
         self.field_num = field_num
         self.fillvalue = fillvalue
         self.two_dims = two_dims
+        self.dtype = dtype
 
     def __call__(self):
         """ Return an array containing data from the referenced volume. """
@@ -1206,4 +1323,6 @@ class _MdvVolumeDataExtractor(object):
         data = np.ma.masked_equal(data, self.fillvalue)
         if self.two_dims:
             data.shape = (data.shape[0] * data.shape[1], data.shape[2])
+        if self.dtype is not None and np.dtype(self.dtype) != data.dtype:
+            data = data.astype(self.dtype)
         return data
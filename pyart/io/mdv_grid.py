@@ -232,7 +232,7 @@ def write_grid_mdv(filename, grid, mdv_field_names=None,
 
 def read_grid_mdv(filename, field_names=None, additional_metadata=None,
                   file_field_names=False, exclude_fields=None,
-                  delay_field_loading=False, **kwargs):
+                  delay_field_loading=False, nthreads=1, **kwargs):
     """
     Read a MDV file to a Grid Object.
 
@@ -266,6 +266,9 @@ def read_grid_mdv(filename, field_names=None, additional_metadata=None,
         key in a particular field dictionary is accessed.  In this case
         the field attribute of the returned Radar object will contain
         LazyLoadDict objects not dict objects.
+    nthreads : int, optional
+        Number of threads used to decompress and decode the levels of the
+        fields.  Not used when delay_field_loading is True.
 
     Returns
     -------
@@ -380,6 +383,12 @@ def read_grid_mdv(filename, field_names=None, additional_metadata=None,
     # fields
     fields = {}
     mdv_fields = mdv._make_fields_list()
+    if not delay_field_loading:
+        # decode all fields together into a single array
+        mdv.read_fields(
+            [mdv.fields.index(mdv_field) for mdv_field in set(mdv_fields)
+             if filemetadata.get_field_name(mdv_field) is not None],
+            nthreads=nthreads)
     for mdv_field in set(mdv_fields):
         field_name = filemetadata.get_field_name(mdv_field)
         if field_name is None:
@@ -17,13 +17,15 @@ from netCDF4 import date2num
 from ..config import FileMetadata, get_fillvalue
 from ..core.radar import Radar
 from .common import make_time_unit_str, _test_arguments, prepare_for_read
+from .common import _packed_field_dic
 from ..lazydict import LazyLoadDict
 from . import mdv_common
 
 
 def read_mdv(filename, field_names=None, additional_metadata=None,
              file_field_names=False, exclude_fields=None,
-             delay_field_loading=False, **kwargs):
+             delay_field_loading=False, dtype=None, keep_packed=False,
+             nthreads=1, **kwargs):
     """
     Read a MDV file.
 
@@ -58,6 +60,19 @@ def read_mdv(filename, field_names=None, additional_metadata=None,
         the field attribute of the returned Radar object will contain
         LazyLoadDict objects not dict objects. Not all file types support this
         parameter.
+    dtype : dtype or None, optional
+        Data type of the field data, for example 'float32' or 'float64'.
+        None, the default, uses float32.
+    keep_packed : bool, optional
+        True to store the data of fields encoded as 8 or 16-bit integers in
+        the file as these codes along with the scale and bias of the field,
+        the data is decoded into a masked array of type dtype each time the
+        'data' key of the field dictionary, a LazyLoadDict, is evaluated.
+        Fields encoded as floating point values are read as usual.  False,
+        the default, decodes the field data when read.
+    nthreads : int, optional
+        Number of threads used to decompress and decode the levels of the
+        fields.  Not used when delay_field_loading is True.
 
     Returns
     -------
@@ -102,6 +117,19 @@ def read_mdv(filename, field_names=None, additional_metadata=None,
     _range['meters_to_center_of_first_gate'] = _range['data'][0]
     _range['meters_between_gates'] = (_range['data'][1] - _range['data'][0])
 
+    # decode the fields which are not kept packed together
+    if not delay_field_loading:
+        field_nums = []
+        for mdv_field in set(mdvfile.fields):
+            if filemetadata.get_field_name(mdv_field) is None:
+                continue
+            field_num = mdvfile.fields.index(mdv_field)
+            encoding_type = mdvfile.field_headers[field_num]['encoding_type']
+            if keep_packed and encoding_type != mdv_common.ENCODING_FLOAT32:
+                continue
+            field_nums.append(field_num)
+        mdvfile.read_fields(field_nums, nthreads=nthreads)
+
     # fields
     fields = {}
     for mdv_field in set(mdvfile.fields):
@@ -112,8 +140,20 @@ def read_mdv(filename, field_names=None, additional_metadata=None,
         # create and store the field dictionary
         field_dic = filemetadata(field_name)
         field_dic['_FillValue'] = get_fillvalue()
+        field_num = mdvfile.fields.index(mdv_field)
+        codes = None
+        if keep_packed:
+            codes = mdvfile.read_a_field_raw(field_num)
+        if codes is not None:
+            field_header = mdvfile.field_headers[field_num]
+            codes.shape = (codes.shape[0] * codes.shape[1], codes.shape[2])
+            field_dic = _packed_field_dic(
+                field_dic, codes, field_header['scale'], field_header['bias'],
+                (field_header['bad_data_value'], ), dtype or 'float32')
+            fields[field_name] = field_dic
+            continue
         dataextractor = mdv_common._MdvVolumeDataExtractor(
-            mdvfile, mdvfile.fields.index(mdv_field), get_fillvalue())
+            mdvfile, field_num, get_fillvalue(), dtype=dtype)
         if delay_field_loading:
             field_dic = LazyLoadDict(field_dic)
             field_dic.set_lazy('data', dataextractor)
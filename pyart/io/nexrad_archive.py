@@ -14,6 +14,9 @@ Functions for reading NEXRAD Level II Archive files.
     :toctree: generated/
 
     read_nexrad_archive
+    read_nexrad_chunks
+    _read_nexrad_chunk_scan
+    _packed_scale_offset
     _find_range_params
     _find_scans_to_interp
     _interpolate_scan
@@ -27,7 +30,8 @@ import numpy as np
 from ..config import FileMetadata, get_fillvalue
 from ..core.radar import Radar
 from .common import make_time_unit_str, _test_arguments, prepare_for_read
-from .nexrad_level2 import NEXRADLevel2File
+from .common import _cast_field_data, _packed_field_dic
+from .nexrad_level2 import NEXRADLevel2File, NEXRADLevel2ChunkBuffer
 from ..lazydict import LazyLoadDict
 from .nexrad_common import get_nexrad_location
 from .nexrad_interpolate import _fast_interpolate_scan
@@ -35,8 +39,9 @@ from .nexrad_interpolate import _fast_interpolate_scan
 
 def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
                         file_field_names=False, exclude_fields=None,
-                        delay_field_loading=False, station=None, scans=None,
-                        linear_interp=True, **kwargs):
+                        include_fields=None, delay_field_loading=False,
+                        station=None, scans=None, linear_interp=True,
+                        dtype=None, keep_packed=False, **kwargs):
     """
     Read a NEXRAD Level 2 Archive file.
 
@@ -68,6 +73,11 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
     exclude_fields : list or None, optional
         List of fields to exclude from the radar object. This is applied
         after the `file_field_names` and `field_names` parameters.
+    include_fields : list or None, optional
+        List of fields to include in the radar object, None (the default)
+        includes all fields not excluded.  This is applied after the
+        `file_field_names` and `field_names` parameters.  Moments which are
+        not included are not decoded from the file.
     delay_field_loading : bool, optional
         True to delay loading of field data from the file until the 'data'
         key in a particular field dictionary is accessed.  In this case
@@ -80,13 +90,27 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
         in older NEXRAD message 1 files.
     scans : list or None, optional
         Read only specified scans from the file.  None (the default) will read
-        all scans.
+        all scans.  Only the message headers of records from other scans are
+        read and records following the last specified scan are not
+        decompressed.
     linear_interp : bool, optional
         True (the default) to perform linear interpolation between valid pairs
         of gates in low resolution rays in files mixed resolution rays.
         False will perform a nearest neighbor interpolation.  This parameter is
         not used if the resolution of all rays in the file or requested sweeps
         is constant.
+    dtype : dtype or None, optional
+        Data type of the field data, for example 'float32' or 'float64'.
+        None, the default, uses float32.
+    keep_packed : bool, optional
+        True to store the field data as the 8 or 16-bit codes from the file
+        along with the scale and offset of each ray, the data is decoded into
+        a masked array of type dtype each time the 'data' key of the field
+        dictionary, a LazyLoadDict, is evaluated.  This reduces the memory
+        used by fields which have not been accessed or which are unloaded,
+        see :py:class:`pyart.lazydict.LazyLoadCache`.  Moments in scans which
+        require interpolation are not kept packed.  False, the default,
+        decodes the field data when read.
 
     Returns
     -------
@@ -106,10 +130,12 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
     # create metadata retrieval object
     filemetadata = FileMetadata('nexrad_archive', field_names,
                                 additional_metadata, file_field_names,
-                                exclude_fields)
+                                exclude_fields, include_fields)
 
-    # open the file and retrieve scan information
-    nfile = NEXRADLevel2File(prepare_for_read(filename))
+    # open the file and retrieve scan information, records are indexed and
+    # only the requested moments from the requested scans are decoded
+    nfile = NEXRADLevel2File(prepare_for_read(filename), lazy=True,
+                             scans=scans)
     scan_info = nfile.scan_info(scans)
 
     # time
@@ -192,7 +218,13 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
             continue
         dic = filemetadata(field_name)
         dic['_FillValue'] = get_fillvalue()
-        if delay_field_loading and moment not in interpolate:
+        if keep_packed and moment not in interpolate:
+            codes = nfile.get_data(moment, max_ngates, scans=scans,
+                                   raw_data=True)
+            scale, offset = _packed_scale_offset(nfile, moment, scans)
+            dic = _packed_field_dic(
+                dic, codes, scale, offset, (0, 1), dtype or 'float32')
+        elif delay_field_loading and moment not in interpolate:
             dic = LazyLoadDict(dic)
             data_call = _NEXRADLevel2StagedField(
                 nfile, moment, max_ngates, scans)
@@ -212,7 +244,7 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
                     end = sweep_end_ray_index['data'][scan]
                     _interpolate_scan(mdata, start, end, moment_ngates,
                                       linear_interp)
-            dic['data'] = mdata
+            dic['data'] = _cast_field_data(mdata, dtype)
         fields[field_name] = dic
 
     # instrument_parameters
@@ -235,6 +267,70 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
         instrument_parameters=instrument_parameters)
 
 
+def read_nexrad_chunks(chunks, **kwargs):
+    """
+    Read real-time NEXRAD Level 2 chunks yielding a Radar for each sweep.
+
+    Chunks are decompressed and decoded as they are received.  A Radar
+    object containing a single sweep is yielded as soon as the chunk
+    completing the sweep is received, allowing products from the lowest
+    sweeps to be created before the volume is complete.  Sweeps which are
+    incomplete when the chunks are exhausted are yielded at the end.
+
+    Parameters
+    ----------
+    chunks : iterable
+        Chunks, as bytes or file-like objects, in the order they were
+        created.  This can be a generator which blocks until the next chunk
+        is available.  A start chunk begins a new volume.
+    kwargs :
+        Additional keyword arguments passed to
+        :py:func:`read_nexrad_archive` when creating each Radar.  The scans
+        argument cannot be used.
+
+    Yields
+    ------
+    radar : Radar
+        Radar object containing a single sweep.  The sweep_number attribute
+        contains the (0 based) number of the sweep in the volume.
+
+    """
+    if 'scans' in kwargs:
+        raise ValueError('scans cannot be specified when reading chunks')
+    chunk_buffer = NEXRADLevel2ChunkBuffer()
+    for chunk in chunks:
+        for scan in chunk_buffer.add_chunk(chunk):
+            yield _read_nexrad_chunk_scan(chunk_buffer, scan, kwargs)
+    for scan in chunk_buffer.finish():
+        yield _read_nexrad_chunk_scan(chunk_buffer, scan, kwargs)
+
+
+def _read_nexrad_chunk_scan(chunk_buffer, scan, kwargs):
+    """ Create a Radar from a scan in a chunk buffer. """
+    radar = read_nexrad_archive(
+        chunk_buffer.pop_scan_file(scan), scans=[scan], **kwargs)
+    radar.sweep_number['data'][:] = scan
+    return radar
+
+
+def _packed_scale_offset(nfile, moment, scans):
+    """
+    Return the scale factor and offset of each ray which decode the raw
+    moment data, value = code * scale_factor + add_offset.
+    """
+    if scans is None:
+        scans = range(nfile.nscans)
+    scale, offset = nfile.get_scale_offset(moment, scans)
+    # scans without the moment contain only masked codes
+    present = ~np.isnan(scale)
+    scale[~present] = 1.
+    offset[~present] = 0.
+    rays_per_scan = [len(nfile.scan_msgs[scan]) for scan in scans]
+    scale_factor = np.repeat(1. / scale, rays_per_scan)
+    add_offset = np.repeat(-offset / scale, rays_per_scan)
+    return scale_factor, add_offset
+
+
 def _find_range_params(scan_info, filemetadata):
     """ Return range parameters, first_gate, gate_spacing, last_gate. """
     min_first_gate = 999999
@@ -7,14 +7,28 @@ pyart.io.nexrad_level2
     :template: dev_template.rst
 
     NEXRADLevel2File
+    NEXRADLevel2ChunkBuffer
+    _LazyRecords
 
 .. autosummary::
     :toctree: generated/
 
     _decompress_records
+    _radial_status
+    _past_elevation
+    _find_compressed_blocks
+    _decompress_blocks_threaded
+    _decompress_block
+    _index_records
+    _index_radials
+    _index_msg1_radials
+    _gather_blocks
+    _gather_structures
+    _native_array
     _get_record_from_buf
     _get_msg31_data_block
     _structure_size
+    _structure_dtype
     _unpack_from_buf
     _unpack_structure
 
@@ -77,12 +91,16 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import bz2
+import mmap
 import struct
 from datetime import datetime, timedelta
+from io import BytesIO
 
 import numpy as np
 import warnings
 
+from .common import _run_in_threads
+
 class NEXRADLevel2File(object):
     """
     Class for accessing data in a NEXRAD (WSR-88D) Level II file.
@@ -97,11 +115,27 @@ class NEXRADLevel2File(object):
     ----------
     filename : str
         Filename of Archive II file to read.
+    lazy : bool, optional
+        True to only scan the message headers when the file is opened,
+        building a record index from which radial records and moment data
+        are decoded on demand.  The payload of uncompressed files is memory
+        mapped when a filename is given.  False, the default, unpacks all
+        records when the file is opened.
+    nthreads : int, optional
+        Number of threads used to decompress the BZ2 compressed blocks of
+        compressed files.  The blocks are located using the control words
+        which precede them and decompressed concurrently.
+    scans : list or None, optional
+        Scans (0 based) which will be read from the file.  Records following
+        the last of these scans are neither decompressed nor decoded and
+        the nscans attribute and scan_msgs reflect only the scans up to and
+        including the last.  None, the default, reads all scans.
 
     Attributes
     ----------
     radial_records : list
-        Radial (1 or 31) messages in the file.
+        Radial (1 or 31) messages in the file.  When opened with lazy=True
+        this is a sequence which unpacks the records when accessed.
     nscans : int
         Number of scans in the file.
     scan_msgs : list of arrays
@@ -113,6 +147,14 @@ class NEXRADLevel2File(object):
         VCP information dictionary.
     _records : list
         A list of all records (message) in the file.
+    _record_index : structured array or None
+        Position and type of all records in the file when opened with
+        lazy=True, None otherwise.
+    _radial_index : dict or None
+        Structured arrays of the message headers, radial data constant
+        blocks and moment block parameters of all radial records indexed
+        by the record dictionary keys, 'msg_header', 'RAD', 'REF', etc, when
+        opened with lazy=True, None otherwise.
     _fh : file-like
         File like object from which data is read.
     _msg_type : '31' or '1':
@@ -125,7 +167,7 @@ class NEXRADLevel2File(object):
     .. [3] http://thredds.ucar.edu/thredds/catalog.html
 
     """
-    def __init__(self, filename):
+    def __init__(self, filename, lazy=False, nthreads=1, scans=None):
         """ initalize the object. """
         # read in the volume header and compression_record
         if hasattr(filename, 'read'):
@@ -135,49 +177,46 @@ class NEXRADLevel2File(object):
         size = _structure_size(VOLUME_HEADER)
         self.volume_header = _unpack_structure(fh.read(size), VOLUME_HEADER)
         compression_record = fh.read(COMPRESSION_RECORD_SIZE)
+        max_elevation = None
+        if scans is not None:
+            max_elevation = max(scans) + 1
 
         # read the records in the file, decompressing as needed
         compression_slice = slice(CONTROL_WORD_SIZE, CONTROL_WORD_SIZE + 2)
         compression_or_ctm_info = compression_record[compression_slice]
+        start = 0
         if compression_or_ctm_info == b'BZ':
-            buf = _decompress_records(fh)
+            buf = _decompress_records(fh, nthreads, max_elevation)
         # The 12-byte compression record previously held the Channel Terminal
         # Manager (CTM) information. Bytes 4 through 6 contain the size of the
         # record (2432) as a big endian unsigned short, which is encoded as
         # b'\t\x80' == struct.pack('>H', 2432).
         # Newer files zero out this section.
         elif compression_or_ctm_info in (b'\x00\x00', b'\t\x80'):
-            buf = fh.read()
+            if lazy and not hasattr(filename, 'read'):
+                # map the file rather than reading it, skipping the headers
+                start = fh.tell()
+                buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buf = fh.read()
         else:
             raise IOError('unknown compression record')
         self._fh = fh
+        self._lazy = lazy
 
-        # read the records from the buffer
-        self._records = []
-        buf_length = len(buf)
-        pos = 0
-        while pos < buf_length:
-            pos, dic = _get_record_from_buf(buf, pos)
-            self._records.append(dic)
+        if lazy:
+            self._init_from_index(buf, start, max_elevation)
+        else:
+            self._init_from_records(buf, max_elevation)
 
-        # pull out radial records (1 or 31) which contain the moment data.
-        self.radial_records = [r for r in self._records
-                               if r['header']['type'] == 31]
-        self._msg_type = '31'
-        if len(self.radial_records) == 0:
-            self.radial_records = [r for r in self._records
-                                   if r['header']['type'] == 1]
-            self._msg_type = '1'
         if len(self.radial_records) == 0:
             raise ValueError('No MSG31 records found, cannot read file')
-        elev_nums = np.array([m['msg_header']['elevation_number']
-                              for m in self.radial_records])
-        self.scan_msgs = [np.where(elev_nums == i + 1)[0]
-                          for i in range(elev_nums.max())]
+        self.scan_msgs = [np.where(self._elev_nums == i + 1)[0]
+                          for i in range(self._elev_nums.max())]
         self.nscans = len(self.scan_msgs)
 
         # pull out the vcp record
-        msg_5 = [r for r in self._records if r['header']['type'] == 5]
+        msg_5 = [r for r in self._msg5_records()]
 
         if len(msg_5):
             self.vcp = msg_5[0]
@@ -186,10 +225,64 @@ class NEXRADLevel2File(object):
             warnings.warn("No MSG5 detected. Setting to meaningless data. "
                           "Rethink your life choices and be ready for errors."
                           "Specifically fixed angle data will be missing")
-            
+
             self.vcp = None
         return
 
+    def _init_from_records(self, buf, max_elevation):
+        """ Unpack the records in the buffer. """
+        self._buf = None
+        self._record_index = None
+        self._radial_index = None
+
+        # read the records from the buffer
+        self._records = []
+        buf_length = len(buf)
+        pos = 0
+        while pos < buf_length:
+            pos, dic = _get_record_from_buf(buf, pos)
+            if (max_elevation is not None and 'msg_header' in dic and
+                    dic['msg_header'].get('elevation_number', 0) >
+                    max_elevation):
+                break
+            self._records.append(dic)
+
+        # pull out radial records (1 or 31) which contain the moment data.
+        self.radial_records = [r for r in self._records
+                               if r['header']['type'] == 31]
+        self._msg_type = '31'
+        if len(self.radial_records) == 0:
+            self.radial_records = [r for r in self._records
+                                   if r['header']['type'] == 1]
+            self._msg_type = '1'
+        self._elev_nums = np.array(
+            [m['msg_header']['elevation_number']
+             for m in self.radial_records], dtype='int64')
+
+    def _init_from_index(self, buf, start, max_elevation):
+        """ Index the records in the buffer from their message headers. """
+        self._buf = buf
+        self._record_index = _index_records(buf, start, max_elevation)
+        self._records = _LazyRecords(buf, self._record_index['pos'])
+
+        # index the radial records (1 or 31) which contain the moment data.
+        types = self._record_index['type']
+        self._msg_type = '31'
+        if not np.any(types == 31):
+            self._msg_type = '1'
+        positions = self._record_index['pos'][types == int(self._msg_type)]
+        self.radial_records = _LazyRecords(buf, positions)
+        self._radial_index = _index_radials(buf, positions, self._msg_type)
+        self._elev_nums = self._radial_index['msg_header'][
+            'elevation_number'].astype('int64')
+
+    def _msg5_records(self):
+        """ Return an iterator over the message 5 records in the file. """
+        if self._record_index is None:
+            return (r for r in self._records if r['header']['type'] == 5)
+        positions = self._record_index['pos'][self._record_index['type'] == 5]
+        return (_get_record_from_buf(self._buf, pos)[1] for pos in positions)
+
     def close(self):
         """ Close the file. """
         self._fh.close()
@@ -321,6 +414,9 @@ class NEXRADLevel2File(object):
         Return an array of radial header elements for all rays in scans.
         """
         msg_nums = self._msg_nums(scans)
+        if self._radial_index is not None:
+            index = self._radial_index['msg_header']
+            return _native_array(index[key][msg_nums])
         temp = [self.radial_records[i]['msg_header'][key] for i in msg_nums]
         return np.array(temp)
 
@@ -329,6 +425,12 @@ class NEXRADLevel2File(object):
         Return an array of RAD or msg_header elements for all rays in scans.
         """
         msg_nums = self._msg_nums(scans)
+        if self._radial_index is not None:
+            if self._msg_type == '31':
+                index = self._radial_index['RAD']
+            else:
+                index = self._radial_index['msg_header']
+            return _native_array(index[key][msg_nums])
         if self._msg_type == '31':
             tmp = [self.radial_records[i]['RAD'][key] for i in msg_nums]
         else:
@@ -491,6 +593,49 @@ class NEXRADLevel2File(object):
         # unambiguous range is stored in tenths of km, x100 for meters
         return self._radial_sub_array(scans, 'unambig_range') * 100.
 
+    def get_scale_offset(self, moment, scans=None):
+        """
+        Retrieve the scale and offset of a moment for a given set of scans.
+
+        Data values are found from the raw data using
+        (raw_data - offset) / scale.
+
+        Parameters
+        ----------
+        moment : 'REF', 'VEL', 'SW', 'ZDR', 'PHI', or 'RHO'
+            Moment for which to to retrieve the scale and offset.
+        scans : list or None.
+            Scans to retrieve the scale and offset for (0 based).  None (the
+            default) will get the values for all scans in the volume.
+
+        Returns
+        -------
+        scale, offset : ndarray
+            Scale and offset of the moment in each scan, NaN for scans which
+            do not contain the moment.
+
+        """
+        if scans is None:
+            scans = range(self.nscans)
+        msg_nums = [self.scan_msgs[scan][0] for scan in scans]
+        if self._radial_index is not None:
+            if moment not in self._radial_index:
+                nan = np.full((len(msg_nums), ), np.nan, dtype='float32')
+                return nan, nan.copy()
+            index = self._radial_index[moment][msg_nums]
+            present = index['data_pos'] >= 0
+            scale = np.where(present, index['scale'], np.nan)
+            offset = np.where(present, index['offset'], np.nan)
+            return scale.astype('float32'), offset.astype('float32')
+        scale = np.full((len(msg_nums), ), np.nan, dtype='float32')
+        offset = np.full((len(msg_nums), ), np.nan, dtype='float32')
+        for i, msg_num in enumerate(msg_nums):
+            msg = self.radial_records[msg_num]
+            if moment in msg.keys():
+                scale[i] = msg[moment]['scale']
+                offset[i] = msg[moment]['offset']
+        return scale, offset
+
     def get_data(self, moment, max_ngates, scans=None, raw_data=False):
         """
         Retrieve moment data for a given set of scans.
@@ -510,7 +655,9 @@ class NEXRADLevel2File(object):
             applying the appropiate scale and offset to the data.  When
             raw_data is True values of 1 in the data likely indicate that
             the gate was not present in the sweep, in some cases in will
-            indicate range folded data.
+            indicate range folded data.  The scale and offset needed to
+            convert the raw data can be found using
+            :py:func:`get_scale_offset`.
         scans : list or None.
             Scans to retrieve data from (0 based).  None (the default) will
             get the data for all scans in the volume.
@@ -518,6 +665,8 @@ class NEXRADLevel2File(object):
         Returns
         -------
         data : ndarray
+            Raw uint8 or uint16 (PHI) data when raw_data is True, otherwise
+            a masked float32 array of data values.
 
         """
         if scans is None:
@@ -532,48 +681,481 @@ class NEXRADLevel2File(object):
             data = np.ones((nrays, max_ngates), dtype='u1')
         else:
             data = np.ones((nrays, max_ngates), dtype='u2')
-        for i, msg_num in enumerate(msg_nums):
-            msg = self.radial_records[msg_num]
-            if moment not in msg.keys():
-                continue
-            ngates = msg[moment]['ngates']
-            data[i, :ngates] = msg[moment]['data']
+        if self._radial_index is not None:
+            self._fill_data_from_index(data, moment, scans)
+        else:
+            for i, msg_num in enumerate(msg_nums):
+                msg = self.radial_records[msg_num]
+                if moment not in msg.keys():
+                    continue
+                ngates = msg[moment]['ngates']
+                data[i, :ngates] = msg[moment]['data']
 
         # return raw data if requested
         if raw_data:
             return data
 
-        # mask, scan and offset, assume that the offset and scale
-        # are the same in all scans/gates
-        for scan in scans:  # find a scan which contains the moment
-            msg_num = self.scan_msgs[scan][0]
-            msg = self.radial_records[msg_num]
-            if moment in msg.keys():
-                offset = np.float32(msg[moment]['offset'])
-                scale = np.float32(msg[moment]['scale'])
-                mask = data <= 1
-                scaled_data = (data - offset) / scale
-                return np.ma.array(scaled_data, mask=mask)
+        # mask, scale and offset using the parameters of each scan
+        scale, offset = self.get_scale_offset(moment, scans)
+        present = ~np.isnan(scale)
+        if not np.any(present):
+            # moment is not present in any scan, mask all values
+            return np.ma.masked_less_equal(data, 1)
+        # scans without the moment are fully masked, any parameters will do
+        scale[~present] = scale[present][0]
+        offset[~present] = offset[present][0]
+        rays_per_scan = [len(self.scan_msgs[scan]) for scan in scans]
+        mask = data <= 1
+        scaled_data = data.astype('float32')
+        scaled_data -= np.repeat(offset, rays_per_scan)[:, np.newaxis]
+        scaled_data /= np.repeat(scale, rays_per_scan)[:, np.newaxis]
+        return np.ma.array(scaled_data, mask=mask)
+
+    def _fill_data_from_index(self, data, moment, scans):
+        """
+        Decode moment data from the record index into an array.
+
+        The rays of most scans are equally spaced in the buffer and are
+        copied from a single strided view of the buffer.
+        """
+        if moment not in self._radial_index:
+            return
+        word_type = np.dtype('>u2' if moment == 'PHI' else '>u1')
+        start = 0
+        for scan in scans:
+            msg_nums = self.scan_msgs[scan]
+            index = self._radial_index[moment][msg_nums]
+            scan_data = data[start:start + len(msg_nums)]
+            start += len(msg_nums)
+
+            data_pos = index['data_pos']
+            ngates = index['ngates']
+            strides = np.diff(data_pos)
+            if (np.all(data_pos >= 0) and np.all(ngates == ngates[0]) and
+                    np.all(strides == strides[:1])):
+                stride = int(strides[0]) if len(strides) else 0
+                scan_data[:, :ngates[0]] = np.ndarray(
+                    (len(msg_nums), ngates[0]), word_type, self._buf,
+                    int(data_pos[0]), (stride, word_type.itemsize))
+                continue
+            for i in np.nonzero(data_pos >= 0)[0]:
+                scan_data[i, :ngates[i]] = np.frombuffer(
+                    self._buf, word_type, ngates[i], data_pos[i])
+
+
+class _LazyRecords(object):
+    """
+    A sequence of NEXRAD records which are unpacked when accessed.
+    """
+
+    def __init__(self, buf, positions):
+        """ initialize. """
+        self._buf = buf
+        self._positions = positions
+
+    def __len__(self):
+        """ Return the number of records. """
+        return len(self._positions)
+
+    def __getitem__(self, key):
+        """ Return the unpacked record(s) at a given index or slice. """
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        return _get_record_from_buf(self._buf, int(self._positions[key]))[1]
 
-        # moment is not present in any scan, mask all values
-        return np.ma.masked_less_equal(data, 1)
+    def __iter__(self):
+        """ Iterate over the unpacked records. """
+        for pos in self._positions:
+            yield _get_record_from_buf(self._buf, int(pos))[1]
 
 
-def _decompress_records(file_handler):
+class NEXRADLevel2ChunkBuffer(object):
+    """
+    Buffer for assembling NEXRAD Level II scans from real-time chunks.
+
+    Real-time NEXRAD Level II data is distributed as a sequence of chunks,
+    a start chunk containing the volume header and metadata records followed
+    by intermediate and end chunks containing the radial records, each a
+    series of BZ2 compressed blocks preceded by control words.  Chunks are
+    decompressed as they are added with the records appended to the buffer
+    of the scan (elevation) they belong to.  A scan is complete when its
+    end of elevation radial or a radial from a later scan is added.
+
+    Attributes
+    ----------
+    volume_header : bytes or None
+        Volume header from the start chunk, None if no start chunk has been
+        added.
+    completed : list
+        Completed scans (0 based) whose records are in the buffer.
+
+    """
+
+    def __init__(self):
+        """ initialize. """
+        self._reset(None)
+
+    def _reset(self, volume_header):
+        """ Discard all records and set the volume header. """
+        self.volume_header = volume_header
+        self.completed = []
+        self._metadata = []
+        self._scans = {}
+        self._nblocks = 0
+        self._last_elevation = 0
+
+    def add_chunk(self, chunk):
+        """
+        Add a chunk to the buffer.
+
+        Parameters
+        ----------
+        chunk : bytes or file-like
+            Chunk to add.  A start chunk, one beginning with a volume
+            header, discards any records from the previous volume.
+
+        Returns
+        -------
+        scans : list
+            Scans (0 based) completed by the records in the chunk.
+
+        """
+        if hasattr(chunk, 'read'):
+            chunk = chunk.read()
+        pos = 0
+        if chunk[:4] == b'AR2V':
+            pos = _structure_size(VOLUME_HEADER)
+            self._reset(chunk[:pos])
+        blocks = _find_compressed_blocks(chunk, pos)
+        if blocks is None:
+            raise IOError('chunk does not contain BZ2 compressed blocks')
+        scans = []
+        for start, end in blocks:
+            scans.extend(self._add_records(bz2.decompress(chunk[start:end])))
+        return scans
+
+    def finish(self):
+        """
+        Mark all scans in the buffer as complete, for use when no more
+        chunks will be added for the volume.
+
+        Returns
+        -------
+        scans : list
+            Scans (0 based) which were completed.
+
+        """
+        return self._complete(max(self._scans.keys() or [0]))
+
+    def pop_scan_file(self, scan):
+        """
+        Remove the records of a scan from the buffer returning them as an
+        uncompressed Archive II file.
+
+        Parameters
+        ----------
+        scan : int
+            Scan (0 based) to remove.
+
+        Returns
+        -------
+        file_like : BytesIO
+            Uncompressed Archive II file containing the volume header,
+            metadata records and records of the scan.  This can be read
+            using :py:class:`NEXRADLevel2File` or
+            :py:func:`pyart.io.read_nexrad_archive` using scans=[scan].
+
+        """
+        records = self._scans.pop(scan + 1)
+        if scan in self.completed:
+            self.completed.remove(scan)
+        volume_header = self.volume_header
+        if volume_header is None:
+            volume_header = b'\x00' * _structure_size(VOLUME_HEADER)
+        return BytesIO(b''.join(
+            [volume_header, b'\x00' * COMPRESSION_RECORD_SIZE] +
+            self._metadata + records))
+
+    def _add_records(self, buf):
+        """ Add the records in a decompressed block to the scan buffers. """
+        pos = 0
+        if self._nblocks == 0 and self.volume_header is not None:
+            pos = COMPRESSION_RECORD_SIZE
+        self._nblocks += 1
+        index = _index_records(buf, pos)
+        ends = list(index['pos'][1:]) + [len(buf)]
+        scans = []
+        for record, end in zip(index, ends):
+            elevation = int(record['elevation_number'])
+            if elevation == 0:
+                # keep metadata records preceding the radial records
+                if self._last_elevation == 0:
+                    self._metadata.append(buf[record['pos']:end])
+                continue
+            if elevation > self._last_elevation:
+                scans.extend(self._complete(elevation - 1))
+                self._last_elevation = elevation
+            self._scans.setdefault(elevation, []).append(
+                buf[record['pos']:end])
+            status = _radial_status(buf, record['pos'], record['type'])
+            if status in (RADIAL_STATUS_END_ELEVATION,
+                          RADIAL_STATUS_END_VOLUME):
+                scans.extend(self._complete(elevation))
+        return scans
+
+    def _complete(self, elevation):
+        """ Mark scans up to and including an elevation as complete. """
+        scans = []
+        for scan_elevation in sorted(self._scans.keys()):
+            scan = scan_elevation - 1
+            if scan_elevation <= elevation and scan not in self.completed:
+                self.completed.append(scan)
+                scans.append(scan)
+        return scans
+
+
+def _radial_status(buf, pos, msg_type):
+    """ Return the radial status of a MSG31 or MSG1 record. """
+    pos += _structure_size(MSG_HEADER)
+    if msg_type == 31:
+        return struct.unpack_from('>B', buf, pos + 21)[0]
+    return struct.unpack_from('>H', buf, pos + 12)[0]
+
+
+def _decompress_records(file_handler, nthreads=1, max_elevation=None):
     """
     Decompressed the records from an BZ2 compressed Archive 2 file.
+
+    When nthreads is larger than one the compressed blocks are located using
+    their control words and decompressed concurrently.  Blocks following
+    the first block containing a radial record with an elevation number
+    larger than max_elevation are not decompressed.  The decompressed
+    blocks are assembled into a single buffer.
     """
     file_handler.seek(0)
     cbuf = file_handler.read()    # read all data from the file
-    decompressor = bz2.BZ2Decompressor()
-    skip = _structure_size(VOLUME_HEADER) + CONTROL_WORD_SIZE
-    buf = decompressor.decompress(cbuf[skip:])
-    while len(decompressor.unused_data):
-        cbuf = decompressor.unused_data
+    skip = _structure_size(VOLUME_HEADER)
+    blocks = None
+    if nthreads > 1:
+        blocks = _find_compressed_blocks(cbuf, skip)
+    if blocks is not None:
+        # decompress nthreads blocks at a time when only part of the
+        # volume is needed
+        step = len(blocks) if max_elevation is None else nthreads
+        parts = []
+        for i in range(0, len(blocks), step):
+            parts.extend(_decompress_blocks_threaded(
+                cbuf, blocks[i:i + step], nthreads))
+            if _past_elevation(parts, max_elevation):
+                break
+    else:
         decompressor = bz2.BZ2Decompressor()
-        buf += decompressor.decompress(cbuf[CONTROL_WORD_SIZE:])
+        parts = [decompressor.decompress(cbuf[skip + CONTROL_WORD_SIZE:])]
+        while (len(decompressor.unused_data) and
+               not _past_elevation(parts, max_elevation)):
+            cbuf = decompressor.unused_data
+            decompressor = bz2.BZ2Decompressor()
+            parts.append(decompressor.decompress(cbuf[CONTROL_WORD_SIZE:]))
+
+    # assemble the blocks, less the compression record, into a buffer
+    buf = bytearray(sum(len(part) for part in parts) - COMPRESSION_RECORD_SIZE)
+    pos = -COMPRESSION_RECORD_SIZE
+    for part in parts:
+        start = max(-pos, 0)
+        buf[pos + start:pos + len(part)] = part[start:]
+        pos += len(part)
+    return buf
+
+
+def _past_elevation(parts, max_elevation):
+    """
+    Return True if the last decompressed block contains a radial record with
+    an elevation number larger than max_elevation.
+    """
+    if max_elevation is None:
+        return False
+    pos = COMPRESSION_RECORD_SIZE if len(parts) == 1 else 0
+    index = _index_records(parts[-1], pos)
+    return np.any(index['elevation_number'] > max_elevation)
+
+
+def _find_compressed_blocks(cbuf, pos):
+    """
+    Find the start and end of the BZ2 compressed blocks in a buffer.
+
+    Each block is preceded by a control word containing the size of the
+    block, negative for the last block in the volume.  None is returned if
+    the control words do not describe a sequence of BZ2 compressed blocks.
+    """
+    blocks = []
+    buf_length = len(cbuf)
+    while pos + CONTROL_WORD_SIZE <= buf_length:
+        size = abs(struct.unpack_from('>i', cbuf, pos)[0])
+        start = pos + CONTROL_WORD_SIZE
+        end = start + size
+        if size == 0 or end > buf_length or cbuf[start:start+3] != b'BZh':
+            return None
+        blocks.append((start, end))
+        pos = end
+    if len(blocks) == 0:
+        return None
+    return blocks
+
+
+def _decompress_blocks_threaded(cbuf, blocks, nthreads):
+    """
+    Decompress BZ2 compressed blocks dividing the blocks between threads.
+
+    BZ2 decompression releases the GIL allowing the blocks to be
+    decompressed concurrently.
+    """
+    return _run_in_threads(
+        _decompress_block, [(cbuf, start, end) for start, end in blocks],
+        nthreads)
 
-    return buf[COMPRESSION_RECORD_SIZE:]
+
+def _decompress_block(cbuf, start, end):
+    """ Decompress a BZ2 compressed block. """
+    return bz2.decompress(cbuf[start:end])
+
+
+def _index_records(buf, pos, max_elevation=None):
+    """
+    Index the records in a buffer using only the message headers.
+
+    Indexing stops at the first radial record with an elevation number
+    larger than max_elevation, None indexes all records.
+    """
+    msg_header_size = _structure_size(MSG_HEADER)
+    buf_length = len(buf)
+    positions = []
+    types = []
+    elevations = []
+    while pos + msg_header_size <= buf_length:
+        size, _, msg_type = struct.unpack_from('>HBB', buf, pos)
+        elevation = 0
+        if msg_type == 31:
+            new_pos = pos + msg_header_size + size * 2 - 4
+            elevation = struct.unpack_from(
+                '>B', buf, pos + msg_header_size + 22)[0]
+        else:
+            new_pos = pos + RECORD_SIZE
+            if msg_type == 1:
+                elevation = struct.unpack_from(
+                    '>H', buf, pos + msg_header_size + 16)[0]
+        if max_elevation is not None and elevation > max_elevation:
+            break
+        positions.append(pos)
+        types.append(msg_type)
+        elevations.append(elevation)
+        pos = new_pos
+    index = np.empty((len(positions), ), dtype=RECORD_INDEX_DTYPE)
+    index['pos'] = positions
+    index['type'] = types
+    index['elevation_number'] = elevations
+    return index
+
+
+def _index_radials(buf, positions, msg_type):
+    """
+    Index the message headers and data blocks of radial records.
+
+    Returns a dictionary of structured arrays with an element for each
+    record.  The 'msg_header' key contains the message 31 or 1 headers,
+    'RAD' the radial data constant blocks of message 31 records and the
+    moment keys, 'REF', 'VEL', etc, the MOMENT_INDEX_DTYPE parameters of the
+    moment blocks.  Records without a given moment have a 'data_pos' of -1.
+    """
+    raw = np.frombuffer(buf, dtype='u1')
+    body = positions + _structure_size(MSG_HEADER)
+    if msg_type == '1':
+        return _index_msg1_radials(raw, body)
+
+    msg_header = _gather_structures(raw, body, MSG_31)
+    index = {'msg_header': msg_header}
+
+    # find the name of the block each block pointer refers to
+    nblocks = 9
+    pointers = np.empty((len(body), nblocks), dtype='int64')
+    for i in range(nblocks):
+        pointers[:, i] = msg_header['block_pointer_%d' % (i + 1)]
+    block_pos = body[:, np.newaxis] + pointers
+    names = raw[block_pos[..., np.newaxis] + np.arange(1, 4)]
+    names = np.ascontiguousarray(names).view('S3')[..., 0]
+    names[pointers <= 0] = b''
+
+    index['RAD'] = _gather_blocks(
+        raw, block_pos, names, b'RAD', RADIAL_DATA_BLOCK)
+    block_size = _structure_size(GENERIC_DATA_BLOCK)
+    for moment in ['REF', 'VEL', 'SW', 'ZDR', 'PHI', 'RHO']:
+        name = moment.ljust(3).encode('ascii')
+        if not np.any(names == name):
+            continue
+        blocks = _gather_blocks(
+            raw, block_pos, names, name, GENERIC_DATA_BLOCK)
+        present = np.any(names == name, axis=1)
+        moment_index = np.zeros((len(body), ), dtype=MOMENT_INDEX_DTYPE)
+        for key in ['ngates', 'first_gate', 'gate_spacing', 'scale',
+                    'offset']:
+            moment_index[key] = blocks[key]
+        pos = np.where(names == name, block_pos, 0).max(axis=1)
+        moment_index['data_pos'] = np.where(present, pos + block_size, -1)
+        index[moment] = moment_index
+    return index
+
+
+def _index_msg1_radials(raw, body):
+    """ Index the message headers and moment data of MSG1 records. """
+    msg_header = _gather_structures(raw, body, MSG_1)
+    index = {'msg_header': msg_header}
+
+    doppler_first = msg_header['doppler_range_first'].astype('int64')
+    doppler_first[doppler_first > 2**15] -= 2**16
+    vel_scale = np.where(msg_header['doppler_resolution'] == 4, 1., 2.)
+    moments = [
+        ('REF', 'sur_pointer', 'sur_nbins', msg_header['sur_range_first'],
+         'sur_range_step', 2., 66.),
+        ('VEL', 'vel_pointer', 'doppler_nbins', doppler_first,
+         'doppler_range_step', vel_scale, 129.),
+        ('SW', 'width_pointer', 'doppler_nbins', doppler_first,
+         'doppler_range_step', 2., 129.)]
+    for moment, pointer, nbins, first_gate, step, scale, offset in moments:
+        present = msg_header[pointer] != 0
+        if not np.any(present):
+            continue
+        moment_index = np.zeros((len(body), ), dtype=MOMENT_INDEX_DTYPE)
+        moment_index['data_pos'] = np.where(
+            present, body + msg_header[pointer], -1)
+        moment_index['ngates'] = msg_header[nbins]
+        moment_index['first_gate'] = first_gate
+        moment_index['gate_spacing'] = msg_header[step]
+        moment_index['scale'] = scale
+        moment_index['offset'] = offset
+        index[moment] = moment_index
+    return index
+
+
+def _gather_blocks(raw, block_pos, names, name, structure):
+    """ Unpack the named block of each record, zeros when not present. """
+    present = names == name
+    pos = np.where(present, block_pos, 0).max(axis=1)
+    blocks = _gather_structures(raw, pos, structure)
+    blocks[~np.any(present, axis=1)] = np.zeros(1, dtype=blocks.dtype)
+    return blocks
+
+
+def _gather_structures(raw, positions, structure):
+    """ Unpack a structure at a number of positions in a uint8 array. """
+    size = _structure_size(structure)
+    data = raw[np.asarray(positions)[:, np.newaxis] + np.arange(size)]
+    return data.view(_structure_dtype(structure))[:, 0]
+
+
+def _native_array(data):
+    """ Return an array of 64-bit integers or floats from structure data. """
+    if data.dtype.kind == 'f':
+        return data.astype('float64')
+    return data.astype('int64')
 
 
 def _get_record_from_buf(buf, pos):
@@ -715,6 +1297,17 @@ def _unpack_from_buf(buf, pos, structure):
     return _unpack_structure(buf[pos:pos + size], structure)
 
 
+def _structure_dtype(structure):
+    """ Find the big-endian NumPy dtype equivalent of a structure. """
+    dtypes = []
+    for name, code in structure:
+        if code.endswith('s'):
+            dtypes.append((name, 'S' + code[:-1]))
+        else:
+            dtypes.append((name, _STRUCT_TO_DTYPE[code]))
+    return np.dtype(dtypes)
+
+
 def _unpack_structure(string, structure):
     """ Unpack a structure from a string """
     fmt = '>' + ''.join([i[1] for i in structure])  # NEXRAD is big-endian
@@ -735,6 +1328,29 @@ RECORD_SIZE = 2432
 COMPRESSION_RECORD_SIZE = 12
 CONTROL_WORD_SIZE = 4
 
+# record index of all records, the position in the buffer, message type and
+# elevation number, 0 for non-radial records
+RECORD_INDEX_DTYPE = [
+    ('pos', 'int64'),
+    ('type', 'uint8'),
+    ('elevation_number', 'uint16'),
+]
+
+# moment block parameters for each radial record
+MOMENT_INDEX_DTYPE = [
+    ('data_pos', 'int64'),
+    ('ngates', 'int32'),
+    ('first_gate', 'int32'),
+    ('gate_spacing', 'int32'),
+    ('scale', 'float32'),
+    ('offset', 'float32'),
+]
+
+# radial status values marking the end of an elevation or volume
+# Table XVII-A, page 3-88
+RADIAL_STATUS_END_ELEVATION = 2
+RADIAL_STATUS_END_VOLUME = 4
+
 # format of structure elements
 # section 3.2.1, page 3-2
 CODE1 = 'B'
@@ -748,6 +1364,11 @@ SINT1 = 'b'
 SINT2 = 'h'
 SINT4 = 'i'
 
+# NumPy big-endian types of the structure element formats
+_STRUCT_TO_DTYPE = {
+    'B': 'u1', 'H': '>u2', 'I': '>u4', 'f': '>f4', 'd': '>f8',
+    'b': 'i1', 'h': '>i2', 'i': '>i4'}
+
 # Figure 1 in Interface Control Document for the Archive II/User
 # page 7-2
 VOLUME_HEADER = (
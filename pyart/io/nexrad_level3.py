@@ -14,6 +14,10 @@ Class for reading data from NEXRAD Level 3 files.
     :toctree: generated/
 
     nexrad_level3_message_code
+    decode_nexrad_level3_files
+    _read_nexrad_level3_file
+    _locate_rows
+    _decode_rle_rows
     _datetime_from_mdate_mtime
     _structure_size
     _unpack_from_buf
@@ -84,6 +88,8 @@ from datetime import datetime, timedelta
 
 import numpy as np
 
+from .common import _run_in_threads
+
 
 class NEXRADLevel3File(object):
     """
@@ -100,11 +106,13 @@ class NEXRADLevel3File(object):
     symbology_header : dict
         Symbology header.
     packet_header : dict
-        Radial data array packet header.
+        Radial data array packet header, or raster data packet header for
+        raster products.
     radial_headers : list of dicts
-        List of radials headers
+        List of radials headers, empty for raster products.
     raw_data : array
-        Raw unscaled, unmasked data.
+        Raw unscaled, unmasked data, shape (nradials, nbins) or, for raster
+        products, (nrows, ncolumns).
     data : array
         Scaled, masked radial data.
     _fh : file-like
@@ -159,36 +167,49 @@ class NEXRADLevel3File(object):
         """ Read symbology block. """
         # Read and decode symbology header
         self.symbology_header = _unpack_from_buf(buf2, 0, SYMBOLOGY_HEADER)
+        buf = np.frombuffer(buf2, dtype='>u1')
 
-        # Read radial packets
+        # Read raster packets
         packet_code = struct.unpack('>h', buf2[16:18])[0]
         assert packet_code in SUPPORTED_PACKET_CODES
+        if packet_code in RASTER_PACKET_CODES:
+            self.packet_header = _unpack_from_buf(
+                buf2, 16, RASTER_PACKET_HEADER)
+            self.radial_headers = []
+            pos = 16 + _structure_size(RASTER_PACKET_HEADER)
+            row_header_size = _structure_size(RASTER_ROW_HEADER)
+            row_pos, nbytes = _locate_rows(
+                buf2, pos, self.packet_header['nrows'], row_header_size, 1)
+            self.raw_data = _decode_rle_rows(
+                buf, row_pos + row_header_size, nbytes)
+            return
+
+        # Read radial packets
         self.packet_header = _unpack_from_buf(buf2, 16, RADIAL_PACKET_HEADER)
-        self.radial_headers = []
         nbins = self.packet_header['nbins']
         nradials = self.packet_header['nradials']
         nbytes = _unpack_from_buf(buf2, 30, RADIAL_HEADER)['nbytes']
         if packet_code == 16 and nbytes != nbins:
             nbins = nbytes  # sometimes these do not match, use nbytes
-        self.raw_data = np.empty((nradials, nbins), dtype='uint8')
-        pos = 30
-
-        for radial in self.raw_data:
-            radial_header = _unpack_from_buf(buf2, pos, RADIAL_HEADER)
-            pos += 6
-            if packet_code == 16:
-                radial[:] = np.frombuffer(buf2[pos:pos+nbins], '>u1')
-                pos += radial_header['nbytes']
-            else:
-                assert packet_code == AF1F
-                # decode run length encoding
-                rle_size = radial_header['nbytes'] * 2
-                rle = np.frombuffer(buf2[pos:pos+rle_size], dtype='>u1')
-                colors = np.bitwise_and(rle, 0b00001111)
-                runs = np.bitwise_and(rle, 0b11110000) // 16
-                radial[:] = np.repeat(colors, runs)
-                pos += rle_size
-            self.radial_headers.append(radial_header)
+
+        # the size of each radial is found from its header, the number of
+        # bytes for packet code 16, run length encoded halfwords for AF1F
+        size_scale = 1 if packet_code == 16 else 2
+        header_size = _structure_size(RADIAL_HEADER)
+        radial_pos, nbytes = _locate_rows(
+            buf2, 30, nradials, header_size, size_scale)
+        headers = buf[radial_pos[:, np.newaxis] + np.arange(header_size)]
+        headers = headers.view('>i2').tolist()
+        names = [name for name, _ in RADIAL_HEADER]
+        self.radial_headers = [dict(zip(names, h)) for h in headers]
+
+        # decode the data of all radials at once
+        data_pos = radial_pos + header_size
+        if packet_code == 16:
+            self.raw_data = buf[data_pos[:, np.newaxis] + np.arange(nbins)]
+        else:
+            assert packet_code == AF1F
+            self.raw_data = _decode_rle_rows(buf, data_pos, nbytes, nbins)
 
     def get_location(self):
         """ Return the latitude, longitude and height of the radar. """
@@ -315,6 +336,83 @@ class NEXRADLevel3File(object):
         return mdata
 
 
+def decode_nexrad_level3_files(filenames, nthreads=1):
+    """
+    Read and decode many NEXRAD Level 3 files.
+
+    The files are divided between a number of threads, BZ2 decompression
+    and the vectorized decoding of the products release the GIL allowing
+    the files to be decoded concurrently.  Each file is closed after it is
+    read.
+
+    Parameters
+    ----------
+    filenames : list
+        Filenames or file-like objects of the NEXRAD Level 3 files.
+    nthreads : int, optional
+        Number of threads used to read the files.
+
+    Returns
+    -------
+    nfiles : list of NEXRADLevel3File
+        Objects containing the decoded products, in the same order as
+        filenames.
+
+    """
+    return _run_in_threads(
+        _read_nexrad_level3_file, [(f, ) for f in filenames], nthreads)
+
+
+def _read_nexrad_level3_file(filename):
+    """ Read and decode a NEXRAD Level 3 file, closing the file. """
+    nfile = NEXRADLevel3File(filename)
+    nfile.close()
+    return nfile
+
+
+def _locate_rows(buf, pos, nrows, header_size, size_scale):
+    """
+    Locate rows, radials or raster rows, each of which begins with a header
+    whose first halfword is the size of the row data, in units of
+    size_scale bytes.  Returns the position of each row and the size of
+    the row data in bytes.
+    """
+    row_pos = np.empty((nrows, ), dtype='intp')
+    nbytes = np.empty((nrows, ), dtype='intp')
+    for i in range(nrows):
+        row_pos[i] = pos
+        nbytes[i] = struct.unpack_from('>h', buf, pos)[0] * size_scale
+        pos += header_size + nbytes[i]
+    return row_pos, nbytes
+
+
+def _decode_rle_rows(buf, starts, nbytes, ncols=None):
+    """
+    Decode rows of 4-bit run length encoded data into a (nrows, ncols)
+    array.
+
+    Each byte encodes a run length in the upper four bits and a color in
+    the lower four bits.  All rows are decoded together, the number of
+    columns is that of the first row when ncols is None.
+    """
+    offsets = np.cumsum(nbytes) - nbytes
+    indices = np.arange(nbytes.sum()) + np.repeat(starts - offsets, nbytes)
+    rle = buf[indices]
+    colors = np.bitwise_and(rle, 0b00001111)
+    runs = np.right_shift(rle, 4)
+
+    # number of values in each row
+    run_ends = np.zeros((len(runs) + 1, ), dtype='intp')
+    np.cumsum(runs, out=run_ends[1:])
+    row_lengths = run_ends[offsets + nbytes] - run_ends[offsets]
+    if ncols is None:
+        ncols = int(row_lengths[0]) if len(row_lengths) else 0
+    if np.any(row_lengths != ncols):
+        raise ValueError('Run length encoded rows do not decode to %d '
+                         'values' % (ncols))
+    return np.repeat(colors, runs).reshape(len(starts), ncols)
+
+
 def _datetime_from_mdate_mtime(mdate, mtime):
     """ Returns a datetime for a given message date and time. """
     epoch = datetime.utcfromtimestamp(0)
@@ -368,7 +466,8 @@ def _int16_to_float16(val):
         return (-1)**sign * 2**(exponent-16) * (1 + fraction/2**10.)
 
 
-_8_OR_16_LEVELS = [19, 20, 25, 27, 28, 30, 56, 78, 79, 80, 169, 171, 181]
+_8_OR_16_LEVELS = [19, 20, 25, 27, 28, 30, 37, 38, 56, 78, 79, 80, 169, 171,
+                   181]
 
 PRODUCT_RANGE_RESOLUTION = {
     19: 1.,     # 124 nm
@@ -480,7 +579,11 @@ SYMBOLOGY_HEADER = (
 # Radial Data Packet - Packet Code AF1F
 # Figure 3-10 (Sheet 1 and 2), page 3-113.
 AF1F = -20705       # struct.unpack('>h', 'AF1F'.decode('hex'))
-SUPPORTED_PACKET_CODES = [16, AF1F]       # elsewhere
+# Raster Data Packet - Packet Codes BA0F and BA07
+BA0F = -17905       # struct.unpack('>h', 'BA0F'.decode('hex'))
+BA07 = -17913       # struct.unpack('>h', 'BA07'.decode('hex'))
+RASTER_PACKET_CODES = [BA0F, BA07]
+SUPPORTED_PACKET_CODES = [16, AF1F, BA0F, BA07]       # elsewhere
 RADIAL_PACKET_HEADER = (
     ('packet_code', INT2),      # Packet Code, Type 16
     ('first_bin', INT2),        # Location of first range bin.
@@ -497,9 +600,28 @@ RADIAL_HEADER = (
     ('angle_delta', INT2)       # Delta angle from previous radial.
 )
 
+RASTER_PACKET_HEADER = (
+    ('packet_code', INT2),      # Packet Code, BA0F or BA07
+    ('op_flags_1', INT2),       # Op Flags, 0x8000
+    ('op_flags_2', INT2),       # Op Flags, 0x00C0
+    ('i_start', INT2),          # I coordinate of start.
+    ('j_start', INT2),          # J coordinate of start.
+    ('x_scale_int', INT2),      # X scale, integer part.
+    ('x_scale_frac', INT2),     # X scale, fractional part.
+    ('y_scale_int', INT2),      # Y scale, integer part.
+    ('y_scale_frac', INT2),     # Y scale, fractional part.
+    ('nrows', INT2),            # Number of rows.
+    ('packing_descriptor', INT2)    # Packing format, 2
+)
+
+RASTER_ROW_HEADER = (
+    ('nbytes', INT2),           # Number of bytes in the row.
+)
+
 # A list of the NEXRAD Level 3 Product supported by this module taken
 # from the "Message Code for Products" Table III pages 3-15 to 3-22
-# All the supported products have a Radial Image Message format.
+# All the supported products have a Radial Image Message format except
+# products 37 and 38 which have a Raster Image Message format.
 #   Code    # Product Name
 #   -----   -----------------------
 SUPPORTED_PRODUCTS = [
@@ -511,6 +633,10 @@ SUPPORTED_PRODUCTS = [
     30,     # Base Spectrum Width
     32,     # Digital Hybrid Scan
     34,     # Clutter Filter Control
+    37,     # Composite Reflectivity
+            # (raster)
+    38,     # Composite Reflectivity
+            # (raster)
     56,     # Storm Relative Mean
             # Radial Velocity
     78,     # Surface Rainfall Accum.
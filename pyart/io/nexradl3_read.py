@@ -16,7 +16,7 @@ import numpy as np
 from ..config import FileMetadata, get_fillvalue
 from ..core.radar import Radar
 from .common import make_time_unit_str, _test_arguments, prepare_for_read
-from .nexrad_level3 import NEXRADLevel3File
+from .nexrad_level3 import NEXRADLevel3File, RASTER_PACKET_CODES
 
 
 def read_nexrad_level3(filename, field_names=None, additional_metadata=None,
@@ -76,6 +76,11 @@ def read_nexrad_level3(filename, field_names=None, additional_metadata=None,
 
     # open the file
     nfile = NEXRADLevel3File(prepare_for_read(filename))
+    if nfile.packet_header['packet_code'] in RASTER_PACKET_CODES:
+        nfile.close()
+        raise NotImplementedError(
+            'Raster NEXRAD Level 3 products cannot be read into a Radar '
+            'object, use pyart.io.nexrad_level3.NEXRADLevel3File')
     nradials = nfile.packet_header['nradials']
     msg_code = nfile.msg_header['code']
 
@@ -16,6 +16,12 @@ Reading and writing of Sigmet (raw format) files
     _time_order_data_and_metadata_reverse
     _time_order_data_and_metadata_full
 
+.. autosummary::
+    :toctree: generated/
+    :template: dev_template.rst
+
+    _SigmetFieldData
+
 """
 
 from __future__ import division
@@ -26,8 +32,11 @@ import numpy as np
 
 from ..config import FileMetadata, get_fillvalue
 from ..core.radar import Radar
+from ..lazydict import LazyLoadDict
 from .common import make_time_unit_str, _test_arguments, prepare_for_read
+from .common import _cast_field_data
 from ._sigmetfile import SigmetFile, bin4_to_angle, bin2_to_angle
+from ._sigmetfile import convert_sigmet_data
 from . import _sigmet_noaa_hh
 from ..util import mean_of_two_angles_deg
 
@@ -38,6 +47,7 @@ def read_sigmet(filename, field_names=None, additional_metadata=None,
                 file_field_names=False, exclude_fields=None,
                 time_ordered='none', full_xhdr=None, noaa_hh_hdr=None,
                 debug=False, ignore_xhdr=False, ignore_sweep_start_ms=None,
+                dtype=None, delay_field_loading=False, keep_packed=False,
                 **kwargs):
     """
     Read a Sigmet (IRIS) product file.
@@ -108,6 +118,21 @@ def read_sigmet(filename, field_names=None, additional_metadata=None,
         collection time with an error from 0 to 2 seconds.
     debug : bool, optional
         Print debug information during read.
+    dtype : dtype or None, optional
+        Data type of the field data, for example 'float32' or 'float64'.
+        None, the default, uses float32.
+    delay_field_loading : bool, optional
+        True to delay the conversion of the field data from the raw values
+        in the file until the 'data' key in a particular field dictionary is
+        accessed.  In this case the field attribute of the returned Radar
+        object will contain LazyLoadDict objects not dict objects.  The file
+        is always read and decoded in full, only the conversion to floating
+        point values is delayed.
+    keep_packed : bool, optional
+        True to store the field data as the 16-bit codes from the file, the
+        data is converted into a masked array of type dtype each time the
+        'data' key of the field dictionary, a LazyLoadDict, is evaluated.
+        False, the default, converts the field data when read.
 
     Returns
     -------
@@ -137,8 +162,9 @@ def read_sigmet(filename, field_names=None, additional_metadata=None,
         else:
             full_xhdr = False
 
-    # read data
-    sigmet_data, sigmet_metadata = sigmetfile.read_data(full_xhdr=full_xhdr)
+    # read the raw data, the data is converted after the missing rays are
+    # removed and the rays are time ordered.
+    sigmet_data, sigmet_metadata = sigmetfile.read_data(raw_data=True)
     first_data_type = sigmetfile.data_type_names[0]
     if first_data_type == 'XHDR':   # don't use XHDR as the first data type
         first_data_type = sigmetfile.data_type_names[1]
@@ -155,17 +181,18 @@ def read_sigmet(filename, field_names=None, additional_metadata=None,
             sigmet_metadata.pop('XHDR')
 
     # parse the extended headers for time
-    if full_xhdr and 'XHDR' in sigmet_data:
+    if 'XHDR' in sigmet_data:
         # extract the ms timing data and store the full header for later
         # analysis, keep both in the sigmet_data dictionary so time ordering
         # and removal of missing rays is performed on these "fields"
         xhdr = sigmet_data.pop('XHDR')
         sigmet_data['XHDR'] = xhdr[:, :, :2].copy().view('i4')
-        sigmet_data['XHDR_FULL'] = xhdr
-        xhdr_metadata = {}
-        for key in sigmet_metadata['XHDR'].keys():
-            xhdr_metadata[key] = sigmet_metadata['XHDR'][key].copy()
-        sigmet_metadata['XHDR_FULL'] = xhdr_metadata
+        if full_xhdr:
+            sigmet_data['XHDR_FULL'] = xhdr
+            xhdr_metadata = {}
+            for key in sigmet_metadata['XHDR'].keys():
+                xhdr_metadata[key] = sigmet_metadata['XHDR'][key].copy()
+            sigmet_metadata['XHDR_FULL'] = xhdr_metadata
 
     # remove missing rays from the data
     good_rays = (sigmet_metadata[first_data_type]['nbins'] != -1)
@@ -303,7 +330,16 @@ def read_sigmet(filename, field_names=None, additional_metadata=None,
         if field_name is None:
             continue
         field_dic = filemetadata(field_name)
-        field_dic['data'] = fdata.reshape(-1, nbins)
+        field_data = _SigmetFieldData(
+            sigmetfile.data_types[
+                sigmetfile.data_type_names.index(data_type_name)],
+            fdata.reshape(-1, nbins), sigmet_metadata[data_type_name]['nbins'],
+            sigmetfile.nyquist_scale(data_type_name), dtype)
+        if delay_field_loading or keep_packed:
+            field_dic = LazyLoadDict(field_dic)
+            field_dic.set_lazy('data', field_data)
+        else:
+            field_dic['data'] = field_data()
         field_dic['_FillValue'] = get_fillvalue()
         fields[field_name] = field_dic
 
@@ -666,6 +702,43 @@ def _time_order_data_and_metadata_full(data, metadata, rays_per_sweep):
     return
 
 
+class _SigmetFieldData(object):
+    """
+    Raw Sigmet data of a field which is converted to floating point values
+    when called.
+
+    Parameters
+    ----------
+    data_type : int
+        Sigmet data type of the field.
+    raw : array
+        Raw int16 data, (nrays, nbins).
+    ray_nbins : array
+        Number of bins collected in each ray, gates beyond these are masked.
+    nyquist : float or None
+        Nyquist velocity which scales the converted data, None when the data
+        type is not scaled.
+    dtype : dtype or None
+        Data type of the converted data, None for float32.
+
+    """
+
+    def __init__(self, data_type, raw, ray_nbins, nyquist, dtype):
+        """ initialize the object. """
+        self.data_type = data_type
+        self.raw = raw
+        self.ray_nbins = ray_nbins
+        self.nyquist = nyquist
+        self.dtype = dtype
+
+    def __call__(self):
+        """ Return the converted data. """
+        data = convert_sigmet_data(self.data_type, self.raw, self.ray_nbins)
+        if self.nyquist is not None:
+            data *= self.nyquist
+        return _cast_field_data(data, self.dtype)
+
+
 def ymds_time_to_datetime(ymds):
     """ Return a datetime object from a Sigmet ymds_time dictionary. """
     dt = datetime.datetime(ymds['year'], ymds['month'], ymds['day'])
@@ -1,11 +1,15 @@
 """ Unit Tests for Py-ART's io/mdv.py module. """
 
 import bz2
+import struct
 from io import BytesIO
 
 import pytest
+from numpy.testing import assert_allclose
 
 import pyart
+from pyart.io.common import make_time_unit_str
+from pyart.util.datetime_utils import datetime_from_radar
 
 
 def test_autoread_mdv():
@@ -74,6 +78,109 @@ def test_autoread_raises():
     pytest.raises(TypeError, pyart.io.read, f)
 
 
+def test_read_metadata_cfradial():
+    meta = pyart.io.read_metadata(pyart.testing.CFRADIAL_PPI_FILE)
+    radar = pyart.io.read_cfradial(pyart.testing.CFRADIAL_PPI_FILE)
+    assert meta['filetype'] in ['NETCDF3', 'NETCDF4']
+    assert meta['scan_type'] == radar.scan_type
+    assert meta['nsweeps'] == radar.nsweeps
+    assert_allclose(meta['fixed_angles'], radar.fixed_angle['data'])
+    assert sorted(meta['fields']) == sorted(radar.fields.keys())
+    assert meta['time_start'] == datetime_from_radar(radar)
+
+
+def test_read_metadata_sigmet():
+    meta = pyart.io.read_metadata(pyart.testing.SIGMET_PPI_FILE)
+    radar = pyart.io.read_sigmet(pyart.testing.SIGMET_PPI_FILE,
+                                 file_field_names=True)
+    assert meta['filetype'] == 'SIGMET'
+    assert meta['scan_type'] == 'ppi'
+    # read_sigmet keeps the null padded site name as bytes
+    instrument_name = radar.metadata['instrument_name']
+    assert isinstance(instrument_name, bytes)
+    assert isinstance(meta['instrument_name'], str)
+    assert meta['instrument_name'] == (
+        instrument_name.decode('ascii').rstrip('\x00').strip())
+    assert meta['nsweeps'] == radar.nsweeps
+    assert_allclose(meta['fixed_angles'], radar.fixed_angle['data'],
+                    atol=0.1)
+    assert sorted(meta['fields']) == sorted(radar.fields.keys())
+    assert_allclose(meta['latitude'], radar.latitude['data'][0])
+
+    meta = pyart.io.read_metadata(pyart.testing.SIGMET_RHI_FILE)
+    assert meta['scan_type'] == 'rhi'
+
+
+def test_read_metadata_nexrad_archive():
+    meta = pyart.io.read_metadata(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_COMPRESSED_FILE)
+    radar = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_COMPRESSED_FILE, scans=[0],
+        file_field_names=True)
+    assert meta['filetype'] == 'WSR88D'
+    assert meta['scan_type'] == 'ppi'
+    assert meta['scan_strategy'] == radar.metadata['vcp_pattern']
+    assert_allclose(meta['fixed_angles'][0], radar.fixed_angle['data'][0])
+    assert sorted(meta['fields']) == sorted(radar.fields.keys())
+    assert make_time_unit_str(meta['time_start']) == radar.time['units']
+
+
+def test_read_metadata_mdv():
+    meta = pyart.io.read_metadata(pyart.testing.MDV_RHI_FILE)
+    radar = pyart.io.read_mdv(pyart.testing.MDV_RHI_FILE,
+                              file_field_names=True)
+    assert meta['filetype'] == 'MDV'
+    assert meta['scan_type'] == 'rhi'
+    assert meta['nsweeps'] == radar.nsweeps
+    assert_allclose(meta['fixed_angles'], radar.fixed_angle['data'])
+    assert sorted(meta['fields']) == sorted(radar.fields.keys())
+
+
+def test_read_metadata_uf():
+    meta = pyart.io.read_metadata(pyart.testing.UF_FILE)
+    radar = pyart.io.read_uf(pyart.testing.UF_FILE, file_field_names=True)
+    assert meta['filetype'] == 'UF'
+    assert meta['scan_type'] == radar.scan_type
+    assert meta['nsweeps'] == radar.nsweeps
+    assert_allclose(meta['fixed_angles'], radar.fixed_angle['data'])
+    assert make_time_unit_str(meta['time_start']) == radar.time['units']
+
+
+class _CountingBytesIO(BytesIO):
+    """ BytesIO which counts the bytes read. """
+    nbytes = 0
+
+    def read(self, size=-1):
+        data = BytesIO.read(self, size)
+        self.nbytes += len(data)
+        return data
+
+
+def test_scan_uf_multiple_sweeps():
+    # records of three sweeps with 4-byte padding around each record
+    with open(pyart.testing.UF_FILE, 'rb') as fh:
+        record = next(pyart.io.uffile._read_records(fh))
+    records = []
+    for sweep_number, fixed_angle in [(1, 64), (1, 64), (2, 96), (3, 128)]:
+        rec = bytearray(record)
+        struct.pack_into('>h', rec, 18, sweep_number)   # sweep_number
+        struct.pack_into('>h', rec, 70, fixed_angle)    # fixed_angle
+        size = struct.pack('>i', len(rec))
+        records.append(size + bytes(rec) + size)
+    fobj = _CountingBytesIO(b''.join(records))
+
+    meta = pyart.io.auto_read._scan_uf(fobj)
+    assert meta['nsweeps'] == 3
+    assert_allclose(meta['fixed_angles'], [1., 1.5, 2.])
+    # only the first record and the mandatory headers of the others are read
+    assert fobj.nbytes < len(record) + 4 * 100
+
+
+def test_read_metadata_raises():
+    pytest.raises(TypeError, pyart.io.read_metadata,
+                  pyart.testing.NEXRAD_LEVEL3_MSG19)
+
+
 headers = [
     (b'\x00\x00\x03\xf8\x00\x007>\x00\x00\x00\x01', 'MDV'),
     (b'\x89HDF\r\n\x1a\n\x02\x08\x08\x00', 'NETCDF4'),
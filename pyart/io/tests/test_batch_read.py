@@ -0,0 +1,60 @@
+""" Unit Tests for Py-ART's io/batch_read.py module. """
+
+import os
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+import pyart
+from pyart.io.batch_read import _SharedArray, _transfer_directory
+
+
+FILENAMES = [pyart.testing.CFRADIAL_PPI_FILE, pyart.testing.SIGMET_PPI_FILE,
+             pyart.testing.UF_FILE]
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_read_many(executor):
+    radars = pyart.io.read_many(FILENAMES, workers=2, executor=executor)
+    assert len(radars) == 3
+    times = [pyart.util.datetime_utils.datetime_from_radar(r) for r in radars]
+    assert times == sorted(times)
+
+    radar = [r for r in radars
+             if r.metadata.get('original_container') == 'UF']
+    expected = pyart.io.read(pyart.testing.UF_FILE)
+    for field_name, field_dic in expected.fields.items():
+        data = radar[0].fields[field_name]['data']
+        assert_array_equal(data, field_dic['data'])
+        assert_array_equal(np.ma.getmaskarray(data),
+                           np.ma.getmaskarray(field_dic['data']))
+
+
+def test_read_many_fields():
+    field_name = sorted(pyart.io.read(pyart.testing.UF_FILE).fields)[0]
+    radars = pyart.io.read_many(
+        [pyart.testing.UF_FILE], workers=1, fields=[field_name])
+    assert list(radars[0].fields.keys()) == [field_name]
+
+
+def test_iread_many():
+    results = list(pyart.io.iread_many(FILENAMES, workers=2,
+                                       executor='thread'))
+    assert sorted(f for f, _ in results) == sorted(FILENAMES)
+
+
+def test_iread_many_raises():
+    reader = pyart.io.iread_many(FILENAMES, executor='foo')
+    pytest.raises(ValueError, next, reader)
+
+
+def test_shared_array():
+    directory = _transfer_directory()
+    data = np.ma.masked_less(np.arange(10.), 3)
+    shared = _SharedArray(data, directory)
+    loaded = shared.load()
+    assert_array_equal(loaded, data)
+    assert_array_equal(loaded.mask, data.mask)
+    assert len(os.listdir(directory)) == 0
+    os.rmdir(directory)
@@ -2,6 +2,7 @@
 
 from __future__ import print_function
 
+import shutil
 import warnings
 
 import numpy as np
@@ -547,3 +548,198 @@ def test_calculate_scale_and_offset():
         pyart.io.cfradial._calculate_scale_and_offset(
             {'data': data}, np.dtype('u1'), 100, 100)
         assert len(w) == 1
+
+
+def test_write_chunks_and_compression():
+    radar = pyart.testing.make_target_radar()
+    with pyart.testing.InTemporaryDirectory():
+        tmpfile = 'tmp_chunks.nc'
+        pyart.io.write_cfradial(tmpfile, radar, chunks='sweep',
+                                compression='fast')
+        dset = netCDF4.Dataset(tmpfile)
+        var = dset.variables['reflectivity']
+        assert var.chunking() == [360, 50]
+        assert var.filters()['complevel'] == 1
+        assert var.filters()['shuffle']
+        dset.close()
+
+        pyart.io.write_cfradial(tmpfile, radar, chunks=(10, 5),
+                                compression=None)
+        dset = netCDF4.Dataset(tmpfile)
+        var = dset.variables['reflectivity']
+        assert var.chunking() == [10, 5]
+        assert not var.filters()['zlib']
+        assert_array_equal(var[:], radar.fields['reflectivity']['data'])
+        dset.close()
+
+        pytest.raises(ValueError, pyart.io.write_cfradial, tmpfile, radar,
+                      compression='foo')
+
+
+def test_pack_field_dic():
+    data = np.ma.masked_invalid([[0., 1., np.nan], [2., 3., np.inf]])
+    data[0, 1] = np.ma.masked
+    dic = {'data': data, '_Write_as_dtype': 'int16'}
+    pyart.io.cfradial._pack_field_dic(dic, 'int16')
+    assert '_Write_as_dtype' not in dic
+    assert dic['data'].dtype == np.int16
+    assert dic['_FillValue'] == -32768
+    unpacked = dic['data'] * dic['scale_factor'] + dic['add_offset']
+    assert_almost_equal(unpacked[0, 0], 0, 3)
+    assert_almost_equal(unpacked[1, 1], 3, 3)
+    assert dic['data'][0, 1] == -32768
+    assert dic['data'][0, 2] == -32768
+    assert dic['data'][1, 2] == -32768
+
+    # existing scale and offset are used and values are clipped
+    dic = {'data': np.array([-10., 0., 1., 10.]), 'scale_factor': 0.5,
+           'add_offset': 1.}
+    pyart.io.cfradial._pack_field_dic(dic, 'uint8')
+    assert_array_equal(dic['data'], [0, 0, 0, 18])
+    assert dic['_FillValue'] == 255
+
+
+def test_pack_fields():
+    fields = {
+        'a': {'data': np.arange(10, dtype='float32')},
+        'b': {'data': np.arange(10, dtype='int32')},
+        'c': {'data': np.arange(10, dtype='float32'),
+              '_Write_as_dtype': 'uint8'},
+        'd': {'data': np.arange(10, dtype='float32') * 2}}
+    packed = pyart.io.cfradial._pack_fields(fields, None)
+    assert list(packed.keys()) == ['c']
+    assert packed['c']['data'].dtype == np.uint8
+    assert 'scale_factor' not in fields['c']
+
+    packed = pyart.io.cfradial._pack_fields(fields, 'int16', nthreads=2)
+    assert sorted(packed.keys()) == ['a', 'c', 'd']
+    assert packed['a']['data'].dtype == np.int16
+    assert packed['c']['data'].dtype == np.uint8
+    ref = pyart.io.cfradial._pack_fields(fields, 'int16', nthreads=1)
+    for field in packed:
+        assert_array_equal(packed[field]['data'], ref[field]['data'])
+
+
+def make_variable_gate_file(filename, ray_n_gates):
+    """ Create a n_gates_vary CF/Radial file from the PPI example file. """
+    ref = netCDF4.Dataset(pyart.testing.CFRADIAL_PPI_FILE)
+    dset = netCDF4.Dataset(filename, 'w')
+    for name, dim in ref.dimensions.items():
+        dset.createDimension(name, len(dim))
+    dset.createDimension('n_points', ray_n_gates.sum())
+    ray_start_index = np.cumsum(ray_n_gates) - ray_n_gates
+    for name, var in ref.variables.items():
+        fill_value = getattr(var, '_FillValue', None)
+        if var.dimensions == ('time', 'range'):
+            out = dset.createVariable(
+                name, var.dtype, ('n_points', ), fill_value=fill_value)
+            var.set_auto_maskandscale(False)
+            out.set_auto_maskandscale(False)
+            data = var[:]
+            out[:] = np.concatenate(
+                [data[i, :n] for i, n in enumerate(ray_n_gates)])
+        else:
+            out = dset.createVariable(
+                name, var.dtype, var.dimensions, fill_value=fill_value)
+            var.set_auto_maskandscale(False)
+            out.set_auto_maskandscale(False)
+            out[:] = var[:]
+        out.setncatts(dict((k, getattr(var, k)) for k in var.ncattrs()
+                           if k != '_FillValue'))
+    for name, data in [('ray_n_gates', ray_n_gates),
+                       ('ray_start_index', ray_start_index)]:
+        out = dset.createVariable(name, 'i4', ('time', ))
+        out[:] = data
+    dset.close()
+    ref.close()
+
+
+@pytest.mark.parametrize('delay_field_loading', [False, True])
+def test_read_variable_gates(delay_field_loading):
+    ray_n_gates = np.arange(40) % 10 + 33
+    with pyart.testing.InTemporaryDirectory():
+        make_variable_gate_file('tmp_n_gates_vary.nc', ray_n_gates)
+        radar = pyart.io.read_cfradial(
+            'tmp_n_gates_vary.nc', delay_field_loading=delay_field_loading)
+        ref_radar = pyart.io.read_cfradial(pyart.testing.CFRADIAL_PPI_FILE)
+        for field in ref_radar.fields.keys():
+            data = radar.fields[field]['data']
+            ref_data = ref_radar.fields[field]['data']
+            assert data.shape == (40, 42)
+            gate_mask = np.arange(42) < ray_n_gates[:, np.newaxis]
+            assert np.all(data.mask[~gate_mask])
+            assert_array_equal(data.mask[gate_mask], ref_data.mask[gate_mask])
+            assert_array_equal(data[gate_mask], ref_data[gate_mask])
+
+
+def test_unpack_variable_gate_field_dic():
+    dic = {'data': np.ma.array([1, 2, 3, 4, 5, 6], mask=[0, 0, 1, 0, 0, 0])}
+    pyart.io.cfradial._unpack_variable_gate_field_dic(
+        dic, (3, 3), [2, 3, 1], [0, 2, 5])
+    assert_array_equal(dic['data'].filled(0),
+                       [[1, 2, 0], [0, 4, 5], [6, 0, 0]])
+    assert_array_equal(dic['data'].mask, [[0, 0, 1], [1, 0, 0], [0, 1, 1]])
+
+
+def test_delay_field_loading_partial():
+    ref_radar = pyart.io.read_cfradial(pyart.testing.CFRADIAL_PPI_FILE)
+    radar = pyart.io.read_cfradial(
+        pyart.testing.CFRADIAL_PPI_FILE, delay_field_loading=True)
+    field_dic = radar.fields['reflectivity_horizontal']
+    data = field_dic.get_partial('data', slice(10, 20))
+    ref_data = ref_radar.fields['reflectivity_horizontal']['data']
+    assert_array_equal(data, ref_data[10:20])
+    data = radar.get_field(0, 'reflectivity_horizontal')
+    assert_array_equal(data, ref_data)
+    assert 'data' in field_dic._lazyload
+
+
+def test_delay_field_loading_partial_variable_gates():
+    ray_n_gates = np.arange(40) % 10 + 33
+    with pyart.testing.InTemporaryDirectory():
+        make_variable_gate_file('tmp_n_gates_vary.nc', ray_n_gates)
+        radar = pyart.io.read_cfradial(
+            'tmp_n_gates_vary.nc', delay_field_loading=True)
+        field_dic = radar.fields['reflectivity_horizontal']
+        for key in [slice(10, 20), (slice(5, 8), slice(30, 40)),
+                    slice(0, 0), 3, slice(0, 40, 2)]:
+            data = field_dic.get_partial('data', key)
+            ref_data = field_dic._lazyload['data']()[key]
+            assert_array_equal(data, ref_data)
+            assert_array_equal(np.ma.getmaskarray(data),
+                               np.ma.getmaskarray(ref_data))
+        assert 'data' in field_dic._lazyload
+
+
+def test_keep_packed_and_dtype():
+    with pyart.testing.InTemporaryDirectory():
+        tmpfile = 'tmp_packed.nc'
+        shutil.copy(pyart.testing.CFRADIAL_PPI_FILE, tmpfile)
+        dset = netCDF4.Dataset(tmpfile, 'a')
+        ref = np.ma.masked_greater(
+            np.arange(40 * 42, dtype='float32').reshape(40, 42) * 0.5, 200)
+        for name, dtype in [('packed', 'i2'), ('unpacked', 'f4')]:
+            ncvar = dset.createVariable(
+                name, dtype, ('time', 'range'), fill_value=-32767)
+            if name == 'packed':
+                ncvar.scale_factor = np.float32(0.5)
+                ncvar.add_offset = np.float32(0)
+            ncvar[:] = ref
+        dset.close()
+
+        radar = pyart.io.read_cfradial(tmpfile, keep_packed=True)
+        field_dic = radar.fields['packed']
+        assert field_dic._lazyload['data'].codes.dtype == np.int16
+        assert 'scale_factor' not in field_dic
+        assert_array_equal(field_dic.get_partial('data', 3), ref[3])
+        data = field_dic['data']
+        assert data.dtype == np.float32
+        assert_array_equal(data, ref)
+        assert_array_equal(data.mask, ref.mask)
+        assert not isinstance(radar.fields['unpacked'],
+                              pyart.lazydict.LazyLoadDict)
+
+        radar = pyart.io.read_cfradial(tmpfile, dtype='float64')
+        assert radar.fields['packed']['data'].dtype == np.float64
+        assert radar.fields['unpacked']['data'].dtype == np.float64
+        assert_array_equal(radar.fields['packed']['data'], ref)
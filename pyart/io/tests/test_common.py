@@ -0,0 +1,33 @@
+""" Unit Tests for Py-ART's io/common.py module. """
+
+import threading
+
+import pytest
+
+from pyart.io.common import _run_in_threads
+
+
+@pytest.mark.parametrize('nthreads', [1, 3, 10])
+def test_run_in_threads(nthreads):
+    args_list = [(i, 2) for i in range(7)]
+    results = _run_in_threads(pow, args_list, nthreads)
+    assert results == [i ** 2 for i in range(7)]
+    assert _run_in_threads(pow, [], nthreads) == []
+
+
+def test_run_in_threads_serial():
+    def thread_name():
+        return threading.current_thread().name
+    names = _run_in_threads(thread_name, [()] * 3, 1)
+    assert names == [threading.current_thread().name] * 3
+
+
+def test_run_in_threads_raises():
+    def check(i):
+        if i == 4:
+            raise ValueError('bad value')
+        return i
+    for nthreads in [1, 3]:
+        pytest.raises(
+            ValueError, _run_in_threads, check, [(i, ) for i in range(6)],
+            nthreads)
@@ -313,6 +313,37 @@ def test_read_all_fields_on_creation():
     mdvfile2.close()
 
 
+def test_read_fields():
+    ref = MdvFile(pyart.testing.MDV_PPI_FILE).read_a_field(0)
+
+    mdvfile = MdvFile(pyart.testing.MDV_PPI_FILE)
+    fields_data = mdvfile.read_fields([0], nthreads=2)
+    assert len(fields_data) == 1
+    assert mdvfile.fields_data[0] is fields_data[0]
+    assert fields_data[0].shape == (1, 360, 110)
+    assert np.array_equal(np.isnan(fields_data[0]), np.isnan(ref))
+    assert_almost_equal(fields_data[0], ref)
+
+    # fields which have been read are not read again
+    assert mdvfile.read_fields(nthreads=2)[0] is fields_data[0]
+    mdvfile.close()
+
+
+def test_decode_rle8():
+    # key of 255, runs with a count or value equal to the key
+    encoded = bytes(bytearray([1, 255, 3, 0, 2, 255, 255, 255, 255, 2, 7]))
+    decoded = pyart.io.mdv_common._decode_rle8(encoded, 255, 263)
+    assert decoded.dtype == np.uint8
+    assert list(decoded[:6]) == [1, 0, 0, 0, 2, 255]
+    assert np.all(decoded[6:260] == 255)
+    assert list(decoded[260:]) == [7, 7, 0]   # missing data set to zero
+
+    # a run truncated by the end of the data ends the decoding
+    encoded = bytes(bytearray([1, 2, 255, 9]))
+    decoded = pyart.io.mdv_common._decode_rle8(encoded, 255, 4)
+    assert list(decoded) == [1, 2, 0, 0]
+
+
 def test_mdvfile_radar_stubs():
     mdvfile = pyart.io.mdv_common.MdvFile(None)
     # These methods are included in MdvFile as a stub for a future
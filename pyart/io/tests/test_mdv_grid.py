@@ -199,6 +199,20 @@ class Mdv_grid_Tests(object):
         assert_raises(TypeError, pyart.io.write_grid_mdv, tmpfile, grid)
 
 
+def test_read_grid_mdv_nthreads():
+    grid = pyart.testing.make_target_grid()
+    grid.add_field('reflectivity_two', {
+        'data': grid.fields['reflectivity']['data'] * 2.})
+    tmpfile = BytesIO()
+    pyart.io.write_grid_mdv(tmpfile, grid)
+    tmpfile.seek(0)
+    grid2 = pyart.io.read_grid_mdv(
+        tmpfile, file_field_names=True, nthreads=2)
+    for field in ['reflectivity', 'reflectivity_two']:
+        assert_almost_equal(grid2.fields[field]['data'],
+                            grid.fields[field]['data'], 4)
+
+
 def test_time_dic_to_datetime():
     dt = pyart.io.mdv_grid._time_dic_to_datetime(
         {'data': [20], 'units': 'seconds since 1970-01-01 00:00:00'})
@@ -354,3 +354,28 @@ def test_radar_exclude_fields():
     radar = pyart.io.read_mdv(
         pyart.testing.MDV_PPI_FILE, exclude_fields=['reflectivity'])
     assert 'reflectivity' not in radar.fields
+
+
+def test_keep_packed_and_dtype():
+    radar = pyart.io.read_mdv(pyart.testing.MDV_PPI_FILE)
+    packed = pyart.io.read_mdv(pyart.testing.MDV_PPI_FILE, keep_packed=True)
+    field_dic = packed.fields['reflectivity']
+    assert field_dic._lazyload['data'].codes.dtype == np.uint16
+    data = field_dic['data']
+    ref = radar.fields['reflectivity']['data']
+    assert data.dtype == np.float32
+    assert data.shape == ref.shape
+    assert_almost_equal(data, ref, 4)
+    assert np.all(np.ma.getmaskarray(data) == np.ma.getmaskarray(ref))
+
+    radar = pyart.io.read_mdv(pyart.testing.MDV_PPI_FILE, dtype='float64')
+    assert radar.fields['reflectivity']['data'].dtype == np.float64
+
+
+def test_nthreads():
+    radar = pyart.io.read_mdv(pyart.testing.MDV_PPI_FILE)
+    threaded = pyart.io.read_mdv(pyart.testing.MDV_PPI_FILE, nthreads=2)
+    ref = radar.fields['reflectivity']['data']
+    data = threaded.fields['reflectivity']['data']
+    assert_almost_equal(data, ref)
+    assert np.all(np.ma.getmaskarray(data) == np.ma.getmaskarray(ref))
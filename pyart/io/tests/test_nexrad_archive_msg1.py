@@ -303,3 +303,11 @@ def test_only_ref():
     assert radar.nrays == 367 + 368 + 366 + 366 + 366
     assert radar.ngates == 460
     assert radar.nsweeps == 5
+
+
+def test_include_fields():
+    radar = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_MSG1_FILE,
+        station='KLOT', scans=[1], include_fields=['velocity'])
+    assert list(radar.fields.keys()) == ['velocity']
+    assert radar.nsweeps == 1
@@ -1,5 +1,8 @@
 """ Unit Tests for Py-ART's io/nexrad_archive.py module using a MSG31 file. """
 
+import bz2
+import struct
+
 import numpy as np
 from numpy.testing import assert_almost_equal
 from numpy.ma.core import MaskedArray
@@ -284,3 +287,79 @@ def test_compressed_archive():
     assert_almost_equal(rdata[2, 0], 9.5, 1)
     assert 'velocity' not in radar.fields.keys()
     assert 'spectrum_width' not in radar.fields.keys()
+
+
+def test_include_fields_and_scans():
+    radar2 = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, scans=[0, 1],
+        include_fields=['reflectivity'])
+    assert list(radar2.fields.keys()) == ['reflectivity']
+    assert radar2.nsweeps == 2
+    assert radar2.nrays == 1440
+    assert radar2.ngates == 1832
+    assert_almost_equal(radar2.fields['reflectivity']['data'],
+                        radar.fields['reflectivity']['data'][:1440])
+    assert_almost_equal(radar2.azimuth['data'], radar.azimuth['data'][:1440])
+
+
+def test_read_nexrad_chunks():
+    # create real-time chunks containing 200 radials from the first 1200
+    uncompressed_file = bz2.BZ2File(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, 'rb')
+    head = uncompressed_file.read(36)
+    records = uncompressed_file.read(1200 * 6000)
+    index = pyart.io.nexrad_level2._index_records(records, 0)
+    radials = index['pos'][index['type'] == 31]
+    bounds = [0] + list(radials[:1200:200]) + [radials[1200]]
+    chunks = [head[:24]]
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        block = records[start:end]
+        if start == 0:
+            block = head[24:] + block
+        cblock = bz2.compress(block)
+        chunks[-1] += struct.pack('>i', len(cblock)) + cblock
+        chunks.append(b'')
+    chunks.pop()
+
+    radars = list(pyart.io.read_nexrad_chunks(
+        chunks, include_fields=['reflectivity']))
+    assert len(radars) == 2
+    assert radars[0].nrays == 720
+    assert radars[1].nrays == 480
+    assert radars[1].sweep_number['data'][0] == 1
+    assert list(radars[0].fields.keys()) == ['reflectivity']
+    assert_almost_equal(radars[0].fields['reflectivity']['data'],
+                        radar.fields['reflectivity']['data'][:720])
+    assert_almost_equal(radars[1].fixed_angle['data'],
+                        radar.fixed_angle['data'][1:2])
+    pytest.raises(ValueError, next,
+                  pyart.io.read_nexrad_chunks(chunks, scans=[0]))
+
+
+def test_keep_packed_and_dtype():
+    radar = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, scans=[0, 1])
+    packed = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, scans=[0, 1],
+        keep_packed=True)
+    ref = radar.fields['reflectivity']['data']
+    field_dic = packed.fields['reflectivity']
+    assert isinstance(field_dic, pyart.lazydict.LazyLoadDict)
+    assert field_dic._lazyload['data'].codes.dtype == np.uint8
+
+    # partial decoding of the rays in a sweep
+    data = field_dic.get_partial('data', slice(720, 1440))
+    assert_almost_equal(data, ref[720:1440])
+    assert np.all(data.mask == ref.mask[720:1440])
+
+    data = field_dic['data']
+    assert data.dtype == np.float32
+    assert_almost_equal(data, ref)
+    assert np.all(data.mask == ref.mask)
+    for field in radar.fields:
+        assert_almost_equal(packed.fields[field]['data'],
+                            radar.fields[field]['data'])
+
+    radar = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, scans=[0], dtype='float64')
+    assert radar.fields['reflectivity']['data'].dtype == np.float64
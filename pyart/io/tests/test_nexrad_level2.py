@@ -2,6 +2,7 @@
 
 import datetime
 import bz2
+import struct
 from io import BytesIO
 
 import numpy as np
@@ -389,3 +390,239 @@ def test_1ms_vel_message():
     # check the velocity scale
     new_pos, dic = nexrad_level2._get_record_from_buf(fake_buf, 0)
     assert dic['VEL']['scale'] == 1.0
+
+
+# create a NEXRADLevel2File using the record index
+lfile = nexrad_level2.NEXRADLevel2File(
+    bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, 'rb'), lazy=True)
+
+
+def test_lazy_attributes():
+    assert len(lfile.radial_records) == 7200
+    assert lfile.nscans == 16
+    assert lfile.scan_msgs[10][10] == 5050
+    assert len(lfile._record_index) == len(nfile._records)
+    assert lfile.vcp == nfile.vcp
+    assert lfile.radial_records[10]['RAD'] == nfile.radial_records[10]['RAD']
+
+
+def test_lazy_methods():
+    assert lfile.scan_info() == nfile.scan_info()
+    assert lfile.location() == nfile.location()
+    assert_array_equal(lfile.get_times()[1], nfile.get_times()[1])
+    assert_array_equal(lfile.get_azimuth_angles(),
+                       nfile.get_azimuth_angles())
+    assert_array_equal(lfile.get_elevation_angles(),
+                       nfile.get_elevation_angles())
+    assert_array_equal(lfile.get_target_angles(), nfile.get_target_angles())
+    assert_array_equal(lfile.get_nyquist_vel(), nfile.get_nyquist_vel())
+    assert_array_equal(lfile.get_unambigous_range(),
+                       nfile.get_unambigous_range())
+
+
+@pytest.mark.parametrize('moment', ['REF', 'VEL', 'SW', 'ZDR', 'PHI', 'RHO'])
+def test_lazy_get_data(moment):
+    data = lfile.get_data(moment, 1832, [0, 4, 15])
+    ref_data = nfile.get_data(moment, 1832, [0, 4, 15])
+    assert_array_equal(data, ref_data)
+    assert_array_equal(data.mask, ref_data.mask)
+    raw = lfile.get_data(moment, 1832, [0, 4, 15], raw_data=True)
+    assert_array_equal(
+        raw, nfile.get_data(moment, 1832, [0, 4, 15], raw_data=True))
+
+
+def test_lazy_mmap(tmpdir):
+    filename = str(tmpdir.join('uncompressed.ar2v'))
+    uncompressed_file = bz2.BZ2File(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, 'rb')
+    with open(filename, 'wb') as f:
+        f.write(uncompressed_file.read())
+    mfile = nexrad_level2.NEXRADLevel2File(filename, lazy=True)
+    mfile.close()
+    assert len(mfile.radial_records) == 7200
+    data = mfile.get_data('REF', 1832, [0, 1], raw_data=True)
+    assert_array_equal(
+        data, nfile.get_data('REF', 1832, [0, 1], raw_data=True))
+
+
+def test_lazy_compressed():
+    lcfile = nexrad_level2.NEXRADLevel2File(COMPRESSED_FILE, lazy=True)
+    assert len(lcfile.radial_records) == 120
+    assert_array_equal(lcfile.get_data('REF', 1832, [0]),
+                       cfile.get_data('REF', 1832, [0]))
+
+
+def test_lazy_msg1():
+    uncompressed_file = bz2.BZ2File(
+        pyart.testing.NEXRAD_ARCHIVE_MSG1_FILE, 'rb')
+    mfile = nexrad_level2.NEXRADLevel2File(uncompressed_file)
+    uncompressed_file.seek(0)
+    lmfile = nexrad_level2.NEXRADLevel2File(uncompressed_file, lazy=True)
+    assert lmfile._msg_type == '1'
+    assert lmfile.scan_info() == mfile.scan_info()
+    assert_array_equal(lmfile.get_azimuth_angles(),
+                       mfile.get_azimuth_angles())
+    assert_array_equal(lmfile.get_nyquist_vel(), mfile.get_nyquist_vel())
+    for moment in ['REF', 'VEL', 'SW']:
+        assert_array_equal(lmfile.get_data(moment, 920),
+                           mfile.get_data(moment, 920))
+
+
+def test_decompress_records_nthreads():
+    # create a compressed file with multiple blocks from the first records
+    uncompressed_file = bz2.BZ2File(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, 'rb')
+    head = uncompressed_file.read(36)
+    records = uncompressed_file.read(2000000)
+    index = nexrad_level2._index_records(records, 0)
+    bounds = list(index['pos'][:300:50]) + [index['pos'][300]]
+    compressed_file = BytesIO()
+    compressed_file.write(head[:24])
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        block = records[start:end]
+        if start == 0:
+            block = head[24:] + block
+        cblock = bz2.compress(block)
+        compressed_file.write(struct.pack('>i', len(cblock)))
+        compressed_file.write(cblock)
+    compressed_file.seek(0)
+
+    blocks = nexrad_level2._find_compressed_blocks(
+        compressed_file.read(), 24)
+    assert len(blocks) == 6
+    buf = nexrad_level2._decompress_records(compressed_file)
+    assert buf == records[:bounds[-1]]
+    buf = nexrad_level2._decompress_records(compressed_file, nthreads=4)
+    assert buf == records[:bounds[-1]]
+
+    compressed_file.seek(0)
+    mfile = nexrad_level2.NEXRADLevel2File(compressed_file, nthreads=3)
+    nradials = np.count_nonzero(index['type'][:300] == 31)
+    assert len(mfile._records) == 300
+    assert len(mfile.radial_records) == nradials
+    assert_array_equal(mfile.get_data('REF', 1832, [0]),
+                       nfile.get_data('REF', 1832, [0])[:nradials])
+
+
+def test_get_scale_offset():
+    for f in [nfile, lfile]:
+        scale, offset = f.get_scale_offset('VEL', [0, 1])
+        assert np.isnan(scale[0]) and np.isnan(offset[0])
+        assert scale[1] == 2.
+        assert offset[1] == 129.
+        scale, offset = f.get_scale_offset('REF')
+        assert scale.shape == (16, )
+        assert np.all(scale == 2.)
+        assert np.all(offset == 66.)
+
+
+def test_lazy_get_data_unequal_rays():
+    mfile = nexrad_level2.NEXRADLevel2File(
+        bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, 'rb'),
+        lazy=True)
+    # rays with differing number of gates are decoded one at a time
+    mfile._radial_index['REF']['ngates'][5] = 100
+    mfile._radial_index['REF']['data_pos'][7] = -1
+    data = mfile.get_data('REF', 1832, [0], raw_data=True)
+    ref_data = nfile.get_data('REF', 1832, [0], raw_data=True)
+    assert np.all(data[5, 100:] == 1)
+    assert np.all(data[7] == 1)
+    assert_array_equal(data[5, :100], ref_data[5, :100])
+    assert_array_equal(data[8:], ref_data[8:])
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_scans_argument(lazy):
+    sfile = nexrad_level2.NEXRADLevel2File(
+        bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, 'rb'),
+        lazy=lazy, scans=[1])
+    # records following the last requested scan are not read
+    assert sfile.nscans == 2
+    assert len(sfile.radial_records) == 1440
+    assert len(sfile._records) < len(nfile._records)
+    assert_array_equal(sfile.get_data('REF', 1832, [1]),
+                       nfile.get_data('REF', 1832, [1]))
+
+
+def test_decompress_records_max_elevation():
+    # create a compressed file with a block for every 360 radials
+    uncompressed_file = bz2.BZ2File(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, 'rb')
+    head = uncompressed_file.read(36)
+    records = uncompressed_file.read()
+    index = nexrad_level2._index_records(records, 0)
+    radials = index['pos'][index['type'] == 31]
+    bounds = [0] + list(radials[360::360]) + [len(records)]
+    compressed_file = BytesIO()
+    compressed_file.write(head[:24])
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        block = records[start:end]
+        if start == 0:
+            block = head[24:] + block
+        cblock = bz2.compress(block)
+        compressed_file.write(struct.pack('>i', len(cblock)))
+        compressed_file.write(cblock)
+
+    # the third block contains the first radials of scan 1 (elevation 2)
+    for nthreads in [1, 2]:
+        buf = nexrad_level2._decompress_records(
+            compressed_file, nthreads, max_elevation=1)
+        assert len(buf) >= bounds[3]
+        assert len(buf) < len(records)
+        assert buf[:bounds[3]] == records[:bounds[3]]
+
+
+def make_chunks(nradials, radials_per_chunk):
+    """ Create real-time chunks from the first radials of the test file. """
+    uncompressed_file = bz2.BZ2File(
+        pyart.testing.NEXRAD_ARCHIVE_MSG31_FILE, 'rb')
+    head = uncompressed_file.read(36)
+    records = uncompressed_file.read(nradials * 6000)
+    index = nexrad_level2._index_records(records, 0)
+    radials = index['pos'][index['type'] == 31]
+    bounds = [0] + list(radials[:nradials:radials_per_chunk])
+    bounds.append(radials[nradials])
+    chunks = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        block = records[start:end]
+        if start == 0:
+            block = head[24:] + block
+        cblock = bz2.compress(block)
+        chunk = struct.pack('>i', len(cblock)) + cblock
+        if start == 0:
+            chunk = head[:24] + chunk
+        chunks.append(chunk)
+    return chunks
+
+
+def test_chunk_buffer():
+    chunks = make_chunks(1200, 200)
+    chunk_buffer = nexrad_level2.NEXRADLevel2ChunkBuffer()
+    # the first chunk contains only metadata
+    assert chunk_buffer.add_chunk(chunks[0]) == []
+    assert chunk_buffer.volume_header[:4] == b'AR2V'
+    assert chunk_buffer.add_chunk(BytesIO(chunks[1])) == []
+    assert chunk_buffer.add_chunk(chunks[2]) == []
+    assert chunk_buffer.add_chunk(chunks[3]) == []
+    # the end of elevation radial of the first scan is in the fifth chunk
+    assert chunk_buffer.add_chunk(chunks[4]) == [0]
+    for chunk in chunks[5:]:
+        assert chunk_buffer.add_chunk(chunk) == []
+    assert chunk_buffer.completed == [0]
+    assert chunk_buffer.finish() == [1]
+
+    sfile = nexrad_level2.NEXRADLevel2File(
+        chunk_buffer.pop_scan_file(0), lazy=True)
+    assert sfile.nscans == 1
+    assert sfile.get_vcp_pattern() == nfile.get_vcp_pattern()
+    assert_array_equal(sfile.get_data('REF', 1832),
+                       nfile.get_data('REF', 1832, [0]))
+    sfile = nexrad_level2.NEXRADLevel2File(
+        chunk_buffer.pop_scan_file(1), lazy=True, scans=[1])
+    assert sfile.get_nrays(1) == 480
+    assert chunk_buffer.completed == []
+
+
+def test_chunk_buffer_invalid_chunk():
+    chunk_buffer = nexrad_level2.NEXRADLevel2ChunkBuffer()
+    pytest.raises(IOError, chunk_buffer.add_chunk, b'XXXXXXXX')
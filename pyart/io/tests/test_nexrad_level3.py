@@ -1,9 +1,16 @@
 """ Unit Tests for Py-ART's io/nexrad_level3.py module. """
 
+import struct
+from io import BytesIO
+
 import numpy as np
 from numpy.ma.core import MaskedArray
+import pytest
 
 import pyart
+from pyart.io.nexrad_level3 import (
+    NEXRADLevel3File, decode_nexrad_level3_files, _decode_rle_rows,
+    MESSAGE_HEADER, PRODUCT_DESCRIPTION)
 
 
 def test_nexrad_level3_msg19():
@@ -139,3 +146,67 @@ def test_nexrad_level3_msg161_fileobj():
     assert radar.fields[field_name]['data'].shape == (360, 1200)
     assert type(radar.fields[field_name]['data']) is MaskedArray
     assert round(radar.fields[field_name]['data'][103, 170]) == 2.
+
+
+def test_decode_nexrad_level3_files():
+    filenames = [pyart.testing.NEXRAD_LEVEL3_MSG19,
+                 pyart.testing.NEXRAD_LEVEL3_MSG163,
+                 pyart.testing.NEXRAD_LEVEL3_MSG19]
+    nfiles = decode_nexrad_level3_files(filenames, nthreads=2)
+    assert len(nfiles) == 3
+    for filename, nfile in zip(filenames, nfiles):
+        ref = NEXRADLevel3File(filename)
+        assert np.array_equal(nfile.raw_data, ref.raw_data)
+        assert nfile.radial_headers == ref.radial_headers
+        ref.close()
+
+    pytest.raises(IOError, decode_nexrad_level3_files, ['missing_file'])
+
+
+def test_decode_rle_rows():
+    # two rows of four values, the second with a padding byte of zero runs
+    buf = np.array([0x31, 0x12, 0x22, 0x22, 0x00], dtype='uint8')
+    data = _decode_rle_rows(buf, np.array([0, 2]), np.array([2, 3]))
+    assert data.shape == (2, 4)
+    assert data.tolist() == [[1, 1, 1, 2], [2, 2, 2, 2]]
+    pytest.raises(ValueError, _decode_rle_rows, buf, np.array([0, 2]),
+                  np.array([2, 3]), 5)
+
+
+def make_raster_file():
+    """ Return a file-like object of a raster, product 37, Level 3 file. """
+    def pack(structure, **kwargs):
+        fmt = '>' + ''.join([i[1] for i in structure])
+        values = [kwargs.get(name, b'' if fmt_char.endswith('s') else 0)
+                  for name, fmt_char in structure]
+        return struct.pack(fmt, *values)
+
+    # 16 data levels of 5 dBZ starting at 0 dBZ, the first is bad data
+    thresh = [128, 0] + [0, 5] * 15
+    thresh[3::2] = range(5, 80, 5)
+    rows = [[0x31, 0x22], [0x52, 0x00], [0x2f, 0x30]]
+    raster = b''.join(
+        struct.pack('>h', len(row)) + bytes(bytearray(row)) for row in rows)
+    return BytesIO(
+        b'SDUS53 KBMX 020205\r\r\nCR1BMX\r\r\n' +
+        pack(MESSAGE_HEADER, code=37) +
+        pack(PRODUCT_DESCRIPTION, threshold_data=bytes(bytearray(thresh))) +
+        struct.pack('>hhihhi', -1, 1, 0, 1, -1, 0) +
+        struct.pack('>11h', -17905, -32768, 192, 0, 0, 1, 0, 1, 0, 3, 2) +
+        raster)
+
+
+def test_nexrad_level3_raster():
+    nfile = NEXRADLevel3File(make_raster_file())
+    assert nfile.packet_header['nrows'] == 3
+    assert nfile.radial_headers == []
+    assert nfile.raw_data.tolist() == [
+        [1, 1, 1, 2, 2], [2, 2, 2, 2, 2], [15, 15, 0, 0, 0]]
+    data = nfile.get_data()
+    assert data.shape == (3, 5)
+    assert data[0, 0] == 5.
+    assert data[2, 0] == 75.
+    assert np.ma.is_masked(data[2, 4])
+
+    pytest.raises(NotImplementedError, pyart.io.read_nexrad_level3,
+                  make_raster_file())
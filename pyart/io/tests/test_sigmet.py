@@ -1,5 +1,7 @@
 """ Unit Tests for Py-ART's io/sigmet.py module. """
 
+import io
+
 import numpy as np
 from numpy.testing import assert_almost_equal
 from numpy.ma.core import MaskedArray
@@ -369,3 +371,99 @@ def test_1byte_datatype():
     result = pyart.io._sigmetfile.convert_sigmet_data(data_type, data, nbins)
     assert np.all(result == -31.5)
     assert result.shape == (2, 2)
+
+
+def test_dtype():
+    radar = pyart.io.read_sigmet(pyart.testing.SIGMET_PPI_FILE,
+                                 dtype='float64')
+    assert radar.fields['reflectivity']['data'].dtype == np.float64
+
+
+def test_1byte_datatype_3d():
+    data_type = 1   # Sigmet type for for a DBT field
+    data = np.ones((2, 3, 4), dtype=np.int16) * 257
+    nbins = np.ones((2, 3), dtype=np.int16) * 3
+    result = pyart.io._sigmetfile.convert_sigmet_data(data_type, data, nbins)
+    assert result.shape == (2, 3, 4)
+    assert np.all(result[..., :3] == -31.5)
+    assert np.all(result.mask[..., 3])
+
+
+def test_1byte_datatype_strided():
+    data_type = 1   # Sigmet type for for a DBT field
+    raw = np.ones((2, 3, 10), dtype=np.int16) * 257
+    nbins = np.ones((2, 3), dtype=np.int16) * 4
+    data = raw[..., 6:]     # strided, as passed by read_data
+    assert not data.flags['C_CONTIGUOUS']
+    result = pyart.io._sigmetfile.convert_sigmet_data(data_type, data, nbins)
+    assert result.shape == (2, 3, 4)
+    assert np.all(result == -31.5)
+
+
+def test_read_data_1byte():
+    # read the 2-byte reflectivity in the example file as 1-byte data
+    sigmetfile = pyart.io._sigmetfile.SigmetFile(
+        pyart.testing.SIGMET_PPI_FILE)
+    sigmetfile.data_types = [2]
+    sigmetfile.data_type_names = ['DBZ']
+    data, metadata = sigmetfile.read_data()
+    sigmetfile.close()
+    sigmetfile = pyart.io._sigmetfile.SigmetFile(
+        pyart.testing.SIGMET_PPI_FILE)
+    raw, _ = sigmetfile.read_data(raw_data=True)
+    sigmetfile.close()
+    expected = pyart.io._sigmetfile.convert_sigmet_data(
+        2, np.ascontiguousarray(raw['DBZ2']), metadata['DBZ']['nbins'])
+    assert data['DBZ'].shape == (1, 20, 25)
+    assert np.ma.allequal(data['DBZ'], expected)
+    assert np.all(data['DBZ'].mask == expected.mask)
+
+
+def test_delay_field_loading():
+    radar_lazy = pyart.io.read_sigmet(
+        pyart.testing.SIGMET_PPI_FILE, delay_field_loading=True)
+    field = radar_lazy.fields['reflectivity']
+    assert isinstance(field, pyart.lazydict.LazyLoadDict)
+    assert 'data' in field._lazyload
+    data = radar.fields['reflectivity']['data']
+    assert np.ma.allequal(field['data'], data)
+    assert np.all(field['data'].mask == data.mask)
+
+
+def test_keep_packed_and_dtype():
+    packed = pyart.io.read_sigmet(
+        pyart.testing.SIGMET_PPI_FILE, keep_packed=True)
+    for field in radar.fields:
+        assert isinstance(packed.fields[field], pyart.lazydict.LazyLoadDict)
+        raw = packed.fields[field]._lazyload['data'].raw
+        assert raw.dtype == np.int16
+        assert raw.shape == radar.fields[field]['data'].shape
+        data = packed.fields[field]['data']
+        ref = radar.fields[field]['data']
+        assert data.dtype == ref.dtype
+        assert_almost_equal(data, ref)
+        assert np.all(np.ma.getmaskarray(data) == np.ma.getmaskarray(ref))
+
+    packed = pyart.io.read_sigmet(
+        pyart.testing.SIGMET_PPI_FILE, dtype='float64', keep_packed=True)
+    assert packed.fields['reflectivity']['data'].dtype == np.float64
+
+
+def test_read_file_like():
+    with open(pyart.testing.SIGMET_PPI_FILE, 'rb') as fh:
+        fileobj = io.BytesIO(fh.read())
+    radar_fobj = pyart.io.read_sigmet(fileobj)
+    data = radar.fields['reflectivity']['data']
+    assert np.ma.allequal(radar_fobj.fields['reflectivity']['data'], data)
+
+
+def test_read_data_raw():
+    sigmetfile = pyart.io._sigmetfile.SigmetFile(
+        pyart.testing.SIGMET_PPI_FILE)
+    raw, metadata = sigmetfile.read_data(raw_data=True)
+    assert raw['DBZ2'].dtype == np.int16
+    assert raw['DBZ2'].shape == (1, 20, 25)
+    data = sigmetfile.convert_data(
+        'DBZ2', raw['DBZ2'], metadata['DBZ2']['nbins'])
+    sigmetfile.close()
+    assert np.ma.allequal(data[0], radar.fields['reflectivity']['data'])
@@ -11,7 +11,7 @@ from numpy.testing import assert_raises, assert_almost_equal, assert_warns
 import pytest
 
 import pyart
-from pyart.io.uffile import UFFile, UFRay
+from pyart.io.uffile import UFFile, UFRay, UFVolume
 
 radar = pyart.io.read_uf(pyart.testing.UF_FILE, file_field_names=True)
 
@@ -177,3 +177,61 @@ def test_range_start_nonzero():
     radar2 = pyart.io.read_uf(in_mem)
     assert_almost_equal(radar2.range['meters_to_center_of_first_gate'], 1530)
     assert_almost_equal(radar2.range['data'][0], 1530)
+
+
+def test_keep_packed_and_dtype():
+    radar = pyart.io.read_uf(pyart.testing.UF_FILE)
+    packed = pyart.io.read_uf(pyart.testing.UF_FILE, keep_packed=True)
+    for field in radar.fields:
+        codes = packed.fields[field]._lazyload['data'].codes
+        assert codes.dtype == np.int16
+        data = packed.fields[field]['data']
+        ref = radar.fields[field]['data']
+        assert data.dtype == ref.dtype
+        assert_almost_equal(data, ref)
+        assert np.all(np.ma.getmaskarray(data) == np.ma.getmaskarray(ref))
+
+    radar = pyart.io.read_uf(pyart.testing.UF_FILE, dtype='float32')
+    assert radar.fields['reflectivity']['data'].dtype == np.float32
+    packed = pyart.io.read_uf(
+        pyart.testing.UF_FILE, dtype='float32', keep_packed=True)
+    assert packed.fields['reflectivity']['data'].dtype == np.float32
+
+
+def test_ufvolume():
+    with open(pyart.testing.UF_FILE, 'rb') as fh:
+        uf_bytes = fh.read()
+    ufile = UFFile(StringIO(uf_bytes * 3))
+    ufvolume = UFVolume(StringIO(uf_bytes * 3))
+    assert ufvolume.nrays == ufile.nrays == 3
+    assert ufvolume.nsweeps == ufile.nsweeps
+    assert ufvolume.get_datetimes() == ufile.get_datetimes()
+    for method in ['get_azimuths', 'get_elevations', 'get_sweep_rates',
+                   'get_pulse_widths', 'get_prts', 'get_nyquists',
+                   'get_sweep_fixed_angles', 'get_sweep_polarizations']:
+        result = getattr(ufvolume, method)()
+        expected = getattr(ufile, method)()
+        assert np.all(result == expected)
+        assert result.dtype == expected.dtype
+    for field_number in range(len(ufile.first_ray.field_positions)):
+        data = ufvolume.get_field_data(field_number)
+        expected = ufile.get_field_data(field_number)
+        assert np.all(data == expected)
+        assert np.all(data.mask == expected.mask)
+    assert len(ufvolume.rays) == 3
+    assert ufvolume.rays[2].mandatory_header == ufile.rays[2].mandatory_header
+
+
+def test_ufvolume_fields_vary():
+    radar = pyart.io.read_uf(pyart.testing.UF_FILE)
+    in_mem = StringIO()
+    pyart.io.write_uf(in_mem, radar, exclude_fields=['reflectivity'])
+    pyart.io.write_uf(in_mem, radar)
+
+    in_mem.seek(0)
+    assert_raises(ValueError, UFVolume, in_mem)
+
+    # read_uf reads the rays individually
+    in_mem.seek(0)
+    radar2 = pyart.io.read_uf(in_mem)
+    assert radar2.nrays == 2
@@ -181,6 +181,30 @@ def test_ray_full():
     assert ref_ray == tst_ray
 
 
+def test_make_rays():
+
+    radar = pyart.testing.make_empty_ppi_radar(10, 2, 2)
+    radar.range['meters_between_gates'] = 100.
+    radar.range['meters_to_center_of_first_gate'] = 50.
+    data = np.arange(40.).reshape(4, 10)
+    radar.add_field('reflectivity', {'data': np.ma.masked_less(data, 5)})
+    radar.add_field('velocity', {'data': np.ma.array(data / 4. - 5.)})
+    radar.instrument_parameters = {
+        'nyquist_velocity': {'data': np.array([10., 10., 15., 15.])},
+        'polarization_mode': {'data': np.array([b'horizontal', b'vertical'])},
+    }
+    field_mapping = {'reflectivity': 'DZ', 'velocity': 'VR'}
+    ufraycreator = UFRayCreator(radar, field_mapping, ['reflectivity',
+                                                     'velocity'])
+
+    rays = ufraycreator.make_rays()
+    assert len(rays) == 4
+    pad = struct.pack(b'>i', ufraycreator.record_length * 2)
+    for ray_num in range(4):
+        ref_ray = pad + ufraycreator.make_ray(ray_num) + pad
+        assert rays[ray_num].tobytes() == ref_ray
+
+
 def test_complete_file():
 
     with open(pyart.testing.UF_FILE, 'rb') as fh:
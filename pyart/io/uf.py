@@ -8,6 +8,7 @@ Reading of Universal format (UF) files
     :toctree: generated/
 
     read_uf
+    _open_uf
     _get_scan_type
     _get_instrument_parameters
 
@@ -21,7 +22,8 @@ from netCDF4 import date2num
 from ..config import FileMetadata, get_fillvalue
 from ..core.radar import Radar
 from .common import make_time_unit_str, _test_arguments, prepare_for_read
-from .uffile import UFFile
+from .common import _cast_field_data, _packed_field_dic
+from .uffile import UFFile, UFVolume
 
 _LIGHT_SPEED = 2.99792458e8  # speed of light in meters per second
 _UF_SWEEP_MODES = {
@@ -50,7 +52,8 @@ _SWEEP_MODE_STR = {
 
 def read_uf(filename, field_names=None, additional_metadata=None,
             file_field_names=False, exclude_fields=None,
-            delay_field_loading=False, **kwargs):
+            delay_field_loading=False, dtype=None, keep_packed=False,
+            **kwargs):
     """
     Read a UF File.
 
@@ -80,6 +83,15 @@ def read_uf(filename, field_names=None, additional_metadata=None,
     delay_field_loading : bool
         This option is not implemented in the function but included for
         compatibility.
+    dtype : dtype or None, optional
+        Data type of the field data, for example 'float32' or 'float64'.
+        None, the default, uses float64.
+    keep_packed : bool, optional
+        True to store the field data as the 16-bit codes from the file along
+        with the scale factor of the field, the data is decoded into a
+        masked array of type dtype each time the 'data' key of the field
+        dictionary, a LazyLoadDict, is evaluated.  False, the default,
+        decodes the field data when read.
 
     Returns
     -------
@@ -95,8 +107,8 @@ def read_uf(filename, field_names=None, additional_metadata=None,
                                 file_field_names, exclude_fields)
 
     # Open UF file and get handle
-    ufile = UFFile(prepare_for_read(filename))
-    first_ray = ufile.rays[0]
+    ufile = _open_uf(prepare_for_read(filename))
+    first_ray = ufile.first_ray
 
     # time
     dts = ufile.get_datetimes()
@@ -172,8 +184,15 @@ def read_uf(filename, field_names=None, additional_metadata=None,
         if field_name is None:
             continue
         field_dic = filemetadata(field_name)
-        field_dic['data'] = ufile.get_field_data(uf_field_number)
         field_dic['_FillValue'] = get_fillvalue()
+        if keep_packed:
+            codes, scale, missing = ufile.get_raw_field_data(uf_field_number)
+            field_dic = _packed_field_dic(
+                field_dic, codes, 1. / scale, 0., (missing, ),
+                dtype or 'float64')
+        else:
+            field_dic['data'] = _cast_field_data(
+                ufile.get_field_data(uf_field_number), dtype)
         fields[field_name] = field_dic
 
     # instrument_parameters
@@ -194,6 +213,19 @@ def read_uf(filename, field_names=None, additional_metadata=None,
         instrument_parameters=instrument_parameters)
 
 
+def _open_uf(fobj):
+    """
+    Return a UFVolume for a UF file, or a UFFile when the layout of the
+    rays in the file varies.
+    """
+    start = fobj.tell()
+    try:
+        return UFVolume(fobj)
+    except ValueError:
+        fobj.seek(start)
+        return UFFile(fobj)
+
+
 def _get_scan_type(ufray):
     """ Ruturn the scan type of a UF ray. """
     uf_sweep_mode = ufray.mandatory_header['sweep_mode']
@@ -213,8 +245,7 @@ def _get_instrument_parameters(ufile, filemetadata):
 
     # assume that the parameters in the first ray represent the beam widths,
     # bandwidth and frequency in the entire volume
-    first_ray = ufile.rays[0]
-    field_header = first_ray.field_headers[0]
+    field_header = ufile.first_ray.field_headers[0]
     beam_width_h = field_header['beam_width_h'] / 64.
     beam_width_v = field_header['beam_width_v'] / 64.
     bandwidth = field_header['bandwidth'] / 16. * 1.e6
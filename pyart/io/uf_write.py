@@ -15,6 +15,7 @@ Functions for writing UF files.
 
     write_uf
     _d_to_dms
+    _fill_structure
     _pack_structure
 
 """
@@ -37,6 +38,7 @@ from .uffile import UF_FIELD_POSITION
 from .uffile import UF_FIELD_HEADER
 from .uffile import UF_FSI_VEL
 from .uffile import POLARIZATION_STR
+from .uffile import _structure_dtype
 
 
 def write_uf(filename, radar, uf_field_names=None, radar_field_names=False,
@@ -116,17 +118,13 @@ def write_uf(filename, radar, uf_field_names=None, radar_field_names=False,
         radar, field_mapping, field_write_order, volume_start=volume_start,
         templates_extra=templates_extra)
 
-    for ray_num in range(radar.nrays):
-
-        ray_bytes = raycreator.make_ray(ray_num)
-        pad = struct.pack(b'>i', raycreator.record_length * 2)
-
-        fhandle.write(pad)
-        fhandle.write(ray_bytes)
-        fhandle.write(pad)
-
+    # all rays have the same layout and are written at once
+    rays = raycreator.make_rays()
     if close:
+        rays.tofile(fhandle)
         fhandle.close()
+    else:
+        fhandle.write(rays.tobytes())
     return
 
 
@@ -348,6 +346,142 @@ class UFRayCreator(object):
 
         return ray
 
+    def make_rays(self):
+        """
+        Return a structured array of all the rays in the volume.
+
+        Each element of the array is a ray, including the 4-byte padding
+        before and after it, with bytes identical to those from make_ray.
+        The layout of every ray is the same so the structures of all rays
+        are filled at once rather than being packed ray by ray.
+        """
+        radar = self.radar
+        iparams = radar.instrument_parameters
+        if iparams is None:
+            iparams = {}
+        field_positions = self.make_field_position_list()
+        rays = np.empty((radar.nrays, ),
+                        dtype=self._make_ray_dtype(field_positions))
+
+        rays['pad_start'] = rays['pad_end'] = self.record_length * 2
+        self._fill_mandatory_headers(rays['mandatory_header'])
+        _fill_structure(rays['optional_header'],
+                        self.optional_header_template, UF_OPTIONAL_HEADER)
+        data_header = UF_DATA_HEADER_TEMPLATE.copy()
+        data_header['ray_nfields'] = len(self.field_write_order)
+        data_header['record_nfields'] = len(self.field_write_order)
+        _fill_structure(rays['data_header'], data_header, UF_DATA_HEADER)
+
+        # parameters of the field headers which vary between rays
+        field_header = self.field_header_template.copy()
+        field_header['nbins'] = radar.ngates
+        if 'pulse_width' in iparams:
+            pulse_width = iparams['pulse_width']['data'] * _LIGHT_SPEED
+            field_header['pulse_width_m'] = np.round(pulse_width)
+        else:
+            field_header['pulse_width_m'] = UF_MISSING_VALUE
+        if 'prt' in iparams:
+            field_header['prt_ms'] = np.round(iparams['prt']['data'] * 1.e6)
+        else:
+            field_header['prt_ms'] = UF_MISSING_VALUE
+        polarization = np.ones((radar.nsweeps, ), dtype='int16')
+        if 'polarization_mode' in iparams:
+            for i, mode in enumerate(iparams['polarization_mode']['data']):
+                if str(mode) in POLARIZATION_STR:
+                    polarization[i] = POLARIZATION_STR.index(str(mode))
+        field_header['polarization'] = polarization[self.ray_num_to_sweep_num]
+
+        for i, field_info in enumerate(field_positions):
+            _fill_structure(rays['field_positions'][:, i], field_info,
+                            UF_FIELD_POSITION)
+
+            data_type = field_info['data_type']
+            offset = field_info['offset_field_header'] + 19
+            radar_field = field_info['radar_field']
+            if '_UF_scale_factor' in radar.fields[radar_field]:
+                scale = radar.fields[radar_field]['_UF_scale_factor']
+            else:
+                scale = UF_DEFAULT_SCALE_FACTOR
+
+            if data_type in UF_VEL_DATA_TYPES:
+                offset += 2
+                fsi_vel = UF_FSI_VEL_TEMPLATE.copy()
+                if 'nyquist_velocity' in iparams:
+                    nyquist = iparams['nyquist_velocity']['data']
+                    fsi_vel['nyquist'] = np.round(nyquist * scale)
+                else:
+                    fsi_vel['nyquist'] = UF_MISSING_VALUE
+                _fill_structure(rays['fsi_vel_%d' % i], fsi_vel, UF_FSI_VEL)
+
+            field_header['data_offset'] = offset
+            field_header['scale_factor'] = scale
+            _fill_structure(rays['field_header_%d' % i], field_header,
+                            UF_FIELD_HEADER)
+
+            field_data = np.ma.asarray(radar.fields[radar_field]['data'])
+            rays['data_%d' % i] = np.round(field_data * scale).filled(-32768)
+        return rays
+
+    def _make_ray_dtype(self, field_positions):
+        """ Return the dtype of a padded UF ray. """
+        dtype = [
+            ('pad_start', '>i4'),
+            ('mandatory_header', _structure_dtype(UF_MANDATORY_HEADER)),
+            ('optional_header', _structure_dtype(UF_OPTIONAL_HEADER)),
+            ('data_header', _structure_dtype(UF_DATA_HEADER)),
+            ('field_positions', _structure_dtype(UF_FIELD_POSITION),
+             (len(field_positions), ))]
+        for i, field_info in enumerate(field_positions):
+            dtype.append(
+                ('field_header_%d' % i, _structure_dtype(UF_FIELD_HEADER)))
+            if field_info['data_type'] in UF_VEL_DATA_TYPES:
+                dtype.append(('fsi_vel_%d' % i, _structure_dtype(UF_FSI_VEL)))
+            dtype.append(('data_%d' % i, '>i2', (self.radar.ngates, )))
+        dtype.append(('pad_end', '>i4'))
+        return np.dtype(dtype)
+
+    def _fill_mandatory_headers(self, header):
+        """ Fill the mandatory headers of all rays. """
+        radar = self.radar
+        _fill_structure(header, self.mandatory_header_template,
+                        UF_MANDATORY_HEADER)
+
+        # time parameters
+        ray_times = num2date(radar.time['data'], radar.time['units'])
+        header['year'] = [ray_time.year - 2000 for ray_time in ray_times]
+        header['month'] = [ray_time.month for ray_time in ray_times]
+        header['day'] = [ray_time.day for ray_time in ray_times]
+        header['hour'] = [ray_time.hour for ray_time in ray_times]
+        header['minute'] = [ray_time.minute for ray_time in ray_times]
+        header['second'] = [ray_time.second for ray_time in ray_times]
+
+        # ray/sweep numbers
+        header['record_number'] = header['ray_number'] = np.arange(
+            1, radar.nrays + 1)
+        header['sweep_number'] = self.ray_num_to_sweep_num + 1
+
+        # pointing
+        header['azimuth'] = np.round(radar.azimuth['data'] * 64)
+        header['elevation'] = np.round(radar.elevation['data'] * 64)
+        fixed_angle = radar.fixed_angle['data'][self.ray_num_to_sweep_num]
+        header['fixed_angle'] = np.round(fixed_angle * 64)
+
+        if radar.scan_rate is not None:
+            header['sweep_rate'] = np.round(radar.scan_rate['data'] * 64)
+        else:
+            header['sweep_rate'] = UF_MISSING_VALUE
+
+        if radar.scan_type in UF_SWEEP_MODES:
+            header['sweep_mode'] = UF_SWEEP_MODES[radar.scan_type]
+        else:
+            warnings.warn(
+                'Unknown scan_type: %s, defaulting to PPI' %
+                (radar.scan_type))
+            header['sweep_mode'] = UF_SWEEP_MODES['ppi']
+
+        header['record_length'] = self.record_length
+        return
+
     def make_mandatory_header(self, ray_num):
         """ Return a byte string representing a UF mandatory header. """
 
@@ -495,6 +629,12 @@ def _d_to_dms(in_deg):
     return degrees, minutes, seconds
 
 
+def _fill_structure(array, dic, structure):
+    """ Fill the elements of a structured array from a dictionary. """
+    for name, _ in structure:
+        array[name] = dic[name]
+
+
 def _pack_structure(dic, structure):
     """ Pack a structure from a dictionary """
     fmt = '>' + ''.join([i[1] for i in structure])  # UF is big-endian
@@ -10,10 +10,15 @@ Low level class for reading Universal Format (UF) files.
 
     UFFile
     UFRay
+    UFVolume
 
 .. autosummary::
     :toctree: generated/
 
+    _read_records
+    _find_records
+    _structure_dtype
+    _unpack_array
     _structure_size
     _unpack_from_buf
     _unpack_structure
@@ -94,6 +99,8 @@ class UFFile(object):
     ----------
     rays : list of UFRay objects
         List of rays within the UF file.
+    first_ray : UFRay
+        First ray within the UF file.
     nrays, nsweeps : int
         Number of rays and sweep in the file.
     ray_sweep_numbers : array
@@ -113,41 +120,9 @@ class UFFile(object):
             fobj = open(filename, 'rb')
         self._fh = fobj
 
-        # UF files come in three 'flavors' depending upon the size of the
-        # padding around each record.  True UF files contain no padding
-        # and start with the mandatory header of the first ray.  Other UF
-        # files contain a 2 or 4-byte padding immediately before and after
-        # each record.  The values in this padding can used to determine the
-        # size of each record, but is not used here, rather the size indicated
-        # by the 'record_length' structure elements is used.
-
-        # determine padding around records
-        buf = fobj.read(8)
-        try:
-            padding = buf.index(b'UF')
-        except ValueError:
-            raise IOError('file in not a valid UF file')
-
         # read in the records, store as a list of rays
-        self.rays = []
-        while len(buf) == 8:  # read until EOF reached
-
-            # record size stored as a 2-byte int start at byte 2
-            record_size = struct.unpack('>h', buf[padding+2:padding+4])[0] * 2
-
-            # read in full record
-            bytes_read = len(buf) - padding
-            bytes_to_read = record_size - bytes_read
-            record = buf[-bytes_read:] + fobj.read(bytes_to_read)
-
-            # convert record into UFRay
-            self.rays.append(UFRay(record))
-
-            # read post record padding
-            fobj.read(padding)
-
-            # read in the first eight bytes of the next record
-            buf = fobj.read(8)
+        self.rays = [UFRay(record) for record in _read_records(fobj)]
+        self.first_ray = self.rays[0]
 
         # determine volume size statistics
         self.nrays = len(self.rays)
@@ -183,6 +158,18 @@ class UFFile(object):
 
     def get_field_data(self, field_number):
         """ Return a 2D array of scale/masked field data for the volume. """
+        raw_data, scale_factor, missing_data_value = self.get_raw_field_data(
+            field_number)
+        data = raw_data / float(scale_factor)
+        mask = raw_data == missing_data_value
+        return np.ma.masked_array(data, mask)
+
+    def get_raw_field_data(self, field_number):
+        """
+        Return a 2D array of the raw int16 field data for the volume along
+        with the scale factor and missing data value of the field.  The data
+        in physical units is the raw data divided by the scale factor.
+        """
         # Assumes that no rays contain more gates than the first ray and
         # that the missing_data_value and scale_factor are identical for all
         # rays.  Additional the order and number of the fields are assumed to
@@ -198,10 +185,7 @@ class UFFile(object):
             bins = len(ray_data)
             raw_data[i, :bins] = ray.field_raw_data[field_number]
             raw_data[i, bins:] = missing_data_value
-
-        data = raw_data / float(scale_factor)
-        mask = raw_data == missing_data_value
-        return np.ma.masked_array(data, mask)
+        return raw_data, scale_factor, missing_data_value
 
     def get_azimuths(self):
         """ Return an array of azimuth angles for each ray in degrees. """
@@ -403,6 +387,317 @@ class UFRay(object):
         return latitude, longitude, height
 
 
+class UFVolume(UFFile):
+    """
+    A class for reading all rays in a Universal Format (UF) file at once.
+
+    The locations of the records are found in a single pass over the file
+    after which the headers and field data of all rays are extracted using
+    numpy structured arrays rather than creating a UFRay object for each
+    ray.  The methods are identical to those of the UFFile class.
+
+    The layout of all rays, the number and order of the fields, is assumed
+    to match that of the first ray, a ValueError is raised when this is not
+    the case, :py:class:`UFFile` can be used to read these files.
+
+    Parameters
+    ----------
+    filename : str or file-like
+        Filename or file-like object containing data in Universal format (UF).
+
+    Attributes
+    ----------
+    first_ray : UFRay
+        First ray within the UF file.
+    mandatory_headers : array
+        Structured array of the mandatory header of each ray.
+    field_types : list
+        Data type, two character bytes, of each field.
+    field_headers : list
+        Structured arrays of the field header of each ray for each field.
+    nrays, nsweeps : int
+        Number of rays and sweep in the file.
+    ray_sweep_numbers : array
+        Sweep number of each ray in the file.
+    first_ray_in_sweep, last_ray_in_sweep : array
+        Indices of the first and last ray in each sweep.
+    _buf : array
+        Bytes of the file as an uint8 array.
+    _record_offsets : array
+        Offset of each record in the file, bytes.
+    _field_header_offsets : list
+        Offset of the field header in the file for each field, bytes.
+
+    """
+
+    def __init__(self, filename):
+        """ initialize. """
+
+        # open the file if file object not passed
+        if hasattr(filename, 'read'):
+            fobj = filename
+        else:
+            fobj = open(filename, 'rb')
+        self._fh = fobj
+
+        self._buf = np.frombuffer(fobj.read(), dtype='u1')
+        self._record_offsets, record_sizes = _find_records(self._buf)
+        self.nrays = len(self._record_offsets)
+        if self.nrays == 0:
+            raise IOError('file in not a valid UF file')
+        first = self._record_offsets[0]
+        self.first_ray = UFRay(
+            self._buf[first:first + record_sizes[0]].tobytes())
+        self._rays = None
+
+        # headers of all rays
+        offsets = self._record_offsets
+        self.mandatory_headers = _unpack_array(
+            self._buf, offsets, UF_MANDATORY_HEADER)
+        data_header_offsets = (
+            offsets + (self.mandatory_headers['offset_data_header'] - 1) * 2)
+        data_headers = _unpack_array(
+            self._buf, data_header_offsets, UF_DATA_HEADER)
+        nfields = self.first_ray.data_header['record_nfields']
+        if np.any(data_headers['record_nfields'] != nfields):
+            raise ValueError('Number of fields varies between rays')
+
+        # field positions and headers of all rays
+        self.field_types = []
+        self.field_headers = []
+        self._field_header_offsets = []
+        for i in range(nfields):
+            positions = _unpack_array(
+                self._buf, data_header_offsets + 6 + i * 4, UF_FIELD_POSITION)
+            data_type = self.first_ray.field_positions[i]['data_type']
+            if np.any(positions['data_type'] != data_type):
+                raise ValueError('Order of fields varies between rays')
+            header_offsets = (
+                offsets + (positions['offset_field_header'] - 1) * 2)
+            self.field_types.append(data_type)
+            self.field_headers.append(_unpack_array(
+                self._buf, header_offsets, UF_FIELD_HEADER))
+            self._field_header_offsets.append(header_offsets)
+
+        # determine sweep information
+        self.ray_sweep_numbers = self._get_ray_sweep_numbers()
+        self.nsweeps = len(np.unique(self.ray_sweep_numbers))
+        first_ray_in_sweep, last_ray_in_sweep = self._get_sweep_limits()
+        self.first_ray_in_sweep = first_ray_in_sweep
+        self.last_ray_in_sweep = last_ray_in_sweep
+
+    @property
+    def rays(self):
+        """ List of UFRay objects for each ray, created when accessed. """
+        if self._rays is None:
+            sizes = self.mandatory_headers['record_length'].astype('int64') * 2
+            records = [
+                self._buf[offset:offset + size].tobytes() for offset, size
+                in zip(self._record_offsets[1:], sizes[1:])]
+            self._rays = [self.first_ray] + [
+                UFRay(record) for record in records]
+        return self._rays
+
+    def _get_ray_sweep_numbers(self):
+        """ Return an array of the sweep_number stored in each ray. """
+        return self.mandatory_headers['sweep_number'].astype('int32')
+
+    def get_raw_field_data(self, field_number):
+        """
+        Return a 2D array of the raw int16 field data for the volume along
+        with the scale factor and missing data value of the field.  The data
+        in physical units is the raw data divided by the scale factor.
+        """
+        # As with UFFile the number of gates, missing_data_value and
+        # scale_factor are taken from the first ray.
+        field_header = self.field_headers[field_number]
+        ngates = int(field_header['nbins'][0])
+        missing_data_value = int(
+            self.mandatory_headers['missing_data_value'][0])
+        scale_factor = int(field_header['scale_factor'][0])
+
+        data_offsets = (self._record_offsets +
+                        (field_header['data_offset'] - 1) * 2)
+        raw_data = _unpack_array(
+            self._buf, data_offsets, np.dtype(('>i2', (ngates, ))))
+        raw_data = raw_data.astype('int16')
+        short_rays = field_header['nbins'] < ngates
+        if np.any(short_rays):
+            gates = np.arange(ngates)
+            not_collected = gates >= field_header['nbins'][:, np.newaxis]
+            raw_data[not_collected] = missing_data_value
+        return raw_data, scale_factor, missing_data_value
+
+    def get_azimuths(self):
+        """ Return an array of azimuth angles for each ray in degrees. """
+        return (self.mandatory_headers['azimuth'] / 64.).astype('float32')
+
+    def get_elevations(self):
+        """ Return an array of elevation angles for each ray in degrees. """
+        return (self.mandatory_headers['elevation'] / 64.).astype('float32')
+
+    def get_sweep_rates(self):
+        """ Return an array of sweep rates for each ray in degrees/sec. """
+        return (self.mandatory_headers['sweep_rate'] / 64.).astype('float32')
+
+    def get_pulse_widths(self):
+        """ Return an array of pulse widths for each ray in meters. """
+        return self.field_headers[0]['pulse_width_m'].astype('float32')
+
+    def get_prts(self):
+        """ Return an array of prts for each ray in microseconds. """
+        return self.field_headers[0]['prt_ms'].astype('float32')
+
+    def get_nyquists(self):
+        """
+        Return an array of nyquist velocities for each ray in m/s.
+
+        Returns None if nyquist velocities cannot be determined for all rays.
+        """
+        field_headers = self.first_ray.field_headers
+        try:
+            field_idx = ['nyquist' in fh for fh in field_headers].index(True)
+        except ValueError:
+            return None  # True not in list
+
+        # the velocity header is present when the data begins 42 bytes
+        # after the field header, see UFRay.get_field_data
+        field_header = self.field_headers[field_idx]
+        header_offsets = self._field_header_offsets[field_idx]
+        data_offsets = (self._record_offsets +
+                        (field_header['data_offset'] - 1) * 2)
+        if np.any(data_offsets - header_offsets != 42):
+            return None  # nyquist not in field header
+        vel_header = _unpack_array(
+            self._buf, header_offsets + 38, UF_FSI_VEL)
+        nyquist = vel_header['nyquist'] / field_header['scale_factor']
+        return nyquist.astype('float32')
+
+    def get_sweep_fixed_angles(self):
+        """ Return an array of fixed angles for each sweep in degrees. """
+        fixed_angle = self.mandatory_headers['fixed_angle']
+        return (fixed_angle[self.first_ray_in_sweep] / 64.).astype('float32')
+
+    def get_sweep_polarizations(self):
+        """ Return an array of polarization modes for each sweep. """
+        polarization = self.field_headers[0]['polarization']
+        polarization = np.minimum(polarization[self.first_ray_in_sweep], 3)
+        return np.array([POLARIZATION_STR[i] for i in polarization])
+
+    def get_datetimes(self):
+        """ Return a list of datetimes for each ray. """
+        header = self.mandatory_headers
+        year, month, day, hour, minute, second = [
+            header[key].astype('int64') for key in
+            ['year', 'month', 'day', 'hour', 'minute', 'second']]
+        year[year < 1900] += 2000   # years after 2000, 11 -> 2011
+        # Some UF writers incorrectly specify midnight as 24:00:00 rather
+        # than 00:00:00, adding the hours as a time delta handles this case.
+        months = ((year - 1970).astype('datetime64[Y]') +
+                  (month - 1).astype('timedelta64[M]'))
+        seconds = (day - 1) * 86400 + hour * 3600 + minute * 60 + second
+        times = (months.astype('datetime64[s]') +
+                 seconds.astype('timedelta64[s]'))
+        return times.tolist()
+
+
+def _read_records(fobj):
+    """ Yield the byte string of each record in a UF file. """
+    # UF files come in three 'flavors' depending upon the size of the
+    # padding around each record.  True UF files contain no padding
+    # and start with the mandatory header of the first ray.  Other UF
+    # files contain a 2 or 4-byte padding immediately before and after
+    # each record.  The values in this padding can used to determine the
+    # size of each record, but is not used here, rather the size indicated
+    # by the 'record_length' structure elements is used.
+
+    # determine padding around records
+    buf = fobj.read(8)
+    try:
+        padding = buf.index(b'UF')
+    except ValueError:
+        raise IOError('file in not a valid UF file')
+
+    while len(buf) == 8:  # read until EOF reached
+
+        # record size stored as a 2-byte int start at byte 2
+        record_size = struct.unpack('>h', buf[padding+2:padding+4])[0] * 2
+
+        # read in full record
+        bytes_read = len(buf) - padding
+        bytes_to_read = record_size - bytes_read
+        yield buf[-bytes_read:] + fobj.read(bytes_to_read)
+
+        # read post record padding
+        fobj.read(padding)
+
+        # read in the first eight bytes of the next record
+        buf = fobj.read(8)
+
+
+def _find_records(buf):
+    """
+    Return the offsets and sizes, in bytes, of the records in a UF file.
+
+    The file, an uint8 array, is scanned once reading only the length of
+    each record.  A record truncated by the end of the file is not included.
+    """
+    # see _read_records for a description of the padding around records
+    try:
+        padding = buf[:8].tobytes().index(b'UF')
+    except ValueError:
+        raise IOError('file in not a valid UF file')
+
+    offsets = []
+    sizes = []
+    start = 0
+    while start + 8 <= len(buf):  # read until EOF reached
+        offset = start + padding
+        # record size stored as a 2-byte int start at byte 2
+        record_size = struct.unpack_from('>h', buf, offset + 2)[0] * 2
+        if record_size <= 0 or offset + record_size > len(buf):
+            break
+        offsets.append(offset)
+        sizes.append(record_size)
+        start = offset + record_size + padding
+    return np.array(offsets, dtype='int64'), np.array(sizes, dtype='int64')
+
+
+def _structure_dtype(structure):
+    """ Return a big-endian numpy dtype with the layout of a structure. """
+    return np.dtype([(name, '>i2' if fmt == INT16 else 'S' + fmt[:-1])
+                     for name, fmt in structure])
+
+
+def _unpack_array(buf, offsets, structure):
+    """
+    Unpack a structure, or a numpy dtype, at each offset in a buffer.
+
+    A strided view of the buffer, an uint8 array, is returned when the
+    offsets are evenly spaced, otherwise the bytes are gathered into a
+    new array.
+    """
+    if isinstance(structure, np.dtype):
+        dtype = structure
+    else:
+        dtype = _structure_dtype(structure)
+    offsets = np.asarray(offsets, dtype='int64')
+    nitems = len(offsets)
+    if nitems > 1:
+        stride = offsets[1] - offsets[0]
+    else:
+        stride = dtype.itemsize
+    if (nitems > 0 and stride > 0 and np.all(np.diff(offsets) == stride) and
+            offsets[-1] + dtype.itemsize <= len(buf)):
+        return np.ndarray((nitems, ), dtype, buf, offsets[0], (stride, ))
+    # bytes beyond the end of the buffer, which can only occur in field data
+    # of rays with fewer gates than the first ray, are read from the last
+    # byte and replaced by the caller.
+    index = np.minimum(offsets[:, np.newaxis] + np.arange(dtype.itemsize),
+                       len(buf) - 1)
+    return np.ndarray((nitems, ), dtype, buf[index])
+
+
 def _structure_size(structure):
     """ Find the size of a structure in bytes. """
     return struct.calcsize('>' + ''.join([i[1] for i in structure]))
@@ -9,11 +9,17 @@ A dictionary-like class supporting lazy loading of specified keys.
     :template: dev_template.rst
 
     LazyLoadDict
+    ThreadSafeLazyLoadDict
+    LazyLoadCache
 
 """
 
 import collections
 import itertools
+import threading
+import weakref
+
+import numpy as np
 
 
 class LazyLoadDict(collections.MutableMapping):
@@ -31,6 +37,15 @@ class LazyLoadDict(collections.MutableMapping):
     result in the loading of a lazy key, use "key in d.keys()" to prevent
     this evaluation.
 
+    A key which has been evaluated can be returned to being lazy using the
+    unload method, releasing the memory used by the value.  When the cache
+    attribute, by default the class attribute shared by all instances, is
+    set to a :py:class:`LazyLoadCache` the values of evaluated keys are
+    tracked and the least recently used values are unloaded when the
+    memory used exceeds the budget of the cache.  Changes made in-place to
+    a value which is unloaded are lost, setting the key using d[key] = value
+    prevents the key from being unloaded.
+
     The comparison methods, __cmp__, __ge__, __gt__, __le__, __lt__, __ne__,
     nor the view methods, viewitems, viewkeys, viewvalues, are implemented.
     Neither is the the fromkeys method.
@@ -55,13 +70,20 @@ class LazyLoadDict(collections.MutableMapping):
     ['key2', 'key1', 'lazykey1']
     >>> d['lazykey1']
     999
+    >>> d.unload('lazykey1')
+    >>> LazyLoadDict.cache = LazyLoadCache(2 ** 30)  # limit to 1 GiB
 
     """
 
+    # LazyLoadCache tracking the values of evaluated keys, None for no cache
+    cache = None
+
     def __init__(self, dic):
         """ initalize. """
         self._dic = dic
         self._lazyload = {}
+        # callables of lazy keys which have been evaluated
+        self._loaded = {}
 
     # abstract methods
     def __setitem__(self, key, value):
@@ -69,14 +91,15 @@ class LazyLoadDict(collections.MutableMapping):
         self._dic[key] = value
         if key in self._lazyload:
             del self._lazyload[key]
+        self._forget(key)
 
     def __getitem__(self, key):
         """ Get the value of a key, evaluating a lazy key if needed. """
-        if key in self._lazyload:
-            value = self._lazyload[key]()
-            self._dic[key] = value
-            del self._lazyload[key]
-        return self._dic[key]
+        value = self._getitem(key)
+        cache = self.cache
+        if cache is not None and key in self._loaded:
+            cache.touch(self, key, value)
+        return value
 
     def __delitem__(self, key):
         """ Remove a lazy or traditional key from the dictionary. """
@@ -84,6 +107,7 @@ class LazyLoadDict(collections.MutableMapping):
             del self._lazyload[key]
         else:
             del self._dic[key]
+            self._forget(key)
 
     def __iter__(self):
         """ Iterate over all lazy and traditional keys. """
@@ -105,6 +129,19 @@ class LazyLoadDict(collections.MutableMapping):
         lazy_str = ", ".join(lazy_strs) + '}'
         return str(self._dic)[:-1] + seperator + lazy_str
 
+    def __getstate__(self):
+        """ Return the state of the object for pickling. """
+        # evaluated keys are not returned to being lazy after unpickling,
+        # their callables, which may not be picklable, are not included.
+        state = self.__dict__.copy()
+        state['_loaded'] = {}
+        return state
+
+    def __setstate__(self, state):
+        """ Restore the state of the object from a pickle. """
+        self.__dict__.update(state)
+        self.__dict__.setdefault('_loaded', {})
+
     def has_key(self, key):
         """ True if dictionary has key, else False. """
         return key in self
@@ -119,6 +156,7 @@ class LazyLoadDict(collections.MutableMapping):
         # load all lazy keys into the copy
         for key, value_callable in self._lazyload.items():
             dic.set_lazy(key, value_callable)
+        dic._loaded.update(self._loaded)
         return dic
 
     # lazy dictionary specific methods
@@ -126,4 +164,252 @@ class LazyLoadDict(collections.MutableMapping):
         """ Set a lazy key to load from a callable object. """
         if key in self._dic:
             del self._dic[key]
+            self._forget(key)
         self._lazyload[key] = value_callable
+
+    def unload(self, key):
+        """
+        Return a lazy key which has been evaluated to being lazy.
+
+        The value of the key is discarded and the key will be evaluated
+        again by the callable object when next accessed.  Keys which are
+        already lazy are not changed.  A ValueError is raised if the key was
+        not set using set_lazy or has been set since it was evaluated.
+        """
+        if key in self._lazyload:
+            return
+        if key not in self._dic:
+            raise KeyError(key)
+        if not self._unload(key):
+            raise ValueError('key %s is not an evaluated lazy key' % (key))
+
+    def _getitem(self, key):
+        """ Get the value of a key, evaluating a lazy key if needed. """
+        if key in self._lazyload:
+            value_callable = self._lazyload[key]
+            value = value_callable()
+            self._dic[key] = value
+            del self._lazyload[key]
+            self._loaded[key] = value_callable
+        return self._dic[key]
+
+    def _unload(self, key):
+        """ Unload an evaluated lazy key, False if the key is not one. """
+        if key not in self._loaded:
+            return False
+        self._lazyload[key] = self._loaded.pop(key)
+        del self._dic[key]
+        if self.cache is not None:
+            self.cache.discard(self, key)
+        return True
+
+    def _forget(self, key):
+        """ Stop tracking the callable of an evaluated lazy key. """
+        if key in self._loaded:
+            del self._loaded[key]
+            if self.cache is not None:
+                self.cache.discard(self, key)
+
+    def get_partial(self, key, index):
+        """
+        Return part of the value of a key, equivalent to d[key][index].
+
+        When the key is lazy and the callable object which produces the
+        value supports indexing only the requested part of the value is
+        loaded, the key is not evaluated and remains lazy.
+        """
+        if key in self._lazyload:
+            value_callable = self._lazyload[key]
+            if hasattr(value_callable, '__getitem__'):
+                return value_callable[index]
+        return self[key][index]
+
+
+class ThreadSafeLazyLoadDict(LazyLoadDict):
+    """
+    A LazyLoadDict which can be shared between threads.
+
+    The evaluation of lazy keys and all changes to the dictionary are
+    protected by a lock so that a lazy key is evaluated at most once when
+    accessed concurrently from multiple threads.  Parameters are identical
+    to those of :py:class:`LazyLoadDict`.
+
+    """
+
+    def __init__(self, dic):
+        """ initalize. """
+        super(ThreadSafeLazyLoadDict, self).__init__(dic)
+        self._lock = threading.RLock()
+
+    def __setitem__(self, key, value):
+        """ Set a key which will not be stored and evaluated traditionally. """
+        with self._lock:
+            super(ThreadSafeLazyLoadDict, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        """ Remove a lazy or traditional key from the dictionary. """
+        with self._lock:
+            super(ThreadSafeLazyLoadDict, self).__delitem__(key)
+
+    def __iter__(self):
+        """ Iterate over all lazy and traditional keys. """
+        with self._lock:
+            return itertools.chain(self._dic.copy(), self._lazyload.copy())
+
+    def __getstate__(self):
+        """ Return the state of the object for pickling. """
+        with self._lock:
+            state = super(ThreadSafeLazyLoadDict, self).__getstate__()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """ Restore the state of the object from a pickle. """
+        super(ThreadSafeLazyLoadDict, self).__setstate__(state)
+        self._lock = threading.RLock()
+
+    def copy(self):
+        """
+        Return a copy of the dictionary.
+
+        Lazy keys are not evaluated in the original or copied dictionary.
+        """
+        with self._lock:
+            return super(ThreadSafeLazyLoadDict, self).copy()
+
+    def set_lazy(self, key, value_callable):
+        """ Set a lazy key to load from a callable object. """
+        with self._lock:
+            super(ThreadSafeLazyLoadDict, self).set_lazy(key, value_callable)
+
+    def get_partial(self, key, index):
+        """
+        Return part of the value of a key, equivalent to d[key][index].
+
+        When the key is lazy and the callable object which produces the
+        value supports indexing only the requested part of the value is
+        loaded, the key is not evaluated and remains lazy.
+        """
+        with self._lock:
+            value_callable = self._lazyload.get(key)
+        if hasattr(value_callable, '__getitem__'):
+            return value_callable[index]
+        return self[key][index]
+
+    def unload(self, key):
+        """
+        Return a lazy key which has been evaluated to being lazy.
+
+        See :py:func:`LazyLoadDict.unload`.
+        """
+        with self._lock:
+            super(ThreadSafeLazyLoadDict, self).unload(key)
+
+    def _getitem(self, key):
+        """ Get the value of a key, evaluating a lazy key if needed. """
+        with self._lock:
+            return super(ThreadSafeLazyLoadDict, self)._getitem(key)
+
+    def _unload(self, key):
+        """ Unload an evaluated lazy key, False if the key is not one. """
+        with self._lock:
+            return super(ThreadSafeLazyLoadDict, self)._unload(key)
+
+
+class LazyLoadCache(object):
+    """
+    A least recently used cache limiting the memory used by the values of
+    evaluated lazy keys in LazyLoadDict objects.
+
+    The values of lazy keys are added to the cache when evaluated and
+    marked as used each time they are accessed.  When the memory used by
+    the values in the cache exceeds max_bytes the least recently used
+    values are unloaded, returning the keys to being lazy, until the memory
+    used is within the budget.  The most recently used value is never
+    unloaded.  Only the memory of NumPy arrays, including the mask of masked
+    arrays, is counted.  The cache holds weak references to the
+    dictionaries so it does not prevent them from being garbage collected.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum number of bytes used by values in the cache.
+
+    Attributes
+    ----------
+    nbytes : int
+        Number of bytes used by values in the cache.
+
+    """
+
+    def __init__(self, max_bytes):
+        """ initalize. """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        """ Return the number of values in the cache. """
+        return len(self._entries)
+
+    def touch(self, dic, key, value):
+        """
+        Add a value to the cache or mark it as most recently used, unloading
+        the least recently used values if the budget is exceeded.
+        """
+        entry_key = (id(dic), key)
+        with self._lock:
+            entry = self._entries.pop(entry_key, None)
+            if entry is None:
+                entry = (weakref.ref(dic, self._remove_dead), _nbytes(value))
+                self.nbytes += entry[1]
+            self._entries[entry_key] = entry
+            evict = []
+            while self.nbytes > self.max_bytes and len(self._entries) > 1:
+                (dic_id, evict_key), (ref, nbytes) = self._entries.popitem(
+                    last=False)
+                self.nbytes -= nbytes
+                evict.append((ref, evict_key))
+        # dictionaries are unloaded without holding the lock as they may
+        # hold their own lock while touching the cache
+        for ref, evict_key in evict:
+            evict_dic = ref()
+            if evict_dic is not None:
+                evict_dic._unload(evict_key)
+
+    def discard(self, dic, key):
+        """ Remove a value from the cache if present. """
+        with self._lock:
+            entry = self._entries.pop((id(dic), key), None)
+            if entry is not None:
+                self.nbytes -= entry[1]
+
+    def clear(self):
+        """ Unload all values in the cache. """
+        with self._lock:
+            entries = list(self._entries.items())
+            self._entries.clear()
+            self.nbytes = 0
+        for (dic_id, key), (ref, nbytes) in entries:
+            dic = ref()
+            if dic is not None:
+                dic._unload(key)
+
+    def _remove_dead(self, ref):
+        """ Remove the values of a dictionary which has been collected. """
+        with self._lock:
+            for entry_key, entry in list(self._entries.items()):
+                if entry[0] is ref:
+                    del self._entries[entry_key]
+                    self.nbytes -= entry[1]
+
+
+def _nbytes(value):
+    """ Return the number of bytes used by a value. """
+    nbytes = getattr(value, 'nbytes', 0)
+    if isinstance(value, np.ma.MaskedArray):
+        mask = np.ma.getmask(value)
+        if mask is not np.ma.nomask:
+            nbytes += mask.nbytes
+    return nbytes
@@ -17,7 +17,10 @@ a uniform grid.
 
 """
 
+import numpy as np
+
 from libc.math cimport sqrt, exp, ceil, floor, sin, cos, tan, asin
+from libc.stdlib cimport malloc, free
 from cython.view cimport array as cvarray
 
 cimport cython
@@ -25,6 +28,12 @@ cimport cython
 # constants
 cdef int BARNES = 0
 cdef int CRESSMAN = 0
+
+# field data types
+cdef enum:
+    FLOAT32 = 0
+    FLOAT64 = 1
+    INT16 = 2
 cdef float PI = 3.141592653589793
 cdef float R = 8494666.66666667   # 4/3 earths radius of 6371 km in meters
 
@@ -227,21 +236,50 @@ cdef class GateToGridMapper:
                     roi_array[iz, iy, ix] = roi
         return
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def find_roi_for_gates(
+            self, float[:, ::1] roi_array, float[:, ::1] gate_z,
+            float[:, ::1] gate_y, float[:, ::1] gate_x,
+            RoIFunction roi_func):
+        """
+        Fill in the radius of influence for each radar gate.
+
+        Parameters
+        ----------
+        roi_array : 2D float32 array
+            Array which will be filled by the radius of influence for each
+            gate.
+        gate_z, gate_y, gate_x : 2D float32 array
+            Cartesian locations of the gates in meters.
+        roi_func : RoIFunction
+            Object whose get_roi method returns the radius of influence.
+
+        """
+        cdef int nray, ngate
+        for nray in range(roi_array.shape[0]):
+            for ngate in range(roi_array.shape[1]):
+                roi_array[nray, ngate] = roi_func.get_roi(
+                    gate_z[nray, ngate], gate_y[nray, ngate],
+                    gate_x[nray, ngate])
+        return
+
     @cython.cdivision(True)
     @cython.boundscheck(False)
     @cython.wraparound(False)
     def map_gates_to_grid(
-            self, 
+            self,
             int ngates, int nrays,
-            float[:, ::1] gate_z, float[:, ::1] gate_y, float[:, ::1] gate_x, 
-            float[:, :, ::1] field_data,
-            char[:, :, ::1] field_mask, char[:, ::1] excluded_gates,
-            float toa, RoIFunction roi_func, int weighting_function):
+            float[:, ::1] gate_z, float[:, ::1] gate_y, float[:, ::1] gate_x,
+            list field_data, list field_mask, char[:, ::1] excluded_gates,
+            float toa, RoIFunction roi_func, int weighting_function,
+            list scale_factors=None, list add_offsets=None):
         """
         Map radar gates unto the regular grid.
 
         The grid_sum and grid_wsum arrays used to initalize the class
-        are update with the mapped gate data.
+        are update with the mapped gate data.  The field data and masks are
+        read directly from the provided arrays, no copies are made.
 
         Parameters
         ----------
@@ -249,60 +287,180 @@ cdef class GateToGridMapper:
             Number of gates and rays in the radar volume.
         gate_z, gate_y, gate_x : 2D float32 array
             Cartesian locations of the gates in meters.
-        field_data : 3D float32 array
-            Array containing field data for the radar, dimension are ordered
-            as nrays, ngates, nfields.
-        field_mask : 3D uint8 array
-            Array containing masking of the field data for the radar,
-            dimension are ordered as nrays, ngates, nfields.
+        field_data : list of 2D arrays
+            Field data for the radar, one C-contiguous float32, float64 or
+            int16 array for each field, dimension are ordered as nrays,
+            ngates.
+        field_mask : list of 2D uint8 arrays or None
+            Masking of the field data for the radar, one C-contiguous array
+            or None when no gates are masked for each field.  Dimension are
+            ordered as nrays, ngates.
         excluded_gates : 2D uint8 array
             Array containing gate masking information.  Gates with non-zero
             values will not be included in the mapping.
-        offset : tuple of floats
-            Offset of the radar from the grid origin.  Dimension are ordered
-            as z, y, x.
+        toa : float
             Top of atmosphere.  Gates above this level are considered.
         roi_func : RoIFunction
             Object whose get_roi method returns the radius of influence.
         weighting_function : int
             Function to use for weighting gates based upon distance.
             0 for Barnes, 1 for Cressman weighting.
+        scale_factors, add_offsets : list of floats, optional
+            Scale factor and offset for each field applied to int16 field
+            data.  None, the default, uses a scale of 1 and offset of 0.
+
+        Raises
+        ------
+        ValueError
+            When the number of field data or mask arrays does not match the
+            number of fields or an array does not have a shape of (nrays,
+            ngates).
 
         """
 
-        cdef float roi
-        cdef float[:] values
-        cdef char[:] masks
+        cdef int nray, ngate, i
+        cdef Py_ssize_t idx
+        cdef float[:, ::1] roi = cvarray(
+            shape=(max(nrays, 1), max(ngates, 1)), itemsize=sizeof(float),
+            format='f')
         cdef float x, y, z
-
+        cdef float[:, ::1] f32_data
+        cdef double[:, ::1] f64_data
+        cdef short[:, ::1] i16_data
+        cdef char[:, ::1] mask_data
+
+        # the arrays are accessed without bounds checking, verify their
+        # shapes before mapping.
+        shape = (nrays, ngates)
+        if len(field_data) != self.nfields or len(field_mask) != self.nfields:
+            raise ValueError(
+                'field_data and field_mask must contain %d arrays' %
+                (self.nfields))
+        for name, array in (('gate_z', gate_z), ('gate_y', gate_y),
+                            ('gate_x', gate_x),
+                            ('excluded_gates', excluded_gates)):
+            if tuple(array.shape[:2]) != shape:
+                raise ValueError(
+                    '%s has shape %s, expected %s' %
+                    (name, tuple(array.shape[:2]), shape))
+        for i in range(self.nfields):
+            if field_data[i].shape != shape:
+                raise ValueError(
+                    'field_data[%d] has shape %s, expected %s' %
+                    (i, field_data[i].shape, shape))
+            if field_mask[i] is not None and field_mask[i].shape != shape:
+                raise ValueError(
+                    'field_mask[%d] has shape %s, expected %s' %
+                    (i, field_mask[i].shape, shape))
+
+        if nrays == 0 or ngates == 0:
+            return
+
+        # find the radius of influence for all included gates, roi_func
+        # may be implemented in Python so this requires the GIL
         for nray in range(nrays):
             for ngate in range(ngates):
-
-                # continue if gate excluded
                 if excluded_gates[nray, ngate]:
                     continue
+                roi[nray, ngate] = roi_func.get_roi(
+                    gate_z[nray, ngate], gate_y[nray, ngate],
+                    gate_x[nray, ngate])
+
+        # pointers to the field data and masks of each field
+        cdef void **data_ptrs = <void **>malloc(
+            self.nfields * sizeof(void *))
+        cdef char **mask_ptrs = <char **>malloc(
+            self.nfields * sizeof(char *))
+        cdef int *dtypes = <int *>malloc(self.nfields * sizeof(int))
+        cdef double *scales = <double *>malloc(self.nfields * sizeof(double))
+        cdef double *offsets = <double *>malloc(self.nfields * sizeof(double))
+        cdef float *values = <float *>malloc(self.nfields * sizeof(float))
+        cdef char *masks = <char *>malloc(self.nfields * sizeof(char))
+
+        try:
+            for i in range(self.nfields):
+                fdata = field_data[i]
+                if fdata.dtype == np.float32:
+                    f32_data = fdata
+                    data_ptrs[i] = &f32_data[0, 0]
+                    dtypes[i] = FLOAT32
+                elif fdata.dtype == np.float64:
+                    f64_data = fdata
+                    data_ptrs[i] = &f64_data[0, 0]
+                    dtypes[i] = FLOAT64
+                elif fdata.dtype == np.int16:
+                    i16_data = fdata
+                    data_ptrs[i] = &i16_data[0, 0]
+                    dtypes[i] = INT16
+                else:
+                    raise ValueError('unsupported dtype: %s' % fdata.dtype)
+
+                if field_mask[i] is None:
+                    mask_ptrs[i] = NULL
+                else:
+                    mask_data = field_mask[i]
+                    mask_ptrs[i] = &mask_data[0, 0]
+
+                scales[i] = 1.
+                offsets[i] = 0.
+                if scale_factors is not None:
+                    scales[i] = scale_factors[i]
+                if add_offsets is not None:
+                    offsets[i] = add_offsets[i]
+
+            # the mapping itself only touches typed memory, release the GIL
+            # so that other threads can map gates concurrently.
+            with nogil:
+                for nray in range(nrays):
+                    for ngate in range(ngates):
+
+                        # continue if gate excluded
+                        if excluded_gates[nray, ngate]:
+                            continue
 
-                x = gate_x[nray, ngate]
-                y = gate_y[nray, ngate]
-                z = gate_z[nray, ngate]
-                roi = roi_func.get_roi(z, y, x)
-                values = field_data[nray, ngate]
-                masks = field_mask[nray, ngate]
-
-                self.map_gate(x, y, z, roi, values, masks, weighting_function)
+                        # load the field values and masks of the gate
+                        idx = <Py_ssize_t>nray * ngates + ngate
+                        for i in range(self.nfields):
+                            if mask_ptrs[i] != NULL and mask_ptrs[i][idx]:
+                                masks[i] = 1
+                                continue
+                            masks[i] = 0
+                            if dtypes[i] == FLOAT32:
+                                values[i] = (<float *>data_ptrs[i])[idx]
+                            elif dtypes[i] == FLOAT64:
+                                values[i] = <float>(
+                                    <double *>data_ptrs[i])[idx]
+                            else:
+                                values[i] = <float>(
+                                    (<short *>data_ptrs[i])[idx] *
+                                    scales[i] + offsets[i])
+
+                        x = gate_x[nray, ngate]
+                        y = gate_y[nray, ngate]
+                        z = gate_z[nray, ngate]
+                        self.map_gate(x, y, z, roi[nray, ngate], values,
+                                      masks, weighting_function)
+        finally:
+            free(data_ptrs)
+            free(mask_ptrs)
+            free(dtypes)
+            free(scales)
+            free(offsets)
+            free(values)
+            free(masks)
 
     @cython.initializedcheck(False)
     @cython.cdivision(True)
     @cython.boundscheck(False)
     @cython.wraparound(False)
     cdef int map_gate(self, float x, float y, float z, float roi,
-                      float[:] values, char[:] masks,
-                      int weighting_function):
+                      float *values, char *masks,
+                      int weighting_function) nogil:
         """ Map a single gate to the grid. """
 
         cdef float xg, yg, zg, dist, weight, roi2, dist2
         cdef int x_min, x_max, y_min, y_max, z_min, z_max
-        cdef int xi, yi, zi
+        cdef int xi, yi, zi, i
 
         # shift positions so that grid starts at 0
         x -= self.x_start
@@ -354,8 +512,147 @@ cdef class GateToGridMapper:
         return 1
 
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def find_gate_weights(
+            self, int ngates, int nrays,
+            float[:, ::1] gate_z, float[:, ::1] gate_y, float[:, ::1] gate_x,
+            RoIFunction roi_func, int weighting_function):
+        """
+        Find the weights with which gates contribute to each grid point.
+
+        The grid_sum and grid_wsum arrays are not modified.
+
+        Parameters
+        ----------
+        ngates, nrays : int
+            Number of gates and rays in the radar volume.
+        gate_z, gate_y, gate_x : 2D float32 array
+            Cartesian locations of the gates in meters.
+        roi_func : RoIFunction
+            Object whose get_roi method returns the radius of influence.
+        weighting_function : int
+            Function to use for weighting gates based upon distance.
+            0 for Barnes, 1 for Cressman weighting.
+
+        Returns
+        -------
+        gate_index, grid_index : 1D intp array
+            Flat index of the gate in the radar volume and of the point in
+            the grid for each gate, grid point pair.
+        weights : 1D float32 array
+            Weight with which the gate contributes to the grid point.
+
+        """
+        cdef int nray, ngate
+        cdef Py_ssize_t nweights = 0
+        cdef float[:, ::1] roi = cvarray(
+            shape=(max(nrays, 1), max(ngates, 1)), itemsize=sizeof(float),
+            format='f')
+        cdef Py_ssize_t[::1] gate_index, grid_index
+        cdef float[::1] weights
+
+        # first pass counts the weights, the second records them
+        for nray in range(nrays):
+            for ngate in range(ngates):
+                roi[nray, ngate] = roi_func.get_roi(
+                    gate_z[nray, ngate], gate_y[nray, ngate],
+                    gate_x[nray, ngate])
+                nweights += self.map_gate_weights(
+                    gate_x[nray, ngate], gate_y[nray, ngate],
+                    gate_z[nray, ngate], roi[nray, ngate], weighting_function,
+                    0, None, None, None, 0)
+
+        gate_index_arr = np.empty(nweights, dtype=np.intp)
+        grid_index_arr = np.empty(nweights, dtype=np.intp)
+        weights_arr = np.empty(nweights, dtype=np.float32)
+        gate_index = gate_index_arr
+        grid_index = grid_index_arr
+        weights = weights_arr
+
+        nweights = 0
+        for nray in range(nrays):
+            for ngate in range(ngates):
+                nweights += self.map_gate_weights(
+                    gate_x[nray, ngate], gate_y[nray, ngate],
+                    gate_z[nray, ngate], roi[nray, ngate], weighting_function,
+                    nray * ngates + ngate, gate_index, grid_index, weights,
+                    nweights)
+        return gate_index_arr, grid_index_arr, weights_arr
+
+    @cython.initializedcheck(False)
+    @cython.cdivision(True)
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef Py_ssize_t map_gate_weights(
+            self, float x, float y, float z, float roi,
+            int weighting_function, Py_ssize_t gate,
+            Py_ssize_t[::1] gate_index, Py_ssize_t[::1] grid_index,
+            float[::1] weights, Py_ssize_t offset):
+        """
+        Record the weights of a single gate starting at offset.
+
+        Returns the number of grid points the gate contributes to, when
+        weights is None these are only counted.
+        """
+        cdef float xg, yg, zg, weight, roi2, dist2
+        cdef int x_min, x_max, y_min, y_max, z_min, z_max
+        cdef int xi, yi, zi
+        cdef Py_ssize_t count = 0
+
+        # shift positions so that grid starts at 0
+        x -= self.x_start
+        y -= self.y_start
+        z -= self.z_start
+
+        x_min = find_min(x, roi, self.x_step)
+        if x_min > self.nx-1:
+            return 0
+        x_max = find_max(x, roi, self.x_step, self.nx)
+        if x_max < 0:
+            return 0
+
+        y_min = find_min(y, roi, self.y_step)
+        if y_min > self.ny-1:
+            return 0
+        y_max = find_max(y, roi, self.y_step, self.ny)
+        if y_max < 0:
+            return 0
+
+        z_min = find_min(z, roi, self.z_step)
+        if z_min > self.nz-1:
+            return 0
+        z_max = find_max(z, roi, self.z_step, self.nz)
+        if z_max < 0:
+            return 0
+
+        roi2 = roi * roi
+        for xi in range(x_min, x_max+1):
+            for yi in range(y_min, y_max+1):
+                for zi in range(z_min, z_max+1):
+                    xg = self.x_step * xi
+                    yg = self.y_step * yi
+                    zg = self.z_step * zi
+                    dist2 = (xg-x)*(xg-x) + (yg-y)*(yg-y) + (zg-z)*(zg-z)
+
+                    if dist2 > roi2:
+                        continue
+
+                    if weights is not None:
+                        if weighting_function == BARNES:
+                            weight = exp(-(dist2) / (2*roi2)) + 1e-5
+                        else:   # CRESSMAN
+                            weight = (roi2 - dist2) / (roi2 + dist2)
+                        gate_index[offset + count] = gate
+                        grid_index[offset + count] = (
+                            (<Py_ssize_t>zi * self.ny + yi) * self.nx + xi)
+                        weights[offset + count] = weight
+                    count += 1
+        return count
+
+
 @cython.cdivision(True)
-cdef int find_min(float a, float roi, float step):
+cdef int find_min(float a, float roi, float step) nogil:
     """ Find the mimumum gate index for a dimension. """
     cdef int a_min
     if step == 0:
@@ -367,7 +664,7 @@ cdef int find_min(float a, float roi, float step):
 
 
 @cython.cdivision(True)
-cdef int find_max(float a, float roi, float step, int na):
+cdef int find_max(float a, float roi, float step, int na) nogil:
     """ Find the maximum gate index for a dimension. """
     cdef int a_max
     if step == 0:
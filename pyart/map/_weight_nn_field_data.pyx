@@ -0,0 +1,90 @@
+from libc.math cimport exp, isfinite
+from cython.view cimport array as cvarray
+
+cimport cython
+
+# weighting functions
+cdef int NEAREST = 0
+cdef int CRESSMAN = 1
+cdef int BARNES = 2
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def _weight_nn_field_data(
+        int weighting, Py_ssize_t[::1] indptr, Py_ssize_t[::1] data_ind,
+        double[::1] dist2, double[::1] roi, double[:, ::1] data,
+        char[:, ::1] mask, double badval, double[:, ::1] grid_data,
+        char[:, ::1] grid_mask):
+    """
+    _weight_nn_field_data(weighting, indptr, data_ind, dist2, roi, data,
+                          mask, badval, grid_data, grid_mask)
+
+    Weight the nearest neighbor field data of a batch of grid points.
+
+    The neighbors of grid point i are the rows data_ind[indptr[i]:indptr[i+1]]
+    of data and mask and are located at a squared distance given by the same
+    elements of dist2.  The weighted field values and masks are stored in
+    row i of grid_data and grid_mask.  Masked neighbors are excluded from
+    the weighting, grid points without any neighbors or without a finite
+    weighted average are set to badval and masked.
+    """
+    cdef Py_ssize_t i, k, nearest
+    cdef int j, nfields
+    cdef double r2, weight, min_dist2
+    cdef double[:] vsum, tsum
+
+    nfields = data.shape[1]
+    vsum = cvarray(
+        shape=(nfields, ), itemsize=sizeof(double), format='d')
+    tsum = cvarray(
+        shape=(nfields, ), itemsize=sizeof(double), format='d')
+
+    for i in range(indptr.shape[0] - 1):
+
+        if indptr[i] == indptr[i + 1]:
+            # no neighbors, mark the grid point as bad
+            for j in range(nfields):
+                grid_data[i, j] = badval
+                grid_mask[i, j] = 1
+            continue
+
+        if weighting == NEAREST:
+            # the first neighbor with the smallest distance
+            nearest = indptr[i]
+            min_dist2 = dist2[nearest]
+            for k in range(indptr[i] + 1, indptr[i + 1]):
+                if dist2[k] < min_dist2:
+                    min_dist2 = dist2[k]
+                    nearest = k
+            for j in range(nfields):
+                grid_data[i, j] = data[data_ind[nearest], j]
+                grid_mask[i, j] = mask[data_ind[nearest], j]
+            continue
+
+        r2 = roi[i] * roi[i]
+        for j in range(nfields):
+            vsum[j] = 0.
+            tsum[j] = 0.
+        for k in range(indptr[i], indptr[i + 1]):
+            if weighting == CRESSMAN:
+                weight = (r2 - dist2[k]) / (r2 + dist2[k])
+            else:
+                weight = exp(-dist2[k] / (2.0 * r2)) + 1e-5
+            for j in range(nfields):
+                if mask[data_ind[k], j]:
+                    continue
+                vsum[j] += weight * data[data_ind[k], j]
+                tsum[j] += weight
+
+        for j in range(nfields):
+            # undefined averages, including those of non-finite data, are
+            # masked as they are in np.ma.average
+            if tsum[j] == 0 or not isfinite(vsum[j] / tsum[j]):
+                grid_data[i, j] = badval
+                grid_mask[i, j] = 1
+            else:
+                grid_data[i, j] = vsum[j] / tsum[j]
+                grid_mask[i, j] = 0
+    return
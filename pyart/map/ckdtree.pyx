@@ -221,13 +221,13 @@ cdef class heap(object):
 
 # Utility functions
 # =================
-cdef inline np.float64_t dmax(np.float64_t x, np.float64_t y):
+cdef inline np.float64_t dmax(np.float64_t x, np.float64_t y) nogil:
     if x>y:
         return x
     else:
         return y
         
-cdef inline np.float64_t dabs(np.float64_t x):
+cdef inline np.float64_t dabs(np.float64_t x) nogil:
     if x>0:
         return x
     else:
@@ -285,7 +285,7 @@ cdef class coo_entries:
 # ===================
 cdef inline np.float64_t _distance_p(np.float64_t *x, np.float64_t *y,
                                      np.float64_t p, np.intp_t k,
-                                     np.float64_t upperbound):
+                                     np.float64_t upperbound) nogil:
     """Compute the distance between x and y
 
     Computes the Minkowski p-distance to the power p between two points.
@@ -761,6 +761,94 @@ cdef class PointRectDistanceTracker(object):
         
         return 0
 
+# Batched point-to-rectangle distance tracker
+# ===========================================
+#
+# query_ball_point_batch finds the neighbors of many points without holding
+# the GIL.  The distance tracking is the same as PointRectDistanceTracker but
+# is kept in a C struct, the state is saved on the C stack by the traversal
+# rather than in a stack owned by the tracker.  The neighbor indices are
+# collected in a growable C buffer.
+
+cdef struct PointRectState:
+    np.float64_t *pt
+    np.float64_t *mins
+    np.float64_t *maxes
+    np.intp_t m
+    np.float64_t p, epsfac, upper_bound
+    np.float64_t min_distance, max_distance
+
+cdef struct IndexBuffer:
+    np.intp_t n, n_max
+    np.intp_t *indices
+
+cdef inline np.float64_t _min_dist_interval(PointRectState *state,
+                                            np.intp_t k) nogil:
+    """ min_dist_point_interval_p for a PointRectState. """
+    return dmax(0, dmax(state.mins[k] - state.pt[k],
+                        state.pt[k] - state.maxes[k])) ** state.p
+
+cdef inline np.float64_t _max_dist_interval(PointRectState *state,
+                                            np.intp_t k) nogil:
+    """ max_dist_point_interval_p for a PointRectState. """
+    return dmax(state.maxes[k] - state.pt[k],
+                state.pt[k] - state.mins[k]) ** state.p
+
+cdef inline void _point_rect_distances(PointRectState *state) nogil:
+    """ Compute the min and max distances between the point and rect. """
+    cdef np.intp_t i
+    state.min_distance = 0.
+    state.max_distance = 0.
+    if state.p == infinity:
+        for i in range(state.m):
+            state.min_distance = dmax(
+                state.min_distance,
+                dmax(state.mins[i] - state.pt[i],
+                     state.pt[i] - state.maxes[i]))
+            state.max_distance = dmax(
+                state.max_distance,
+                dmax(state.maxes[i] - state.pt[i],
+                     state.pt[i] - state.mins[i]))
+    else:
+        for i in range(state.m):
+            state.min_distance += _min_dist_interval(state, i)
+            state.max_distance += _max_dist_interval(state, i)
+
+cdef inline void _point_rect_split(PointRectState *state,
+                                   np.intp_t direction,
+                                   np.intp_t split_dim,
+                                   np.float64_t split_val) nogil:
+    """ Shrink the rectangle to one side of a split, see push. """
+    if state.p != infinity:
+        state.min_distance -= _min_dist_interval(state, split_dim)
+        state.max_distance -= _max_dist_interval(state, split_dim)
+
+    if direction == LESS:
+        state.maxes[split_dim] = split_val
+    else:
+        state.mins[split_dim] = split_val
+
+    if state.p != infinity:
+        state.min_distance += _min_dist_interval(state, split_dim)
+        state.max_distance += _max_dist_interval(state, split_dim)
+    else:
+        _point_rect_distances(state)
+
+cdef inline int _index_buffer_append(IndexBuffer *buf,
+                                     np.intp_t i) nogil:
+    """ Append an index to the buffer, return -1 if out of memory. """
+    cdef void *tmp
+    if buf.n == buf.n_max:
+        tmp = stdlib.realloc(<void*> buf.indices,
+                             2 * buf.n_max * sizeof(np.intp_t))
+        if tmp == NULL:
+            return -1
+        buf.indices = <np.intp_t*> tmp
+        buf.n_max *= 2
+    buf.indices[buf.n] = i
+    buf.n += 1
+    return 0
+
 # Tree structure
 # ==============
 cdef struct innernode:
@@ -1377,7 +1465,186 @@ cdef class cKDTree:
         return results
 
 
-    def query_ball_point(cKDTree self, object x, np.float64_t r,
+    cdef int __query_ball_point_batch_no_checking(cKDTree self,
+                                                  IndexBuffer *buf,
+                                                  innernode* node) nogil:
+        cdef leafnode* lnode
+        cdef np.intp_t i
+
+        if node.split_dim == -1:  # leaf node
+            lnode = <leafnode*> node
+            for i in range(lnode.start_idx, lnode.end_idx):
+                if _index_buffer_append(buf, self.raw_indices[i]) < 0:
+                    return -1
+        else:
+            if self.__query_ball_point_batch_no_checking(
+                    buf, node.less) < 0:
+                return -1
+            if self.__query_ball_point_batch_no_checking(
+                    buf, node.greater) < 0:
+                return -1
+
+        return 0
+
+
+    @cython.cdivision(True)
+    cdef int __query_ball_point_batch_checking(cKDTree self,
+                                               IndexBuffer *buf,
+                                               innernode* node,
+                                               PointRectState *state) nogil:
+        cdef leafnode* lnode
+        cdef np.float64_t d
+        cdef np.intp_t i
+        cdef np.float64_t min_distance, max_distance
+        cdef np.float64_t min_along_dim, max_along_dim
+
+        if state.min_distance > state.upper_bound * state.epsfac:
+            return 0
+        elif state.max_distance < state.upper_bound / state.epsfac:
+            return self.__query_ball_point_batch_no_checking(buf, node)
+        elif node.split_dim == -1:  # leaf node
+            lnode = <leafnode*>node
+            # brute-force
+            for i in range(lnode.start_idx, lnode.end_idx):
+                d = _distance_p(
+                    self.raw_data + self.raw_indices[i] * self.m,
+                    state.pt, state.p, self.m, state.upper_bound)
+                if d <= state.upper_bound:
+                    if _index_buffer_append(buf, self.raw_indices[i]) < 0:
+                        return -1
+        else:
+            # state restored after searching each side of the split
+            min_distance = state.min_distance
+            max_distance = state.max_distance
+            min_along_dim = state.mins[node.split_dim]
+            max_along_dim = state.maxes[node.split_dim]
+
+            _point_rect_split(state, LESS, node.split_dim, node.split)
+            if self.__query_ball_point_batch_checking(
+                    buf, node.less, state) < 0:
+                return -1
+            state.min_distance = min_distance
+            state.max_distance = max_distance
+            state.mins[node.split_dim] = min_along_dim
+            state.maxes[node.split_dim] = max_along_dim
+
+            _point_rect_split(state, GREATER, node.split_dim, node.split)
+            if self.__query_ball_point_batch_checking(
+                    buf, node.greater, state) < 0:
+                return -1
+            state.min_distance = min_distance
+            state.max_distance = max_distance
+            state.mins[node.split_dim] = min_along_dim
+            state.maxes[node.split_dim] = max_along_dim
+
+        return 0
+
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def query_ball_point_batch(cKDTree self, object x, object r,
+                               np.float64_t p=2., np.float64_t eps=0):
+        """query_ball_point_batch(self, x, r, p, eps)
+
+        Find all points within distance r of each point in x.
+
+        The search for all points is done in compiled code without holding
+        the GIL, the neighbors are returned in compressed sparse row form.
+
+        Parameters
+        ----------
+        x : array_like, shape (n, self.m)
+            The points to search for neighbors of.
+        r : positive float or array_like of floats, shape (n, )
+            The radius of points to return, either a single value or one
+            value for each point.
+        p : float, optional
+            Which Minkowski p-norm to use.  Should be in the range [1, inf].
+        eps : nonnegative float, optional
+            Approximate search, see query_ball_point.
+
+        Returns
+        -------
+        indptr : ndarray of ints, shape (n + 1, )
+            Offsets into indices for each point, the neighbors of point i
+            are indices[indptr[i]:indptr[i + 1]].
+        indices : ndarray of ints
+            Indices of the neighbors of all points, the neighbors of each
+            point are in the same order as returned by query_ball_point.
+
+        """
+        cdef np.ndarray[np.float64_t, ndim=2, mode="c"] xx
+        cdef np.ndarray[np.float64_t, ndim=1, mode="c"] rr
+        cdef np.ndarray[np.intp_t, ndim=1, mode="c"] indptr
+        cdef np.ndarray[np.intp_t, ndim=1, mode="c"] indices
+        cdef np.ndarray[np.float64_t, ndim=1, mode="c"] mins, maxes
+        cdef PointRectState state
+        cdef IndexBuffer buf
+        cdef np.intp_t i, j, npoints
+        cdef np.float64_t epsfac
+        cdef int status = 0
+
+        xx = np.ascontiguousarray(x, dtype=np.float64)
+        if xx.shape[1] != self.m:
+            raise ValueError("Searching for a %d-dimensional point in a " \
+                             "%d-dimensional KDTree" % (int(xx.shape[1]), int(self.m)))
+        npoints = xx.shape[0]
+        rr = np.ascontiguousarray(np.broadcast_to(
+            np.asarray(r, dtype=np.float64), (npoints, )))
+        indptr = np.empty(npoints + 1, dtype=np.intp)
+        mins = np.empty(self.m, dtype=np.float64)
+        maxes = np.empty(self.m, dtype=np.float64)
+
+        # fiddle approximation factor
+        if eps == 0:
+            epsfac = 1
+        elif p == infinity:
+            epsfac = 1 / (1 + eps)
+        else:
+            epsfac = 1 / (1 + eps) ** p
+
+        state.mins = &mins[0]
+        state.maxes = &maxes[0]
+        state.m = self.m
+        state.p = p
+        state.epsfac = epsfac
+
+        buf.n = 0
+        buf.n_max = npoints + 16
+        buf.indices = <np.intp_t*> stdlib.malloc(
+            buf.n_max * sizeof(np.intp_t))
+        if buf.indices == NULL:
+            raise MemoryError
+        try:
+            with nogil:
+                indptr[0] = 0
+                for i in range(npoints):
+                    for j in range(self.m):
+                        mins[j] = self.raw_mins[j]
+                        maxes[j] = self.raw_maxes[j]
+                    state.pt = &xx[i, 0]
+                    # internally we represent all distances as distance ** p
+                    if p != infinity and rr[i] != infinity:
+                        state.upper_bound = rr[i] ** p
+                    else:
+                        state.upper_bound = rr[i]
+                    _point_rect_distances(&state)
+                    status = self.__query_ball_point_batch_checking(
+                        &buf, self.tree, &state)
+                    if status < 0:
+                        break
+                    indptr[i + 1] = buf.n
+            if status < 0:
+                raise MemoryError
+            indices = np.empty(buf.n, dtype=np.intp)
+            for i in range(buf.n):
+                indices[i] = buf.indices[i]
+        finally:
+            stdlib.free(buf.indices)
+        return indptr, indices
+
+
+    def query_ball_point(cKDTree self, object x, object r,
                          np.float64_t p=2., np.float64_t eps=0):
         """query_ball_point(self, x, r, p, eps)
         
@@ -1387,8 +1654,10 @@ cdef class cKDTree:
         ----------
         x : array_like, shape tuple + (self.m,)
             The point or points to search for neighbors of.
-        r : positive float
-            The radius of points to return.
+        r : positive float or array_like of floats
+            The radius of points to return.  When `x` is an array of points
+            this may be an array which broadcasts to the shape of the points,
+            allowing a different radius to be used for each point.
         p : float, optional
             Which Minkowski p-norm to use.  Should be in the range [1, inf].
         eps : nonnegative float, optional
@@ -1421,7 +1690,11 @@ cdef class cKDTree:
 
         """
         cdef np.ndarray[np.float64_t, ndim=1, mode="c"] xx
-        
+        cdef np.ndarray[np.intp_t, ndim=1, mode="c"] indptr
+        cdef np.ndarray flat_result
+        cdef list indices
+        cdef np.intp_t i
+
         x = np.asarray(x).astype(np.float64)
         if x.shape[-1] != self.m:
             raise ValueError("Searching for a %d-dimensional point in a " \
@@ -1430,11 +1703,17 @@ cdef class cKDTree:
             xx = np.ascontiguousarray(x, dtype=np.float64)
             return self.__query_ball_point(&xx[0], r, p, eps)
         else:
+            # all points are searched by query_ball_point_batch, only the
+            # lists of neighbors are created here
             retshape = x.shape[:-1]
+            rr = np.broadcast_to(np.asarray(r, dtype=np.float64), retshape)
+            indptr, ind = self.query_ball_point_batch(
+                x.reshape(-1, self.m), rr.ravel(), p, eps)
+            indices = ind.tolist()
             result = np.empty(retshape, dtype=np.object)
-            for c in np.ndindex(retshape):
-                xx = np.ascontiguousarray(x[c], dtype=np.float64)
-                result[c] = self.__query_ball_point(&xx[0], r, p, eps)
+            flat_result = result.reshape(-1)
+            for i in range(flat_result.shape[0]):
+                flat_result[i] = indices[indptr[i]:indptr[i + 1]]
             return result
 
     # ---------------
@@ -0,0 +1,351 @@
+"""
+pyart.map.gate_to_grid_plan
+===========================
+
+Reusable plans for mapping radar gates to a Cartesian grid.
+
+.. autosummary::
+    :toctree: generated/
+
+    load_gate_to_grid_plan
+    _radar_geometry
+
+.. autosummary::
+    :toctree: generated/
+    :template: dev_template.rst
+
+    GateToGridPlan
+
+"""
+
+import json
+
+import numpy as np
+import scipy.sparse
+
+from ..core.radar import Radar
+from ..filters import moment_based_gate_filter
+from ._gate_to_grid_map import GateToGridMapper, RoIFunction
+from .gates_to_grid import _detemine_cy_weighting_func, _find_projparams
+from .gates_to_grid import _parse_gatefilters, _determine_fields
+from .gates_to_grid import _find_offsets, _find_grid_params, _parse_roi_func
+from .gates_to_grid import _find_gate_locations, _field_buffers
+
+# radar attributes which describe the geometry of the gates
+_GEOMETRY_ATTRS = ['latitude', 'longitude', 'altitude', 'range', 'azimuth',
+                   'elevation']
+
+
+class GateToGridPlan(object):
+    """
+    A reusable plan for mapping the gates of one or more radars to a grid.
+
+    The plan records the weight with which each radar gate contributes to
+    each grid point as a sparse matrix.  Mapping the fields of radars which
+    share the geometry used to create the plan, for example consecutive
+    volumes from a site using the same scan strategy, only requires a sparse
+    matrix-vector product.  The results are the same as those from
+    :py:func:`map_gates_to_grid`.
+
+    Parameters not defined below are identical to those in
+    :py:func:`map_gates_to_grid`.
+
+    Parameters
+    ----------
+    radars : Radar or tuple of Radar objects.
+        Radar objects whose gate geometry is used to create the plan.  The
+        field data in these radars is not used.
+    roi_func : str
+        Radius of influence function, one of 'constant', 'dist' or
+        'dist_beam'.  Custom RoIFunction objects can be used but plans
+        created with them cannot be saved.
+    angle_tol : float
+        Maximum difference in degrees between the azimuth and elevation
+        angles of a radar and those used to create the plan for the plan to
+        be used to map the radar.
+    range_tol : float
+        Maximum difference in meters between the gate ranges and radar
+        altitude of a radar and those used to create the plan for the plan to
+        be used to map the radar.  Differences in the radar latitude and
+        longitude are limited to this value divided by 1e5.
+
+    Attributes
+    ----------
+    weights : scipy.sparse.csr_matrix
+        Weight of each gate (columns) for each grid point (rows).  Gates
+        from multiple radars are ordered by radar then by gate in the flat
+        radar volume.
+    roi : 3D float32 array
+        Radius of influence for each point in the grid.
+    geometry : list of dict
+        Radar geometry, the latitude, longitude, altitude, range, azimuth
+        and elevation data, used to create the plan.
+
+    """
+
+    def __init__(self, radars, grid_shape, grid_limits, grid_origin=None,
+                 grid_origin_alt=None, grid_projection=None,
+                 weighting_function='Barnes', roi_func='dist_beam',
+                 constant_roi=500., z_factor=0.05, xy_factor=0.02,
+                 min_radius=500.0, h_factor=1.0, nb=1.5, bsp=1.0,
+                 angle_tol=0.1, range_tol=1.0):
+        """ initialize. """
+        self.grid_shape = tuple(grid_shape)
+        self.grid_limits = tuple(tuple(limit) for limit in grid_limits)
+        self.params = {
+            'grid_origin': grid_origin, 'grid_origin_alt': grid_origin_alt,
+            'grid_projection': grid_projection,
+            'weighting_function': weighting_function, 'roi_func': roi_func,
+            'constant_roi': constant_roi, 'z_factor': z_factor,
+            'xy_factor': xy_factor, 'min_radius': min_radius,
+            'h_factor': h_factor, 'nb': nb, 'bsp': bsp}
+        self.angle_tol = angle_tol
+        self.range_tol = range_tol
+        self.weights = None
+        self.roi = None
+        self.geometry = None
+        if radars is not None:
+            self.build(radars)
+
+    def build(self, radars):
+        """
+        Create the plan from the geometry of one or more radars.
+
+        Parameters
+        ----------
+        radars : Radar or tuple of Radar objects.
+            Radar objects whose gate geometry is used to create the plan.
+
+        """
+        if isinstance(radars, Radar):
+            radars = (radars, )
+        params = self.params
+
+        grid_origin = params['grid_origin']
+        grid_origin_alt = params['grid_origin_alt']
+        skip_transform = (len(radars) == 1 and grid_origin_alt is None and
+                          grid_origin is None)
+        if grid_origin_alt is None:
+            grid_origin_alt = float(radars[0].altitude['data'])
+
+        cy_weighting_function = _detemine_cy_weighting_func(
+            params['weighting_function'])
+        projparams = _find_projparams(
+            grid_origin, radars, params['grid_projection'])
+        grid_starts, grid_steps = _find_grid_params(
+            self.grid_shape, self.grid_limits)
+        offsets = _find_offsets(radars, projparams, grid_origin_alt)
+        roi_func = _parse_roi_func(
+            params['roi_func'], params['constant_roi'], params['z_factor'],
+            params['xy_factor'], params['min_radius'], params['h_factor'],
+            params['nb'], params['bsp'], offsets)
+
+        # the grid_sum and grid_wsum arrays are not used to find weights
+        empty = np.zeros((1, 1, 1, 1), dtype=np.float32)
+        gatemapper = GateToGridMapper(
+            self.grid_shape, grid_starts, grid_steps, empty, empty)
+
+        gate_indices = []
+        grid_indices = []
+        weights = []
+        gate_offset = 0
+        for radar in radars:
+            gate_z, gate_y, gate_x = _find_gate_locations(
+                radar, skip_transform, projparams, grid_origin_alt)
+            gate_index, grid_index, weight = gatemapper.find_gate_weights(
+                radar.ngates, radar.nrays, gate_z, gate_y, gate_x, roi_func,
+                cy_weighting_function)
+            gate_indices.append(gate_index + gate_offset)
+            grid_indices.append(grid_index)
+            weights.append(weight)
+            gate_offset += radar.nrays * radar.ngates
+
+        ngrid = int(np.prod(self.grid_shape))
+        self.weights = scipy.sparse.coo_matrix(
+            (np.concatenate(weights),
+             (np.concatenate(grid_indices), np.concatenate(gate_indices))),
+            shape=(ngrid, gate_offset)).tocsr()
+        self.roi = np.empty(self.grid_shape, dtype=np.float32)
+        gatemapper.find_roi_for_grid(self.roi, roi_func)
+        self.geometry = [_radar_geometry(radar) for radar in radars]
+
+    def check_geometry(self, radars):
+        """
+        Check if the plan can be used to map one or more radars.
+
+        Parameters
+        ----------
+        radars : Radar or tuple of Radar objects.
+            Radar objects to check.
+
+        Returns
+        -------
+        valid : bool
+            True if the geometry of the radars matches that used to create
+            the plan within the angle_tol and range_tol tolerances.
+
+        """
+        if isinstance(radars, Radar):
+            radars = (radars, )
+        if self.geometry is None or len(radars) != len(self.geometry):
+            return False
+        tols = {'latitude': self.range_tol / 1e5,
+                'longitude': self.range_tol / 1e5,
+                'altitude': self.range_tol, 'range': self.range_tol,
+                'azimuth': self.angle_tol, 'elevation': self.angle_tol}
+        for radar, geometry in zip(radars, self.geometry):
+            for attr, plan_data in geometry.items():
+                data = getattr(radar, attr)['data']
+                if np.shape(data) != plan_data.shape:
+                    return False
+                diff = np.abs(np.asarray(data, dtype=np.float64) - plan_data)
+                if attr == 'azimuth':
+                    diff = np.minimum(diff, 360. - diff)
+                if np.any(diff > tols[attr]):
+                    return False
+        return True
+
+    def map_gates_to_grid(self, radars, fields=None, gatefilters=False,
+                          map_roi=True, **kwargs):
+        """
+        Map gates from one or more radars to the grid using the plan.
+
+        If the geometry of the radars does not match that used to create the
+        plan, see :py:func:`check_geometry`, the plan is first rebuilt from
+        the geometry of these radars.
+
+        Parameters
+        ----------
+        radars : Radar or tuple of Radar objects.
+            Radar objects which will be mapped to the Cartesian grid.
+        fields, gatefilters, map_roi :
+            See :py:func:`map_gates_to_grid`.  Additional arguments are
+            passed to :py:func:`moment_based_gate_filter` when gatefilters is
+            None.
+
+        Returns
+        -------
+        grids : dict
+            Dictionary of mapped fields, identical to that returned by
+            :py:func:`map_gates_to_grid`.
+
+        """
+        if isinstance(radars, Radar):
+            radars = (radars, )
+        if not self.check_geometry(radars):
+            self.build(radars)
+
+        gatefilters = _parse_gatefilters(gatefilters, radars)
+        fields = _determine_fields(fields, radars)
+        nfields = len(fields)
+
+        # gate values and indicators of which gates should be included,
+        # masked and excluded gates contribute no weight to the grid.
+        ngates = self.weights.shape[1]
+        values = np.empty((ngates, nfields), dtype=np.float32)
+        included = np.empty((ngates, nfields), dtype=np.float32)
+        start = 0
+        for radar, gatefilter in zip(radars, gatefilters):
+            end = start + radar.nrays * radar.ngates
+            if gatefilter is False:
+                gate_included = True
+            else:
+                if gatefilter is None:
+                    gatefilter = moment_based_gate_filter(radar, **kwargs)
+                gate_included = gatefilter.gate_included.ravel()
+            for i, field in enumerate(fields):
+                data, mask, scale_factor, add_offset = _field_buffers(
+                    radar.fields[field])
+                data = data.ravel()
+                if data.dtype == np.int16:
+                    data = data * scale_factor + add_offset
+                gincluded = gate_included
+                if mask is not None:
+                    gincluded = np.logical_and(
+                        mask.ravel() == 0, gate_included)
+                included[start:end, i] = gincluded
+                values[start:end, i] = np.where(gincluded, data, 0)
+            start = end
+
+        grid_shape = self.grid_shape + (nfields, )
+        grid_sum = self.weights.dot(values).reshape(grid_shape)
+        grid_wsum = self.weights.dot(included).reshape(grid_shape)
+
+        # create and return the grid dictionary
+        mweight = np.ma.masked_equal(grid_wsum, 0)
+        msum = np.ma.masked_array(grid_sum, mweight.mask)
+        grids = dict(
+            [(f, msum[..., i] / mweight[..., i])
+             for i, f in enumerate(fields)])
+        if map_roi:
+            grids['ROI'] = self.roi.copy()
+        return grids
+
+    def save(self, filename):
+        """
+        Save the plan to a NumPy .npz file.
+
+        Parameters
+        ----------
+        filename : str
+            Filename to save the plan to.
+
+        """
+        if isinstance(self.params['roi_func'], RoIFunction):
+            raise ValueError(
+                'plans using a custom roi_func cannot be saved')
+        arrays = {
+            'weights_data': self.weights.data,
+            'weights_indices': self.weights.indices,
+            'weights_indptr': self.weights.indptr,
+            'weights_shape': np.array(self.weights.shape),
+            'roi': self.roi}
+        for i, geometry in enumerate(self.geometry):
+            for attr, data in geometry.items():
+                arrays['radar%d_%s' % (i, attr)] = data
+        header = {
+            'grid_shape': self.grid_shape, 'grid_limits': self.grid_limits,
+            'params': self.params, 'angle_tol': self.angle_tol,
+            'range_tol': self.range_tol, 'nradars': len(self.geometry)}
+        arrays['header'] = np.array(json.dumps(header))
+        with open(filename, 'wb') as f:
+            np.savez(f, **arrays)
+
+
+def load_gate_to_grid_plan(filename):
+    """
+    Load a gate to grid plan saved with :py:func:`GateToGridPlan.save`.
+
+    Parameters
+    ----------
+    filename : str
+        Filename of the saved plan.
+
+    Returns
+    -------
+    plan : GateToGridPlan
+        Plan loaded from the file.
+
+    """
+    with np.load(filename) as npz:
+        header = json.loads(str(npz['header']))
+        plan = GateToGridPlan(
+            None, header['grid_shape'], header['grid_limits'],
+            angle_tol=header['angle_tol'], range_tol=header['range_tol'],
+            **header['params'])
+        plan.weights = scipy.sparse.csr_matrix(
+            (npz['weights_data'], npz['weights_indices'],
+             npz['weights_indptr']), shape=tuple(npz['weights_shape']))
+        plan.roi = npz['roi']
+        plan.geometry = [
+            dict((attr, npz['radar%d_%s' % (i, attr)])
+                 for attr in _GEOMETRY_ATTRS)
+            for i in range(header['nradars'])]
+    return plan
+
+
+def _radar_geometry(radar):
+    """ Return a dictionary of the arrays describing the radar geometry. """
+    return dict((attr, np.array(getattr(radar, attr)['data'],
+                                dtype=np.float64))
+                for attr in _GEOMETRY_ATTRS)
@@ -13,15 +13,28 @@ Generate a Cartesian grid by mapping from radar gates onto the grid.
     _parse_gatefilters
     _determine_fields
     _find_offsets
+    _find_gate_locations
     _find_grid_params
     _parse_roi_func
+    _prepare_gates
+    _map_gates_to_grid_tiled
+    _map_gates_threaded
+    _field_buffers
+    _field_data_view
+    _field_mask_view
 
 """
 
+import os
+
 import numpy as np
+from numpy.lib.format import open_memmap
+
+from ..config import get_fillvalue
 from ..core.radar import Radar
 from ..core.transforms import geographic_to_cartesian
 from ..filters import GateFilter, moment_based_gate_filter
+from ..io.common import _PackedFieldData, _run_in_threads
 
 from ._gate_to_grid_map import GateToGridMapper
 from ._gate_to_grid_map import RoIFunction, ConstantRoI, DistBeamRoI, DistRoI
@@ -33,7 +46,8 @@ def map_gates_to_grid(
         fields=None, gatefilters=False, map_roi=True,
         weighting_function='Barnes', toa=17000.0, roi_func='dist_beam',
         constant_roi=500., z_factor=0.05, xy_factor=0.02, min_radius=500.0,
-        h_factor=1.0, nb=1.5, bsp=1.0, **kwargs):
+        h_factor=1.0, nb=1.5, bsp=1.0, nthreads=1, tile_shape=None,
+        filename=None, **kwargs):
     """
     Map gates from one or more radars to a Cartesian grid.
 
@@ -65,6 +79,25 @@ def map_gates_to_grid(
         A custom RoIFunction can be defined using the RoIFunction class
         and defining a get_roi method which returns the radius.  For efficient
         mapping this class should be implemented in Cython.
+    nthreads : int
+        Number of threads used to map the gates onto the grid.  The rays of
+        each radar are divided between the threads, each of which collects
+        weighted values in a private copy of the grid which are summed once
+        all radars have been mapped.  Each additional thread requires memory
+        for two float32 arrays of size `grid_shape` times the number of
+        fields.
+    tile_shape : 2-tuple of ints or None
+        Number of points along the y and x dimensions in each tile when
+        mapping the grid one tile at a time.  Each tile is mapped using only
+        the gates whose radius of influence intersects the tile, temporary
+        arrays are the size of a tile rather than the full grid.  None, the
+        default, maps the entire grid at once.
+    filename : str or None
+        Name of a NumPy .npy file to which the mapped fields are written
+        when tile_shape is specified, the returned grids are memory mapped
+        views of this file.  This file holds the field data followed by the
+        radius of influence, the field masks are written to a second file
+        whose name ends in '_mask.npy'.  None keeps the grids in memory.
 
     Returns
     -------
@@ -100,6 +133,16 @@ def map_gates_to_grid(
     roi_func = _parse_roi_func(roi_func, constant_roi, z_factor, xy_factor,
                                min_radius, h_factor, nb, bsp, offsets)
 
+    if tile_shape is not None:
+        radar_gates = [
+            _prepare_gates(radar, gatefilter, fields, skip_transform,
+                           projparams, grid_origin_alt, **kwargs)
+            for radar, gatefilter in zip(radars, gatefilters)]
+        return _map_gates_to_grid_tiled(
+            radar_gates, fields, grid_shape, grid_starts, grid_steps,
+            tile_shape, filename, map_roi, nthreads, toa, roi_func,
+            cy_weighting_function)
+
     # prepare grid storage arrays
     nfields = len(fields)
     grid_sum = np.zeros(grid_shape + (nfields, ), dtype=np.float32)
@@ -107,43 +150,32 @@ def map_gates_to_grid(
     gatemapper = GateToGridMapper(
         grid_shape, grid_starts, grid_steps, grid_sum, grid_wsum)
 
+    # each additional thread collects values in its own storage arrays
+    nthreads = max(int(nthreads), 1)
+    thread_sums = [(np.zeros_like(grid_sum), np.zeros_like(grid_wsum))
+                   for i in range(nthreads - 1)]
+    gatemappers = [gatemapper] + [
+        GateToGridMapper(grid_shape, grid_starts, grid_steps, tsum, twsum)
+        for tsum, twsum in thread_sums]
+
     # project gates from each radar onto the grid
     for radar, gatefilter in zip(radars, gatefilters):
-
-        # Copy the field data and masks.
-        # TODO method that does not copy field data into new array
-        shape = (radar.nrays, radar.ngates, nfields)
-        field_data = np.empty(shape, dtype='float32')
-        field_mask = np.empty(shape, dtype='uint8')
-        for i, field in enumerate(fields):
-            fdata = radar.fields[field]['data']
-            field_data[:, :, i] = np.ma.getdata(fdata)
-            field_mask[:, :, i] = np.ma.getmaskarray(fdata)
-
-        # find excluded gates from the gatefilter
-        if gatefilter is False:
-            gatefilter = GateFilter(radar)  # include all gates
-        elif gatefilter is None:
-            gatefilter = moment_based_gate_filter(radar, **kwargs)
-        excluded_gates = gatefilter.gate_excluded.astype('uint8')
-
-        # calculate gate locations relative to the grid origin
-        if skip_transform:
-            # single radar, grid centered at radar location
-            gate_x = radar.gate_x['data']
-            gate_y = radar.gate_y['data']
-        else:
-            gate_x, gate_y = geographic_to_cartesian(
-                radar.gate_longitude['data'], radar.gate_latitude['data'],
-                projparams)
-        gate_z = radar.gate_altitude['data'] - grid_origin_alt
+        (gate_z, gate_y, gate_x, field_data, field_mask, scale_factors,
+         add_offsets, excluded_gates) = _prepare_gates(
+             radar, gatefilter, fields, skip_transform, projparams,
+             grid_origin_alt, **kwargs)
 
         # map the gates onto the grid
-        gatemapper.map_gates_to_grid(
-            radar.ngates, radar.nrays, gate_z.astype('float32'),
-            gate_y.astype('float32'), gate_x.astype('float32'),
-            field_data, field_mask, excluded_gates,
-            toa, roi_func, cy_weighting_function)
+        _map_gates_threaded(
+            gatemappers, radar.ngates, radar.nrays, gate_z, gate_y, gate_x,
+            field_data, field_mask, scale_factors, add_offsets,
+            excluded_gates, toa, roi_func, cy_weighting_function)
+
+    # reduce the storage arrays from each thread
+    for tsum, twsum in thread_sums:
+        grid_sum += tsum
+        grid_wsum += twsum
+    del thread_sums
 
     # create and return the grid dictionary
     mweight = np.ma.masked_equal(grid_wsum, 0)
@@ -157,6 +189,235 @@ def map_gates_to_grid(
     return grids
 
 
+def _prepare_gates(radar, gatefilter, fields, skip_transform, projparams,
+                   grid_origin_alt, **kwargs):
+    """
+    Find the gate locations, field data, masks, scale factors and offsets
+    and excluded gates of a radar in the form expected by GateToGridMapper.
+    """
+    # find views of the field data and masks, no copies are made when
+    # these are C-contiguous arrays of a type supported by the mapper.
+    field_data = []
+    field_mask = []
+    scale_factors = []
+    add_offsets = []
+    shape = (radar.nrays, radar.ngates)
+    for field in fields:
+        data, mask, scale_factor, add_offset = _field_buffers(
+            radar.fields[field])
+        if data.shape != shape:
+            raise ValueError(
+                'field %s has shape %s, expected (nrays, ngates) %s' %
+                (field, data.shape, shape))
+        field_data.append(data)
+        field_mask.append(mask)
+        scale_factors.append(scale_factor)
+        add_offsets.append(add_offset)
+
+    # find excluded gates from the gatefilter
+    if gatefilter is False:
+        gatefilter = GateFilter(radar)  # include all gates
+    elif gatefilter is None:
+        gatefilter = moment_based_gate_filter(radar, **kwargs)
+    excluded_gates = np.ascontiguousarray(
+        gatefilter.gate_excluded.astype('uint8'))
+
+    # calculate gate locations relative to the grid origin
+    gate_z, gate_y, gate_x = _find_gate_locations(
+        radar, skip_transform, projparams, grid_origin_alt)
+    return (gate_z, gate_y, gate_x, field_data, field_mask, scale_factors,
+            add_offsets, excluded_gates)
+
+
+def _map_gates_to_grid_tiled(
+        radar_gates, fields, grid_shape, grid_starts, grid_steps,
+        tile_shape, filename, map_roi, nthreads, toa, roi_func,
+        cy_weighting_function):
+    """
+    Map gates onto the grid one y, x tile at a time.
+
+    Only the gates whose radius of influence intersects a tile are mapped
+    onto that tile.  Finished tiles are written to in memory arrays or when
+    filename is not None, to memory mapped .npy files.
+    """
+    nz, ny, nx = grid_shape
+    z_start, y_start, x_start = grid_starts
+    z_step, y_step, x_step = grid_steps
+    tile_ny, tile_nx = tile_shape
+    nfields = len(fields)
+
+    # output arrays, the radius of influence follows the fields
+    data_shape = (nfields + 1, ) + tuple(grid_shape)
+    mask_shape = (nfields, ) + tuple(grid_shape)
+    if filename is None:
+        grid_data = np.empty(data_shape, dtype=np.float32)
+        grid_mask = np.empty(mask_shape, dtype=np.bool_)
+    else:
+        mask_filename = os.path.splitext(filename)[0] + '_mask.npy'
+        grid_data = open_memmap(
+            filename, mode='w+', dtype=np.float32, shape=data_shape)
+        grid_mask = open_memmap(
+            mask_filename, mode='w+', dtype=np.bool_, shape=mask_shape)
+
+    # radius of influence of each gate, used to find the gates which
+    # contribute to each tile
+    empty = np.zeros((1, 1, 1, 1), dtype=np.float32)
+    gatemapper = GateToGridMapper(
+        tuple(grid_shape), grid_starts, grid_steps, empty, empty)
+    gate_rois = []
+    for gates in radar_gates:
+        gate_z, gate_y, gate_x = gates[:3]
+        gate_roi = np.empty(gate_z.shape, dtype=np.float32)
+        gatemapper.find_roi_for_gates(gate_roi, gate_z, gate_y, gate_x,
+                                      roi_func)
+        gate_rois.append(gate_roi)
+
+    nthreads = max(int(nthreads), 1)
+    for ty0 in range(0, ny, tile_ny):
+        for tx0 in range(0, nx, tile_nx):
+            ty1 = min(ty0 + tile_ny, ny)
+            tx1 = min(tx0 + tile_nx, nx)
+            tile_grid_shape = (nz, ty1 - ty0, tx1 - tx0)
+            tile_starts = (
+                z_start, y_start + y_step * ty0, x_start + x_step * tx0)
+            y_min, y_max = y_start + y_step * ty0, y_start + y_step * (ty1 - 1)
+            x_min, x_max = x_start + x_step * tx0, x_start + x_step * (tx1 - 1)
+
+            tile_sums = [
+                (np.zeros(tile_grid_shape + (nfields, ), dtype=np.float32),
+                 np.zeros(tile_grid_shape + (nfields, ), dtype=np.float32))
+                for i in range(nthreads)]
+            gatemappers = [
+                GateToGridMapper(tile_grid_shape, tile_starts, grid_steps,
+                                 tsum, twsum)
+                for tsum, twsum in tile_sums]
+
+            for gates, gate_roi in zip(radar_gates, gate_rois):
+                (gate_z, gate_y, gate_x, field_data, field_mask,
+                 scale_factors, add_offsets, excluded) = gates
+
+                # find the rays with gates which contribute to the tile
+                included = np.logical_and.reduce((
+                    excluded == 0,
+                    gate_y + gate_roi >= y_min, gate_y - gate_roi <= y_max,
+                    gate_x + gate_roi >= x_min, gate_x - gate_roi <= x_max))
+                rays = np.flatnonzero(included.any(axis=1))
+                if len(rays) == 0:
+                    continue
+
+                _map_gates_threaded(
+                    gatemappers, gate_z.shape[1], len(rays), gate_z[rays],
+                    gate_y[rays], gate_x[rays],
+                    [d[rays] for d in field_data],
+                    [None if m is None else m[rays] for m in field_mask],
+                    scale_factors, add_offsets,
+                    np.ascontiguousarray(~included[rays], dtype=np.uint8),
+                    toa, roi_func, cy_weighting_function)
+
+            # reduce the storage arrays from each thread
+            tile_sum, tile_wsum = tile_sums[0]
+            for tsum, twsum in tile_sums[1:]:
+                tile_sum += tsum
+                tile_wsum += twsum
+
+            # write the finished tile
+            tile_mask = tile_wsum == 0
+            tile_wsum[tile_mask] = 1
+            tile_data = tile_sum / tile_wsum
+            tile_data[tile_mask] = get_fillvalue()
+            grid_data[:nfields, :, ty0:ty1, tx0:tx1] = np.rollaxis(
+                tile_data, 3)
+            grid_mask[:, :, ty0:ty1, tx0:tx1] = np.rollaxis(tile_mask, 3)
+            if map_roi:
+                roi_array = np.empty(tile_grid_shape, dtype=np.float32)
+                gatemappers[0].find_roi_for_grid(roi_array, roi_func)
+                grid_data[nfields, :, ty0:ty1, tx0:tx1] = roi_array
+            del tile_sums, gatemappers
+
+    # create and return the grid dictionary
+    grids = dict(
+        [(f, np.ma.masked_array(grid_data[i], mask=grid_mask[i], copy=False))
+         for i, f in enumerate(fields)])
+    if map_roi:
+        grids['ROI'] = grid_data[nfields]
+    return grids
+
+
+def _map_gates_threaded(gatemappers, ngates, nrays, gate_z, gate_y, gate_x,
+                        field_data, field_mask, scale_factors, add_offsets,
+                        excluded_gates, toa, roi_func, cy_weighting_function):
+    """
+    Map gates onto the grid dividing the rays between the gate mappers.
+
+    Each gate mapper is run in a separate thread, the mapping of gates
+    releases the GIL.
+    """
+    bounds = np.linspace(0, nrays, len(gatemappers) + 1).astype('int')
+    args = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        args.append((
+            ngates, stop - start, gate_z[start:stop], gate_y[start:stop],
+            gate_x[start:stop], [d[start:stop] for d in field_data],
+            [None if m is None else m[start:stop] for m in field_mask],
+            excluded_gates[start:stop], toa, roi_func,
+            cy_weighting_function, scale_factors, add_offsets))
+
+    _run_in_threads(
+        GateToGridMapper.map_gates_to_grid,
+        [(gatemapper, ) + arg for gatemapper, arg in zip(gatemappers, args)],
+        len(gatemappers))
+
+
+def _field_buffers(field_dic):
+    """
+    Return the data, mask, scale factor and offset of a field in the form
+    expected by GateToGridMapper.
+
+    Fields whose 'data' key holds packed int16 codes which have not been
+    decoded, see :py:func:`pyart.io.common._packed_field_dic`, are mapped
+    from the codes without decoding them.  All other field data is in
+    physical units and is not scaled, the 'scale_factor' and 'add_offset'
+    keys of a field dictionary are only used when writing.
+    """
+    packed = getattr(field_dic, '_lazyload', {}).get('data')
+    if (isinstance(packed, _PackedFieldData) and
+            packed.codes.dtype == np.int16 and
+            np.ndim(packed.scale_factor) == 0 and
+            np.ndim(packed.add_offset) == 0):
+        codes = np.ascontiguousarray(packed.codes)
+        mask = None
+        if packed.masked_codes:
+            mask = np.in1d(codes, packed.masked_codes).reshape(codes.shape)
+            mask = mask.view(np.uint8)
+        return (codes, mask, float(packed.scale_factor),
+                float(packed.add_offset))
+
+    fdata = field_dic['data']
+    return _field_data_view(fdata), _field_mask_view(fdata), 1., 0.
+
+
+def _field_data_view(fdata):
+    """
+    Return the field data as a C-contiguous array of a dtype supported by
+    GateToGridMapper, the data is only copied if required.
+    """
+    data = np.ma.getdata(fdata)
+    if data.dtype not in (np.float32, np.float64, np.int16):
+        data = data.astype(np.float32)
+    return np.ascontiguousarray(data)
+
+
+def _field_mask_view(fdata):
+    """
+    Return the field mask as a C-contiguous uint8 array or None if no
+    gates are masked, the mask is only copied if required.
+    """
+    mask = np.ma.getmask(fdata)
+    if mask is np.ma.nomask:
+        return None
+    return np.ascontiguousarray(mask).view(np.uint8)
+
+
 def _detemine_cy_weighting_func(weighting_function):
     """ Determine cython weight function value. """
     if weighting_function.upper() == 'CRESSMAN':
@@ -210,6 +471,8 @@ def _determine_fields(fields, radars):
         for radar in radars[1:]:
             fields = fields.intersection(radar.fields.keys())
         fields = list(fields)
+    if len(fields) == 0:
+        raise ValueError('No fields to map to the grid')
     return fields
 
 
@@ -225,6 +488,22 @@ def _find_offsets(radars, projparams, grid_origin_alt):
     return offsets
 
 
+def _find_gate_locations(radar, skip_transform, projparams, grid_origin_alt):
+    """ Find the float32 gate locations relative to the grid origin. """
+    if skip_transform:
+        # single radar, grid centered at radar location
+        gate_x = radar.gate_x['data']
+        gate_y = radar.gate_y['data']
+    else:
+        gate_x, gate_y = geographic_to_cartesian(
+            radar.gate_longitude['data'], radar.gate_latitude['data'],
+            projparams)
+    gate_z = radar.gate_altitude['data'] - grid_origin_alt
+    return (np.ascontiguousarray(gate_z, dtype='float32'),
+            np.ascontiguousarray(gate_y, dtype='float32'),
+            np.ascontiguousarray(gate_x, dtype='float32'))
+
+
 def _find_grid_params(grid_shape, grid_limits):
     """ Find the starting points and step size of the grid. """
     nz, ny, nx = grid_shape
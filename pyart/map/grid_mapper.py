@@ -13,6 +13,7 @@ Utilities for mapping radar objects to Cartesian grids.
     example_roi_func_dist
     _unify_times_for_radars
     _load_nn_field_data
+    _weight_nn_field_data
     _gen_roi_func_constant
     _gen_roi_func_dist
     _gen_roi_func_dist_beam
@@ -36,6 +37,7 @@ from ..core.radar import Radar
 from ..filters import GateFilter, moment_based_gate_filter
 from ..io.common import make_time_unit_str
 from ._load_nn_field_data import _load_nn_field_data
+from ._weight_nn_field_data import _weight_nn_field_data
 from .ckdtree import cKDTree
 from .gates_to_grid import map_gates_to_grid
 
@@ -246,6 +248,39 @@ class NNLocator:
             dist = scipy.spatial.minkowski_distance(q, self.tree.data[ind])
 
             return ind, dist
+        else:
+            raise ValueError('invalid algorithm')
+
+    def find_neighbors_and_dists_batch(self, q, r):
+        """
+        Find all neighbors and distances for a batch of points.
+
+        Parameters
+        ----------
+        q : array, (n_points, n_dimensions)
+            Points to query.
+        r : float or array of floats
+            Distance within which neighbors are returned, either a single
+            value or one value for each point.
+
+        Returns
+        -------
+        indptr : array of intergers
+            Offsets into ind and dist for each point, the neighbors of point
+            i are ind[indptr[i]:indptr[i + 1]].
+        ind : array of intergers
+            Indices of the neighbors of all points.
+        dist : array of floats
+            Distances to the neighbors of all points.
+
+        """
+        if self._algorithm == 'kd_tree':
+            indptr, ind = self.tree.query_ball_point_batch(q, r)
+            dist = scipy.spatial.minkowski_distance(
+                np.repeat(q, np.diff(indptr), axis=0), self.tree.data[ind])
+            return indptr, ind, dist
+        else:
+            raise ValueError('invalid algorithm')
 
 
 def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
@@ -255,7 +290,7 @@ def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
                 copy_field_data=True, algorithm='kd_tree', leafsize=10.,
                 roi_func='dist_beam', constant_roi=500.,
                 z_factor=0.05, xy_factor=0.02, min_radius=500.0,
-                h_factor=1.0, nb=1.5, bsp=1.0, **kwargs):
+                h_factor=1.0, nb=1.5, bsp=1.0, batch_size=4096, **kwargs):
     """
     Map one or more radars to a Cartesian grid.
 
@@ -372,6 +407,14 @@ def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
         to store the tree. The optimal value depends on the nature of the
         problem. This value should only effect the speed of the gridding,
         not the results.
+    batch_size : int or None
+        Number of grid points which are interpolated together.  The radius
+        of influence, neighbors and weighted field values of a batch of
+        points are found using vectorized and compiled routines which is
+        significantly faster than interpolating each grid point separately.
+        Larger batches require more memory.  None will interpolate each grid
+        point separately.  This value should only effect the speed of the
+        gridding, not the results.
 
     Returns
     -------
@@ -570,7 +613,9 @@ def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
     else:
         x_step = (x_stop - x_start) / (nx - 1.)
 
-    if not hasattr(roi_func, '__call__'):
+    # the built in RoI functions accept arrays of grid locations
+    vectorized_roi = not hasattr(roi_func, '__call__')
+    if vectorized_roi:
         if roi_func == 'constant':
             roi_func = _gen_roi_func_constant(constant_roi)
         elif roi_func == 'dist':
@@ -589,57 +634,114 @@ def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
     if map_roi:
         roi = np.empty((nz, ny, nx), dtype=np.float64)
 
-    # interpolate field values for each point in the grid
-    for iz, iy, ix in np.ndindex(nz, ny, nx):
+    if batch_size is not None:
+        # interpolate field values for batches of points in the grid
+        if copy_field_data:
+            # neighbor data is looked up in the filtered field data
+            data = np.ascontiguousarray(filtered_field_data.data)
+            mask = np.ascontiguousarray(
+                np.ma.getmaskarray(filtered_field_data), dtype=np.uint8)
+        weighting = {'NEAREST': 0, 'CRESSMAN': 1, 'BARNES': 2}[
+            weighting_function.upper()]
+        npoints = nz * ny * nx
+        flat_grid_data = grid_data.data.reshape(npoints, nfields)
+        flat_grid_mask = np.empty((npoints, nfields), dtype=np.uint8)
+
+        for start in range(0, npoints, batch_size):
+            stop = min(start + batch_size, npoints)
+
+            # calculate the grid points and radius of influence
+            iz, iy, ix = np.unravel_index(
+                np.arange(start, stop), (nz, ny, nx))
+            x = x_start + x_step * ix
+            y = y_start + y_step * iy
+            z = z_start + z_step * iz
+            if vectorized_roi:
+                r = np.empty(stop - start, dtype=np.float64)
+                r[:] = roi_func(z, y, x)
+            else:
+                r = np.array([roi_func(*p) for p in zip(z, y, x)],
+                             dtype=np.float64)
+            if map_roi:
+                roi.flat[start:stop] = r
+
+            # find neighbors and distances
+            q = np.column_stack((z, y, x))
+            indptr, ind, dist = nnlocator.find_neighbors_and_dists_batch(q, r)
+
+            if not copy_field_data:
+                # load the field data for all neighbors in the batch
+                r_nums, e_nums = divmod(lookup[ind], total_gates)
+                nneighbors = r_nums.size
+                data = np.empty((nneighbors, nfields), np.float64)
+                _load_nn_field_data(
+                    field_data_objs, nfields, nneighbors,
+                    r_nums.astype(np.intc), e_nums.astype(np.intc), data)
+                mask = np.zeros((nneighbors, nfields), dtype=np.uint8)
+                ind = np.arange(nneighbors, dtype=np.intp)
+
+            # preforms weighting of neighbors.
+            _weight_nn_field_data(
+                weighting, indptr, ind, dist * dist, r, data, mask,
+                badval, flat_grid_data[start:stop],
+                flat_grid_mask[start:stop])
+
+        grid_data.mask = flat_grid_mask.reshape(
+            (nz, ny, nx, nfields)).astype(np.bool)
 
-        # calculate the grid point
-        x = x_start + x_step * ix
-        y = y_start + y_step * iy
-        z = z_start + z_step * iz
-        r = roi_func(z, y, x)
-        if map_roi:
-            roi[iz, iy, ix] = r
+    else:
+        # interpolate field values for each point in the grid
+        for iz, iy, ix in np.ndindex(nz, ny, nx):
 
-        # find neighbors and distances
-        ind, dist = nnlocator.find_neighbors_and_dists((z, y, x), r)
+            # calculate the grid point
+            x = x_start + x_step * ix
+            y = y_start + y_step * iy
+            z = z_start + z_step * iz
+            r = roi_func(z, y, x)
+            if map_roi:
+                roi[iz, iy, ix] = r
 
-        if len(ind) == 0:
-            # when there are no neighbors, mark the grid point as bad
-            grid_data[iz, iy, ix] = np.ma.masked
-            grid_data.data[iz, iy, ix] = badval
-            continue
+            # find neighbors and distances
+            ind, dist = nnlocator.find_neighbors_and_dists((z, y, x), r)
 
-        # find the field values for all neighbors
-        if copy_field_data:
-            # copy_field_data == True, a slice will get the field data.
-            nn_field_data = filtered_field_data[ind]
-        else:
-            # copy_field_data == False, use the lookup table to find the
-            # radar numbers and gate numbers for the neighbors.  Then
-            # use the _load_nn_field_data function to load this data from
-            # the field data object array.  This is done in Cython for speed.
-            r_nums, e_nums = divmod(lookup[ind], total_gates)
-            npoints = r_nums.size
-            r_nums = r_nums.astype(np.intc)
-            e_nums = e_nums.astype(np.intc)
-            nn_field_data = np.empty((npoints, nfields), np.float64)
-            _load_nn_field_data(field_data_objs, nfields, npoints, r_nums,
-                                e_nums, nn_field_data)
-
-        # preforms weighting of neighbors.
-        dist2 = dist * dist
-        r2 = r * r
-
-        if weighting_function.upper() == 'NEAREST':
-            value = nn_field_data[np.argmin(dist2)] 
-        else:
-            if weighting_function.upper() == 'CRESSMAN':
-                weights = (r2 - dist2) / (r2 + dist2)
-            elif weighting_function.upper() == 'BARNES':
-                weights = np.exp(-dist2 / (2.0 * r2)) + 1e-5
-            value = np.ma.average(nn_field_data, weights=weights, axis=0)
+            if len(ind) == 0:
+                # when there are no neighbors, mark the grid point as bad
+                grid_data[iz, iy, ix] = np.ma.masked
+                grid_data.data[iz, iy, ix] = badval
+                continue
+
+            # find the field values for all neighbors
+            if copy_field_data:
+                # copy_field_data == True, a slice will get the field data.
+                nn_field_data = filtered_field_data[ind]
+            else:
+                # copy_field_data == False, use the lookup table to find the
+                # radar numbers and gate numbers for the neighbors.  Then
+                # use the _load_nn_field_data function to load this data
+                # from the field data object array.  This is done in Cython
+                # for speed.
+                r_nums, e_nums = divmod(lookup[ind], total_gates)
+                npoints = r_nums.size
+                r_nums = r_nums.astype(np.intc)
+                e_nums = e_nums.astype(np.intc)
+                nn_field_data = np.empty((npoints, nfields), np.float64)
+                _load_nn_field_data(field_data_objs, nfields, npoints, r_nums,
+                                    e_nums, nn_field_data)
+
+            # preforms weighting of neighbors.
+            dist2 = dist * dist
+            r2 = r * r
+
+            if weighting_function.upper() == 'NEAREST':
+                value = nn_field_data[np.argmin(dist2)] 
+            else:
+                if weighting_function.upper() == 'CRESSMAN':
+                    weights = (r2 - dist2) / (r2 + dist2)
+                elif weighting_function.upper() == 'BARNES':
+                    weights = np.exp(-dist2 / (2.0 * r2)) + 1e-5
+                value = np.ma.average(nn_field_data, weights=weights, axis=0)
 
-        grid_data[iz, iy, ix] = value
+            grid_data[iz, iy, ix] = value
 
     # create and return the grid dictionary
     grids = dict([(f, grid_data[..., i]) for i, f in enumerate(fields)])
@@ -727,11 +829,12 @@ def _gen_roi_func_dist(z_factor, xy_factor, min_radius, offsets):
 
     def roi(zg, yg, xg):
         """ dist radius of influence function. """
+        zg, yg, xg = [np.expand_dims(g, -1) for g in (zg, yg, xg)]
         r = np.maximum(
             z_factor * (zg - zg_off) +
             xy_factor * np.sqrt((xg - xg_off)**2 + (yg - yg_off)**2),
             min_radius)
-        return min(r)
+        return r.min(axis=-1)
 
     return roi
 
@@ -783,10 +886,11 @@ def _gen_roi_func_dist_beam(h_factor, nb, bsp, min_radius, offsets):
 
     def roi(zg, yg, xg):
         """ dist_beam radius of influence function. """
+        zg, yg, xg = [np.expand_dims(g, -1) for g in (zg, yg, xg)]
         r = np.maximum(
                 h_factor * ((zg - zg_off) / 20.0) +
                 np.sqrt((yg - yg_off)**2 + (xg - xg_off)**2) *
                 np.tan(nb * bsp * np.pi / 180.0), min_radius)
-        return min(r)
+        return r.min(axis=-1)
 
     return roi
@@ -0,0 +1,4 @@
+# remove and rebuild the _weight_nn_field_data module
+rm  _weight_nn_field_data.so
+cython _weight_nn_field_data.pyx
+python setup.py build_ext -i
@@ -22,6 +22,10 @@ def configuration(parent_package='', top_path=None):
                          sources=['_load_nn_field_data.c'],
                          include_dirs=[numpy.get_include()])
 
+    config.add_extension('_weight_nn_field_data',
+                         sources=['_weight_nn_field_data.c'],
+                         libraries=libraries)
+
     config.add_extension('_gate_to_grid_map',
                          sources=['_gate_to_grid_map.c'],
                          libraries=libraries)
@@ -0,0 +1,118 @@
+""" Unit Tests for Py-ART's map/gate_to_grid_plan.py. """
+
+from __future__ import print_function
+
+import numpy as np
+from numpy.testing import assert_almost_equal
+import pytest
+
+import pyart
+from pyart.testing import InTemporaryDirectory
+
+EXPECTED_CENTER_SLICE = [40, 30, 20, 10, 0, 0, 10, 20, 30, 40]
+
+COMMON_MAP_TO_GRID_ARGS = {
+    'grid_shape': (3, 9, 10),
+    'grid_limits': ((-400.0, 400.0), (-900.0, 900.0), (-900, 900)),
+    'roi_func': 'constant',
+    'constant_roi': 30., }
+
+
+def test_plan_map_gates_to_grid():
+    radar = pyart.testing.make_target_radar()
+    plan = pyart.map.GateToGridPlan(radar, **COMMON_MAP_TO_GRID_ARGS)
+    grids = plan.map_gates_to_grid(radar)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_almost_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+    assert np.all(grids['ROI'] == 30.)
+
+
+@pytest.mark.parametrize('weighting_function', ['Barnes', 'Cressman'])
+def test_plan_matches_map_gates_to_grid(weighting_function):
+    radar = pyart.testing.make_target_radar()
+    fdata = np.ma.array(radar.fields['reflectivity']['data'])
+    fdata[100:120, 20:40] = np.ma.masked
+    radar.fields['reflectivity']['data'] = fdata
+    gatefilter = pyart.filters.GateFilter(radar)
+    gatefilter.exclude_above('reflectivity', 35.)
+    kwargs = {
+        'grid_shape': (3, 9, 10),
+        'grid_limits': ((-400.0, 400.0), (-9000.0, 9000.0), (-9000, 9000)),
+        'weighting_function': weighting_function, 'roi_func': 'dist_beam',
+        'min_radius': 300.}
+
+    grids = pyart.map.map_gates_to_grid(
+        (radar, radar), gatefilters=(gatefilter, False), **kwargs)
+    plan = pyart.map.GateToGridPlan((radar, radar), **kwargs)
+    plan_grids = plan.map_gates_to_grid(
+        (radar, radar), gatefilters=(gatefilter, False))
+    for field in ['reflectivity', 'ROI']:
+        assert np.all(np.ma.getmaskarray(grids[field]) ==
+                      np.ma.getmaskarray(plan_grids[field]))
+        assert_almost_equal(grids[field], plan_grids[field], 4)
+
+
+def test_plan_int16_scaled():
+    radar = pyart.testing.make_target_radar()
+    fdata = np.ma.masked_invalid(radar.fields['reflectivity']['data'])
+    fdata[0, -1] = np.ma.masked
+    radar.fields['reflectivity']['data'] = fdata
+    codes = np.round(fdata * 10.).filled(-9999).astype('int16')
+
+    # int16 data is in physical units, the scale_factor key is ignored
+    radar.add_field_like('reflectivity', 'refl_int16', fdata.astype('int16'))
+    radar.fields['refl_int16']['scale_factor'] = 0.5
+    radar.fields['refl_packed'] = pyart.io.common._packed_field_dic(
+        {}, codes, 0.1, 0., (-9999, ), 'float32')
+
+    plan = pyart.map.GateToGridPlan(radar, **COMMON_MAP_TO_GRID_ARGS)
+    grids = plan.map_gates_to_grid(radar)
+    ref = pyart.map.map_gates_to_grid(
+        radar, fields=['reflectivity'], **COMMON_MAP_TO_GRID_ARGS)
+    for field in ['refl_int16', 'refl_packed']:
+        assert_almost_equal(grids[field], ref['reflectivity'], 4)
+        assert np.all(np.ma.getmaskarray(grids[field]) ==
+                      np.ma.getmaskarray(ref['reflectivity']))
+    assert 'data' in radar.fields['refl_packed']._lazyload
+
+
+def test_plan_check_geometry():
+    radar = pyart.testing.make_target_radar()
+    plan = pyart.map.GateToGridPlan(
+        radar, angle_tol=0.1, **COMMON_MAP_TO_GRID_ARGS)
+    assert plan.check_geometry(radar)
+    assert not plan.check_geometry((radar, radar))
+
+    radar.azimuth['data'][0] += 0.05
+    assert plan.check_geometry(radar)
+    radar.azimuth['data'][0] += 0.1
+    assert not plan.check_geometry(radar)
+
+    # mapping a radar with a different geometry rebuilds the plan
+    plan.map_gates_to_grid(radar)
+    assert plan.check_geometry(radar)
+
+
+def test_plan_save_and_load():
+    radar = pyart.testing.make_target_radar()
+    plan = pyart.map.GateToGridPlan(radar, **COMMON_MAP_TO_GRID_ARGS)
+    with InTemporaryDirectory():
+        plan.save('plan.npz')
+        loaded_plan = pyart.map.load_gate_to_grid_plan('plan.npz')
+
+    assert loaded_plan.grid_shape == plan.grid_shape
+    assert loaded_plan.params['roi_func'] == 'constant'
+    assert loaded_plan.check_geometry(radar)
+    assert (loaded_plan.weights != plan.weights).nnz == 0
+    grids = loaded_plan.map_gates_to_grid(radar)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_almost_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+
+
+def test_plan_save_custom_roi_func():
+    radar = pyart.testing.make_target_radar()
+    roi_func = pyart.map._gate_to_grid_map.ConstantRoI(30.)
+    plan = pyart.map.GateToGridPlan(
+        radar, (3, 9, 10), ((-400.0, 400.0), (-900.0, 900.0), (-900, 900)),
+        roi_func=roi_func)
+    pytest.raises(ValueError, plan.save, 'plan.npz')
@@ -101,6 +101,119 @@ def test_map_to_grid_default_two_radars():
     assert_almost_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
 
 
+def test_map_to_grid_nthreads():
+    radar = pyart.testing.make_target_radar()
+    grids = pyart.map.map_gates_to_grid((radar, radar), nthreads=3,
+                                        **COMMON_MAP_TO_GRID_ARGS)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_almost_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+
+    single_grids = pyart.map.map_gates_to_grid((radar, radar), nthreads=1,
+                                               **COMMON_MAP_TO_GRID_ARGS)
+    assert_almost_equal(grids['reflectivity'], single_grids['reflectivity'],
+                        decimal=3)
+
+
+def test_map_to_grid_field_dtypes():
+    radar = pyart.testing.make_target_radar()
+    fdata = np.ma.masked_invalid(radar.fields['reflectivity']['data'])
+    fdata[0, -1] = np.ma.masked
+    radar.add_field_like('reflectivity', 'refl_float32',
+                         fdata.astype('float32'))
+    radar.add_field_like('reflectivity', 'refl_int16', fdata.astype('int16'))
+    radar.add_field_like('reflectivity', 'refl_uint8',
+                         np.asfortranarray(fdata.filled(0).astype('uint8')))
+    grids = pyart.map.map_gates_to_grid(radar, **COMMON_MAP_TO_GRID_ARGS)
+    for field in ['reflectivity', 'refl_float32', 'refl_int16',
+                  'refl_uint8']:
+        center_slice = grids[field][1, 4, :]
+        assert_almost_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+
+
+def test_map_to_grid_int16_scaled():
+    radar = pyart.testing.make_target_radar()
+    fdata = np.ma.masked_invalid(radar.fields['reflectivity']['data'])
+    fdata[0, -1] = np.ma.masked
+    codes = np.round(fdata * 10.).filled(-9999).astype('int16')
+
+    # int16 data is in physical units, scale_factor and add_offset keys
+    # are only used when writing
+    radar.add_field_like('reflectivity', 'refl_int16', fdata.astype('int16'))
+    radar.fields['refl_int16']['scale_factor'] = 0.5
+    radar.fields['refl_int16']['add_offset'] = 10.
+
+    # packed codes which are mapped without being decoded
+    packed = pyart.io.common._packed_field_dic(
+        {}, codes, 0.1, 0., (-9999, ), 'float32')
+    radar.fields['refl_packed'] = packed
+
+    for tile_shape in [None, (4, 4)]:
+        grids = pyart.map.map_gates_to_grid(
+            radar, tile_shape=tile_shape, **COMMON_MAP_TO_GRID_ARGS)
+        ref = grids['reflectivity']
+        for field in ['refl_int16', 'refl_packed']:
+            assert_almost_equal(grids[field], ref, decimal=3)
+            assert np.all(np.ma.getmaskarray(grids[field]) ==
+                          np.ma.getmaskarray(ref))
+    assert 'data' in packed._lazyload
+
+
+def test_map_to_grid_field_shape_mismatch():
+    radar = pyart.testing.make_target_radar()
+    radar.fields['reflectivity']['data'] = (
+        radar.fields['reflectivity']['data'][:, :-1])
+    pytest.raises(ValueError, pyart.map.map_gates_to_grid, (radar, ),
+                  **COMMON_MAP_TO_GRID_ARGS)
+
+    # mismatched arrays passed directly to the mapper
+    grid_sum = np.zeros((1, 1, 1, 1), dtype=np.float32)
+    gatemapper = pyart.map._gate_to_grid_map.GateToGridMapper(
+        (1, 1, 1), (0., 0., 0.), (1., 1., 1.), grid_sum, grid_sum.copy())
+    gates = np.zeros((2, 3), dtype=np.float32)
+    excluded = np.zeros((2, 3), dtype=np.uint8)
+    roi_func = pyart.map._gate_to_grid_map.ConstantRoI(1.)
+    pytest.raises(ValueError, gatemapper.map_gates_to_grid, 3, 2, gates,
+                  gates, gates, [np.zeros((2, 2), 'float32')], [None],
+                  excluded, 1e6, roi_func, 0)
+    pytest.raises(ValueError, gatemapper.map_gates_to_grid, 3, 2, gates,
+                  gates, gates, [gates], [np.zeros((1, 3), 'uint8')],
+                  excluded, 1e6, roi_func, 0)
+    pytest.raises(ValueError, gatemapper.map_gates_to_grid, 3, 2, gates,
+                  gates, gates, [], [], excluded, 1e6, roi_func, 0)
+
+
+def test_map_to_grid_tiled():
+    radar = pyart.testing.make_target_radar()
+    grids = pyart.map.map_gates_to_grid(radar, **COMMON_MAP_TO_GRID_ARGS)
+    tiled_grids = pyart.map.map_gates_to_grid(
+        radar, tile_shape=(4, 3), **COMMON_MAP_TO_GRID_ARGS)
+    center_slice = tiled_grids['reflectivity'][1, 4, :]
+    assert_almost_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+    for field in ['reflectivity', 'ROI']:
+        assert np.all(np.ma.getmaskarray(grids[field]) ==
+                      np.ma.getmaskarray(tiled_grids[field]))
+        assert_almost_equal(grids[field], tiled_grids[field], 3)
+
+
+def test_map_to_grid_tiled_filename():
+    radar = pyart.testing.make_target_radar()
+    with pyart.testing.InTemporaryDirectory():
+        grids = pyart.map.map_gates_to_grid(
+            radar, tile_shape=(5, 5), filename='grid.npy',
+            **COMMON_MAP_TO_GRID_ARGS)
+        assert isinstance(grids['reflectivity'].data, np.memmap)
+        center_slice = grids['reflectivity'][1, 4, :]
+        assert_almost_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+        del grids
+
+        data = np.load('grid.npy')
+        mask = np.load('grid_mask.npy')
+        assert data.shape == (2, 3, 9, 10)
+        assert mask.shape == (1, 3, 9, 10)
+        assert_almost_equal(np.round(data[0, 1, 4]), EXPECTED_CENTER_SLICE)
+        assert np.all(data[1] == 30.)
+
+
 def test_map_to_grid_masked_refl_field():
     radar = pyart.testing.make_target_radar()
 
@@ -149,6 +149,76 @@ def test_map_to_grid_no_copy_two_radars():
     assert_almost_equal(center_slice, EXPECTED_CENTER_SLICE)
 
 
+@pytest.mark.parametrize('weighting_function',
+                         ['Barnes', 'Cressman', 'Nearest'])
+@pytest.mark.parametrize('roi_func', ['constant', 'dist', 'dist_beam'])
+def test_map_to_grid_batch_size(weighting_function, roi_func):
+    radar = pyart.testing.make_target_radar()
+    fdata = np.ma.array(radar.fields['reflectivity']['data'])
+    fdata[100:120, 20:40] = np.ma.masked
+    radar.fields['reflectivity']['data'] = fdata
+    kwargs = {
+        'grid_shape': (3, 9, 10),
+        'grid_limits': ((-400.0, 400.0), (-9000.0, 9000.0), (-9000, 9000)),
+        'weighting_function': weighting_function, 'roi_func': roi_func,
+        'min_radius': 300., 'constant_roi': 300.}
+
+    point_grids = pyart.map.map_to_grid(radar, batch_size=None, **kwargs)
+    batch_grids = pyart.map.map_to_grid(radar, batch_size=7, **kwargs)
+    for field in ['reflectivity', 'ROI']:
+        point_grid = np.ma.masked_array(point_grids[field])
+        batch_grid = np.ma.masked_array(batch_grids[field])
+        assert np.all(np.ma.getmaskarray(point_grid) ==
+                      np.ma.getmaskarray(batch_grid))
+        assert_almost_equal(point_grid.compressed(), batch_grid.compressed())
+
+
+def test_map_to_grid_batch_size_no_copy():
+    radar = pyart.testing.make_target_radar()
+    grids = pyart.map.map_to_grid(
+        (radar, radar), copy_field_data=False, batch_size=11,
+        **COMMON_MAP_TO_GRID_ARGS)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_almost_equal(center_slice, EXPECTED_CENTER_SLICE)
+
+
+@pytest.mark.parametrize('p', [1., 2., np.inf])
+@pytest.mark.parametrize('eps', [0., 0.5])
+def test_query_ball_point_batch(p, eps):
+    rng = np.random.RandomState(0)
+    tree = pyart.map.ckdtree.cKDTree(rng.uniform(size=(500, 3)), leafsize=5)
+    points = rng.uniform(size=(40, 3))
+    radii = rng.uniform(0, 0.3, size=40)
+
+    indptr, indices = tree.query_ball_point_batch(points, radii, p, eps)
+    results = tree.query_ball_point(points, radii, p, eps)
+    assert indptr[0] == 0
+    assert indptr[-1] == len(indices)
+    for i, (point, r) in enumerate(zip(points, radii)):
+        expected = tree.query_ball_point(point, r, p, eps)
+        assert list(indices[indptr[i]:indptr[i + 1]]) == expected
+        assert results[i] == expected
+
+
+def test_nnlocator_batch():
+    rng = np.random.RandomState(0)
+    locator = pyart.map.grid_mapper.NNLocator(rng.uniform(size=(500, 3)))
+    points = rng.uniform(size=(30, 3))
+    radii = rng.uniform(0, 0.3, size=30)
+
+    indptr, ind, dist = locator.find_neighbors_and_dists_batch(points, radii)
+    for i, (point, r) in enumerate(zip(points, radii)):
+        expected_ind, expected_dist = locator.find_neighbors_and_dists(
+            point, r)
+        assert list(ind[indptr[i]:indptr[i + 1]]) == expected_ind
+        assert_almost_equal(dist[indptr[i]:indptr[i + 1]],
+                            np.ravel(expected_dist)[:len(expected_ind)])
+
+    locator._algorithm = 'foo'
+    pytest.raises(ValueError, locator.find_neighbors_and_dists_batch,
+                  points, radii)
+
+
 def test_map_to_grid_tiny_grid():
     radar = pyart.testing.make_target_radar()
     grids = pyart.map.map_to_grid(
@@ -0,0 +1,859 @@
+/* File: _echo_steinermodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 20:37:21 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <string.h>
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *_echo_steiner_error;
+static PyObject *_echo_steiner_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef char * string;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+\
+#define FAILNULL(p) do {                                            \
+    if ((p) == NULL) {                                              \
+        PyErr_SetString(PyExc_MemoryError, "NULL pointer found");   \
+        goto capi_fail;                                             \
+    }                                                               \
+} while (0)
+
+#define STRINGMALLOC(str,len)\
+    if ((str = (string)malloc(sizeof(char)*(len+1))) == NULL) {\
+        PyErr_SetString(PyExc_MemoryError, "out of memory");\
+        goto capi_fail;\
+    } else {\
+        (str)[len] = '\0';\
+    }
+
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define STRINGFREE(str) do {if (!(str == NULL)) free(str);} while (0)
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(_echo_steiner_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#define STRINGCOPYN(to,from,buf_size)                           \
+    do {                                                        \
+        int _m = (buf_size);                                    \
+        char *_to = (to);                                       \
+        char *_from = (from);                                   \
+        FAILNULL(_to); FAILNULL(_from);                         \
+        (void)strncpy(_to, _from, sizeof(char)*_m);             \
+        _to[_m-1] = '\0';                                      \
+        /* Padding with spaces instead of nulls */              \
+        for (_m -= 2; _m >= 0 && _to[_m] == '\0'; _m--) {      \
+            _to[_m] = ' ';                                      \
+        }                                                       \
+    } while (0)
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = _echo_steiner_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int string_from_pyobj(string *str,int *len,const string inistr,PyObject *obj,const char *errmess) {
+    PyArrayObject *arr = NULL;
+    PyObject *tmp = NULL;
+#ifdef DEBUGCFUNCS
+fprintf(stderr,"string_from_pyobj(str='%s',len=%d,inistr='%s',obj=%p)\n",(char*)str,*len,(char *)inistr,obj);
+#endif
+    if (obj == Py_None) {
+        if (*len == -1)
+            *len = strlen(inistr); /* Will this cause problems? */
+        STRINGMALLOC(*str,*len);
+        STRINGCOPYN(*str,inistr,*len+1);
+        return 1;
+    }
+    if (PyArray_Check(obj)) {
+        if ((arr = (PyArrayObject *)obj) == NULL)
+            goto capi_fail;
+        if (!ISCONTIGUOUS(arr)) {
+            PyErr_SetString(PyExc_ValueError,"array object is non-contiguous.");
+            goto capi_fail;
+        }
+        if (*len == -1)
+            *len = (PyArray_ITEMSIZE(arr))*PyArray_SIZE(arr);
+        STRINGMALLOC(*str,*len);
+        STRINGCOPYN(*str,PyArray_DATA(arr),*len+1);
+        return 1;
+    }
+    if (PyString_Check(obj)) {
+        tmp = obj;
+        Py_INCREF(tmp);
+    }
+    else if (PyUnicode_Check(obj)) {
+        tmp = PyUnicode_AsASCIIString(obj);
+    }
+    else {
+        PyObject *tmp2;
+        tmp2 = PyObject_Str(obj);
+        if (tmp2) {
+            tmp = PyUnicode_AsASCIIString(tmp2);
+            Py_DECREF(tmp2);
+        }
+        else {
+            tmp = NULL;
+        }
+    }
+    if (tmp == NULL) goto capi_fail;
+    if (*len == -1)
+        *len = PyString_GET_SIZE(tmp);
+    STRINGMALLOC(*str,*len);
+    STRINGCOPYN(*str,PyString_AS_STRING(tmp),*len+1);
+    Py_DECREF(tmp);
+    return 1;
+capi_fail:
+    Py_XDECREF(tmp);
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = _echo_steiner_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = _echo_steiner_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC_US(convective_radius,CONVECTIVE_RADIUS)(double*,string,double*,size_t);
+extern void F_FUNC(peakedness,PEAKEDNESS)(double*,string,double*,size_t);
+extern void F_FUNC(classify,CLASSIFY)(double*,double*,double*,double*,double*,double*,double*,double*,double*,string,string,int*,double*,int*,int*,int*,int*,size_t,size_t);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/***************************** convective_radius *****************************/
+static char doc_f2py_rout__echo_steiner_convective_radius[] = "\
+conv_rad = convective_radius(ze_bkg,area_relation)\n\nWrapper for ``convective_radius``.\
+\n\nParameters\n----------\n"
+"ze_bkg : input float\n"
+"area_relation : input string(len=16)\n"
+"\nReturns\n-------\n"
+"conv_rad : float";
+/* extern void F_FUNC_US(convective_radius,CONVECTIVE_RADIUS)(double*,string,double*,size_t); */
+static PyObject *f2py_rout__echo_steiner_convective_radius(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,string,double*,size_t)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ze_bkg = 0;
+  PyObject *ze_bkg_capi = Py_None;
+  string area_relation = NULL;
+  int slen(area_relation);
+  PyObject *area_relation_capi = Py_None;
+  double conv_rad = 0;
+  static char *capi_kwlist[] = {"ze_bkg","area_relation",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|:_echo_steiner.convective_radius",\
+    capi_kwlist,&ze_bkg_capi,&area_relation_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ze_bkg */
+    f2py_success = double_from_pyobj(&ze_bkg,ze_bkg_capi,"_echo_steiner.convective_radius() 1st argument (ze_bkg) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable area_relation */
+  slen(area_relation) = 16;
+  f2py_success = string_from_pyobj(&area_relation,&slen(area_relation),"",area_relation_capi,"string_from_pyobj failed in converting 2nd argument `area_relation' of _echo_steiner.convective_radius to C string");
+  if (f2py_success) {
+  /* Processing variable conv_rad */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&ze_bkg,area_relation,&conv_rad,slen(area_relation));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",conv_rad);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable conv_rad */
+    STRINGFREE(area_relation);
+  }  /*if (f2py_success) of area_relation*/
+  /* End of cleaning variable area_relation */
+  } /*if (f2py_success) of ze_bkg*/
+  /* End of cleaning variable ze_bkg */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************** end of convective_radius **************************/
+
+/********************************* peakedness *********************************/
+static char doc_f2py_rout__echo_steiner_peakedness[] = "\
+peak = peakedness(ze_bkg,peak_relation)\n\nWrapper for ``peakedness``.\
+\n\nParameters\n----------\n"
+"ze_bkg : input float\n"
+"peak_relation : input string(len=16)\n"
+"\nReturns\n-------\n"
+"peak : float";
+/* extern void F_FUNC(peakedness,PEAKEDNESS)(double*,string,double*,size_t); */
+static PyObject *f2py_rout__echo_steiner_peakedness(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,string,double*,size_t)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ze_bkg = 0;
+  PyObject *ze_bkg_capi = Py_None;
+  string peak_relation = NULL;
+  int slen(peak_relation);
+  PyObject *peak_relation_capi = Py_None;
+  double peak = 0;
+  static char *capi_kwlist[] = {"ze_bkg","peak_relation",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO|:_echo_steiner.peakedness",\
+    capi_kwlist,&ze_bkg_capi,&peak_relation_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ze_bkg */
+    f2py_success = double_from_pyobj(&ze_bkg,ze_bkg_capi,"_echo_steiner.peakedness() 1st argument (ze_bkg) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable peak_relation */
+  slen(peak_relation) = 16;
+  f2py_success = string_from_pyobj(&peak_relation,&slen(peak_relation),"",peak_relation_capi,"string_from_pyobj failed in converting 2nd argument `peak_relation' of _echo_steiner.peakedness to C string");
+  if (f2py_success) {
+  /* Processing variable peak */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&ze_bkg,peak_relation,&peak,slen(peak_relation));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",peak);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable peak */
+    STRINGFREE(peak_relation);
+  }  /*if (f2py_success) of peak_relation*/
+  /* End of cleaning variable peak_relation */
+  } /*if (f2py_success) of ze_bkg*/
+  /* End of cleaning variable ze_bkg */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of peakedness *****************************/
+
+/********************************** classify **********************************/
+static char doc_f2py_rout__echo_steiner_classify[] = "\
+sclass = classify(ze,x,y,z,dx,dy,intense,bkg_rad,work_level,area_relation,peak_relation,use_intense,fill_value,[nx,ny,nz])\n\nWrapper for ``classify``.\
+\n\nParameters\n----------\n"
+"ze : input rank-3 array('d') with bounds (nz,ny,nx)\n"
+"x : input rank-1 array('d') with bounds (nx)\n"
+"y : input rank-1 array('d') with bounds (ny)\n"
+"z : input rank-1 array('d') with bounds (nz)\n"
+"dx : input float\n"
+"dy : input float\n"
+"intense : input float\n"
+"bkg_rad : input float\n"
+"work_level : input float\n"
+"area_relation : input string(len=16)\n"
+"peak_relation : input string(len=16)\n"
+"use_intense : input int\n"
+"fill_value : input float\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(ze,2)\n"
+"ny : input int, optional\n    Default: shape(ze,1)\n"
+"nz : input int, optional\n    Default: shape(ze,0)\n"
+"\nReturns\n-------\n"
+"sclass : rank-2 array('i') with bounds (ny,nx)";
+/* extern void F_FUNC(classify,CLASSIFY)(double*,double*,double*,double*,double*,double*,double*,double*,double*,string,string,int*,double*,int*,int*,int*,int*,size_t,size_t); */
+static PyObject *f2py_rout__echo_steiner_classify(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*,double*,double*,double*,double*,double*,string,string,int*,double*,int*,int*,int*,int*,size_t,size_t)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double *ze = NULL;
+  npy_intp ze_Dims[3] = {-1, -1, -1};
+  const int ze_Rank = 3;
+  PyArrayObject *capi_ze_tmp = NULL;
+  int capi_ze_intent = 0;
+  PyObject *ze_capi = Py_None;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  PyObject *y_capi = Py_None;
+  double *z = NULL;
+  npy_intp z_Dims[1] = {-1};
+  const int z_Rank = 1;
+  PyArrayObject *capi_z_tmp = NULL;
+  int capi_z_intent = 0;
+  PyObject *z_capi = Py_None;
+  double dx = 0;
+  PyObject *dx_capi = Py_None;
+  double dy = 0;
+  PyObject *dy_capi = Py_None;
+  double intense = 0;
+  PyObject *intense_capi = Py_None;
+  double bkg_rad = 0;
+  PyObject *bkg_rad_capi = Py_None;
+  double work_level = 0;
+  PyObject *work_level_capi = Py_None;
+  string area_relation = NULL;
+  int slen(area_relation);
+  PyObject *area_relation_capi = Py_None;
+  string peak_relation = NULL;
+  int slen(peak_relation);
+  PyObject *peak_relation_capi = Py_None;
+  int use_intense = 0;
+  PyObject *use_intense_capi = Py_None;
+  double fill_value = 0;
+  PyObject *fill_value_capi = Py_None;
+  int nx = 0;
+  PyObject *nx_capi = Py_None;
+  int ny = 0;
+  PyObject *ny_capi = Py_None;
+  int nz = 0;
+  PyObject *nz_capi = Py_None;
+  int *sclass = NULL;
+  npy_intp sclass_Dims[2] = {-1, -1};
+  const int sclass_Rank = 2;
+  PyArrayObject *capi_sclass_tmp = NULL;
+  int capi_sclass_intent = 0;
+  static char *capi_kwlist[] = {"ze","x","y","z","dx","dy","intense","bkg_rad","work_level","area_relation","peak_relation","use_intense","fill_value","nx","ny","nz",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOOOO|OOO:_echo_steiner.classify",\
+    capi_kwlist,&ze_capi,&x_capi,&y_capi,&z_capi,&dx_capi,&dy_capi,&intense_capi,&bkg_rad_capi,&work_level_capi,&area_relation_capi,&peak_relation_capi,&use_intense_capi,&fill_value_capi,&nx_capi,&ny_capi,&nz_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable ze */
+  ;
+  capi_ze_intent |= F2PY_INTENT_IN;
+  capi_ze_tmp = array_from_pyobj(NPY_DOUBLE,ze_Dims,ze_Rank,capi_ze_intent,ze_capi);
+  if (capi_ze_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _echo_steiner_error,"failed in converting 1st argument `ze' of _echo_steiner.classify to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    ze = (double *)(PyArray_DATA(capi_ze_tmp));
+
+  /* Processing variable dx */
+    f2py_success = double_from_pyobj(&dx,dx_capi,"_echo_steiner.classify() 5th argument (dx) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable dy */
+    f2py_success = double_from_pyobj(&dy,dy_capi,"_echo_steiner.classify() 6th argument (dy) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable intense */
+    f2py_success = double_from_pyobj(&intense,intense_capi,"_echo_steiner.classify() 7th argument (intense) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable bkg_rad */
+    f2py_success = double_from_pyobj(&bkg_rad,bkg_rad_capi,"_echo_steiner.classify() 8th argument (bkg_rad) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable work_level */
+    f2py_success = double_from_pyobj(&work_level,work_level_capi,"_echo_steiner.classify() 9th argument (work_level) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable area_relation */
+  slen(area_relation) = 16;
+  f2py_success = string_from_pyobj(&area_relation,&slen(area_relation),"",area_relation_capi,"string_from_pyobj failed in converting 10th argument `area_relation' of _echo_steiner.classify to C string");
+  if (f2py_success) {
+  /* Processing variable peak_relation */
+  slen(peak_relation) = 16;
+  f2py_success = string_from_pyobj(&peak_relation,&slen(peak_relation),"",peak_relation_capi,"string_from_pyobj failed in converting 11st argument `peak_relation' of _echo_steiner.classify to C string");
+  if (f2py_success) {
+  /* Processing variable use_intense */
+    use_intense = (int)PyObject_IsTrue(use_intense_capi);
+    f2py_success = 1;
+  if (f2py_success) {
+  /* Processing variable fill_value */
+    f2py_success = double_from_pyobj(&fill_value,fill_value_capi,"_echo_steiner.classify() 13rd argument (fill_value) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable nx */
+  if (nx_capi == Py_None) nx = shape(ze,2); else
+    f2py_success = int_from_pyobj(&nx,nx_capi,"_echo_steiner.classify() 1st keyword (nx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(ze,2)==nx,"shape(ze,2)==nx","1st keyword nx","classify:nx=%d",nx) {
+  /* Processing variable ny */
+  if (ny_capi == Py_None) ny = shape(ze,1); else
+    f2py_success = int_from_pyobj(&ny,ny_capi,"_echo_steiner.classify() 2nd keyword (ny) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(ze,1)==ny,"shape(ze,1)==ny","2nd keyword ny","classify:ny=%d",ny) {
+  /* Processing variable nz */
+  if (nz_capi == Py_None) nz = shape(ze,0); else
+    f2py_success = int_from_pyobj(&nz,nz_capi,"_echo_steiner.classify() 3rd keyword (nz) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(shape(ze,0)==nz,"shape(ze,0)==nz","3rd keyword nz","classify:nz=%d",nz) {
+  /* Processing variable sclass */
+  sclass_Dims[0]=ny,sclass_Dims[1]=nx;
+  capi_sclass_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+  capi_sclass_tmp = array_from_pyobj(NPY_INT,sclass_Dims,sclass_Rank,capi_sclass_intent,Py_None);
+  if (capi_sclass_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _echo_steiner_error,"failed in converting hidden `sclass' of _echo_steiner.classify to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    sclass = (int *)(PyArray_DATA(capi_sclass_tmp));
+
+  /* Processing variable x */
+  x_Dims[0]=nx;
+  capi_x_intent |= F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _echo_steiner_error,"failed in converting 2nd argument `x' of _echo_steiner.classify to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable y */
+  y_Dims[0]=ny;
+  capi_y_intent |= F2PY_INTENT_IN;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,y_capi);
+  if (capi_y_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _echo_steiner_error,"failed in converting 3rd argument `y' of _echo_steiner.classify to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+  /* Processing variable z */
+  z_Dims[0]=nz;
+  capi_z_intent |= F2PY_INTENT_IN;
+  capi_z_tmp = array_from_pyobj(NPY_DOUBLE,z_Dims,z_Rank,capi_z_intent,z_capi);
+  if (capi_z_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _echo_steiner_error,"failed in converting 4th argument `z' of _echo_steiner.classify to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    z = (double *)(PyArray_DATA(capi_z_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(ze,x,y,z,&dx,&dy,&intense,&bkg_rad,&work_level,area_relation,peak_relation,&use_intense,&fill_value,&nx,&ny,&nz,sclass,slen(area_relation),slen(peak_relation));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_sclass_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_z_tmp!=z_capi) {
+    Py_XDECREF(capi_z_tmp); }
+  }  /*if (capi_z_tmp == NULL) ... else of z*/
+  /* End of cleaning variable z */
+  if((PyObject *)capi_y_tmp!=y_capi) {
+    Py_XDECREF(capi_y_tmp); }
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+  }  /*if (capi_sclass_tmp == NULL) ... else of sclass*/
+  /* End of cleaning variable sclass */
+  } /*CHECKSCALAR(shape(ze,0)==nz)*/
+  } /*if (f2py_success) of nz*/
+  /* End of cleaning variable nz */
+  } /*CHECKSCALAR(shape(ze,1)==ny)*/
+  } /*if (f2py_success) of ny*/
+  /* End of cleaning variable ny */
+  } /*CHECKSCALAR(shape(ze,2)==nx)*/
+  } /*if (f2py_success) of nx*/
+  /* End of cleaning variable nx */
+  } /*if (f2py_success) of fill_value*/
+  /* End of cleaning variable fill_value */
+  } /*if (f2py_success) of use_intense*/
+  /* End of cleaning variable use_intense */
+    STRINGFREE(peak_relation);
+  }  /*if (f2py_success) of peak_relation*/
+  /* End of cleaning variable peak_relation */
+    STRINGFREE(area_relation);
+  }  /*if (f2py_success) of area_relation*/
+  /* End of cleaning variable area_relation */
+  } /*if (f2py_success) of work_level*/
+  /* End of cleaning variable work_level */
+  } /*if (f2py_success) of bkg_rad*/
+  /* End of cleaning variable bkg_rad */
+  } /*if (f2py_success) of intense*/
+  /* End of cleaning variable intense */
+  } /*if (f2py_success) of dy*/
+  /* End of cleaning variable dy */
+  } /*if (f2py_success) of dx*/
+  /* End of cleaning variable dx */
+  if((PyObject *)capi_ze_tmp!=ze_capi) {
+    Py_XDECREF(capi_ze_tmp); }
+  }  /*if (capi_ze_tmp == NULL) ... else of ze*/
+  /* End of cleaning variable ze */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of classify ******************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"convective_radius",-1,{{-1}},0,(char *)F_FUNC_US(convective_radius,CONVECTIVE_RADIUS),(f2py_init_func)f2py_rout__echo_steiner_convective_radius,doc_f2py_rout__echo_steiner_convective_radius},
+  {"peakedness",-1,{{-1}},0,(char *)F_FUNC(peakedness,PEAKEDNESS),(f2py_init_func)f2py_rout__echo_steiner_peakedness,doc_f2py_rout__echo_steiner_peakedness},
+  {"classify",-1,{{-1}},0,(char *)F_FUNC(classify,CLASSIFY),(f2py_init_func)f2py_rout__echo_steiner_classify,doc_f2py_rout__echo_steiner_classify},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "_echo_steiner",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+
+PyMODINIT_FUNC PyInit__echo_steiner(void) {
+  int i;
+  PyObject *m,*d, *s, *tmp;
+  m = _echo_steiner_module = PyModule_Create(&moduledef);
+  Py_SET_TYPE(&PyFortran_Type, &PyType_Type);
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module _echo_steiner (failed to import numpy)"); return m;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+  Py_DECREF(s);
+  s = PyUnicode_FromString(
+    "This module '_echo_steiner' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  conv_rad = convective_radius(ze_bkg,area_relation)\n"
+"  peak = peakedness(ze_bkg,peak_relation)\n"
+"  sclass = classify(ze,x,y,z,dx,dy,intense,bkg_rad,work_level,area_relation,peak_relation,use_intense,fill_value,nx=shape(ze,2),ny=shape(ze,1),nz=shape(ze,0))\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  Py_DECREF(s);
+  _echo_steiner_error = PyErr_NewException ("_echo_steiner.error", NULL, NULL);
+  /*
+   * Store the error object inside the dict, so that it could get deallocated.
+   * (in practice, this is a module, so it likely will not and cannot.)
+   */
+  PyDict_SetItemString(d, "__echo_steiner_error", _echo_steiner_error);
+  Py_DECREF(_echo_steiner_error);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++) {
+    tmp = PyFortranObject_NewAsAttr(&f2py_routine_defs[i]);
+    PyDict_SetItemString(d, f2py_routine_defs[i].name, tmp);
+    Py_DECREF(tmp);
+  }
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"_echo_steiner");
+#endif
+  return m;
+}
+#ifdef __cplusplus
+}
+#endif
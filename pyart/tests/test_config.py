@@ -68,6 +68,12 @@ def test_filemetadata_custom():
         'sigmet', exclude_fields=['spectrum_width'])
     assert filemetadata.get_field_name('WIDTH2') is None
 
+    # include fields
+    filemetadata = pyart.config.FileMetadata(
+        'sigmet', include_fields=['spectrum_width'])
+    assert filemetadata.get_field_name('WIDTH2') == 'spectrum_width'
+    assert filemetadata.get_field_name('DBT') is None
+
 
 def test_init_load():
 
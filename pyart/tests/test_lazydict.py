@@ -0,0 +1,135 @@
+""" Unit Tests for Py-ART's lazydict.py module. """
+
+import gc
+import pickle
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pyart.lazydict import LazyLoadDict, ThreadSafeLazyLoadDict
+from pyart.lazydict import LazyLoadCache
+
+
+class CountingLoader(object):
+    """ Callable which counts the number of times it is called. """
+
+    def __init__(self, size=10, delay=0):
+        self.size = size
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return np.zeros(self.size, dtype='uint8')
+
+
+def test_unload():
+    loader = CountingLoader()
+    d = LazyLoadDict({'a': 1})
+    d.set_lazy('b', loader)
+    d.unload('b')   # unevaluated lazy keys are unchanged
+    assert d['b'].shape == (10, )
+    assert 'b' not in d._lazyload
+    d.unload('b')
+    assert 'b' in d._lazyload
+    assert len(d) == 2
+    assert d['b'].shape == (10, )
+    assert loader.calls == 2
+
+    pytest.raises(ValueError, d.unload, 'a')
+    pytest.raises(KeyError, d.unload, 'c')
+
+    # keys set after evaluation can not be unloaded
+    d['b'] = 2
+    pytest.raises(ValueError, d.unload, 'b')
+
+
+def test_unload_copy_and_pickle():
+    d = LazyLoadDict({})
+    d.set_lazy('a', CountingLoader())
+    d['a']
+    d2 = d.copy()
+    d2.unload('a')
+    assert 'a' in d2._lazyload
+    assert 'a' not in d._lazyload
+
+    # the callables of evaluated keys are not pickled
+    d3 = pickle.loads(pickle.dumps(d))
+    assert d3['a'].shape == (10, )
+    pytest.raises(ValueError, d3.unload, 'a')
+
+
+def test_thread_safe_lazy_load_dict():
+    loader = CountingLoader(delay=0.05)
+    d = ThreadSafeLazyLoadDict({'a': 1})
+    d.set_lazy('b', loader)
+    results = []
+
+    def worker():
+        results.append(d['b'])
+
+    threads = [threading.Thread(target=worker) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert loader.calls == 1
+    assert all(result is results[0] for result in results)
+
+    d.unload('b')
+    assert sorted(d.keys()) == ['a', 'b']
+    assert d.copy()['b'].shape == (10, )
+    d2 = pickle.loads(pickle.dumps(d))
+    assert d2['a'] == 1
+    assert isinstance(d2, ThreadSafeLazyLoadDict)
+
+
+def test_lazy_load_cache():
+    cache = LazyLoadCache(25)
+    dics = []
+    for i in range(3):
+        d = LazyLoadDict({})
+        d.set_lazy('data', CountingLoader())
+        d.cache = cache
+        dics.append(d)
+
+    dics[0]['data']
+    dics[1]['data']
+    assert cache.nbytes == 20
+    assert len(cache) == 2
+
+    # least recently used value is unloaded
+    dics[0]['data']
+    dics[2]['data']
+    assert cache.nbytes == 20
+    assert 'data' in dics[1]._lazyload
+    assert 'data' not in dics[0]._lazyload
+
+    # unloaded, set or garbage collected values are removed from the cache
+    dics[0].unload('data')
+    assert cache.nbytes == 10
+    dics[2]['data'] = np.zeros(5)
+    assert cache.nbytes == 0
+    dics[1]['data']
+    assert cache.nbytes == 10
+    del dics[1]
+    gc.collect()
+    assert cache.nbytes == 0
+
+    # clear unloads all values
+    dics[0]['data']
+    cache.clear()
+    assert cache.nbytes == 0
+    assert 'data' in dics[0]._lazyload
+
+
+def test_lazy_load_cache_masked():
+    cache = LazyLoadCache(100)
+    d = LazyLoadDict({})
+    d.set_lazy('data', lambda: np.ma.masked_equal(np.arange(10), 5))
+    d.cache = cache
+    d['data']
+    assert cache.nbytes == 10 * 8 + 10
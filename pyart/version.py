@@ -0,0 +1,10 @@
+
+# THIS FILE IS GENERATED FROM PYART SETUP.PY
+short_version = '1.10.0'
+version = '1.10.0'
+full_version = '1.10.0.dev+875f3f5'
+git_revision = '875f3f5409bd2f4472db73fe0d7bbd9912b4737e'
+release = False
+
+if not release:
+    version = full_version